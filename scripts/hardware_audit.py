@@ -3,7 +3,8 @@
 Hardware and Dependency Audit Script
 
 Generates a comprehensive audit report including:
-- Hardware specifications hash
+- Environment hash (same environment_hash attached to every evaluation:
+  CPU governor, turbo, SMT, isolcpus, NUMA, quantcrypt build, package hash)
 - Python version
 - Installed package versions
 - Environment reproducibility data
@@ -12,68 +13,35 @@ Usage:
     python scripts/hardware_audit.py [--output <path>]
 """
 
-import hashlib
 import json
 import platform
+import sys
 from datetime import datetime
 from pathlib import Path
 
+# Same capture code as the benchmark runtime (src/metrics), so the audit hash
+# matches the environment_hash attached to every evaluation
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
-def get_hardware_info():
-    """Collect hardware and system information."""
-    try:
-        import cpuinfo
-        cpu_info = cpuinfo.get_cpu_info()
-        cpu_data = {
-            "brand": cpu_info.get("brand_raw", "Unknown"),
-            "arch": cpu_info.get("arch", "Unknown"),
-            "count": cpu_info.get("count", 0),
-            "hz": cpu_info.get("hz_advertised_friendly", "Unknown"),
-        }
-    except ImportError:
-        cpu_data = {"error": "py-cpuinfo not installed"}
+from metrics.environment import capture_environment, installed_packages  # noqa: E402
+from metrics.hardware import Hardware  # noqa: E402
 
-    try:
-        import psutil
-        memory = psutil.virtual_memory()
-        memory_data = {
-            "total_gb": round(memory.total / (1024**3), 2),
-            "available_gb": round(memory.available / (1024**3), 2),
-        }
-    except ImportError:
-        memory_data = {"error": "psutil not installed"}
 
+def get_hardware_info():
+    """Collect hardware and system information (cached per host by metrics.hardware)."""
     return {
         "platform": platform.platform(),
         "python_version": platform.python_version(),
         "python_implementation": platform.python_implementation(),
         "machine": platform.machine(),
         "processor": platform.processor(),
-        "cpu": cpu_data,
-        "memory": memory_data,
+        **Hardware().snapshot_hardware(),
     }
 
 
 def get_installed_packages():
     """Get list of installed packages with versions."""
-    try:
-        from importlib.metadata import distributions
-        packages = {}
-        for dist in distributions():
-            packages[dist.name] = dist.version
-        return packages
-    except ImportError:
-        return {"error": "importlib.metadata not available"}
-
-
-def compute_environment_hash(hardware_info, packages):
-    """Compute SHA256 hash of hardware and dependency configuration."""
-    combined_data = {
-        "hardware": hardware_info,
-        "packages": packages,
-    }
-    json_str = json.dumps(combined_data, sort_keys=True)
-    return hashlib.sha256(json_str.encode()).hexdigest()
+    return installed_packages()
 
 
 def generate_audit_report(output_path=None):
@@ -84,13 +52,14 @@ def generate_audit_report(output_path=None):
     print("Scanning installed packages...")
     packages = get_installed_packages()
     
-    print("Computing environment hash...")
-    env_hash = compute_environment_hash(hardware_info, packages)
+    print("Capturing runtime environment...")
+    environment = capture_environment()
     
     report = {
         "audit_timestamp": datetime.now().isoformat(),
-        "environment_hash": env_hash,
+        "environment_hash": environment["environment_hash"],
         "hardware": hardware_info,
+        "environment": environment,
         "packages": packages,
     }
     
@@ -3,21 +3,86 @@ Krypton Cipher usando quantCrypt.
 
 Princípio I da Constituição: Uso EXCLUSIVO de quantCrypt.
 """
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Sequence
 from logging import getLogger
+from random import Random
+from time import perf_counter_ns
+from metrics.histogram import LatencyHistogram
 from quantcrypt.cipher import Krypton
-from secrets import token_bytes
 
 logger = getLogger(__name__)
 
+# Payload padrão quando nenhuma varredura é solicitada
+DEFAULT_PAYLOAD_SIZES = (64,)
+KEY_SIZE = 64
 
-def cipher_rounds(volume: int, seed: int = 42) -> Dict[str, Any]:
+
+def _validate(volume: int, payload_sizes: Optional[Sequence[int]]) -> List[int]:
+    if volume <= 0:
+        raise ValueError(f"volume must be greater than 0, got {volume}")
+    payload_sizes = list(payload_sizes or DEFAULT_PAYLOAD_SIZES)
+    if any(size <= 0 for size in payload_sizes):
+        raise ValueError(f"payload sizes must be greater than 0, got {payload_sizes}")
+    return payload_sizes
+
+
+def prepare_inputs(
+    volume: int,
+    seed: int = 42,
+    payload_sizes: Optional[Sequence[int]] = None,
+    key_reuse: bool = False
+) -> Dict[str, Any]:
+    """
+    Sorteia o buffer de payload e as chaves a partir da seed.
+    
+    Exposta como cipher_rounds.prepare: o ProfilerManager a executa antes do
+    aquecimento e da passada medida. Um buffer de 64 MiB custa centenas de
+    ms de CPU no Random, que de outra forma cairiam em cpu_time_ms.
+    
+    Returns:
+        Dict com:
+            - buffer: bytes (max(payload_sizes) bytes)
+            - keys: list[list[bytes]] (por célula; 1 chave em key_reuse, volume senão)
+    """
+    payload_sizes = _validate(volume, payload_sizes)
+    rng = Random(seed)
+    buffer = rng.randbytes(max(payload_sizes))
+    keys_per_cell = 1 if key_reuse else volume
+    keys = [[rng.randbytes(KEY_SIZE) for _ in range(keys_per_cell)] for _ in payload_sizes]
+    return {"buffer": buffer, "keys": keys}
+
+
+def cipher_rounds(
+    volume: int,
+    seed: int = 42,
+    payload_sizes: Optional[Sequence[int]] = None,
+    key_reuse: bool = False,
+    inputs: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
     """
     Executa rodadas de cifração/decifração usando Krypton.
     
+    Para cada tamanho de payload (célula) são cifradas e decifradas `volume`
+    mensagens. Os payloads são fatias de um único buffer gerado a partir
+    da seed; buffer e chaves vêm de prepare_inputs, fora da medição quando
+    chamada pelo ProfilerManager.
+    
+    Modos:
+        - key_reuse=False: nova chave e novo objeto Krypton por mensagem; a
+          construção do Krypton é medida à parte, na fase setup
+        - key_reuse=True: uma chave/objeto Krypton por célula (throughput bruto)
+    
+    Latências: um histograma por fase e por célula. Com um único payload as
+    fases se chamam setup/encrypt/decrypt; numa varredura levam o tamanho
+    (encrypt_64B, encrypt_1024B, ...) — misturar 64 B e 64 MiB num mesmo
+    histograma tornaria os percentis sem sentido.
+    
     Args:
-        volume: Número de operações (encrypt/decrypt pairs)
+        volume: Número de operações (encrypt/decrypt pairs) por payload
         seed: Seed para PRNG (reprodutibilidade)
+        payload_sizes: Tamanhos de payload em bytes (default: 64)
+        key_reuse: Reutiliza a mesma chave em todas as mensagens da célula
+        inputs: Retorno de prepare_inputs com volume >= este (default: preparado aqui)
         
     Returns:
         Dict com:
@@ -25,38 +90,87 @@ def cipher_rounds(volume: int, seed: int = 42) -> Dict[str, Any]:
             - algorithm: str
             - volume: int
             - seed: int
+            - mode: str (key_per_message|key_reuse)
+            - phase_latencies_ns: dict[str, LatencyHistogram] (setup, encrypt,
+              decrypt; com sufixo _<bytes>B em varreduras)
+            - cells: list[dict] (payload_bytes, messages, setup_ns, encrypt_ns, decrypt_ns)
             
     Raises:
-        ValueError: Se volume <= 0
+        ValueError: Se volume <= 0 ou algum payload_size <= 0
     """
     # Validação obrigatória
-    if volume <= 0:
-        raise ValueError(f"volume must be greater than 0, got {volume}")
+    payload_sizes = _validate(volume, payload_sizes)
+    
+    mode = "key_reuse" if key_reuse else "key_per_message"
+    logger.info(f"action=Krypton: START volume={volume} seed={seed} payloads={payload_sizes} mode={mode}")
+    
+    if inputs is None:
+        inputs = prepare_inputs(volume, seed, payload_sizes, key_reuse)
+    buffer = inputs["buffer"]
+    
+    phase_latencies = {}
+    cells = []
     
-    logger.info(f"action=Krypton: START volume={volume} seed={seed}")
-    plaintext = b"Hello World"
+    for size, keys in zip(payload_sizes, inputs["keys"]):
+        suffix = f"_{size}B" if len(payload_sizes) > 1 else ""
+        setup_ns = phase_latencies.setdefault(f"setup{suffix}", LatencyHistogram())
+        encrypt_ns = phase_latencies.setdefault(f"encrypt{suffix}", LatencyHistogram())
+        decrypt_ns = phase_latencies.setdefault(f"decrypt{suffix}", LatencyHistogram())
+        plaintext = buffer[:size]
+        cell_setup_ns = 0
+        cell_encrypt_ns = 0
+        cell_decrypt_ns = 0
+        krypton = None
         
-    # Simular cifragens
-    for _ in range(volume):
-        secret_key = token_bytes(64)
-        krypton = Krypton(secret_key)
-
-        krypton.begin_encryption()
-        ciphertext = krypton.encrypt(plaintext)
-        verif_dp = krypton.finish_encryption()
+        # Simular cifragens
+        for message in range(volume):
+            if krypton is None or not key_reuse:
+                ts = perf_counter_ns()
+                krypton = Krypton(keys[message])
+                elapsed = perf_counter_ns() - ts
+                setup_ns.record(elapsed)
+                cell_setup_ns += elapsed
+            
+            t0 = perf_counter_ns()
+            krypton.begin_encryption()
+            ciphertext = krypton.encrypt(plaintext)
+            verif_dp = krypton.finish_encryption()
+            t1 = perf_counter_ns()
 
-        krypton.begin_decryption(verif_dp)
-        plaintext_copy = krypton.decrypt(ciphertext)
-        krypton.finish_decryption()
+            krypton.begin_decryption(verif_dp)
+            plaintext_copy = krypton.decrypt(ciphertext)
+            krypton.finish_decryption()
+            t2 = perf_counter_ns()
+            
+            encrypt_ns.record(t1 - t0)
+            decrypt_ns.record(t2 - t1)
+            cell_encrypt_ns += t1 - t0
+            cell_decrypt_ns += t2 - t1
 
-        assert plaintext_copy == plaintext
+            assert plaintext_copy == plaintext
+        
+        cells.append({
+            "payload_bytes": size,
+            "messages": volume,
+            "mode": mode,
+            "setup_ns": cell_setup_ns,
+            "encrypt_ns": cell_encrypt_ns,
+            "decrypt_ns": cell_decrypt_ns
+        })
     
     result = {
-        "operations_completed": volume,
+        "operations_completed": volume * len(payload_sizes),
         "algorithm": "Krypton",
         "volume": volume,
-        "seed": seed
+        "seed": seed,
+        "mode": mode,
+        "phase_latencies_ns": phase_latencies,
+        "cells": cells
     }
     
-    logger.info(f"action=Krypton: COMPLETE operations={volume}")
+    logger.info(f"action=Krypton: COMPLETE operations={result['operations_completed']}")
     return result
+
+
+# Preparação executada pelo ProfilerManager fora da janela medida
+cipher_rounds.prepare = prepare_inputs
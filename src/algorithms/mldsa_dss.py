@@ -3,20 +3,28 @@ MLDSA_87 Digital Signature Scheme usando quantCrypt.
 
 Princípio I da Constituição: Uso EXCLUSIVO de quantCrypt.
 """
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from logging import getLogger
+from time import perf_counter_ns
+from metrics.histogram import LatencyHistogram
 from quantcrypt.dss import MLDSA_87
 
 logger = getLogger(__name__)
 
 
-def generate_and_sign(volume: int, seed: int = 42) -> Dict[str, Any]:
+def generate_and_sign(volume: int, seed: int = 42, key_count: Optional[int] = None) -> Dict[str, Any]:
     """
     Executa operações de assinatura digital usando MLDSA_87.
     
+    Modos:
+        - key_count=None: keygen + sign + verify a cada iteração (padrão)
+        - key_count=N: gera N pares de chaves antes do laço e mede apenas
+          sign/verify, alternando entre as chaves (perfil de produção)
+    
     Args:
         volume: Número de operações (sign/verify pairs)
         seed: Seed para PRNG (reprodutibilidade)
+        key_count: Número de pares de chaves pré-gerados (opcional)
         
     Returns:
         Dict com:
@@ -24,32 +32,78 @@ def generate_and_sign(volume: int, seed: int = 42) -> Dict[str, Any]:
             - algorithm: str
             - volume: int
             - seed: int
+            - mode: str (keygen_per_op|key_reuse)
+            - key_count: int
+            - phase_latencies_ns: dict[str, LatencyHistogram] (keygen, sign, verify)
             
     Raises:
-        ValueError: Se volume <= 0
+        ValueError: Se volume <= 0 ou key_count <= 0
     """
     # Validação obrigatória
     if volume <= 0:
         raise ValueError(f"volume must be greater than 0, got {volume}")
     
-    logger.info(f"action=DSS: START volume={volume} seed={seed}")
+    if key_count is not None and key_count <= 0:
+        raise ValueError(f"key_count must be greater than 0, got {key_count}")
+    
+    mode = "keygen_per_op" if key_count is None else "key_reuse"
+    logger.info(f"action=DSS: START volume={volume} seed={seed} mode={mode}")
 
     dss = MLDSA_87()
     message = b'Hello World'
     
-    # Simular assinaturas
-    for _ in range(volume):
-        public_key, secret_key = dss.keygen()
-        signature = dss.sign(secret_key, message)
-        is_valid = dss.verify(public_key, message, signature)
-        assert is_valid
+    keygen_ns = LatencyHistogram()
+    sign_ns = LatencyHistogram()
+    verify_ns = LatencyHistogram()
+    
+    if key_count is None:
+        # Simular assinaturas com chave nova por operação
+        for _ in range(volume):
+            t0 = perf_counter_ns()
+            public_key, secret_key = dss.keygen()
+            t1 = perf_counter_ns()
+            signature = dss.sign(secret_key, message)
+            t2 = perf_counter_ns()
+            is_valid = dss.verify(public_key, message, signature)
+            t3 = perf_counter_ns()
+            
+            keygen_ns.record(t1 - t0)
+            sign_ns.record(t2 - t1)
+            verify_ns.record(t3 - t2)
+            assert is_valid
+    else:
+        # Gerar chaves uma vez e medir sign/verify isoladamente
+        keys = []
+        for _ in range(key_count):
+            t0 = perf_counter_ns()
+            keys.append(dss.keygen())
+            keygen_ns.record(perf_counter_ns() - t0)
+        
+        for idx in range(volume):
+            public_key, secret_key = keys[idx % key_count]
+            t0 = perf_counter_ns()
+            signature = dss.sign(secret_key, message)
+            t1 = perf_counter_ns()
+            is_valid = dss.verify(public_key, message, signature)
+            t2 = perf_counter_ns()
+            
+            sign_ns.record(t1 - t0)
+            verify_ns.record(t2 - t1)
+            assert is_valid
     
     result = {
         "operations_completed": volume,
         "algorithm": "MLDSA_87",
         "volume": volume,
-        "seed": seed
+        "seed": seed,
+        "mode": mode,
+        "key_count": volume if key_count is None else key_count,
+        "phase_latencies_ns": {
+            "keygen": keygen_ns,
+            "sign": sign_ns,
+            "verify": verify_ns
+        }
     }
     
-    logger.info(f"action=DSS: COMPLETE operations={volume}")
+    logger.info(f"action=DSS: COMPLETE operations={volume} mode={mode}")
     return result
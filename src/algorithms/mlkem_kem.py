@@ -6,6 +6,8 @@ Sem implementações customizadas de criptografia.
 """
 from typing import Dict, Any
 from logging import getLogger
+from time import perf_counter_ns
+from metrics.histogram import LatencyHistogram
 from quantcrypt.kem import MLKEM_1024
 
 logger = getLogger(__name__)
@@ -15,6 +17,9 @@ def run_mlkem(volume: int, seed: int = 42) -> Dict[str, Any]:
     """
     Executa operações de KEM (Key Encapsulation) usando MLKEM_1024.
     
+    Cada fase (keygen, encaps, decaps) é cronometrada isoladamente com
+    perf_counter_ns e registrada em um LatencyHistogram (memória fixa por fase).
+    
     Args:
         volume: Número de operações (encapsulation/decapsulation pairs)
         seed: Seed para PRNG (reprodutibilidade - Princípio V)
@@ -25,6 +30,7 @@ def run_mlkem(volume: int, seed: int = 42) -> Dict[str, Any]:
             - algorithm: str
             - volume: int
             - seed: int
+            - phase_latencies_ns: dict[str, LatencyHistogram] (keygen, encaps, decaps)
             
     Raises:
         ValueError: Se volume <= 0
@@ -35,19 +41,36 @@ def run_mlkem(volume: int, seed: int = 42) -> Dict[str, Any]:
     
     logger.info(f"action=KEM: START volume={volume} seed={seed}")
     kem = MLKEM_1024()
+    
+    keygen_ns = LatencyHistogram()
+    encaps_ns = LatencyHistogram()
+    decaps_ns = LatencyHistogram()
         
     # Simular execuções
     for _ in range(volume):
+        t0 = perf_counter_ns()
         public_key, secret_key = kem.keygen()
+        t1 = perf_counter_ns()
         cipher_text, shared_secret = kem.encaps(public_key)
+        t2 = perf_counter_ns()
         decapsulated_secret = kem.decaps(secret_key, cipher_text)
+        t3 = perf_counter_ns()
+        
+        keygen_ns.record(t1 - t0)
+        encaps_ns.record(t2 - t1)
+        decaps_ns.record(t3 - t2)
         assert shared_secret == decapsulated_secret
     
     result = {
         "operations_completed": volume,
         "algorithm": "MLKEM_1024",
         "volume": volume,
-        "seed": seed
+        "seed": seed,
+        "phase_latencies_ns": {
+            "keygen": keygen_ns,
+            "encaps": encaps_ns,
+            "decaps": decaps_ns
+        }
     }
     
     logger.info(f"action=KEM: COMPLETE operations={volume}")
@@ -0,0 +1,58 @@
+"""
+Registro preguiçoso dos algoritmos suportados.
+
+Cada entrada aponta para "módulo:função" e o módulo (com o quantcrypt por
+trás dele) só é importado no primeiro acesso. Listar nomes, validar opções
+da CLI ou consultar o store não pagam a importação das três bibliotecas, e
+uma execução de KEM carrega apenas o módulo do KEM.
+"""
+from collections.abc import MutableMapping
+from importlib import import_module
+from typing import Callable, Dict, Iterator, Union
+
+
+class AlgorithmRegistry(MutableMapping):
+    """
+    Mapeamento nome -> função do algoritmo, resolvido sob demanda.
+
+    Uso típico:
+        registry = AlgorithmRegistry({"KEM": "algorithms.mlkem_kem:run_mlkem"})
+        "KEM" in registry     # não importa nada
+        registry["KEM"]       # importa algorithms.mlkem_kem e retorna run_mlkem
+
+    Atribuir uma função diretamente (registry["KEM"] = fn) substitui a entrada.
+    """
+
+    def __init__(self, entries: Dict[str, Union[str, Callable]]) -> None:
+        self._entries: Dict[str, Union[str, Callable]] = dict(entries)
+
+    def __getitem__(self, name: str) -> Callable:
+        target = self._entries[name]
+        if isinstance(target, str):
+            module_name, _, attribute = target.partition(":")
+            target = getattr(import_module(module_name), attribute)
+            self._entries[name] = target
+        return target
+
+    def __setitem__(self, name: str, target: Union[str, Callable]) -> None:
+        self._entries[name] = target
+
+    def __delitem__(self, name: str) -> None:
+        del self._entries[name]
+
+    def __contains__(self, name: object) -> bool:
+        # Mapping.__contains__ chamaria __getitem__ (e importaria o módulo)
+        return name in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def is_loaded(self, name: str) -> bool:
+        """True se o módulo do algoritmo já foi importado."""
+        return not isinstance(self._entries[name], str)
+
+    def __repr__(self) -> str:
+        return f"AlgorithmRegistry({list(self._entries)})"
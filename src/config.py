@@ -3,14 +3,15 @@ Configuração centralizada para execuções.
 """
 from pathlib import Path
 from sys import path
-from algorithms.krypton_cipher import cipher_rounds
-from algorithms.mldsa_dss import generate_and_sign
-from algorithms.mlkem_kem import run_mlkem
+from algorithms.registry import AlgorithmRegistry
 
 # Diretórios
 PROJECT_ROOT = Path().resolve()
 DEVELOP_DIR = PROJECT_ROOT / "src"
 RESULTS_DIR = PROJECT_ROOT / "docs" / "results"
+STORE_DIR = PROJECT_ROOT / "docs" / "store"
+CATALOG_PATH = STORE_DIR / "catalog.sqlite"
+HARDWARE_CACHE_PATH = STORE_DIR / "hardware_profile.json"  # metrics.hardware: perfil por host
 
 # if str(DEVELOP_DIR) not in path:
 #     path.insert(0, str(DEVELOP_DIR))
@@ -20,17 +21,68 @@ DEFAULT_ALGORITM = 'KEM'
 DEFAULT_VOLUME = 1
 SEED = 42
 
+# Repetições da mesma configuração (aggregate: MAD + IC bootstrap)
+DEFAULT_TRIALS = 1
+
+# Aquecimento antes da medição (cold start, caches, carregamento CFFI)
+WARMUP_ITERATIONS = 3
+STEADY_STATE_CV = 0.10       # CV máximo da janela para considerar regime estável
+STEADY_STATE_WINDOW = 5
+MAX_WARMUP_ITERATIONS = 20
+
+# Volume adaptativo ("auto"): lotes até o IC 95% atingir o erro relativo alvo
+AUTO_VOLUME = "auto"
+AUTO_TARGET_ERROR = 0.02     # meia-largura do IC / média
+AUTO_TIME_BUDGET_S = 60.0
+AUTO_MIN_BATCHES = 5
+AUTO_MIN_BATCH_MS = 50.0
+
+# Séries de volumes (orchestration.scheduler): repetições por volume em ordem
+# permutada com seed e pausa opcional entre execuções (deriva térmica)
+SCHEDULE_ORDERS = ["random", "sequential"]
+SCHEDULE_ORDER = "random"
+SCHEDULE_TRIALS = 1
+SCHEDULE_COOLDOWN_S = 0.0
+
+# Relatórios individuais (visualize.renderer): "inline" renderiza antes de
+# Single.run retornar, "background" em processos separados, "deferred" só via `render`
+RENDER_MODES = ["inline", "background", "deferred"]
+RENDER_MODE = "inline"
+SERIES_RENDER_MODE = "background"  # Scalability: relatórios individuais não bloqueiam a série
+RENDER_WORKERS = 2
+
+# Modo fixado (orchestration.affinity.PinnedExecution): carga e amostrador em
+# núcleos dedicados; "refuse" aborta se governador != performance ou turbo ligado
+PIN_POLICIES = ["warn", "refuse"]
+PIN_POLICY = "warn"
+PIN_PRIORITY = None  # nice da carga (ex: -10; negativo exige CAP_SYS_NICE)
+
+# Memória (tracemalloc + VmHWM): "separate" roda passada própria, fora do tempo medido
+MEMORY_PASSES = ["separate", "inline"]
+MEMORY_PASS = "separate"
+MEMORY_TOP_SITES = 10
+
+# Varredura de payload do Krypton: 64 B até 64 MiB (fator 16)
+KRYPTON_PAYLOAD_SIZES = [64, 1024, 16 * 1024, 256 * 1024, 4 * 1024**2, 64 * 1024**2]
+
+# Store colunar de avaliações (storage.results_store): linhas por chunk do índice
+STORE_CHUNK_ROWS = 1024
+
+# Comparação baseline x candidata (orchestration.compare): significância e variação mínima
+REGRESSION_ALPHA = 0.01
+REGRESSION_THRESHOLD = 0.05  # 5% na mediana de latência / média por operação
+
 # Timestamp format: DD-MM-YYYY HHhMMmSSs.mmm
 # Unicidade: milissegundos + sufixo incremental se colisão detectada
 # Exemplo: "04-11-2025 15h15m03s.127"
 TIMESTAMP_FORMAT = "%d-%m-%Y %Hh%Mm%Ss"  # milliseconds adicionados via código
 
-# Algoritmos suportados
-ALGORITHMS = {
-    "KEM": run_mlkem,
-    "DSS": generate_and_sign,
-    "Krypton": cipher_rounds
-}
+# Algoritmos suportados (importados no primeiro acesso: quantcrypt fica fora do startup)
+ALGORITHMS = AlgorithmRegistry({
+    "KEM": "algorithms.mlkem_kem:run_mlkem",
+    "DSS": "algorithms.mldsa_dss:generate_and_sign",
+    "Krypton": "algorithms.krypton_cipher:cipher_rounds"
+})
 
 # Métricas obrigatórias
 REQUIRED_METRICS = [
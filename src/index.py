@@ -1,8 +1,28 @@
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
 from logging import INFO, basicConfig
 from argparse import ArgumentParser
-from config import DEFAULT_VOLUME, SEED, ALGORITHMS, DEFAULT_ALGORITM
+from statistics import median
+from time import perf_counter
+from config import (
+    DEFAULT_VOLUME, SEED, ALGORITHMS, DEFAULT_ALGORITM, KRYPTON_PAYLOAD_SIZES,
+    WARMUP_ITERATIONS, STEADY_STATE_CV, MEMORY_PASSES, MEMORY_PASS,
+    AUTO_VOLUME, AUTO_TARGET_ERROR, AUTO_TIME_BUDGET_S, DEFAULT_TRIALS,
+    REGRESSION_ALPHA, REGRESSION_THRESHOLD, SCHEDULE_ORDERS, SCHEDULE_ORDER, SCHEDULE_COOLDOWN_S,
+    RENDER_MODES, RENDER_MODE, SERIES_RENDER_MODE, RENDER_WORKERS,
+    PIN_POLICIES, PIN_POLICY, PIN_PRIORITY
+)
 from orchestration.single import Single
 from orchestration.scalability import Scalability
+from orchestration.compare import Compare
+from storage.catalog import RunCatalog, LATENCY_METRICS
+from storage.results_store import ResultsStore
+from visualize.renderer import RenderPool, reserve_report_path
+
+def volume_arg(value: str):
+    """Volume da CLI: inteiro positivo ou "auto"."""
+    return value if value == AUTO_VOLUME else int(value)
 
 def cli():
     basicConfig(
@@ -20,8 +40,21 @@ def cli():
 
     parser.add_argument(
         "--volume", "-v", nargs="+",
-        type=list, default=DEFAULT_VOLUME,
-        help="Número de operações"
+        type=volume_arg, default=[DEFAULT_VOLUME],
+        help=f"Número de operações (vários valores executam análise de escalabilidade; "
+             f"'{AUTO_VOLUME}' executa lotes até a precisão alvo)"
+    )
+
+    parser.add_argument(
+        "--target-error",
+        type=float, default=AUTO_TARGET_ERROR,
+        help="Volume auto: erro relativo alvo do IC de 95%% da latência por operação"
+    )
+
+    parser.add_argument(
+        "--time-budget",
+        type=float, default=AUTO_TIME_BUDGET_S,
+        help="Volume auto: orçamento de tempo em segundos"
     )
 
     parser.add_argument(
@@ -29,27 +62,340 @@ def cli():
         type=int, default=SEED,
         help="Seed para reprodutibilidade"
     )   
+
+    parser.add_argument(
+        "--workers", "-w", nargs="+",
+        type=int, default=[1],
+        help="Número de processos paralelos (vários valores executam varredura de núcleos)"
+    )
+
+    parser.add_argument(
+        "--scaling",
+        default="strong", choices=["strong", "weak"],
+        help="Varredura de núcleos: volume total fixo (strong) ou por worker (weak)"
+    )
+
+    parser.add_argument(
+        "--keys", "-k",
+        type=int, default=None,
+        help="DSS: pares de chaves gerados antes do laço (mede apenas sign/verify)"
+    )
+
+    parser.add_argument(
+        "--payload-sizes", "-p", nargs="*",
+        type=int, default=None,
+        help=f"Krypton: tamanhos de payload em bytes (sem valores: {KRYPTON_PAYLOAD_SIZES})"
+    )
+
+    parser.add_argument(
+        "--key-reuse",
+        action="store_true",
+        help="Krypton: reutiliza a mesma chave em todas as mensagens de cada payload"
+    )
+
+    parser.add_argument(
+        "--trials", "-t",
+        type=int, default=DEFAULT_TRIALS,
+        help="Repetições da mesma configuração (agregadas com MAD e IC bootstrap; "
+             "com vários volumes: repetições por volume; matriz e workers: por célula)"
+    )
+
+    parser.add_argument(
+        "--order",
+        default=SCHEDULE_ORDER, choices=SCHEDULE_ORDERS,
+        help="Vários volumes: ordem das execuções (random = permutação com a seed)"
+    )
+
+    parser.add_argument(
+        "--cooldown",
+        type=float, default=SCHEDULE_COOLDOWN_S,
+        help="Vários volumes: pausa em segundos entre execuções"
+    )
+
+    parser.add_argument(
+        "--matrix", nargs="*",
+        choices=list(ALGORITHMS.keys()), default=None,
+        help="Modo matriz: compara algoritmos nos mesmos volumes em ordem intercalada (sem valores: todos)"
+    )
+
+    parser.add_argument(
+        "--rounds",
+        type=int, default=1,
+        help="Modo matriz: rodadas de cada algoritmo x volume"
+    )
+
+    parser.add_argument(
+        "--warmup",
+        type=int, default=WARMUP_ITERATIONS,
+        help="Iterações mínimas de aquecimento antes da medição (0 desativa)"
+    )
+
+    parser.add_argument(
+        "--cprofile",
+        action="store_true",
+        help="Passada diagnóstica extra sob cProfile (reporta o overhead do tracing)"
+    )
+
+    parser.add_argument(
+        "--render",
+        default=None, choices=RENDER_MODES,
+        help=f"Relatórios individuais (default: {RENDER_MODE} na execução única, "
+             f"{SERIES_RENDER_MODE} em séries; deferred gera só com `render`)"
+    )
+
+    parser.add_argument(
+        "--memory-pass",
+        default=MEMORY_PASS, choices=MEMORY_PASSES,
+        help="Memória em passada separada (não infla o tempo de CPU) ou na mesma execução"
+    )
+
+    parser.add_argument(
+        "--pinned",
+        action="store_true",
+        help="Modo fixado: carga e amostrador em núcleos dedicados, checando governador e turbo"
+    )
+
+    parser.add_argument(
+        "--workload-core",
+        type=int, default=None,
+        help="Modo fixado: núcleo da carga (default: isolado de maior índice ou o último)"
+    )
+
+    parser.add_argument(
+        "--sampler-core",
+        type=int, default=None,
+        help="Modo fixado: núcleo do amostrador (default: fora do núcleo físico da carga)"
+    )
+
+    parser.add_argument(
+        "--priority",
+        type=int, default=PIN_PRIORITY,
+        help="Modo fixado: nice da carga (negativo exige CAP_SYS_NICE)"
+    )
+
+    parser.add_argument(
+        "--pin-policy",
+        default=PIN_POLICY, choices=PIN_POLICIES,
+        help="Modo fixado: governador != performance ou turbo ligado apenas avisam (warn) ou abortam (refuse)"
+    )
     
     args = parser.parse_args()
+    if AUTO_VOLUME in args.volume and (len(args.volume) > 1 or len(args.workers) > 1 or args.workers[0] > 1):
+        parser.error(f"--volume {AUTO_VOLUME} requires a single volume and a single worker")
+    if args.matrix is not None and (AUTO_VOLUME in args.volume or len(args.workers) > 1):
+        parser.error("--matrix requires numeric volumes and a single worker")
+    if args.pinned and (args.matrix is not None or len(args.workers) > 1 or args.workers[0] > 1):
+        parser.error("--pinned requires a single worker and is not supported with --matrix")
     return args
 
+def query_cli(argv):
+    """Subcomando `query`: histórico de latência por fase a partir do RunCatalog."""
+    parser = ArgumentParser(prog="index.py query", description="Consulta o catálogo de execuções")
+    parser.add_argument("--algorithm", "-a", default=DEFAULT_ALGORITM, choices=list(ALGORITHMS.keys()))
+    parser.add_argument("--metric", "-m", default="p99_us", choices=LATENCY_METRICS)
+    parser.add_argument("--phase", default=None, help="Fase (keygen, encaps, sign, encrypt, ...); default: todas")
+    parser.add_argument("--host", default=None, help="Host (default: todos)")
+    parser.add_argument("--volume", type=int, default=None)
+    parser.add_argument("--days", type=float, default=30, help="Janela em dias (0 = sem limite)")
+    args = parser.parse_args(argv)
+    
+    started = perf_counter()
+    rows = RunCatalog().latency_history(
+        algorithm=args.algorithm,
+        metric=args.metric,
+        phase=args.phase,
+        host=args.host,
+        volume=args.volume,
+        days=args.days or None
+    )
+    elapsed_ms = (perf_counter() - started) * 1000
+    
+    if not rows:
+        print(f"Nenhuma execução de {args.algorithm} encontrada ({elapsed_ms:.1f} ms)")
+        return 1
+    
+    from tabulate import tabulate
+
+    print(tabulate(
+        [[r["started_at"], r["evaluation_id"], r["host"], r["volume"], r["phase"], r["value"]] for r in rows],
+        headers=["Início", "Id", "Host", "Volume", "Fase", args.metric],
+        tablefmt="github",
+        floatfmt=".2f"
+    ))
+    print()
+    for phase in dict.fromkeys(r["phase"] for r in rows):
+        values = [r["value"] for r in rows if r["phase"] == phase and r["value"] is not None]
+        if values:
+            print(f"{phase}: {args.metric} mediana {median(values):.2f} (min {min(values):.2f}, max {max(values):.2f}, n={len(values)})")
+    print(f"\n{len(rows)} linhas em {elapsed_ms:.1f} ms")
+    return 0
+
+def render_cli(argv):
+    """Subcomando `render`: gera relatórios individuais a partir do ResultsStore."""
+    parser = ArgumentParser(prog="index.py render", description="Renderiza relatórios de avaliações armazenadas")
+    parser.add_argument("--id", nargs="+", default=None, help="Ids das avaliações (default: filtros abaixo)")
+    parser.add_argument("--algorithm", "-a", default=None, choices=list(ALGORITHMS.keys()))
+    parser.add_argument("--days", type=float, default=None, help="Apenas avaliações dos últimos N dias")
+    parser.add_argument("--force", action="store_true", help="Renderiza mesmo se o relatório já existir")
+    parser.add_argument("--workers", "-w", type=int, default=RENDER_WORKERS, help="Processos de renderização")
+    args = parser.parse_args(argv)
+    
+    store = ResultsStore()
+    if args.id:
+        ids = args.id
+    else:
+        since = datetime.now() - timedelta(days=args.days) if args.days else None
+        ids = list(store.query(algorithm=args.algorithm, status="success", since=since)["id"])
+    
+    pool = RenderPool(args.workers)
+    skipped = 0
+    for evaluation_id in ids:
+        try:
+            record = store.load(evaluation_id)
+        except KeyError as e:
+            print(f"Erro: {e}")
+            continue
+        evaluation = {**record["evaluation"], "latency_histograms": record["latency_histograms"]}
+        report_path = evaluation.get("report_path")
+        if report_path and Path(report_path).exists() and not args.force:
+            skipped += 1
+            continue
+        pool.submit(evaluation, report_path or reserve_report_path(evaluation))
+    
+    rendered = pool.wait()
+    pool.close()
+    for result in rendered.values():
+        print(f"{result['id']}: {result['report_path']} ({len(result['report_images'])} imagens)")
+    print(f"\n{len(rendered)} relatórios gerados, {skipped} já existentes")
+    return 0
+
+def compare_cli(argv):
+    """Subcomando `compare`: baseline x candidata do ResultsStore; código 1 se houver regressão."""
+    parser = ArgumentParser(prog="index.py compare", description="Detecta regressões entre execuções armazenadas")
+    parser.add_argument("--baseline", "-b", nargs="+", required=True, help="Ids das avaliações da baseline (ver `query`)")
+    parser.add_argument("--candidate", "-c", nargs="+", required=True, help="Ids das avaliações candidatas")
+    parser.add_argument("--alpha", type=float, default=REGRESSION_ALPHA, help="Nível de significância")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD, help="Variação relativa mínima (0.05 = 5%%)")
+    parser.add_argument("--output", "-o", default=None, help="Caminho do relatório Markdown")
+    args = parser.parse_args(argv)
+    
+    try:
+        comparison = Compare().run(
+            baseline_ids=args.baseline,
+            candidate_ids=args.candidate,
+            alpha=args.alpha,
+            threshold=args.threshold,
+            output_path=args.output
+        )
+    except (KeyError, ValueError) as e:
+        print(f"Erro: {e}")
+        return 2
+    
+    for phase, r in comparison["phases"].items():
+        p_value = "N/A" if r["p_value"] is None else f"{r['p_value']:.2g}"
+        print(f"{phase}: p50 {r['baseline'].get('p50', 0):.2f} -> {r['candidate'].get('p50', 0):.2f} µs (p={p_value}) {r['verdict']}")
+    for name, r in comparison["metrics"].items():
+        change = "N/A" if r["change"] is None else f"{r['change']:+.2%}"
+        print(f"{name}: {change} {r['verdict']}")
+    print(f"\nRelatório: {comparison['report_path']}")
+    if comparison["has_regression"]:
+        print(f"REGRESSÃO: {', '.join(comparison['regressions'])}")
+        return 1
+    return 0
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "query":
+        sys.exit(query_cli(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == "compare":
+        sys.exit(compare_cli(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == "render":
+        sys.exit(render_cli(sys.argv[2:]))
+    
     args = cli()
     
     print(f"\n{'='*60}")
-    print(f"Executando: {args.algorithm}")
+    print(f"Executando: {', '.join(args.matrix or ALGORITHMS) if args.matrix is not None else args.algorithm}")
     print(f"Volume: {args.volume}")
     print(f"Seed: {args.seed}")
     print(f"{'='*60}\n")
     
-    result = Scalability().run(
+    options = {}
+    if args.keys is not None:
+        options["key_count"] = args.keys
+    if args.payload_sizes is not None:
+        options["payload_sizes"] = args.payload_sizes or KRYPTON_PAYLOAD_SIZES
+    if args.key_reuse:
+        options["key_reuse"] = True
+    
+    # Aquecimento e passadas de profiling valem para execução única e séries
+    profiler_settings = {
+        "warmup_iterations": args.warmup,
+        "steady_state_cv": STEADY_STATE_CV if args.warmup > 0 else None,
+        "cprofile": args.cprofile,
+        "memory_pass": args.memory_pass,
+    }
+    
+    pinning = None
+    if args.pinned:
+        pinning = {
+            "workload_core": args.workload_core,
+            "sampler_core": args.sampler_core,
+            "priority": args.priority,
+            "policy": args.pin_policy
+        }
+    
+    if args.matrix is not None:
+        # Opções específicas de cada algoritmo
+        matrix_options = {"DSS": {k: v for k, v in options.items() if k == "key_count"},
+                          "Krypton": {k: v for k, v in options.items() if k in ("payload_sizes", "key_reuse")}}
+        result = Scalability().run_matrix(
+            volumes=args.volume,
+            algorithms=args.matrix or None,
+            seed=args.seed,
+            options=matrix_options,
+            rounds=args.rounds,
+            render=args.render or SERIES_RENDER_MODE,
+            trials=args.trials,
+            profiler_settings=profiler_settings
+        )
+    elif len(args.workers) > 1:
+        result = Scalability().run_workers(
+            algorithm=args.algorithm,
+            volume=args.volume[0],
+            worker_counts=args.workers,
+            seed=args.seed,
+            options=options,
+            mode=args.scaling,
+            render=args.render or SERIES_RENDER_MODE,
+            trials=args.trials,
+            profiler_settings=profiler_settings
+        )
+    elif len(args.volume) > 1:
+        result = Scalability().run(
             algorithm=args.algorithm,
             volumes=args.volume,
-            seed=args.seed
-        ) if len(args.volume) > 1 else Single().run(
+            seed=args.seed,
+            options=options,
+            trials=args.trials,
+            order=args.order,
+            cooldown_s=args.cooldown,
+            render=args.render or SERIES_RENDER_MODE,
+            pinning=pinning,
+            profiler_settings=profiler_settings
+        )
+    else:
+        result = Single().run(
             algorithm=args.algorithm,
-            volume=args.volume,
-            seed=args.seed
+            volume=args.volume[0],
+            seed=args.seed,
+            options=options,
+            workers=args.workers[0],
+            target_error=args.target_error,
+            time_budget_s=args.time_budget,
+            trials=args.trials,
+            render=args.render or RENDER_MODE,
+            pinning=pinning,
+            **profiler_settings
         )
 
     
@@ -57,7 +403,9 @@ if __name__ == "__main__":
     print(f"✓ Execução concluída!")
     print(f"Status: {result['status']}")
     print(f"Duração: {result['duration_ms']:.2f} ms")
-    print(f"Volumes testados: {len(result['evaluations'])}")
-    if "report_path" in result:
+    print(f"Volumes testados: {len(result.get('volumes', [args.volume[0]]))}")
+    if result.get("report_path"):
         print(f"Relatório: {result['report_path']}")
+    if "comparative_report_path" in result:
+        print(f"Relatório: {result['comparative_report_path']}")
     print(f"{'='*60}\n")
@@ -0,0 +1,132 @@
+"""
+Acumuladores de streaming para séries de avaliações.
+
+RunningStats mantém contagem, média e soma dos quadrados dos desvios pelo
+algoritmo de Welford (numericamente estável, O(1) por valor) e combina
+acumuladores parciais pela fórmula de Chan et al. SeriesAccumulator usa
+esses acumuladores para produzir o resultado de aggregate_series sem
+guardar as avaliações: o custo de memória depende só do número de fases.
+"""
+from math import sqrt
+from typing import Dict, Any, List, Optional
+from metrics.histogram import LatencyHistogram, as_histogram
+from metrics.latency import summarize_latencies
+
+
+class RunningStats:
+    """Média/variância (Welford), mínimo e máximo de uma métrica.
+
+    Uso típico:
+        stats = RunningStats()
+        for value in values:
+            stats.add(value)
+        stats.mean, stats.stdev
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, value: float) -> None:
+        """Registra um valor em O(1)."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """Combina outro acumulador a este (Chan et al.), in-place. Retorna self."""
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self) -> float:
+        """Variância amostral (0.0 com menos de 2 valores)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return sqrt(max(self.variance, 0.0))
+
+
+class SeriesAccumulator:
+    """Agregação incremental de avaliações de uma série (ver aggregate_series).
+
+    Uso típico:
+        acc = SeriesAccumulator()
+        for volume in volumes:
+            acc.add(single.run(algorithm, volume))
+        acc.result()
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.successful = 0
+        self.volumes: List[int] = []
+        self.cpu_time_ms = RunningStats()
+        self.memory_mb = RunningStats()
+        self.histograms: Dict[str, LatencyHistogram] = {}
+
+    def add(self, evaluation: Dict[str, Any]) -> None:
+        """Registra uma avaliação (bem-sucedida ou não)."""
+        self.total += 1
+        self.volumes.append(evaluation.get("volume", 0))
+        if evaluation.get("status") != "success":
+            return
+
+        self.successful += 1
+        metrics = evaluation.get("metrics", {})
+        self.cpu_time_ms.add(metrics.get("cpu_time_ms", 0.0))
+        self.memory_mb.add(metrics.get("memory_mb", 0.0))
+        for phase, hist in (evaluation.get("latency_histograms") or {}).items():
+            self.histograms.setdefault(phase, LatencyHistogram()).merge(as_histogram(hist))
+
+    def merge(self, other: "SeriesAccumulator") -> "SeriesAccumulator":
+        """Combina um acumulador parcial (ex: de outro worker), in-place. Retorna self."""
+        self.total += other.total
+        self.successful += other.successful
+        self.volumes.extend(other.volumes)
+        self.cpu_time_ms.merge(other.cpu_time_ms)
+        self.memory_mb.merge(other.memory_mb)
+        for phase, hist in other.histograms.items():
+            self.histograms.setdefault(phase, LatencyHistogram()).merge(hist)
+        return self
+
+    def result(self) -> Dict[str, Any]:
+        """
+        Agregados da série no formato de aggregate_series.
+
+        Returns:
+            Dict com cpu_time_avg_ms, cpu_time_std_ms, memory_peak_mb, volumes,
+            success_rate, total_evaluations, successful_evaluations e
+            latency_percentiles
+        """
+        return {
+            "cpu_time_avg_ms": self.cpu_time_ms.mean if self.successful else 0.0,
+            "cpu_time_std_ms": self.cpu_time_ms.stdev,
+            "memory_peak_mb": self.memory_mb.max if self.memory_mb.max is not None else 0.0,
+            "volumes": list(self.volumes),
+            "success_rate": self.successful / self.total if self.total else 0.0,
+            "total_evaluations": self.total,
+            "successful_evaluations": self.successful,
+            "latency_percentiles": {phase: summarize_latencies(hist) for phase, hist in self.histograms.items()}
+        }
@@ -1,38 +1,94 @@
 """
 Agregação de métricas de múltiplas execuções.
 """
-from typing import List, Dict, Any
-from statistics import mean, stdev
+from typing import Iterable, List, Dict, Any, Optional
+from statistics import mean
+from metrics.accumulator import SeriesAccumulator
+from metrics.histogram import LatencyHistogram, as_histogram, merge_histograms
+from metrics.latency import summarize_phases, summarize_throughput
+from metrics.perf_events import derive_counter_metrics
+from metrics.stats import reject_outliers_mad, bootstrap_mean_ci, summarize_trials
 
-def aggregate(metrics_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+def aggregate(
+    metrics_list: List[Dict[str, Any]],
+    latencies_list: Optional[List[Dict[str, Any]]] = None
+) -> Dict[str, Any]:
     """
-    Agrega métricas de uma única execução.
+    Agrega métricas de K repetições da mesma configuração.
+    
+    Cada métrica por repetição passa por rejeição de outliers (MAD) antes
+    da descrição; o IC de 95% da média é obtido por bootstrap sobre as
+    repetições. Percentis de latência vêm da soma dos histogramas de todas
+    as repetições; outliers e IC de latência usam a média de cada repetição.
     
     Args:
-        metrics_list: Lista de dicts com métricas brutas (CPU, memória, sistema)
+        metrics_list: Métricas brutas de cada repetição (ProfilerManager.profile_function)
+        latencies_list: phase_latencies_ns de cada repetição (histogramas, dicts
+            serializados ou séries em ns; opcional)
         
     Returns:
         Dict consolidado com métricas agregadas:
-            - cpu_time_ms: float
-            - memory_mb: float
-            - cpu_cycles: int | None
+            - cpu_time_ms: float (média das repetições após rejeição MAD)
+            - memory_mb: float (pico entre repetições)
+            - cpu_cycles: int | None (média, se contadores disponíveis)
             - hardware_info: dict
+            - trials: int
+            - cpu_time_stats / wall_time_stats: dict (describe + outliers_rejected + ci_low/ci_high)
+            - latency_us: dict fase -> describe em µs + outliers_rejected + ci_low/ci_high
+              (MAD e IC sobre as médias de cada repetição; IC None com uma repetição)
     """
-    # Placeholder: implementar agregação real
+    def collect(section: str, key: str) -> List[float]:
+        values = [m.get(section, {}).get(key) for m in metrics_list]
+        return [v for v in values if v is not None]
+    
+    cpu_times = collect("cpu_metrics", "cpu_time_ms")
+    wall_times = collect("cpu_metrics", "wall_time_ms")
+    memory_peaks = collect("memory_metrics", "memory_mb")
+    cycles = collect("system_metrics", "cpu_cycles")
+    
+    cpu_time_stats = summarize_trials(cpu_times) if cpu_times else {}
+    wall_time_stats = summarize_trials(wall_times) if wall_times else {}
+    
+    # Latência por fase: histogramas somados entre repetições
+    latency_us: Dict[str, Dict[str, Any]] = {}
+    latencies_list = latencies_list or []
+    phases = sorted({phase for lat in latencies_list for phase in (lat or {})})
+    for phase in phases:
+        per_trial = [as_histogram(lat[phase]) for lat in latencies_list if lat and phase in lat]
+        per_trial = [h for h in per_trial if h.count]
+        if not per_trial:
+            continue
+        trial_means, rejected = reject_outliers_mad([h.mean_ns / 1e3 for h in per_trial])
+        ci = bootstrap_mean_ci(trial_means)
+        latency_us[phase] = {
+            **merge_histograms(per_trial).describe(unit_ns=1e3),
+            "outliers_rejected": rejected,
+            "ci_low": ci["low"],
+            "ci_high": ci["high"]
+        }
+    
     return {
-        "cpu_time_ms": 0.0,
-        "memory_mb": 0.0,
-        "cpu_cycles": None,
-        "hardware_info": {}
+        "cpu_time_ms": cpu_time_stats.get("mean", 0.0),
+        "memory_mb": float(max(memory_peaks)) if memory_peaks else 0.0,
+        "cpu_cycles": int(mean(cycles)) if cycles else None,
+        "hardware_info": metrics_list[0].get("hardware_info", {}) if metrics_list else {},
+        "trials": len(metrics_list),
+        "cpu_time_stats": cpu_time_stats,
+        "wall_time_stats": wall_time_stats,
+        "latency_us": latency_us
     }
 
 
-def aggregate_series(evaluations: List[Dict[str, Any]]) -> Dict[str, Any]:
+def aggregate_series(evaluations: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Agrega métricas de múltiplas execuções (diferentes volumes).
     
+    As avaliações são consumidas em streaming por um SeriesAccumulator
+    (média/desvio por Welford, pico corrente, contagem de sucessos), então
+    um gerador pode ser passado sem materializar a série.
+    
     Args:
-        evaluations: Lista de avaliações completas (AlgorithmEvaluation dicts)
+        evaluations: Avaliações completas (AlgorithmEvaluation dicts)
         
     Returns:
         Dict com agregados:
@@ -43,58 +99,211 @@ def aggregate_series(evaluations: List[Dict[str, Any]]) -> Dict[str, Any]:
             - success_rate: float (0-1)
             - total_evaluations: int
             - successful_evaluations: int
+            - latency_percentiles: dict fase -> summarize_latencies dos
+              histogramas (latency_histograms) somados entre avaliações
     """
-    if not evaluations:
-        return {
-            "cpu_time_avg_ms": 0.0,
-            "cpu_time_std_ms": 0.0,
-            "memory_peak_mb": 0.0,
-            "volumes": [],
-            "success_rate": 0.0,
-            "total_evaluations": 0,
-            "successful_evaluations": 0
-        }
+    accumulator = SeriesAccumulator()
+    for evaluation in evaluations:
+        accumulator.add(evaluation)
+    return accumulator.result()
+
+
+def _sum_numeric(dicts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Soma chaves numéricas de vários dicts (None é ignorado; todos None -> None)."""
+    merged: Dict[str, Any] = {}
+    for d in dicts:
+        for key, value in d.items():
+            if isinstance(value, bool) or not isinstance(value, (int, float, type(None))):
+                continue
+            if value is None:
+                merged.setdefault(key, None)
+            else:
+                merged[key] = (merged.get(key) or 0) + value
+    return merged
+
+
+def merge_algorithm_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Combina retornos de várias execuções de um algoritmo (workers ou lotes).
     
-    # Filtrar avaliações bem-sucedidas
-    successful = [e for e in evaluations if e.get("status") == "success"]
-    
-    # Extrair volumes
-    volumes = [e.get("volume", 0) for e in evaluations]
-    
-    # Calcular success rate
-    success_rate = len(successful) / len(evaluations) if evaluations else 0.0
-    
-    # Se nenhuma bem-sucedida, retornar agregados vazios
-    if not successful:
-        return {
-            "cpu_time_avg_ms": 0.0,
-            "cpu_time_std_ms": 0.0,
-            "memory_peak_mb": 0.0,
-            "volumes": volumes,
-            "success_rate": success_rate,
-            "total_evaluations": len(evaluations),
-            "successful_evaluations": 0
-        }
+    Args:
+        results: Dicts com phase_latencies_ns, cells e operations_completed
+        
+    Returns:
+        Dict com:
+            - operations_completed: int (soma)
+            - phase_latencies_ns: dict[str, LatencyHistogram] (histogramas somados)
+            - cells: list[dict] (somadas por (payload_bytes, mode))
+    """
+    # Histogramas por fase somados (entradas não são alteradas)
+    phases: Dict[str, LatencyHistogram] = {}
+    for res in results:
+        for phase, latencies in (res.get("phase_latencies_ns") or {}).items():
+            phases.setdefault(phase, LatencyHistogram()).merge(as_histogram(latencies))
     
-    # Extrair métricas das avaliações bem-sucedidas
-    cpu_times = []
-    memory_peaks = []
+    # Células de payload somadas por (tamanho, modo)
+    cells: Dict[tuple, Dict[str, Any]] = {}
+    for res in results:
+        for cell in res.get("cells") or []:
+            key = (cell["payload_bytes"], cell.get("mode", ""))
+            merged_cell = cells.setdefault(key, {**cell, "messages": 0, "setup_ns": 0, "encrypt_ns": 0, "decrypt_ns": 0})
+            merged_cell["messages"] += cell["messages"]
+            merged_cell["setup_ns"] += cell.get("setup_ns", 0)
+            merged_cell["encrypt_ns"] += cell["encrypt_ns"]
+            merged_cell["decrypt_ns"] += cell["decrypt_ns"]
     
-    for eval_item in successful:
-        metrics = eval_item.get("metrics", {})
-        cpu_times.append(metrics.get("cpu_time_ms", 0.0))
-        memory_peaks.append(metrics.get("memory_mb", 0.0))
+    return {
+        "operations_completed": sum(res.get("operations_completed", 0) for res in results),
+        "phase_latencies_ns": phases,
+        "cells": list(cells.values())
+    }
+
+
+def merge_worker_results(
+    worker_results: List[Dict[str, Any]],
+    reference: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Combina resultados de workers paralelos em uma única avaliação.
+    
+    Args:
+        worker_results: Resultados de cada worker (ver orchestration.parallel._run_shard)
+        reference: Resultado de um worker executando sozinho (base da eficiência)
         
-    cpu_time_avg = mean(cpu_times) if cpu_times else 0.0
-    cpu_time_std = stdev(cpu_times) if len(cpu_times) > 1 else 0.0
-    memory_peak = max(memory_peaks) if memory_peaks else 0.0
+    Returns:
+        Dict no formato de ProfilerManager.profile_function:
+            - result: dict (operations_completed, phase_latencies_ns, cells)
+            - metrics: dict (cpu/system/memory somados entre processos,
+              phase_metrics, throughput_metrics, parallel_metrics)
+    """
+    combined = merge_algorithm_results(worker_results)
+    phases = combined["phase_latencies_ns"]
+    cells = combined["cells"]
+    
+    worker_metrics = [w["metrics"] for w in worker_results]
+    cpu_freq_mhz = next(
+        (m.get("hardware_info", {}).get("cpu_freq_mhz") for m in worker_metrics if m.get("hardware_info")),
+        None
+    )
+    
+    # Memória: picos somados entre processos; sítios de alocação do primeiro worker
+    memory_metrics = _sum_numeric([m.get("memory_metrics", {}) for m in worker_metrics])
+    memory_metrics["memory_increments"] = []
+    first_memory = worker_metrics[0].get("memory_metrics", {}) if worker_metrics else {}
+    memory_metrics["top_allocations"] = first_memory.get("top_allocations", [])
+    memory_metrics["memory_pass"] = first_memory.get("memory_pass")
+    memory_metrics["peak_reset"] = all(m.get("memory_metrics", {}).get("peak_reset", False) for m in worker_metrics)
+    
+    # Throughput agregado: operações totais / janela de execução conjunta
+    total_ops = sum(w["operations_completed"] for w in worker_results)
+    window_ns = max(w["ended_ns"] for w in worker_results) - min(w["started_ns"] for w in worker_results)
+    aggregate_ops_per_sec = total_ops / (window_ns / 1e9) if window_ns > 0 else 0.0
+    
+    per_worker = []
+    for idx, w in enumerate(worker_results):
+        wall_ns = w["ended_ns"] - w["started_ns"]
+        per_worker.append({
+            "worker": idx,
+            "core": w["core"],
+            "pinned": w["pinned"],
+            "volume": w["volume"],
+            "seed": w["seed"],
+            "operations_completed": w["operations_completed"],
+            "wall_time_ms": wall_ns / 1e6,
+            "ops_per_sec": w["operations_completed"] / (wall_ns / 1e9) if wall_ns > 0 else 0.0,
+            "cpu_time_ms": w["metrics"].get("cpu_metrics", {}).get("cpu_time_ms", 0.0)
+        })
+    
+    single_worker_ops_per_sec = None
+    if reference is not None:
+        ref_ns = reference["ended_ns"] - reference["started_ns"]
+        single_worker_ops_per_sec = reference["operations_completed"] / (ref_ns / 1e9) if ref_ns > 0 else None
+    elif len(worker_results) == 1:
+        single_worker_ops_per_sec = aggregate_ops_per_sec
+    
+    speedup = aggregate_ops_per_sec / single_worker_ops_per_sec if single_worker_ops_per_sec else None
+    
+    # Aquecimento: pior cold start entre workers; regime estável só se todos atingiram
+    warmups = [m.get("warmup_metrics", {}) for m in worker_metrics]
+    cold_starts = [w["cold_start_latency_ms"] for w in warmups if w.get("cold_start_latency_ms") is not None]
+    steady_flags = [w["steady_state_reached"] for w in warmups if w.get("steady_state_reached") is not None]
+    warmup_metrics = {
+        "cold_start_latency_ms": max(cold_starts) if cold_starts else None,
+        "warmup_iterations": sum(w.get("warmup_iterations", 0) for w in warmups),
+        "warmup_time_ms": sum(w.get("warmup_time_ms", 0.0) for w in warmups),
+        "steady_state_reached": all(steady_flags) if steady_flags else None,
+        "final_cv": max((w["final_cv"] for w in warmups if w.get("final_cv") is not None), default=None)
+    }
+    
+    # Diagnóstico cProfile (opcional): overhead recalculado sobre a soma dos workers
+    diagnostics = [m["diagnostic_metrics"] for m in worker_metrics if m.get("diagnostic_metrics")]
+    diagnostic_metrics: Dict[str, Any] = {}
+    if diagnostics:
+        lean_ms = sum(d["lean_wall_time_ms"] for d in diagnostics)
+        traced_ms = sum(d["cprofile_wall_time_ms"] for d in diagnostics)
+        diagnostic_metrics = {
+            "cprofile": _sum_numeric([d.get("cprofile", {}) for d in diagnostics]),
+            "lean_wall_time_ms": lean_ms,
+            "cprofile_wall_time_ms": traced_ms,
+            "cprofile_overhead_ms": traced_ms - lean_ms,
+            "cprofile_overhead_pct": (traced_ms - lean_ms) / lean_ms * 100 if lean_ms > 0 else None
+        }
+    
+    # Contadores perf: cada worker mede o próprio processo; somas por evento
+    counter_sets = [m.get("counter_metrics", {}) for m in worker_metrics]
+    counts = _sum_numeric([c.get("counts", {}) for c in counter_sets])
+    unavailable: Dict[str, str] = {}
+    for c in counter_sets:
+        unavailable.update(c.get("unavailable", {}))
+    counter_metrics = {
+        "counts": counts,
+        **derive_counter_metrics(counts, total_ops),
+        "unavailable": unavailable
+    }
+    
+    # CPU por thread com prefixo do worker; núcleos são medidos pelo executor
+    thread_cpu_ms = {
+        f"w{idx}/{name}": ms
+        for idx, m in enumerate(worker_metrics)
+        for name, ms in m.get("cpu_distribution", {}).get("thread_cpu_ms", {}).items()
+    }
+    cpu_distribution = {
+        "sampler_backend": worker_metrics[0].get("cpu_distribution", {}).get("sampler_backend") if worker_metrics else None,
+        "per_core_utilization": [],
+        "busy_cores": 0,
+        "thread_cpu_ms": thread_cpu_ms
+    }
     
     return {
-        "cpu_time_avg_ms": cpu_time_avg,
-        "cpu_time_std_ms": cpu_time_std,
-        "memory_peak_mb": memory_peak,
-        "volumes": volumes,
-        "success_rate": success_rate,
-        "total_evaluations": len(evaluations),
-        "successful_evaluations": len(successful)
+        "result": {
+            "operations_completed": total_ops,
+            "phase_latencies_ns": phases,
+            "cells": cells
+        },
+        "metrics": {
+            "cpu_metrics": _sum_numeric([m.get("cpu_metrics", {}) for m in worker_metrics]),
+            "system_metrics": _sum_numeric([m.get("system_metrics", {}) for m in worker_metrics]),
+            "memory_metrics": memory_metrics,
+            "hardware_info": {},
+            "phase_metrics": summarize_phases(phases),
+            "throughput_metrics": summarize_throughput(
+                cells, cpu_freq_mhz,
+                measured_cycles=counts.get("cycles"),
+                measured_ns=sum(w["ended_ns"] - w["started_ns"] for w in worker_results)
+            ),
+            "warmup_metrics": warmup_metrics,
+            "diagnostic_metrics": diagnostic_metrics,
+            "counter_metrics": counter_metrics,
+            "cpu_distribution": cpu_distribution,
+            "parallel_metrics": {
+                "workers": len(worker_results),
+                "cores": sorted({w["core"] for w in worker_results if w["core"] is not None}),
+                "wall_time_ms": window_ns / 1e6,
+                "aggregate_ops_per_sec": aggregate_ops_per_sec,
+                "single_worker_ops_per_sec": single_worker_ops_per_sec,
+                "speedup": speedup,
+                "scaling_efficiency": speedup / len(worker_results) if speedup is not None else None,
+                "per_worker": per_worker
+            }
+        }
     }
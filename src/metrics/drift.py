@@ -0,0 +1,114 @@
+"""
+Estimativa e correção de deriva temporal entre repetições.
+
+Frequência de CPU, throttling térmico e ruído de fundo variam ao longo da
+execução. Com as repetições de cada volume espalhadas no tempo (ordem
+aleatória), a deriva é estimada por regressão com efeitos fixos por grupo:
+
+    log(valor_i) = a_volume + b * t_i
+
+onde t_i é o instante (s) em que a repetição começou. Só a variação dentro de
+cada volume entra em b, então o custo próprio do volume não se confunde com
+a deriva. A correção leva cada valor ao instante médio da execução:
+valor_i * exp(-b * (t_i - t_médio)).
+"""
+from math import exp, sqrt
+from typing import Dict, Any, Hashable, List, Sequence
+import numpy as np
+
+
+def estimate_drift(
+    offsets_s: Sequence[float],
+    groups: Sequence[Hashable],
+    values: Sequence[float]
+) -> Dict[str, Any]:
+    """
+    Estima a deriva multiplicativa de uma métrica ao longo do tempo.
+
+    Args:
+        offsets_s: Instante de cada amostra (s desde o início da série)
+        groups: Grupo de cada amostra (ex: volume)
+        values: Métrica de cada amostra (> 0; ex: cpu_time_ms)
+
+    Returns:
+        Dict com:
+            - identifiable: bool (False: nenhum grupo com 2+ amostras em instantes distintos)
+            - slope_per_s: float (b, variação de log(valor) por segundo)
+            - drift_pct_per_min: float (variação percentual por minuto)
+            - std_error: float | None (erro padrão de b)
+            - samples: int (amostras usadas)
+            - reference_offset_s: float (instante de referência da correção)
+            - factors: list[float] (multiplicador de correção de cada amostra)
+    """
+    t = np.asarray(offsets_s, dtype=np.float64)
+    y = np.asarray(values, dtype=np.float64)
+    valid = y > 0
+    reference = float(t.mean()) if t.size else 0.0
+
+    result = {
+        "identifiable": False,
+        "slope_per_s": 0.0,
+        "drift_pct_per_min": 0.0,
+        "std_error": None,
+        "samples": int(valid.sum()),
+        "reference_offset_s": reference,
+        "factors": [1.0] * t.size,
+    }
+
+    # Centraliza t e log(y) dentro de cada grupo (estimador within)
+    codes = {group: code for code, group in enumerate(dict.fromkeys(groups))}
+    labels = np.array([codes[g] for g in groups], dtype=np.int64)
+    t_dev = np.zeros_like(t)
+    y_dev = np.zeros_like(t)
+    informative = 0
+    group_count = 0
+    for label in np.unique(labels[valid]):
+        idx = np.nonzero((labels == label) & valid)[0]
+        group_count += 1
+        if idx.size < 2:
+            continue
+        informative += idx.size
+        t_dev[idx] = t[idx] - t[idx].mean()
+        y_dev[idx] = np.log(y[idx]) - np.log(y[idx]).mean()
+
+    sxx = float(np.dot(t_dev, t_dev))
+    if informative < 2 or sxx == 0:
+        return result
+
+    slope = float(np.dot(t_dev, y_dev)) / sxx
+    dof = int(valid.sum()) - group_count - 1
+    residuals = y_dev - slope * t_dev
+    std_error = sqrt(float(np.dot(residuals, residuals)) / dof / sxx) if dof > 0 else None
+
+    result.update({
+        "identifiable": True,
+        "slope_per_s": slope,
+        "drift_pct_per_min": (exp(slope * 60) - 1) * 100,
+        "std_error": std_error,
+        "factors": [exp(-slope * (offset - reference)) for offset in t.tolist()],
+    })
+    return result
+
+
+def corrected_medians(
+    groups: Sequence[Hashable],
+    values: Sequence[float],
+    factors: Sequence[float]
+) -> Dict[Hashable, Dict[str, Any]]:
+    """
+    Mediana por grupo antes e depois da correção de deriva.
+
+    Returns:
+        Dict grupo -> {count, median, corrected_median}
+    """
+    summary: Dict[Hashable, List[tuple]] = {}
+    for group, value, factor in zip(groups, values, factors):
+        summary.setdefault(group, []).append((value, value * factor))
+    return {
+        group: {
+            "count": len(pairs),
+            "median": float(np.median([raw for raw, _ in pairs])),
+            "corrected_median": float(np.median([corrected for _, corrected in pairs])),
+        }
+        for group, pairs in summary.items()
+    }
@@ -0,0 +1,219 @@
+"""
+Captura do ambiente de execução que afeta a comparabilidade das medições.
+
+Complementa o perfil de hardware (metrics.hardware) com o estado que muda
+entre hosts ou entre execuções no mesmo host: governador de frequência,
+turbo, SMT, núcleos isolados (isolcpus), topologia NUMA, build do quantCrypt
+(variantes PQClean empacotadas e tags do wheel) e hash dos pacotes
+instalados. A parte estática (pacotes, build, NUMA, isolcpus) é calculada
+uma vez por processo; governador, turbo e SMT são relidos do sysfs a cada
+captura (microssegundos), então dá para capturar a cada repetição.
+
+environment_hash resume os campos de ENVIRONMENT_FIELDS; avaliações com
+hashes diferentes não são diretamente comparáveis (ver environment_mismatches).
+"""
+from importlib import metadata, util
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+from logging import getLogger
+import hashlib
+import json
+import platform
+
+logger = getLogger(__name__)
+
+# Campos que entram no environment_hash e na detecção de divergências
+ENVIRONMENT_FIELDS = (
+    "cpu_governor", "turbo", "smt_active", "isolated_cpus", "numa_nodes", "quantcrypt_build", "package_hash"
+)
+
+# Parte estática memorizada por processo (raiz do sistema de arquivos -> campos)
+_STATIC: Dict[str, Dict[str, Any]] = {}
+
+
+def _read(path: Path) -> Optional[str]:
+    try:
+        return path.read_text().strip()
+    except OSError:
+        return None
+
+
+def parse_cpulist(text: Optional[str]) -> List[int]:
+    """Converte lista de CPUs do kernel ("0-3,8,10-11") em índices ordenados."""
+    cpus = set()
+    for part in (text or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        start, _, end = part.partition("-")
+        if not (start.isdigit() and (not end or end.isdigit())):
+            continue
+        cpus.update(range(int(start), int(end or start) + 1))
+    return sorted(cpus)
+
+
+def cpu_governors(root: Path = Path("/")) -> Dict[str, List[int]]:
+    """Governador de frequência -> CPUs que o usam (vazio sem cpufreq, ex: VMs)."""
+    governors: Dict[str, List[int]] = {}
+    for path in (root / "sys/devices/system/cpu").glob("cpu[0-9]*/cpufreq/scaling_governor"):
+        governor = _read(path)
+        if governor:
+            governors.setdefault(governor, []).append(int(path.parent.parent.name[3:]))
+    return {governor: sorted(cpus) for governor, cpus in sorted(governors.items())}
+
+
+def turbo_state(root: Path = Path("/")) -> Optional[bool]:
+    """Turbo/boost habilitado (intel_pstate/no_turbo ou cpufreq/boost); None se não exposto."""
+    no_turbo = _read(root / "sys/devices/system/cpu/intel_pstate/no_turbo")
+    if no_turbo in ("0", "1"):
+        return no_turbo == "0"
+    boost = _read(root / "sys/devices/system/cpu/cpufreq/boost")
+    if boost in ("0", "1"):
+        return boost == "1"
+    return None
+
+
+def smt_state(root: Path = Path("/")) -> Dict[str, Any]:
+    """SMT (hyper-threading): active (bool | None) e control ("on", "off", "notsupported", ...)."""
+    active = _read(root / "sys/devices/system/cpu/smt/active")
+    return {
+        "active": active == "1" if active in ("0", "1") else None,
+        "control": _read(root / "sys/devices/system/cpu/smt/control"),
+    }
+
+
+def isolated_cpus(root: Path = Path("/")) -> List[int]:
+    """Núcleos isolados do escalonador (sysfs 'isolated' ou isolcpus= na linha de comando do kernel)."""
+    isolated = parse_cpulist(_read(root / "sys/devices/system/cpu/isolated"))
+    if isolated:
+        return isolated
+    for arg in (_read(root / "proc/cmdline") or "").split():
+        if arg.startswith("isolcpus="):
+            # Flags opcionais antes da lista: isolcpus=nohz,domain,2-3
+            cpus = [part for part in arg.split("=", 1)[1].split(",") if part[:1].isdigit()]
+            return parse_cpulist(",".join(cpus))
+    return []
+
+
+def numa_nodes(root: Path = Path("/")) -> Dict[str, List[int]]:
+    """Nó NUMA -> CPUs (vazio se o kernel não expõe /sys/devices/system/node)."""
+    nodes = {}
+    for path in (root / "sys/devices/system/node").glob("node[0-9]*/cpulist"):
+        nodes[path.parent.name] = parse_cpulist(_read(path))
+    return dict(sorted(nodes.items(), key=lambda item: int(item[0][4:])))
+
+
+def quantcrypt_build() -> Dict[str, Any]:
+    """
+    Build instalado do quantCrypt sem importá-lo.
+
+    Returns:
+        Dict com version, wheel_tags, variants (binários PQClean empacotados:
+        clean, avx2, aarch64) e expected_variant (escolhida automaticamente
+        pelo quantCrypt nesta arquitetura)
+    """
+    try:
+        dist = metadata.distribution("quantcrypt")
+    except metadata.PackageNotFoundError:
+        return {"version": None, "wheel_tags": [], "variants": [], "expected_variant": None}
+
+    wheel = dist.read_text("WHEEL") or ""
+    tags = [line.split(":", 1)[1].strip() for line in wheel.splitlines() if line.startswith("Tag:")]
+
+    variants = set()
+    spec = util.find_spec("quantcrypt")
+    if spec is not None and spec.origin:
+        for binary in (Path(spec.origin).parent / "internal" / "bin").glob("*.*"):
+            if binary.suffix in (".so", ".pyd"):
+                variants.add(binary.name.split(".")[0].rsplit("_", 1)[-1])
+
+    machine = platform.machine().lower()
+    expected = "aarch64" if machine in ("arm64", "aarch64") else "avx2" if machine in ("x86_64", "amd64") else "clean"
+    return {
+        "version": dist.version,
+        "wheel_tags": tags,
+        "variants": sorted(variants),
+        "expected_variant": expected,
+    }
+
+
+def installed_packages() -> Dict[str, str]:
+    """Distribuições instaladas (nome -> versão), ordenadas por nome."""
+    packages = {}
+    for dist in metadata.distributions():
+        name = dist.metadata["Name"]
+        if name:
+            packages[name] = dist.version
+    return dict(sorted(packages.items(), key=lambda item: item[0].lower()))
+
+
+def package_hash(packages: Dict[str, str]) -> str:
+    """SHA-256 (16 hex) das linhas "nome==versão" ordenadas."""
+    lines = "\n".join(f"{name.lower()}=={version}" for name, version in sorted(packages.items(), key=lambda i: i[0].lower()))
+    return hashlib.sha256(lines.encode()).hexdigest()[:16]
+
+
+def environment_hash(environment: Dict[str, Any]) -> str:
+    """Hash estável dos campos de ENVIRONMENT_FIELDS."""
+    key = {field: environment.get(field) for field in ENVIRONMENT_FIELDS}
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def capture_environment(refresh: bool = False, root: Path = Path("/")) -> Dict[str, Any]:
+    """
+    Captura o ambiente de execução (parte estática memorizada por processo).
+
+    Args:
+        refresh: Recalcula também a parte estática (pacotes, build, NUMA, isolcpus)
+        root: Raiz do sistema de arquivos para /sys e /proc (testes)
+
+    Returns:
+        Dict com:
+            - cpu_governor: str | None (único governador, "mixed" ou None sem cpufreq)
+            - governors: dict governador -> list[int] (CPUs)
+            - turbo: bool | None
+            - smt_active: bool | None
+            - smt_control: str | None
+            - isolated_cpus: list[int]
+            - numa_nodes: dict nó -> list[int]
+            - quantcrypt_build: dict (ver quantcrypt_build)
+            - package_count: int
+            - package_hash: str
+            - environment_hash: str
+    """
+    memo_key = str(root)
+    static = None if refresh else _STATIC.get(memo_key)
+    if static is None:
+        packages = installed_packages()
+        static = {
+            "isolated_cpus": isolated_cpus(root),
+            "numa_nodes": numa_nodes(root),
+            "quantcrypt_build": quantcrypt_build(),
+            "package_count": len(packages),
+            "package_hash": package_hash(packages),
+        }
+        _STATIC[memo_key] = static
+
+    governors = cpu_governors(root)
+    smt = smt_state(root)
+    environment = {
+        "cpu_governor": (next(iter(governors)) if len(governors) == 1 else "mixed") if governors else None,
+        "governors": governors,
+        "turbo": turbo_state(root),
+        "smt_active": smt["active"],
+        "smt_control": smt["control"],
+        **static,
+    }
+    environment["environment_hash"] = environment_hash(environment)
+    return environment
+
+
+def environment_mismatches(reference: Dict[str, Any], other: Dict[str, Any]) -> List[str]:
+    """
+    Campos de ENVIRONMENT_FIELDS que diferem entre dois ambientes.
+
+    Ambientes ausentes (avaliações antigas, sem captura) não geram divergência.
+    """
+    if not reference or not other:
+        return []
+    return [field for field in ENVIRONMENT_FIELDS if reference.get(field) != other.get(field)]
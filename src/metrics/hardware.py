@@ -1,18 +1,129 @@
 """
 Snapshot de informações de hardware usando py-cpuinfo.
+
+get_cpu_info() pode levar centenas de ms (inclusive abrindo subprocessos), e
+cada ProfilerManager tirava um snapshot novo. O perfil agora é calculado uma
+vez por host e persistido em HARDWARE_CACHE_PATH, junto com a chave que o
+invalida: host, boot id, versão do kernel, arquitetura, modelo da CPU e
+versão do quantCrypt (todas baratas de ler). O host entra na chave porque
+hardware_profile_id depende dele e o cache fica no checkout, que pode ser
+compartilhado ou copiado entre máquinas. Dentro do processo o perfil fica memorizado; só a
+frequência atual é lida a cada snapshot.
 """
 from psutil import cpu_count, cpu_freq, virtual_memory
-from cpuinfo import get_cpu_info
-from typing import Dict, Any
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, Any, Optional
 from logging import getLogger
+import hashlib
+import json
+import platform
+
+from config import HARDWARE_CACHE_PATH
 
 logger = getLogger(__name__)
 
+# Perfis já carregados neste processo (caminho do cache -> perfil)
+_PROFILES: Dict[str, Dict[str, Any]] = {}
+
+
+def quantcrypt_version() -> Optional[str]:
+    """Versão instalada do quantCrypt (None se não instalado)."""
+    try:
+        return metadata.version("quantcrypt")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def hardware_profile_id(hardware_profile: Dict[str, Any], host: Optional[str] = None) -> str:
+    """Hash estável do host + arquitetura/CPU (data-model: HardwareProfile.id)."""
+    key = {
+        "host": host or platform.node(),
+        "architecture": hardware_profile.get("cpu_arch"),
+        "cpu_brand": hardware_profile.get("cpu_brand"),
+        "cores_physical": hardware_profile.get("cpu_cores"),
+        "cores_logical": hardware_profile.get("cpu_threads"),
+    }
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def cpu_model() -> str:
+    """Modelo da CPU lido de /proc/cpuinfo (sem py-cpuinfo); fallback platform.processor()."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith(("model name", "Hardware", "cpu model")):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or "Unknown"
+
+
+def boot_id() -> Optional[str]:
+    """Identificador do boot atual (/proc/sys/kernel/random/boot_id); None fora do Linux."""
+    try:
+        with open("/proc/sys/kernel/random/boot_id") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def cache_key() -> Dict[str, Any]:
+    """Chave de invalidação do perfil em cache: host, boot, kernel, CPU e versão do quantCrypt."""
+    return {
+        "host": platform.node(),
+        "boot_id": boot_id(),
+        "kernel": platform.release(),
+        "machine": platform.machine(),
+        "cpu_model": cpu_model(),
+        "quantcrypt_version": quantcrypt_version(),
+    }
+
+
 class Hardware:
-    def snapshot_hardware(self) -> Dict[str, Any]:
+    def __init__(self, cache_path: Optional[Path] = None) -> None:
+        """
+        Args:
+            cache_path: Arquivo JSON do perfil em cache (default: HARDWARE_CACHE_PATH)
         """
-        Captura informações de hardware do sistema.
-        
+        self.cache_path = Path(cache_path) if cache_path is not None else HARDWARE_CACHE_PATH
+
+    def snapshot_hardware(self, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Retorna o perfil de hardware do host (memorizado e em cache no disco).
+
+        Args:
+            refresh: Ignora caches e coleta de novo com py-cpuinfo
+
+        Returns:
+            Dict com os campos de collect_hardware e cpu_freq_mhz atual
+        """
+        memo_key = str(self.cache_path)
+        profile = None if refresh else _PROFILES.get(memo_key)
+
+        if profile is None:
+            key = cache_key()
+            profile = None if refresh else self._load_cache(key)
+            if profile is None:
+                profile = self.collect_hardware(key)
+                if not profile["warning_logged"]:
+                    self._save_cache(key, profile)
+            if not profile["warning_logged"]:
+                _PROFILES[memo_key] = profile
+
+        snapshot = dict(profile)
+        if not snapshot["warning_logged"]:
+            freq = cpu_freq()
+            snapshot["cpu_freq_mhz"] = freq.current if freq else 0.0
+        return snapshot
+
+    def collect_hardware(self, key: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Captura informações de hardware do sistema (py-cpuinfo; lento).
+
+        Args:
+            key: Chave de cache (default: cache_key()); kernel e versão do quantCrypt vêm dela
+
         Returns:
             Dict com:
                 - cpu_brand: str
@@ -20,32 +131,46 @@ class Hardware:
                 - cpu_cores: int (físicos)
                 - cpu_threads: int (lógicos)
                 - cpu_freq_mhz: float (atual)
+                - max_freq_mhz: float | None
                 - ram_total_gb: float
                 - platform: str (OS)
-                
+                - kernel: str
+                - os_name: str
+                - quantcrypt_version: str | None
+                - hardware_profile_id: str (hash estável do host + CPU)
+
         Nota: Se coleta falhar, retorna dict com campos None e warning_logged=True
         """
+        key = key or cache_key()
         try:
+            from cpuinfo import get_cpu_info  # ~10 ms de import; a chamada pode levar centenas de ms
+
             cpu_info = get_cpu_info()
-            
+            freq = cpu_freq()
+
             hw_info = {
                 "cpu_brand": cpu_info.get("brand_raw", "Unknown"),
                 "cpu_arch": cpu_info.get("arch", "Unknown"),
                 "cpu_cores": cpu_count(logical=False) or 0,
                 "cpu_threads": cpu_count(logical=True) or 0,
-                "cpu_freq_mhz": cpu_freq().current if cpu_freq() else 0.0,
+                "cpu_freq_mhz": freq.current if freq else 0.0,
+                "max_freq_mhz": (freq.max or None) if freq else None,
                 "ram_total_gb": virtual_memory().total / (1024**3),
                 "platform": cpu_info.get("python_version", "Unknown"),
+                "kernel": key["kernel"],
+                "os_name": platform.system(),
+                "quantcrypt_version": key["quantcrypt_version"],
                 "warning_logged": False
             }
-            
+            hw_info["hardware_profile_id"] = hardware_profile_id(hw_info)
+
             logger.info(f"action=hardware_snapshot status=success cpu_brand={hw_info['cpu_brand']} cores={hw_info['cpu_cores']}")
             return hw_info
-            
+
         except Exception as e:
             # Fallback: retorna estrutura com Nones
             logger.warning(f"action=hardware_snapshot status=failed error={str(e)} fallback=partial_data")
-            
+
             return {
                 "cpu_brand": None,
                 "cpu_arch": None,
@@ -57,3 +182,25 @@ class Hardware:
                 "warning_logged": True,
                 "error": str(e)
             }
+
+    def _load_cache(self, key: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Perfil do arquivo de cache se a chave ainda confere; None se ausente, inválido ou obsoleto."""
+        if not self.cache_path.exists():
+            return None
+        try:
+            cached = json.loads(self.cache_path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning(f"action=hardware_cache status=unreadable path={self.cache_path} error={e}")
+            return None
+        if cached.get("key") != key:
+            logger.info(f"action=hardware_cache status=stale path={self.cache_path}")
+            return None
+        logger.info(f"action=hardware_cache status=hit id={cached['profile'].get('hardware_profile_id')}")
+        return cached["profile"]
+
+    def _save_cache(self, key: Dict[str, Any], profile: Dict[str, Any]) -> None:
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_path.write_text(json.dumps({"key": key, "profile": profile}, indent=2))
+        except OSError as e:
+            logger.warning(f"action=hardware_cache status=write_failed path={self.cache_path} error={e}")
@@ -0,0 +1,252 @@
+"""
+Histograma de latências com buckets log-lineares (estilo HdrHistogram).
+
+Cada potência de 2 é dividida em 2**sub_bucket_bits buckets lineares, então
+o erro relativo de qualquer valor registrado é limitado a 1/2**sub_bucket_bits
+(0,8% com o padrão de 7 bits) independentemente da magnitude. Valores abaixo
+de 2**(sub_bucket_bits + 1) ns ficam em buckets exatos. A memória é fixa
+(~31 KB por fase com o limite padrão de ~68 s por operação), o registro é
+O(1) e histogramas com o mesmo layout são somados bucket a bucket — entre
+workers, repetições ou hosts (via to_dict/from_dict).
+"""
+from array import array
+from math import ceil, sqrt
+from typing import Dict, Any, Iterable, Optional, Sequence, Tuple, Union
+import numpy as np
+
+SUB_BUCKET_BITS = 7
+HIGHEST_TRACKABLE_NS = 2 ** 36  # ~68,7 s por operação; acima disso satura no último bucket
+
+
+class LatencyHistogram:
+    """Histograma de latências por operação em nanossegundos.
+
+    Uso típico:
+        hist = LatencyHistogram()
+        for _ in range(volume):
+            t0 = perf_counter_ns(); op(); hist.record(perf_counter_ns() - t0)
+        hist.percentiles((50, 99))
+    """
+
+    def __init__(self, sub_bucket_bits: int = SUB_BUCKET_BITS, highest_trackable_ns: int = HIGHEST_TRACKABLE_NS):
+        if sub_bucket_bits < 1:
+            raise ValueError(f"sub_bucket_bits must be at least 1, got {sub_bucket_bits}")
+        if highest_trackable_ns < 2 ** (sub_bucket_bits + 1):
+            raise ValueError(f"highest_trackable_ns must be at least {2 ** (sub_bucket_bits + 1)}, got {highest_trackable_ns}")
+        self.sub_bucket_bits = sub_bucket_bits
+        self.highest_trackable_ns = highest_trackable_ns
+        self._mantissa_bits = sub_bucket_bits + 1
+        self._linear_limit = 1 << self._mantissa_bits
+        self._last_bucket = self._index(highest_trackable_ns)
+        self._counts = array('q', [0]) * (self._last_bucket + 1)
+
+        self.count = 0
+        self.total_ns = 0
+        self.sum_squares = 0.0
+        self.min_ns: Optional[int] = None
+        self.max_ns: Optional[int] = None
+
+    def _index(self, value_ns: int) -> int:
+        if value_ns < self._linear_limit:
+            return value_ns if value_ns > 0 else 0
+        shift = value_ns.bit_length() - self._mantissa_bits
+        return (shift << self.sub_bucket_bits) + (value_ns >> shift)
+
+    def record(self, value_ns: int) -> None:
+        """Registra uma latência (ns) em O(1)."""
+        if value_ns < self._linear_limit:
+            idx = value_ns if value_ns > 0 else 0
+        else:
+            shift = value_ns.bit_length() - self._mantissa_bits
+            idx = (shift << self.sub_bucket_bits) + (value_ns >> shift)
+            if idx > self._last_bucket:
+                idx = self._last_bucket
+        self._counts[idx] += 1
+        self.count += 1
+        self.total_ns += value_ns
+        self.sum_squares += value_ns * value_ns
+        if self.min_ns is None or value_ns < self.min_ns:
+            self.min_ns = value_ns
+        if self.max_ns is None or value_ns > self.max_ns:
+            self.max_ns = value_ns
+
+    def record_many(self, values_ns: Union[Sequence[int], np.ndarray]) -> None:
+        """Registra uma série de latências (vetorizado)."""
+        values = np.asarray(values_ns, dtype=np.int64)
+        if values.size == 0:
+            return
+        clipped = np.clip(values, 0, self.highest_trackable_ns)
+        # Índice log-linear: bit_length via log2 exato para inteiros < 2**53
+        bit_length = np.zeros(clipped.shape, dtype=np.int64)
+        nonzero = clipped > 0
+        bit_length[nonzero] = np.floor(np.log2(clipped[nonzero])).astype(np.int64) + 1
+        shift = np.maximum(bit_length - self._mantissa_bits, 0)
+        idx = np.where(clipped < self._linear_limit, clipped, (shift << self.sub_bucket_bits) + (clipped >> shift))
+        idx = np.minimum(idx, self._last_bucket)
+        self._view()[:] += np.bincount(idx, minlength=self._last_bucket + 1)
+
+        self.count += int(values.size)
+        self.total_ns += int(values.sum())
+        as_float = values.astype(np.float64)
+        self.sum_squares += float(np.dot(as_float, as_float))
+        low, high = int(values.min()), int(values.max())
+        self.min_ns = low if self.min_ns is None else min(self.min_ns, low)
+        self.max_ns = high if self.max_ns is None else max(self.max_ns, high)
+
+    @classmethod
+    def from_samples(cls, values_ns: Union[Sequence[int], np.ndarray], **kwargs) -> "LatencyHistogram":
+        """Cria um histograma a partir de uma série de latências em ns."""
+        hist = cls(**kwargs)
+        hist.record_many(values_ns)
+        return hist
+
+    def _view(self) -> np.ndarray:
+        return np.frombuffer(self._counts, dtype=np.int64)
+
+    def _check_layout(self, other: "LatencyHistogram") -> None:
+        if (other.sub_bucket_bits, other.highest_trackable_ns) != (self.sub_bucket_bits, self.highest_trackable_ns):
+            raise ValueError(
+                "cannot merge histograms with different layouts: "
+                f"({self.sub_bucket_bits}, {self.highest_trackable_ns}) != "
+                f"({other.sub_bucket_bits}, {other.highest_trackable_ns})"
+            )
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Soma outro histograma (mesmo layout) a este, in-place. Retorna self."""
+        self._check_layout(other)
+        if other.count == 0:
+            return self
+        self._view()[:] += other._view()
+        self.count += other.count
+        self.total_ns += other.total_ns
+        self.sum_squares += other.sum_squares
+        self.min_ns = other.min_ns if self.min_ns is None else min(self.min_ns, other.min_ns)
+        self.max_ns = other.max_ns if self.max_ns is None else max(self.max_ns, other.max_ns)
+        return self
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return f"LatencyHistogram(count={self.count}, min_ns={self.min_ns}, max_ns={self.max_ns})"
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count else 0.0
+
+    @property
+    def std_ns(self) -> float:
+        """Desvio padrão amostral (a partir da soma e da soma dos quadrados)."""
+        if self.count < 2:
+            return 0.0
+        variance = (self.sum_squares - self.total_ns * self.total_ns / self.count) / (self.count - 1)
+        return sqrt(max(variance, 0.0))
+
+    def buckets(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Buckets não vazios.
+
+        Returns:
+            tuple: (valor representativo em ns (ponto médio), contagem)
+        """
+        counts = self._view()
+        idx = np.nonzero(counts)[0]
+        return self._midpoints(idx), counts[idx].copy()
+
+    def _midpoints(self, idx: np.ndarray) -> np.ndarray:
+        idx = np.asarray(idx, dtype=np.int64)
+        shift = np.maximum((idx >> self.sub_bucket_bits) - 1, 0)
+        low = np.where(idx < self._linear_limit, idx, (idx - (shift << self.sub_bucket_bits)) << shift)
+        width = np.where(idx < self._linear_limit, 1, 1 << shift)
+        return low + (width - 1) / 2
+
+    def percentiles(self, percentiles: Iterable[float]) -> Dict[float, float]:
+        """
+        Valores (ns) nos percentis pedidos, limitados a [min_ns, max_ns].
+
+        Args:
+            percentiles: Percentis em 0-100
+
+        Returns:
+            Dict percentil -> valor em ns (0.0 se vazio)
+        """
+        percentiles = list(percentiles)
+        if self.count == 0:
+            return {p: 0.0 for p in percentiles}
+        cumulative = np.cumsum(self._view())
+        ranks = [max(1, ceil(p / 100 * self.count)) for p in percentiles]
+        idx = np.searchsorted(cumulative, ranks)
+        values = np.clip(self._midpoints(idx), self.min_ns, self.max_ns)
+        return {p: float(v) for p, v in zip(percentiles, values)}
+
+    def describe(self, unit_ns: float = 1.0) -> Dict[str, Any]:
+        """
+        Estatística descritiva no formato de stats.describe.
+
+        Args:
+            unit_ns: Divisor das grandezas (1e3 para µs, 1e6 para ms)
+
+        Returns:
+            Dict com count, mean, median, std, min, max, p50, p90, p99, p99_9
+        """
+        if self.count == 0:
+            return {"count": 0}
+        p = self.percentiles((50.0, 90.0, 99.0, 99.9))
+        return {
+            "count": self.count,
+            "mean": self.mean_ns / unit_ns,
+            "median": p[50.0] / unit_ns,
+            "std": self.std_ns / unit_ns,
+            "min": self.min_ns / unit_ns,
+            "max": self.max_ns / unit_ns,
+            "p50": p[50.0] / unit_ns,
+            "p90": p[90.0] / unit_ns,
+            "p99": p[99.0] / unit_ns,
+            "p99_9": p[99.9] / unit_ns,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Representação serializável (JSON) com buckets esparsos."""
+        counts = self._view()
+        idx = np.nonzero(counts)[0]
+        return {
+            "sub_bucket_bits": self.sub_bucket_bits,
+            "highest_trackable_ns": self.highest_trackable_ns,
+            "count": self.count,
+            "total_ns": self.total_ns,
+            "sum_squares": self.sum_squares,
+            "min_ns": self.min_ns,
+            "max_ns": self.max_ns,
+            "bucket_index": idx.tolist(),
+            "bucket_count": counts[idx].tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        """Reconstrói um histograma de to_dict (ex: resultado de outro host)."""
+        hist = cls(data["sub_bucket_bits"], data["highest_trackable_ns"])
+        view = hist._view()
+        view[np.asarray(data["bucket_index"], dtype=np.int64)] = data["bucket_count"]
+        hist.count = data["count"]
+        hist.total_ns = data["total_ns"]
+        hist.sum_squares = data["sum_squares"]
+        hist.min_ns = data["min_ns"]
+        hist.max_ns = data["max_ns"]
+        return hist
+
+
+def as_histogram(latencies: Union[LatencyHistogram, Dict[str, Any], Sequence[int], None]) -> LatencyHistogram:
+    """Normaliza histograma, dict serializado ou série de latências (ns) em LatencyHistogram."""
+    if isinstance(latencies, LatencyHistogram):
+        return latencies
+    if isinstance(latencies, dict):
+        return LatencyHistogram.from_dict(latencies)
+    return LatencyHistogram.from_samples(latencies if latencies is not None else [])
+
+
+def merge_histograms(histograms: Iterable[Union[LatencyHistogram, Dict[str, Any], Sequence[int]]]) -> LatencyHistogram:
+    """Soma histogramas (ou séries) em um novo histograma, sem alterar as entradas."""
+    merged = LatencyHistogram()
+    for hist in histograms:
+        merged.merge(as_histogram(hist))
+    return merged
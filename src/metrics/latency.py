@@ -0,0 +1,124 @@
+"""
+Resumo de latências por operação (histogramas ou séries em nanossegundos).
+"""
+from typing import Dict, Any, List, Mapping, Optional, Sequence, Union
+from metrics.histogram import LatencyHistogram, as_histogram
+
+
+def summarize_latencies(latencies_ns: Union[LatencyHistogram, Sequence[int]]) -> Dict[str, Any]:
+    """
+    Resume as latências por operação de uma fase.
+    
+    Args:
+        latencies_ns: LatencyHistogram, dict serializado (to_dict) ou série
+            de latências em nanossegundos (array('q'), lista ou ndarray)
+            
+    Returns:
+        Dict com:
+            - count: int
+            - total_ms: float (soma das latências)
+            - ops_per_sec: float
+            - mean_us, min_us, p50_us, p90_us, p99_us, p99_9_us, max_us: float
+              (percentis do histograma, erro relativo < 1%)
+    """
+    hist = as_histogram(latencies_ns)
+    
+    if hist.count == 0:
+        return {
+            "count": 0,
+            "total_ms": 0.0,
+            "ops_per_sec": 0.0,
+            "mean_us": 0.0,
+            "min_us": 0.0,
+            "p50_us": 0.0,
+            "p90_us": 0.0,
+            "p99_us": 0.0,
+            "p99_9_us": 0.0,
+            "max_us": 0.0
+        }
+    
+    total_ns = hist.total_ns
+    percentiles = hist.percentiles((50.0, 90.0, 99.0, 99.9))
+    
+    return {
+        "count": hist.count,
+        "total_ms": total_ns / 1e6,
+        "ops_per_sec": hist.count / (total_ns / 1e9) if total_ns > 0 else 0.0,
+        "mean_us": hist.mean_ns / 1e3,
+        "min_us": hist.min_ns / 1e3,
+        "p50_us": percentiles[50.0] / 1e3,
+        "p90_us": percentiles[90.0] / 1e3,
+        "p99_us": percentiles[99.0] / 1e3,
+        "p99_9_us": percentiles[99.9] / 1e3,
+        "max_us": hist.max_ns / 1e3
+    }
+
+
+def summarize_phases(phase_latencies_ns: Mapping[str, Union[LatencyHistogram, Sequence[int]]] | None) -> Dict[str, Dict[str, Any]]:
+    """
+    Resume latências de cada fase de um algoritmo (ex: keygen, encaps, decaps).
+    
+    Args:
+        phase_latencies_ns: Dict fase -> histograma ou série de latências em ns
+        
+    Returns:
+        Dict fase -> resumo (ver summarize_latencies), preservando a ordem das fases
+    """
+    if not phase_latencies_ns:
+        return {}
+    return {phase: summarize_latencies(series) for phase, series in phase_latencies_ns.items()}
+
+
+def summarize_throughput(
+    cells: Sequence[Mapping[str, Any]] | None,
+    cpu_freq_mhz: Optional[float] = None,
+    measured_cycles: Optional[int] = None,
+    measured_ns: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """
+    Calcula throughput (MB/s) e ciclos por byte para cada célula de payload.
+    
+    Com a contagem de ciclos do perf (counter_metrics) os ciclos de cada
+    fase são tempo * frequência efetiva medida (ciclos / duração da passada);
+    sem ela, tempo * frequência nominal da CPU, marcado com
+    cycles_estimated=True. Sem nenhuma das duas, cycles_per_byte fica None.
+    
+    Args:
+        cells: Lista de células com payload_bytes, messages, mode,
+            encrypt_ns e decrypt_ns
+        cpu_freq_mhz: Frequência da CPU em MHz (hardware_info)
+        measured_cycles: Ciclos contados pelo perf na passada medida
+        measured_ns: Duração da passada em que measured_cycles foi contado
+        
+    Returns:
+        Lista de dicts com:
+            - payload_bytes, messages, mode
+            - encrypt_mb_s, decrypt_mb_s: float
+            - encrypt_cycles_per_byte, decrypt_cycles_per_byte: float | None
+            - cycles_estimated: bool (True: tempo x frequência nominal)
+    """
+    if measured_cycles and measured_ns:
+        cycles_per_ns, cycles_estimated = measured_cycles / measured_ns, False
+    elif cpu_freq_mhz:
+        cycles_per_ns, cycles_estimated = cpu_freq_mhz / 1e3, True
+    else:
+        cycles_per_ns, cycles_estimated = None, False
+    
+    rows = []
+    for cell in cells or []:
+        total_bytes = cell["payload_bytes"] * cell["messages"]
+        row = {
+            "payload_bytes": cell["payload_bytes"],
+            "messages": cell["messages"],
+            "mode": cell.get("mode", ""),
+            "cycles_estimated": cycles_estimated
+        }
+        for phase in ("encrypt", "decrypt"):
+            elapsed_ns = cell.get(f"{phase}_ns", 0)
+            row[f"{phase}_mb_s"] = (total_bytes / 1e6) / (elapsed_ns / 1e9) if elapsed_ns > 0 else 0.0
+            row[f"{phase}_cycles_per_byte"] = (
+                elapsed_ns * cycles_per_ns / total_bytes
+                if cycles_per_ns and total_bytes > 0 else None
+            )
+        rows.append(row)
+    return rows
@@ -0,0 +1,122 @@
+"""
+Métricas normalizadas para comparação entre algoritmos (modo matriz).
+
+Cada avaliação é reduzida a grandezas por operação, comparáveis entre
+KEM, DSS e Krypton: ops/s de CPU, bytes/op (pico do heap Python via
+tracemalloc dividido pelas operações) e ciclos/op (contador de hardware
+quando disponível; senão estimado por tempo de CPU x frequência nominal).
+"""
+from statistics import mean
+from typing import Dict, Any, List, Optional
+
+
+def operations(evaluation: Dict[str, Any]) -> int:
+    """Operações medidas: maior contagem entre fases (Krypton: mensagens x payloads) ou volume."""
+    counts = [stats.get("count", 0) for stats in (evaluation.get("phase_metrics") or {}).values()]
+    volume = evaluation.get("volume")
+    return max(counts, default=0) or (volume if isinstance(volume, int) else 0)
+
+
+def efficiency_metrics(evaluation: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Grandezas por operação de uma avaliação bem-sucedida.
+
+    Returns:
+        Dict com:
+            - operations: int
+            - ops_per_sec: float | None (operações / segundo de CPU)
+            - bytes_per_op: float | None
+            - cycles_per_op: float | None
+            - cycles_estimated: bool (True: tempo de CPU x frequência)
+    """
+    metrics = evaluation.get("metrics") or {}
+    ops = operations(evaluation)
+    cpu_time_ms = metrics.get("cpu_time_ms") or 0.0
+    python_peak_mb = (evaluation.get("memory_metrics") or {}).get("python_peak_mb")
+
+    cycles_per_op = ((evaluation.get("counter_metrics") or {}).get("per_op") or {}).get("cycles")
+    cycles_estimated = False
+    if cycles_per_op is None and ops:
+        if metrics.get("cpu_cycles"):
+            cycles_per_op = metrics["cpu_cycles"] / ops
+        else:
+            freq_mhz = (evaluation.get("hardware_profile") or {}).get("cpu_freq_mhz")
+            if freq_mhz and cpu_time_ms:
+                cycles_per_op = cpu_time_ms / 1e3 * freq_mhz * 1e6 / ops
+                cycles_estimated = True
+
+    return {
+        "operations": ops,
+        "ops_per_sec": ops / (cpu_time_ms / 1e3) if ops and cpu_time_ms else None,
+        "bytes_per_op": python_peak_mb * 1024 * 1024 / ops if ops and python_peak_mb is not None else None,
+        "cycles_per_op": cycles_per_op,
+        "cycles_estimated": cycles_estimated,
+    }
+
+
+def _mean_or_none(values: List[Optional[float]]) -> Optional[float]:
+    values = [v for v in values if v is not None]
+    return mean(values) if values else None
+
+
+def summarize_matrix(
+    evaluations: List[Dict[str, Any]],
+    algorithms: List[str],
+    volumes: List[int]
+) -> Dict[str, Any]:
+    """
+    Consolida avaliações algoritmo x volume (média entre rodadas).
+
+    ops/s normalizado = ops/s do algoritmo / maior ops/s no mesmo volume.
+
+    Returns:
+        Dict com:
+            - cells: dict algoritmo -> volume -> {ops_per_sec, ops_per_sec_normalized,
+              bytes_per_op, cycles_per_op, cycles_estimated, rounds, failed}
+            - phases: dict algoritmo -> phase_metrics da última avaliação bem-sucedida
+              no maior volume
+    """
+    cells: Dict[str, Dict[int, Dict[str, Any]]] = {}
+    phases: Dict[str, Dict[str, Any]] = {}
+    for algorithm in algorithms:
+        cells[algorithm] = {}
+        for volume in volumes:
+            group = [e for e in evaluations if e.get("algorithm") == algorithm and e.get("volume") == volume]
+            successful = [e for e in group if e.get("status") == "success"]
+            rates = [efficiency_metrics(e) for e in successful]
+            cells[algorithm][volume] = {
+                "ops_per_sec": _mean_or_none([r["ops_per_sec"] for r in rates]),
+                "bytes_per_op": _mean_or_none([r["bytes_per_op"] for r in rates]),
+                "cycles_per_op": _mean_or_none([r["cycles_per_op"] for r in rates]),
+                "cycles_estimated": any(r["cycles_estimated"] for r in rates),
+                "rounds": len(successful),
+                "failed": len(group) - len(successful),
+            }
+            if successful and volume == max(volumes):
+                phases[algorithm] = successful[-1].get("phase_metrics") or {}
+
+    for volume in volumes:
+        best = max((cells[a][volume]["ops_per_sec"] or 0.0 for a in algorithms), default=0.0)
+        for algorithm in algorithms:
+            ops = cells[algorithm][volume]["ops_per_sec"]
+            cells[algorithm][volume]["ops_per_sec_normalized"] = ops / best if ops and best else None
+
+    return {"cells": cells, "phases": phases}
+
+
+def interleaved_order(algorithms: List[str], volumes: List[int], rounds: int = 1) -> List[tuple]:
+    """
+    Ordem de execução (rodada, volume, algoritmo) com rotação dos algoritmos.
+
+    Em cada bloco (rodada, volume) todos os algoritmos rodam em sequência e o
+    primeiro da fila avança a cada bloco (A B C, B C A, C A B, ...): a deriva
+    térmica se distribui entre os algoritmos em vez de penalizar sempre o último.
+    """
+    order = []
+    block = 0
+    for round_idx in range(rounds):
+        for volume in volumes:
+            shift = block % len(algorithms)
+            order.extend((round_idx, volume, algorithm) for algorithm in algorithms[shift:] + algorithms[:shift])
+            block += 1
+    return order
@@ -0,0 +1,278 @@
+"""
+Contadores de hardware via perf_event_open (Linux) usando ctypes.
+
+Abre ciclos, instruções, referências/falhas de cache, falhas de branch e
+trocas de contexto como um único grupo (agendados juntos pelo kernel) para
+a thread chamadora, com inherit=1 para incluir threads e processos filhos
+criados durante a medição. Em processos paralelos cada worker abre seu
+próprio grupo e os valores são somados em merge_worker_results.
+
+Sem permissão (perf_event_paranoid), sem PMU (VMs/containers) ou fora do
+Linux, os eventos indisponíveis retornam None com o motivo registrado.
+"""
+import ctypes
+import errno
+import os
+import platform
+import struct
+from typing import Dict, Any, Optional, Tuple
+import logging
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Tipos e configs de <linux/perf_event.h>
+PERF_TYPE_HARDWARE = 0
+PERF_TYPE_SOFTWARE = 1
+
+PERF_COUNT_HW_CPU_CYCLES = 0
+PERF_COUNT_HW_INSTRUCTIONS = 1
+PERF_COUNT_HW_CACHE_REFERENCES = 2
+PERF_COUNT_HW_CACHE_MISSES = 3
+PERF_COUNT_HW_BRANCH_MISSES = 5
+PERF_COUNT_SW_CONTEXT_SWITCHES = 3
+
+PERF_FORMAT_TOTAL_TIME_ENABLED = 1 << 0
+PERF_FORMAT_TOTAL_TIME_RUNNING = 1 << 1
+
+# Bits de perf_event_attr.flags
+_FLAG_DISABLED = 1 << 0
+_FLAG_INHERIT = 1 << 1
+_FLAG_EXCLUDE_KERNEL = 1 << 5
+_FLAG_EXCLUDE_HV = 1 << 6
+
+PERF_EVENT_IOC_ENABLE = 0x2400
+PERF_EVENT_IOC_DISABLE = 0x2401
+PERF_EVENT_IOC_RESET = 0x2403
+PERF_IOC_FLAG_GROUP = 1
+
+_SYSCALL_NUMBERS = {
+    "x86_64": 298,
+    "amd64": 298,
+    "aarch64": 241,
+    "arm64": 241,
+    "i386": 336,
+    "i686": 336,
+    "armv7l": 364,
+    "ppc64le": 319,
+    "s390x": 331,
+    "riscv64": 241,
+}
+
+# (nome, tipo, config) — o primeiro evento aberto com sucesso lidera o grupo
+DEFAULT_EVENTS: Tuple[Tuple[str, int, int], ...] = (
+    ("cycles", PERF_TYPE_HARDWARE, PERF_COUNT_HW_CPU_CYCLES),
+    ("instructions", PERF_TYPE_HARDWARE, PERF_COUNT_HW_INSTRUCTIONS),
+    ("cache_references", PERF_TYPE_HARDWARE, PERF_COUNT_HW_CACHE_REFERENCES),
+    ("cache_misses", PERF_TYPE_HARDWARE, PERF_COUNT_HW_CACHE_MISSES),
+    ("branch_misses", PERF_TYPE_HARDWARE, PERF_COUNT_HW_BRANCH_MISSES),
+    ("context_switches", PERF_TYPE_SOFTWARE, PERF_COUNT_SW_CONTEXT_SWITCHES),
+)
+
+
+class _PerfEventAttr(ctypes.Structure):
+    """struct perf_event_attr (PERF_ATTR_SIZE_VER5, 112 bytes)."""
+    _fields_ = [
+        ("type", ctypes.c_uint32),
+        ("size", ctypes.c_uint32),
+        ("config", ctypes.c_uint64),
+        ("sample_period", ctypes.c_uint64),
+        ("sample_type", ctypes.c_uint64),
+        ("read_format", ctypes.c_uint64),
+        ("flags", ctypes.c_uint64),
+        ("wakeup_events", ctypes.c_uint32),
+        ("bp_type", ctypes.c_uint32),
+        ("config1", ctypes.c_uint64),
+        ("config2", ctypes.c_uint64),
+        ("branch_sample_type", ctypes.c_uint64),
+        ("sample_regs_user", ctypes.c_uint64),
+        ("sample_stack_user", ctypes.c_uint32),
+        ("clockid", ctypes.c_int32),
+        ("sample_regs_intr", ctypes.c_uint64),
+        ("aux_watermark", ctypes.c_uint32),
+        ("sample_max_stack", ctypes.c_uint16),
+        ("reserved", ctypes.c_uint16),
+    ]
+
+
+def _paranoid_level() -> Optional[int]:
+    """Lê /proc/sys/kernel/perf_event_paranoid (None se inexistente)."""
+    try:
+        with open("/proc/sys/kernel/perf_event_paranoid") as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def _describe_error(err: int) -> str:
+    """Traduz errno de perf_event_open em motivo legível."""
+    if err in (errno.EACCES, errno.EPERM):
+        return f"permission denied (perf_event_paranoid={_paranoid_level()})"
+    if err in (errno.ENOENT, errno.EOPNOTSUPP, errno.ENODEV):
+        return "event not supported (no PMU access)"
+    if err == errno.ENOSYS:
+        return "perf_event_open not implemented"
+    return os.strerror(err)
+
+
+class PerfCounterGroup:
+    """Grupo de contadores perf_event_open para a thread chamadora.
+
+    Uso típico:
+        group = PerfCounterGroup()
+        group.open()
+        group.enable()
+        ... executar workload ...
+        group.disable()
+        counters = group.read()
+        group.close()
+    """
+
+    def __init__(self, events: Tuple[Tuple[str, int, int], ...] = DEFAULT_EVENTS, inherit: bool = True):
+        self.events = events
+        self.inherit = inherit
+        self.fds: Dict[str, int] = {}
+        self.errors: Dict[str, str] = {}
+        self._leader: Optional[int] = None
+        self._libc = None
+
+    @property
+    def available(self) -> bool:
+        return bool(self.fds)
+
+    def _syscall_number(self) -> Optional[int]:
+        if platform.system() != "Linux" or fcntl is None:
+            return None
+        return _SYSCALL_NUMBERS.get(platform.machine().lower())
+
+    def _open_event(self, nr: int, event_type: int, config: int, group_fd: int) -> int:
+        attr = _PerfEventAttr()
+        attr.type = event_type
+        attr.size = ctypes.sizeof(_PerfEventAttr)
+        attr.config = config
+        attr.read_format = PERF_FORMAT_TOTAL_TIME_ENABLED | PERF_FORMAT_TOTAL_TIME_RUNNING
+        # Só o líder nasce desabilitado; membros seguem o estado do grupo.
+        # Eventos de software (trocas de contexto) ocorrem no kernel: não excluir
+        flags = _FLAG_EXCLUDE_HV
+        if event_type == PERF_TYPE_HARDWARE:
+            flags |= _FLAG_EXCLUDE_KERNEL
+        if group_fd == -1:
+            flags |= _FLAG_DISABLED
+        if self.inherit:
+            flags |= _FLAG_INHERIT
+        attr.flags = flags
+        # pid=0, cpu=-1: thread chamadora em qualquer CPU
+        fd = self._libc.syscall(nr, ctypes.byref(attr), 0, -1, group_fd, 0)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "perf_event_open")
+        return fd
+
+    def open(self) -> bool:
+        """
+        Abre os eventos do grupo.
+
+        Returns:
+            bool: True se ao menos um evento foi aberto
+        """
+        nr = self._syscall_number()
+        if nr is None:
+            self.errors = {name: "perf_event_open unavailable on this platform" for name, _, _ in self.events}
+            logger.debug("action=perf_events_open status=unsupported_platform")
+            return False
+
+        self._libc = ctypes.CDLL(None, use_errno=True)
+        for name, event_type, config in self.events:
+            try:
+                fd = self._open_event(nr, event_type, config, self._leader if self._leader is not None else -1)
+            except OSError as e:
+                self.errors[name] = _describe_error(e.errno)
+                continue
+            if self._leader is None:
+                self._leader = fd
+            self.fds[name] = fd
+
+        if self.errors:
+            logger.info(f"action=perf_events_open: PARTIAL opened={list(self.fds)} unavailable={self.errors}")
+        else:
+            logger.debug(f"action=perf_events_open status=ok events={list(self.fds)}")
+        return self.available
+
+    def _ioctl(self, request: int) -> None:
+        if self._leader is not None:
+            fcntl.ioctl(self._leader, request, PERF_IOC_FLAG_GROUP)
+
+    def enable(self) -> None:
+        """Zera e habilita o grupo inteiro."""
+        self._ioctl(PERF_EVENT_IOC_RESET)
+        self._ioctl(PERF_EVENT_IOC_ENABLE)
+
+    def disable(self) -> None:
+        """Desabilita o grupo inteiro."""
+        self._ioctl(PERF_EVENT_IOC_DISABLE)
+
+    def read(self) -> Dict[str, Optional[int]]:
+        """
+        Lê os contadores, escalando por time_enabled/time_running (multiplexação).
+
+        Returns:
+            Dict evento -> contagem (None se indisponível)
+        """
+        counts: Dict[str, Optional[int]] = {name: None for name, _, _ in self.events}
+        for name, fd in self.fds.items():
+            try:
+                value, enabled, running = struct.unpack("QQQ", os.read(fd, 24))
+            except OSError as e:
+                logger.debug(f"Failed to read perf counter {name}: {e}")
+                continue
+            counts[name] = int(value * enabled / running) if running and running < enabled else value
+        return counts
+
+    def close(self) -> None:
+        """Fecha todos os descritores (membros antes do líder)."""
+        for fd in sorted(self.fds.values(), key=lambda fd: fd == self._leader):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self.fds = {}
+        self._leader = None
+
+
+def derive_counter_metrics(
+    counts: Dict[str, Optional[int]],
+    operations: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Calcula métricas derivadas dos contadores.
+
+    Args:
+        counts: Contagens por evento (PerfCounterGroup.read)
+        operations: Operações executadas (para contagens por operação)
+
+    Returns:
+        Dict com:
+            - ipc: float | None (instruções por ciclo)
+            - cache_miss_rate: float | None (falhas / referências)
+            - per_op: dict (evento -> contagem por operação, None se indisponível)
+    """
+    cycles = counts.get("cycles")
+    instructions = counts.get("instructions")
+    references = counts.get("cache_references")
+    misses = counts.get("cache_misses")
+
+    per_op = {}
+    if operations:
+        per_op = {
+            name: (value / operations if value is not None else None)
+            for name, value in counts.items()
+        }
+
+    return {
+        "ipc": instructions / cycles if cycles and instructions is not None else None,
+        "cache_miss_rate": misses / references if references and misses is not None else None,
+        "per_op": per_op,
+    }
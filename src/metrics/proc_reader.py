@@ -0,0 +1,226 @@
+"""
+Leitura direta de /proc (Linux) para o SystemSampler.
+
+Os arquivos /proc/self/stat, /proc/stat e /proc/self/task/<tid>/{stat,schedstat}
+são abertos uma única vez e relidos com os.pread no offset 0, sem criar
+objetos psutil nem reabrir arquivos a cada amostra — o que viabiliza
+intervalos de amostragem abaixo de 1 ms. Fornece CPU%/memória% do processo,
+tempo de CPU por thread e utilização por núcleo (evidência de distribuição
+entre cores).
+
+Resolução: utime/stime de stat contam em ticks de SC_CLK_TCK (10 ms com
+CLK_TCK=100), então intervalos curtos leem 0% ou 100%. O tempo de CPU vem
+em nanossegundos: do processo por CLOCK_PROCESS_CPUTIME_ID (mesma fonte do
+schedstat, incluindo threads encerradas; /proc/self/schedstat cobre só a
+thread líder) e de cada thread pela primeira coluna de task/<tid>/schedstat.
+Os ticks ficam só como fallback para threads em kernels sem schedstat
+(CONFIG_SCHED_INFO desligado), com o piso de 1/SC_CLK_TCK. A utilização por
+núcleo (/proc/stat) continua em jiffies.
+"""
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+_READ_SIZE = 64 * 1024
+
+
+def proc_available() -> bool:
+    """True se /proc/self/stat e /proc/stat podem ser lidos."""
+    return os.access("/proc/self/stat", os.R_OK) and os.access("/proc/stat", os.R_OK)
+
+
+def busy_cores(utilization: List[float], threshold: float = 50.0) -> int:
+    """Quantidade de núcleos com utilização >= threshold (%)."""
+    return sum(1 for u in utilization if u >= threshold)
+
+
+def _parse_task_stat(raw: bytes) -> Tuple[str, int, int, int]:
+    """Extrai (comm, utime, stime, rss_pages) de uma linha stat de processo/thread."""
+    # comm pode conter espaços e parênteses: separar pelo último ')'
+    open_idx = raw.index(b"(")
+    close_idx = raw.rindex(b")")
+    comm = raw[open_idx + 1:close_idx].decode(errors="replace")
+    fields = raw[close_idx + 2:].split()
+    # fields[0] é o campo 3 (state); utime=14, stime=15, rss=24 (1-based)
+    return comm, int(fields[11]), int(fields[12]), int(fields[21])
+
+
+def _parse_schedstat(raw: bytes) -> int:
+    """Tempo em execução (ns): primeira coluna de /proc/.../schedstat."""
+    return int(raw.split()[0])
+
+
+class ProcStatReader:
+    """Leitor de /proc com descritores reutilizados.
+
+    Uso típico:
+        reader = ProcStatReader()
+        before = reader.read_cores(); threads = reader.read_threads()
+        ... workload ...
+        utilization = reader.core_utilization(before, reader.read_cores())
+        reader.close()
+    """
+
+    def __init__(self):
+        self.clk_tck = os.sysconf("SC_CLK_TCK")
+        self.page_size = os.sysconf("SC_PAGE_SIZE")
+        self.mem_total = self._read_mem_total()
+        self._self_fd = os.open("/proc/self/stat", os.O_RDONLY)
+        self._stat_fd = os.open("/proc/stat", os.O_RDONLY)
+        # Caminho absoluto: /proc/self muda de significado após fork
+        self._task_dir = f"/proc/{os.getpid()}/task"
+        # schedstat (ns) por thread quando o kernel expõe; senão ticks de stat
+        self.schedstat = os.access(f"{self._task_dir}/{os.getpid()}/schedstat", os.R_OK)
+        self._task_fds: Dict[int, Tuple[int, Optional[int]]] = {}
+        self._last_process: Optional[Tuple[float, int]] = None
+
+    def _read_mem_total(self) -> int:
+        """MemTotal de /proc/meminfo em bytes."""
+        with open("/proc/meminfo", "rb") as f:
+            for line in f:
+                if line.startswith(b"MemTotal:"):
+                    return int(line.split()[1]) * 1024
+        return 0
+
+    def _open_task(self, tid: int) -> Tuple[int, Optional[int]]:
+        """Abre stat (nome, fallback em ticks) e schedstat (ns) de uma thread."""
+        stat_fd = os.open(f"{self._task_dir}/{tid}/stat", os.O_RDONLY)
+        schedstat_fd = None
+        if self.schedstat:
+            try:
+                schedstat_fd = os.open(f"{self._task_dir}/{tid}/schedstat", os.O_RDONLY)
+            except OSError:
+                pass
+        return stat_fd, schedstat_fd
+
+    def read_process(self) -> Tuple[float, float]:
+        """
+        Lê CPU% e memória% do processo desde a leitura anterior.
+
+        CPU% usa tempo de CPU em ns (CLOCK_PROCESS_CPUTIME_ID), não ticks,
+        então intervalos menores que 1/SC_CLK_TCK não leem 0%.
+
+        Returns:
+            tuple: (cpu_percent, memory_percent); cpu_percent é 0.0 na primeira leitura
+        """
+        now = time.monotonic()
+        cpu_ns = time.process_time_ns()
+        _, _, _, rss_pages = _parse_task_stat(os.pread(self._self_fd, _READ_SIZE, 0))
+
+        cpu_percent = 0.0
+        if self._last_process is not None:
+            elapsed = now - self._last_process[0]
+            if elapsed > 0:
+                cpu_percent = (cpu_ns - self._last_process[1]) / 1e9 / elapsed * 100
+        self._last_process = (now, cpu_ns)
+
+        memory_percent = rss_pages * self.page_size / self.mem_total * 100 if self.mem_total else 0.0
+        return cpu_percent, memory_percent
+
+    def read_threads(self) -> Dict[int, Tuple[str, int]]:
+        """
+        Lê tempo de CPU (ns) de cada thread viva do processo.
+
+        Vem de task/<tid>/schedstat; sem schedstat, de utime+stime em ticks
+        convertidos para ns (resolução de 1/SC_CLK_TCK).
+
+        Returns:
+            Dict tid -> (nome, cpu_ns)
+        """
+        try:
+            live = {int(tid) for tid in os.listdir(self._task_dir)}
+        except OSError:
+            return {}
+
+        # Fecha fds de threads encerradas e abre os das novas
+        for tid in set(self._task_fds) - live:
+            self._close_fds(self._task_fds.pop(tid))
+
+        threads = {}
+        for tid in live:
+            try:
+                fds = self._task_fds.get(tid)
+                if fds is None:
+                    fds = self._task_fds[tid] = self._open_task(tid)
+                stat_fd, schedstat_fd = fds
+                comm, utime, stime, _ = _parse_task_stat(os.pread(stat_fd, _READ_SIZE, 0))
+                if schedstat_fd is not None:
+                    cpu_ns = _parse_schedstat(os.pread(schedstat_fd, _READ_SIZE, 0))
+                else:
+                    cpu_ns = (utime + stime) * 1_000_000_000 // self.clk_tck
+            except (OSError, ValueError, IndexError):
+                continue
+            threads[tid] = (comm, cpu_ns)
+        return threads
+
+    def read_cores(self) -> List[Tuple[int, int]]:
+        """
+        Lê jiffies por núcleo de /proc/stat.
+
+        Returns:
+            Lista (ocupado, total) por núcleo, na ordem cpu0, cpu1, ...
+        """
+        cores = []
+        for line in os.pread(self._stat_fd, _READ_SIZE, 0).splitlines():
+            # Linha agregada "cpu " primeiro, depois cpu0..cpuN e demais contadores
+            if line.startswith(b"cpu "):
+                continue
+            if not line.startswith(b"cpu"):
+                break
+            values = [int(v) for v in line.split()[1:]]
+            # idle + iowait não contam como ocupado
+            idle = values[3] + (values[4] if len(values) > 4 else 0)
+            total = sum(values[:8])
+            cores.append((total - idle, total))
+        return cores
+
+    def core_utilization(self, before: List[Tuple[int, int]], after: List[Tuple[int, int]]) -> List[float]:
+        """Utilização (%) de cada núcleo entre duas leituras de read_cores."""
+        utilization = []
+        for (busy0, total0), (busy1, total1) in zip(before, after):
+            total = total1 - total0
+            utilization.append((busy1 - busy0) / total * 100 if total > 0 else 0.0)
+        return utilization
+
+    def thread_cpu_ms(
+        self,
+        before: Dict[int, Tuple[str, int]],
+        after: Dict[int, Tuple[str, int]],
+        names: Optional[Dict[int, str]] = None
+    ) -> Dict[str, float]:
+        """
+        Tempo de CPU (ms) por thread entre duas leituras.
+
+        Args:
+            before, after: Leituras de read_threads
+            names: Nomes Python por tid (threading.Thread.native_id), se conhecidos
+
+        Returns:
+            Dict "nome:tid" -> ms
+        """
+        names = names or {}
+        cpu_ms = {}
+        for tid, (comm, cpu_ns) in after.items():
+            delta = cpu_ns - before.get(tid, (comm, 0))[1]
+            cpu_ms[f"{names.get(tid, comm)}:{tid}"] = delta / 1e6
+        return cpu_ms
+
+    @staticmethod
+    def _close_fds(fds) -> None:
+        for fd in fds:
+            if fd is None:
+                continue
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        """Fecha todos os descritores."""
+        self._close_fds([self._self_fd, self._stat_fd])
+        for fds in self._task_fds.values():
+            self._close_fds(fds)
+        self._task_fds = {}
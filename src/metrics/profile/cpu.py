@@ -1,15 +1,94 @@
 """
 Profiling de CPU usando cProfile e line_profiler.
+
+O modo lean (start_lean/stop_lean) mede apenas deltas de relógio e de
+getrusage, sem ganchos de tracing; cProfile fica como passada diagnóstica.
 """
 import cProfile
 import pstats
 from io import StringIO
+from time import perf_counter_ns, process_time_ns, thread_time_ns
 from typing import Dict, Any
 import logging
 
+try:
+    import resource
+except ImportError:  # Windows: sem getrusage
+    resource = None
+
 logger = logging.getLogger(__name__)
 
 class CPU:
+    def start_lean(self) -> Dict[str, Any]:
+        """
+        Captura o instante inicial do modo lean (sem tracing).
+        
+        Returns:
+            Dict com contadores de relógio e rusage no início
+        """
+        rusage = resource.getrusage(resource.RUSAGE_SELF) if resource else None
+        return {
+            "rusage": rusage,
+            "thread_ns": thread_time_ns(),
+            "process_ns": process_time_ns(),
+            "wall_ns": perf_counter_ns()
+        }
+
+
+    def stop_lean(self, snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        """Finaliza a medição lean e calcula deltas.
+
+        Args:
+            snapshot: Retorno de start_lean.
+
+        Returns:
+            Dict com:
+                cpu_time_ms: Tempo de CPU da thread medida (thread_time) em ms; exclui
+                    o SystemSampler, que roda em outra thread durante a janela
+                thread_cpu_time_ms: Igual a cpu_time_ms (nome anterior, mantido)
+                process_cpu_time_ms: Tempo de CPU do processo (process_time) em ms,
+                    incluindo o sampler e threads criadas pela carga
+                wall_time_ms: Tempo de relógio (perf_counter) em ms
+                user_time_ms / system_time_ms: Tempo em modo usuário/kernel (getrusage)
+                voluntary_ctx_switches / involuntary_ctx_switches: Trocas de contexto
+                minor_page_faults / major_page_faults: Faltas de página
+        """
+        wall_ns = perf_counter_ns() - snapshot["wall_ns"]
+        process_ns = process_time_ns() - snapshot["process_ns"]
+        thread_ns = thread_time_ns() - snapshot["thread_ns"]
+        
+        metrics = {
+            "cpu_time_ms": thread_ns / 1e6,
+            "thread_cpu_time_ms": thread_ns / 1e6,
+            "process_cpu_time_ms": process_ns / 1e6,
+            "wall_time_ms": wall_ns / 1e6,
+            "user_time_ms": None,
+            "system_time_ms": None,
+            "voluntary_ctx_switches": None,
+            "involuntary_ctx_switches": None,
+            "minor_page_faults": None,
+            "major_page_faults": None,
+        }
+        
+        before = snapshot.get("rusage")
+        if before is not None:
+            after = resource.getrusage(resource.RUSAGE_SELF)
+            metrics.update({
+                "user_time_ms": (after.ru_utime - before.ru_utime) * 1000.0,
+                "system_time_ms": (after.ru_stime - before.ru_stime) * 1000.0,
+                "voluntary_ctx_switches": after.ru_nvcsw - before.ru_nvcsw,
+                "involuntary_ctx_switches": after.ru_nivcsw - before.ru_nivcsw,
+                "minor_page_faults": after.ru_minflt - before.ru_minflt,
+                "major_page_faults": after.ru_majflt - before.ru_majflt,
+            })
+        
+        logger.info(
+            "action=cpu_lean: STOPPED cpu_time_ms=%.3f process_cpu_time_ms=%.3f wall_time_ms=%.3f",
+            metrics["cpu_time_ms"], metrics["process_cpu_time_ms"], metrics["wall_time_ms"]
+        )
+        return metrics
+
+
     def start(self) -> cProfile.Profile:
         """
         Inicia profiling de CPU com cProfile.
@@ -1,11 +1,16 @@
 """
 Módulos de coleta e processamento de métricas.
 """
-from typing import Dict, Any, Callable
+from typing import Dict, Any, Callable, Optional
+from statistics import mean, pstdev
+from time import perf_counter_ns
 from .cpu import CPU
 from .memory import Memory
 from ..system_sampler import SystemSampler
 from ..hardware import Hardware
+from ..latency import summarize_phases, summarize_throughput
+from ..perf_events import derive_counter_metrics
+from ..proc_reader import busy_cores
 
 class ProfilerManager:
     """
@@ -13,22 +18,114 @@ class ProfilerManager:
     
     Aplica instrumentação idêntica a MLKEM_1024, MLDSA_87, Krypton seguindo
     Princípio II da Constituição: métricas padronizadas.
+    
+    Antes da medição, executa iterações de aquecimento (volume=1) para
+    absorver carregamento lazy de bibliotecas e caches frios. Com
+    steady_state_cv definido, o aquecimento continua até o coeficiente de
+    variação das últimas `steady_state_window` iterações ficar abaixo do limiar.
+    
+    A medição principal usa o modo lean (thread_time/perf_counter/getrusage,
+    sem tracing); cpu_time_ms é a CPU da thread medida, sem o SystemSampler. Com cprofile=True, uma passada diagnóstica extra roda sob
+    cProfile e o overhead do tracing é reportado em diagnostic_metrics.
+    
+    Memória (tracemalloc + pico de RSS) roda por padrão em passada separada
+    (memory_pass="separate"), para que o rastreamento de alocações não infle
+    cpu_time_ms; "inline" mede tudo na mesma execução.
+    
+    Com sampler_core (modo fixado, orchestration.affinity.PinnedExecution), a
+    thread do SystemSampler roda em núcleo próprio, fora do núcleo da carga.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        warmup_iterations: int = 0,
+        steady_state_cv: Optional[float] = None,
+        steady_state_window: int = 5,
+        max_warmup_iterations: int = 50,
+        cprofile: bool = False,
+        memory_pass: str = "separate",
+        memory_top_sites: int = 10,
+        sampler_core: Optional[int] = None
+    ):
+        if memory_pass not in ("separate", "inline"):
+            raise ValueError(f"memory_pass must be 'separate' or 'inline', got {memory_pass!r}")
         self.profilerCPU = CPU()
-        self.cpu_profiler = None
-        self.system_sampler = SystemSampler()
+        self.memory = Memory(top_n=memory_top_sites)
+        self.memory_pass = memory_pass
+        self.cpu_snapshot = None
+        self.cprofile = cprofile
+        self.system_sampler = SystemSampler(core=sampler_core)
         self.hardware_info = None
+        self.warmup_iterations = warmup_iterations
+        self.steady_state_cv = steady_state_cv
+        self.steady_state_window = steady_state_window
+        self.max_warmup_iterations = max(max_warmup_iterations, warmup_iterations)
+        
+    def warmup(self, func: Callable, *args, **kwargs) -> Dict[str, Any]:
+        """
+        Executa iterações de aquecimento fora da medição.
+        
+        Se a função recebe `volume`, cada iteração usa volume=1.
+        
+        Returns:
+            Dict com:
+                - cold_start_latency_ms: float | None (primeira iteração)
+                - warmup_iterations: int
+                - warmup_time_ms: float
+                - steady_state_reached: bool | None (None sem detecção)
+                - final_cv: float | None (CV da última janela)
+        """
+        if self.warmup_iterations <= 0 and self.steady_state_cv is None:
+            return {
+                "cold_start_latency_ms": None,
+                "warmup_iterations": 0,
+                "warmup_time_ms": 0.0,
+                "steady_state_reached": None,
+                "final_cv": None
+            }
+        
+        if "volume" in kwargs:
+            kwargs = {**kwargs, "volume": 1}
+        
+        durations = []
+        final_cv = None
+        steady = False
+        
+        while len(durations) < self.max_warmup_iterations:
+            start_ns = perf_counter_ns()
+            func(*args, **kwargs)
+            durations.append(perf_counter_ns() - start_ns)
+            
+            if len(durations) < self.warmup_iterations:
+                continue
+            if self.steady_state_cv is None:
+                break
+            
+            # Coeficiente de variação da janela mais recente
+            if len(durations) >= self.steady_state_window:
+                window = durations[-self.steady_state_window:]
+                window_mean = mean(window)
+                final_cv = pstdev(window) / window_mean if window_mean > 0 else 0.0
+                if final_cv <= self.steady_state_cv:
+                    steady = True
+                    break
+        
+        return {
+            "cold_start_latency_ms": durations[0] / 1e6,
+            "warmup_iterations": len(durations),
+            "warmup_time_ms": sum(durations) / 1e6,
+            "steady_state_reached": steady if self.steady_state_cv is not None else None,
+            "final_cv": final_cv
+        }
         
     def start_profiling(self) -> None:
         """Inicia todos os profilers."""
-        self.cpu_profiler = self.profilerCPU.start()
-        self.system_sampler.start()
-        
-        # Captura hardware uma vez por execução
+        # Captura hardware uma vez por execução (fora da janela de CPU)
         if self.hardware_info is None:
             self.hardware_info = Hardware().snapshot_hardware()
+        
+        self.system_sampler.start()
+        self.cpu_snapshot = self.profilerCPU.start_lean()
     
     def stop_profiling(self) -> Dict[str, Any]:
         """
@@ -36,11 +133,11 @@ class ProfilerManager:
         
         Returns:
             Dict com:
-                - cpu_metrics: dict (tempo, chamadas)
+                - cpu_metrics: dict (tempo de CPU/relógio, rusage)
                 - system_metrics: dict (CPU%, memória%)
                 - hardware_info: dict (CPU, RAM, etc)
         """
-        cpu_metrics = self.profilerCPU.stop(self.cpu_profiler) if self.cpu_profiler else {}
+        cpu_metrics = self.profilerCPU.stop_lean(self.cpu_snapshot) if self.cpu_snapshot else {}
         system_metrics = self.system_sampler.stop()
         
         return {
@@ -49,10 +146,47 @@ class ProfilerManager:
             "hardware_info": self.hardware_info or {}
         }
     
+    def diagnose(self, func: Callable, lean_wall_time_ms: float, *args, **kwargs) -> Dict[str, Any]:
+        """
+        Passada diagnóstica sob cProfile, separada da medição principal.
+        
+        Args:
+            func: Função a perfilar
+            lean_wall_time_ms: Duração da passada lean para calcular o overhead
+            *args, **kwargs: Argumentos da função
+            
+        Returns:
+            Dict com:
+                - cprofile: dict (chamadas e tempos do cProfile)
+                - lean_wall_time_ms: float
+                - cprofile_wall_time_ms: float
+                - cprofile_overhead_ms: float
+                - cprofile_overhead_pct: float | None
+        """
+        profiler = self.profilerCPU.start()
+        snapshot = self.profilerCPU.start_lean()
+        func(*args, **kwargs)
+        traced = self.profilerCPU.stop_lean(snapshot)
+        cprofile_metrics = self.profilerCPU.stop(profiler)
+        
+        overhead_ms = traced["wall_time_ms"] - lean_wall_time_ms
+        return {
+            "cprofile": cprofile_metrics,
+            "lean_wall_time_ms": lean_wall_time_ms,
+            "cprofile_wall_time_ms": traced["wall_time_ms"],
+            "cprofile_overhead_ms": overhead_ms,
+            "cprofile_overhead_pct": overhead_ms / lean_wall_time_ms * 100 if lean_wall_time_ms > 0 else None
+        }
+    
     def profile_function(self, func: Callable, *args, **kwargs) -> Dict[str, Any]:
         """
         Perfila uma função completa com todas as métricas.
         
+        Se a função expõe `prepare` (ex: cipher_rounds.prepare), ela é chamada
+        uma vez com os mesmos argumentos antes do aquecimento e o retorno é
+        repassado como `inputs` a todas as passadas: buffers e chaves ficam
+        fora de cpu_time_ms, do aquecimento e do pico de memória.
+        
         Args:
             func: Função a perfilar (run_mlkem, generate_and_sign, cipher_rounds)
             *args, **kwargs: Argumentos da função
@@ -60,20 +194,84 @@ class ProfilerManager:
         Returns:
             Dict com:
                 - result: Any (retorno da função)
-                - metrics: dict (todas as métricas coletadas)
+                - metrics: dict (todas as métricas coletadas, incluindo
+                  phase_metrics quando a função retorna phase_latencies_ns e
+                  throughput_metrics quando retorna cells, warmup_metrics
+                  com a latência de cold start e diagnostic_metrics com o
+                  overhead do cProfile quando cprofile=True e counter_metrics
+                  com contadores perf, IPC e contagens por operação e
+                  cpu_distribution com CPU por thread e por núcleo)
+                - window_ns: dict (started_ns/ended_ns da passada medida, em
+                  perf_counter_ns; exclui aquecimento, passada de memória
+                  separada e cProfile)
         """
+        prepare = getattr(func, "prepare", None)
+        if prepare is not None:
+            kwargs = {**kwargs, "inputs": prepare(*args, **kwargs)}
+        
+        # Aquecimento fora da medição: não conta em cpu_time_ms
+        warmup_metrics = self.warmup(func, *args, **kwargs)
+        
         self.start_profiling()
+        started_ns = self.cpu_snapshot["wall_ns"]
         
-        # Executa com trace de memória
-        memory_result = Memory().trace(func, *args, **kwargs)
+        if self.memory_pass == "inline":
+            memory_result = self.memory.trace(func, *args, **kwargs)
+            result = memory_result["result"]
+            metrics = self.stop_profiling()
+        else:
+            result = func(*args, **kwargs)
+            metrics = self.stop_profiling()
+            # Passada de memória própria, fora da janela de CPU e contadores
+            memory_result = self.memory.trace(func, *args, **kwargs)
+        
+        ended_ns = started_ns + round(metrics["cpu_metrics"]["wall_time_ms"] * 1e6)
         
-        metrics = self.stop_profiling()
         metrics["memory_metrics"] = {
-            "memory_mb": memory_result["memory_mb"],
-            "memory_increments": memory_result["memory_increments"]
+            key: value for key, value in memory_result.items() if key != "result"
         }
+        metrics["memory_metrics"]["memory_pass"] = self.memory_pass
+        
+        phase_latencies = result.get("phase_latencies_ns") if isinstance(result, dict) else None
+        metrics["phase_metrics"] = summarize_phases(phase_latencies)
+        metrics["warmup_metrics"] = warmup_metrics
+        
+        # Passada diagnóstica opcional: cProfile nunca contamina a medição principal
+        metrics["diagnostic_metrics"] = (
+            self.diagnose(func, metrics["cpu_metrics"]["wall_time_ms"], *args, **kwargs)
+            if self.cprofile else {}
+        )
+        
+        # Contadores de hardware (perf_event_open): IPC e contagens por operação
+        system_metrics = metrics["system_metrics"]
+        counts = system_metrics.get("hardware_counters", {})
+        operations = result.get("operations_completed") if isinstance(result, dict) else None
+        metrics["counter_metrics"] = {
+            "counts": counts,
+            **derive_counter_metrics(counts, operations),
+            "unavailable": system_metrics.get("counters_unavailable", {})
+        }
+        
+        # Distribuição de CPU (backend /proc): por núcleo e por thread
+        per_core = system_metrics.get("per_core_utilization", [])
+        metrics["cpu_distribution"] = {
+            "sampler_backend": system_metrics.get("sampler_backend"),
+            "per_core_utilization": per_core,
+            "busy_cores": busy_cores(per_core),
+            "thread_cpu_ms": system_metrics.get("thread_cpu_ms", {})
+        }
+        
+        # Throughput por payload (Krypton): MB/s e ciclos/byte (perf ou estimados)
+        cells = result.get("cells") if isinstance(result, dict) else None
+        metrics["throughput_metrics"] = summarize_throughput(
+            cells,
+            (self.hardware_info or {}).get("cpu_freq_mhz"),
+            measured_cycles=counts.get("cycles"),
+            measured_ns=ended_ns - started_ns
+        )
         
         return {
-            "result": memory_result["result"],
-            "metrics": metrics
+            "result": result,
+            "metrics": metrics,
+            "window_ns": {"started_ns": started_ns, "ended_ns": ended_ns}
         }
@@ -1,37 +1,119 @@
 """
-Profiling de memória usando memory_profiler.
+Profiling de memória usando tracemalloc e pico de RSS (VmHWM/ru_maxrss).
+
+tracemalloc mede o heap Python (pico e sítios de alocação); alocações
+nativas das extensões CFFI aparecem apenas no RSS, lido de
+/proc/self/status (VmHWM, zerado via /proc/self/clear_refs) e de
+getrusage(ru_maxrss). Não há thread ou processo de polling.
 """
-from typing import Dict, Any, Callable, cast
-from memory_profiler import memory_usage
+import sys
+import tracemalloc
+from typing import Dict, Any, Callable, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows: sem getrusage
+    resource = None
+
+# Alocações do próprio instrumental não entram no ranking
+_IGNORED_FILES = (tracemalloc.__file__, __file__, "<frozen importlib._bootstrap>", "<unknown>")
+
 
 class Memory:
+    def __init__(self, top_n: int = 10, frames: int = 1):
+        self.top_n = top_n
+        self.frames = frames
+
+    def _read_status_kb(self, field: str) -> Optional[int]:
+        """Lê um campo em kB de /proc/self/status (None fora do Linux)."""
+        try:
+            with open("/proc/self/status") as f:
+                for line in f:
+                    if line.startswith(field + ":"):
+                        return int(line.split()[1])
+        except (OSError, ValueError, IndexError):
+            pass
+        return None
+
+    def _reset_peak_rss(self) -> bool:
+        """Zera VmHWM para o RSS atual (Linux >= 4.0). Retorna False se indisponível."""
+        try:
+            with open("/proc/self/clear_refs", "w") as f:
+                f.write("5")
+            return True
+        except OSError:
+            return False
+
+    def _max_rss_mb(self) -> Optional[float]:
+        """Pico de RSS do processo desde o início (ru_maxrss: kB no Linux, bytes no macOS)."""
+        if resource is None:
+            return None
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+    def _top_allocations(self, before: tracemalloc.Snapshot, after: tracemalloc.Snapshot) -> List[Dict[str, Any]]:
+        """Sítios (arquivo:linha) com maior crescimento líquido entre snapshots."""
+        filters = [tracemalloc.Filter(False, name) for name in _IGNORED_FILES]
+        stats = after.filter_traces(filters).compare_to(before.filter_traces(filters), "lineno")
+        growth = sorted((s for s in stats if s.size_diff > 0), key=lambda s: s.size_diff, reverse=True)
+        return [
+            {
+                "site": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                "size_kb": stat.size_diff / 1024,
+                "count": stat.count_diff,
+            }
+            for stat in growth[:self.top_n]
+        ]
+
     def trace(self, func: Callable, *args, **kwargs) -> Dict[str, Any]:
         """
         Rastreia consumo de memória durante execução.
-        
+
         Args:
             func: Função a monitorar
             *args, **kwargs: Argumentos para função
-            
+
         Returns:
             Dict com:
-                - memory_mb: float (pico de memória em MB)
-                - memory_increments: list (crescimento incremental)
+                - memory_mb: float (pico de RSS em MB: VmHWM ou ru_maxrss)
+                - python_peak_mb: float (pico do heap Python via tracemalloc)
+                - rss_peak_mb: float | None (VmHWM durante a execução)
+                - rss_growth_mb: float | None (pico de RSS - RSS inicial)
+                - max_rss_mb: float | None (ru_maxrss, pico desde o início do processo)
+                - peak_reset: bool (False: VmHWM inclui picos anteriores)
+                - top_allocations: list (site, size_kb, count)
+                - memory_increments: list (vazia: não há mais amostragem temporal)
                 - result: Any (retorno da função)
         """
-        mem_usage, result = memory_usage(
-            cast(Any, (func, args, kwargs)),
-            interval=0.01,
-            include_children=True,
-            retval=True
-        )
-
-        peak_memory = max(mem_usage) if mem_usage else 0.0
-        baseline = mem_usage[0] if mem_usage else 0.0
-        increments = [m - baseline for m in mem_usage]
-        
+        peak_reset = self._reset_peak_rss()
+        rss_before_kb = self._read_status_kb("VmRSS")
+
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start(self.frames)
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+
+        try:
+            result = func(*args, **kwargs)
+            _, python_peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+
+        hwm_kb = self._read_status_kb("VmHWM")
+        max_rss_mb = self._max_rss_mb()
+        rss_peak_mb = hwm_kb / 1024 if hwm_kb is not None else None
+
         return {
-            "memory_mb": peak_memory,
-            "memory_increments": increments,
+            "memory_mb": float(rss_peak_mb if rss_peak_mb is not None else (max_rss_mb or 0.0)),
+            "python_peak_mb": python_peak / (1024 * 1024),
+            "rss_peak_mb": rss_peak_mb,
+            "rss_growth_mb": (hwm_kb - rss_before_kb) / 1024 if hwm_kb is not None and rss_before_kb is not None else None,
+            "max_rss_mb": max_rss_mb,
+            "peak_reset": peak_reset,
+            "top_allocations": self._top_allocations(before, after),
+            "memory_increments": [],
             "result": result
         }
@@ -0,0 +1,194 @@
+"""
+Detecção de regressões de desempenho entre duas execuções (baseline x candidata).
+
+Latência por fase: teste U de Mann-Whitney sobre os buckets dos histogramas
+(todas as operações medidas, sem reamostrar séries brutas). Métricas por
+execução (CPU/wall por operação, pico de memória): diferença de médias por
+bootstrap sobre as repetições. Uma diferença só é regressão quando é
+estatisticamente significativa (p < alpha) E a variação relativa excede o
+limiar — com milhões de operações, diferenças irrelevantes também são
+"significativas".
+"""
+from typing import Dict, Any, List, Optional
+from metrics.environment import environment_mismatches
+from metrics.histogram import LatencyHistogram, as_histogram
+from metrics.stats import mann_whitney_u, bootstrap_mean_difference
+
+VERDICTS = ("regression", "improvement", "unchanged", "inconclusive")
+
+
+def relative_change(baseline: Optional[float], candidate: Optional[float]) -> Optional[float]:
+    """(candidata - baseline) / baseline; None se baseline ausente ou zero."""
+    if baseline is None or candidate is None or baseline == 0:
+        return None
+    return (candidate - baseline) / baseline
+
+
+def verdict(p_value: Optional[float], change: Optional[float], alpha: float, threshold: float) -> str:
+    """Classifica uma diferença (métricas onde maior é pior)."""
+    if p_value is None or change is None:
+        return "inconclusive"
+    if p_value < alpha and change > threshold:
+        return "regression"
+    if p_value < alpha and change < -threshold:
+        return "improvement"
+    return "unchanged"
+
+
+def compare_latency(
+    baseline: LatencyHistogram,
+    candidate: LatencyHistogram,
+    alpha: float,
+    threshold: float
+) -> Dict[str, Any]:
+    """
+    Compara latências de uma fase (Mann-Whitney sobre os buckets).
+
+    Args:
+        baseline / candidate: Histogramas da fase (mesmo layout)
+        alpha: Nível de significância
+        threshold: Variação relativa mínima da mediana para regressão
+
+    Returns:
+        Dict com:
+            - baseline / candidate: describe em µs
+            - p50_change / p99_change: float | None (variação relativa)
+            - p_value: float | None
+            - prob_slower: float | None (P(candidata > baseline))
+            - verdict: str (ver VERDICTS; decidido pela mediana)
+    """
+    values_a, counts_a = baseline.buckets()
+    values_b, counts_b = candidate.buckets()
+    test = mann_whitney_u(values_a, values_b, counts_a, counts_b)
+    base = baseline.describe(unit_ns=1e3)
+    cand = candidate.describe(unit_ns=1e3)
+    p50_change = relative_change(base.get("p50"), cand.get("p50"))
+    return {
+        "baseline": base,
+        "candidate": cand,
+        "p50_change": p50_change,
+        "p99_change": relative_change(base.get("p99"), cand.get("p99")),
+        "p_value": test["p_value"],
+        "prob_slower": test["prob_b_greater"],
+        "verdict": verdict(test["p_value"], p50_change, alpha, threshold)
+    }
+
+
+def compare_samples(
+    baseline: List[float],
+    candidate: List[float],
+    alpha: float,
+    threshold: float,
+    seed: int = 0
+) -> Dict[str, Any]:
+    """
+    Compara uma métrica por repetição (diferença de médias por bootstrap).
+
+    Returns:
+        Dict com baseline_mean, candidate_mean, change, ci_low, ci_high
+        (IC da diferença, unidades da métrica), p_value, n_baseline,
+        n_candidate e verdict
+    """
+    test = bootstrap_mean_difference(baseline, candidate, seed=seed)
+    baseline_mean = sum(baseline) / len(baseline) if baseline else None
+    candidate_mean = sum(candidate) / len(candidate) if candidate else None
+    change = relative_change(baseline_mean, candidate_mean)
+    return {
+        "baseline_mean": baseline_mean,
+        "candidate_mean": candidate_mean,
+        "change": change,
+        "ci_low": test["low"],
+        "ci_high": test["high"],
+        "p_value": test["p_value"],
+        "n_baseline": len(baseline),
+        "n_candidate": len(candidate),
+        "verdict": verdict(test["p_value"], change, alpha, threshold)
+    }
+
+
+def trial_samples(evaluations: List[Dict[str, Any]]) -> Dict[str, List[float]]:
+    """
+    Métricas por repetição de um conjunto de avaliações, normalizadas por operação.
+
+    Usa os valores de cada repetição (cpu_time_stats/wall_time_stats) quando
+    disponíveis; avaliações antigas contribuem com a média.
+
+    Returns:
+        Dict com cpu_us_per_op, wall_us_per_op e memory_mb
+    """
+    samples: Dict[str, List[float]] = {"cpu_us_per_op": [], "wall_us_per_op": [], "memory_mb": []}
+    for evaluation in evaluations:
+        metrics = evaluation.get("metrics") or {}
+        volume = evaluation.get("volume")
+        if isinstance(volume, int) and volume > 0:
+            for name, key, fallback in (
+                ("cpu_us_per_op", "cpu_time_stats", metrics.get("cpu_time_ms")),
+                ("wall_us_per_op", "wall_time_stats", None)
+            ):
+                stats = metrics.get(key) or {}
+                values = stats.get("values") or ([stats["mean"]] if "mean" in stats else [])
+                if not values and fallback is not None:
+                    values = [fallback]
+                samples[name].extend(v * 1e3 / volume for v in values)
+        if metrics.get("memory_mb") is not None:
+            samples["memory_mb"].append(metrics["memory_mb"])
+    return samples
+
+
+def compare_runs(
+    baseline: List[Dict[str, Any]],
+    candidate: List[Dict[str, Any]],
+    alpha: float,
+    threshold: float
+) -> Dict[str, Any]:
+    """
+    Compara duas execuções (cada uma com uma ou mais avaliações do mesmo algoritmo).
+
+    Args:
+        baseline / candidate: Registros de ResultsStore.load
+        alpha: Nível de significância
+        threshold: Variação relativa mínima para regressão (ex: 0.05 = 5%)
+
+    Returns:
+        Dict com:
+            - phases: dict fase -> compare_latency
+            - metrics: dict métrica -> compare_samples
+            - regressions: list[str] (fases e métricas com regressão)
+            - has_regression: bool
+            - environment_mismatches: list[str] (campos de ambiente que diferem da
+              primeira avaliação da baseline; ver metrics.environment)
+    """
+    def merged(records: List[Dict[str, Any]]) -> Dict[str, LatencyHistogram]:
+        histograms: Dict[str, LatencyHistogram] = {}
+        for record in records:
+            for phase, hist in record["latency_histograms"].items():
+                histograms.setdefault(phase, LatencyHistogram()).merge(as_histogram(hist))
+        return histograms
+
+    base_hists, cand_hists = merged(baseline), merged(candidate)
+    phases = {
+        phase: compare_latency(base_hists[phase], cand_hists[phase], alpha, threshold)
+        for phase in base_hists
+        if phase in cand_hists and base_hists[phase].count and cand_hists[phase].count
+    }
+
+    base_samples = trial_samples([r["evaluation"] for r in baseline])
+    cand_samples = trial_samples([r["evaluation"] for r in candidate])
+    metrics = {
+        name: compare_samples(base_samples[name], cand_samples[name], alpha, threshold)
+        for name in base_samples
+        if base_samples[name] and cand_samples[name]
+    }
+
+    regressions = [f"latency:{phase}" for phase, result in phases.items() if result["verdict"] == "regression"]
+    regressions += [name for name, result in metrics.items() if result["verdict"] == "regression"]
+
+    environments = [r["evaluation"].get("environment") or {} for r in baseline + candidate]
+    mismatches = {field for environment in environments[1:] for field in environment_mismatches(environments[0], environment)}
+    return {
+        "phases": phases,
+        "metrics": metrics,
+        "regressions": regressions,
+        "has_regression": bool(regressions),
+        "environment_mismatches": sorted(mismatches)
+    }
@@ -0,0 +1,146 @@
+"""
+Armazenamento de amostras de sistema em buffer circular de capacidade fixa.
+
+Amostras vivem em uma matriz NumPy pré-alocada (uma coluna por campo); estatísticas
+(min/max/média) são atualizadas em O(1) a cada amostra, então o custo de
+stop() e a memória não dependem da duração da execução. Níveis de
+downsampling guardam médias de blocos de `factor` amostras do nível anterior,
+preservando a visão de longo prazo quando o nível bruto já foi sobrescrito.
+"""
+import threading
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+from metrics.system_stat_sample import SystemStatSample
+
+_FIELDS = ("timestamp", "cpu_percent", "memory_percent", "cpu_cycles")
+
+
+class _Ring:
+    """Anel de vetores float64 (um por campo); NaN representa None."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.data = np.full((capacity, len(_FIELDS)), np.nan)
+        self.count = 0
+
+    def push(self, row: Sequence[float]) -> None:
+        self.data[self.count % self.capacity] = row
+        self.count += 1
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def ordered(self) -> np.ndarray:
+        """Linhas retidas em ordem cronológica."""
+        if self.count <= self.capacity:
+            return self.data[:self.count]
+        start = self.count % self.capacity
+        return np.concatenate((self.data[start:], self.data[:start]))
+
+
+class SampleRingBuffer:
+    """Buffer circular de SystemStatSample com estatísticas contínuas.
+
+    Mantém a interface de lista usada pelo SystemSampler (append, len,
+    iteração), mas retém no máximo `capacity` amostras brutas.
+    """
+
+    def __init__(self, capacity: int = 4096, downsample_factors: Tuple[int, ...] = (16, 256)):
+        if capacity <= 0:
+            raise ValueError(f"capacity must be greater than 0, got {capacity}")
+        if any(f <= 1 for f in downsample_factors):
+            raise ValueError(f"downsample factors must be greater than 1, got {downsample_factors}")
+        self.capacity = capacity
+        self.downsample_factors = tuple(downsample_factors)
+        self._lock = threading.Lock()
+        self._tiers: List[_Ring] = [_Ring(capacity) for _ in range(len(self.downsample_factors) + 1)]
+        # Acumuladores de bloco por nível de downsampling: (soma por campo, amostras)
+        self._pending = [[np.zeros(len(_FIELDS)), 0] for _ in self.downsample_factors]
+
+        self.count = 0
+        self._sum = np.zeros(len(_FIELDS))
+        self._min = np.full(len(_FIELDS), np.inf)
+        self._max = np.full(len(_FIELDS), -np.inf)
+        self._cycles_count = 0
+
+    def append(self, sample: SystemStatSample) -> None:
+        """Registra uma amostra em O(1) (atualiza anéis e estatísticas)."""
+        row = np.array([
+            sample.timestamp,
+            sample.cpu_percent,
+            sample.memory_percent,
+            np.nan if sample.cpu_cycles is None else sample.cpu_cycles,
+        ])
+        with self._lock:
+            self.count += 1
+            self._sum[:3] += row[:3]
+            np.minimum(self._min, row, out=self._min, where=~np.isnan(row))
+            np.maximum(self._max, row, out=self._max, where=~np.isnan(row))
+            if sample.cpu_cycles is not None:
+                self._cycles_count += 1
+
+            self._tiers[0].push(row)
+            self._cascade(row)
+
+    def _cascade(self, row: np.ndarray) -> None:
+        """Propaga a amostra para os níveis de downsampling (média de blocos)."""
+        for level, factor in enumerate(self.downsample_factors):
+            pending = self._pending[level]
+            pending[0] += np.nan_to_num(row)
+            pending[1] += 1
+            if pending[1] < factor:
+                return
+            row = pending[0] / factor
+            self._tiers[level + 1].push(row)
+            self._pending[level] = [np.zeros(len(_FIELDS)), 0]
+
+    def __len__(self) -> int:
+        return len(self._tiers[0])
+
+    def __iter__(self) -> Iterator[SystemStatSample]:
+        for timestamp, cpu, mem, cycles in self._tiers[0].ordered():
+            yield SystemStatSample(
+                timestamp=float(timestamp),
+                cpu_percent=float(cpu),
+                memory_percent=float(mem),
+                cpu_cycles=None if np.isnan(cycles) else int(cycles),
+            )
+
+    def series(self, tier: int = 0) -> Dict[str, np.ndarray]:
+        """
+        Séries retidas de um nível (0 = bruto, 1.. = downsampled).
+
+        Returns:
+            Dict campo -> np.ndarray em ordem cronológica
+        """
+        with self._lock:
+            rows = self._tiers[tier].ordered().copy()
+        return {name: rows[:, idx] for idx, name in enumerate(_FIELDS)}
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Estatísticas de todas as amostras já registradas (não só as retidas).
+
+        Returns:
+            Dict com:
+                - count: int (amostras registradas)
+                - retained: int (amostras brutas em memória)
+                - cpu_percent_avg / cpu_percent_min / cpu_percent_max: float
+                - memory_percent_avg / memory_percent_min / memory_percent_max: float
+                - cpu_cycles_max: int | None
+        """
+        with self._lock:
+            if self.count == 0:
+                return {"count": 0, "retained": 0}
+            cycles_max: Optional[int] = int(self._max[3]) if self._cycles_count else None
+            return {
+                "count": self.count,
+                "retained": len(self),
+                "cpu_percent_avg": float(self._sum[1] / self.count),
+                "cpu_percent_min": float(self._min[1]),
+                "cpu_percent_max": float(self._max[1]),
+                "memory_percent_avg": float(self._sum[2] / self.count),
+                "memory_percent_min": float(self._min[2]),
+                "memory_percent_max": float(self._max[2]),
+                "cpu_cycles_max": cycles_max,
+            }
@@ -0,0 +1,112 @@
+"""
+Análise de escalabilidade por número de workers (strong/weak scaling).
+"""
+from typing import Dict, Any, List, Optional, Sequence
+
+SCALING_MODES = ("strong", "weak")
+
+
+def default_worker_counts(max_workers: int) -> List[int]:
+    """
+    Gera contagens de workers em potências de 2 até max_workers (inclusive).
+    
+    Exemplo: max_workers=12 -> [1, 2, 4, 8, 12]
+    """
+    counts = []
+    n = 1
+    while n < max_workers:
+        counts.append(n)
+        n *= 2
+    counts.append(max(1, max_workers))
+    return counts
+
+
+def serial_fraction(speedup: float, workers: int, mode: str = "strong") -> Optional[float]:
+    """
+    Estima a fração serial para um ponto da curva.
+    
+    - strong: Karp-Flatt (Amdahl), e = (1/S - 1/n) / (1 - 1/n)
+    - weak: Gustafson, e = (n - S) / (n - 1)
+    
+    Returns:
+        Fração serial ou None quando indefinida (n=1 ou speedup <= 0)
+    """
+    if workers <= 1 or speedup <= 0:
+        return None
+    if mode == "weak":
+        return (workers - speedup) / (workers - 1)
+    return (1 / speedup - 1 / workers) / (1 - 1 / workers)
+
+
+def analyze_scaling(
+    worker_counts: Sequence[int],
+    throughputs: Sequence[float],
+    mode: str = "strong"
+) -> Dict[str, Any]:
+    """
+    Calcula speedup, eficiência paralela e fração serial estimada.
+    
+    Speedup é medido em throughput relativo ao menor número de workers
+    (S_n = X_n / X_1), válido para strong e weak scaling.
+    
+    Args:
+        worker_counts: Número de workers de cada ponto (crescente, iniciando em 1)
+        throughputs: Throughput agregado (ops/s) de cada ponto
+        mode: "strong" (volume total fixo) ou "weak" (volume por worker fixo)
+        
+    Returns:
+        Dict com:
+            - mode: str
+            - points: list[dict] (workers, ops_per_sec, speedup, efficiency, serial_fraction)
+            - serial_fraction: float | None (ajuste por mínimos quadrados)
+            - max_speedup: float | None (limite de Amdahl 1/f, apenas strong)
+            
+    Raises:
+        ValueError: Se modo inválido ou listas de tamanhos diferentes
+    """
+    if mode not in SCALING_MODES:
+        raise ValueError(f"Unknown scaling mode '{mode}'. Valid options: {', '.join(SCALING_MODES)}")
+    
+    if len(worker_counts) != len(throughputs):
+        raise ValueError(f"worker_counts ({len(worker_counts)}) and throughputs ({len(throughputs)}) must have same length")
+    
+    if not worker_counts or throughputs[0] <= 0:
+        return {"mode": mode, "points": [], "serial_fraction": None, "max_speedup": None}
+    
+    base_workers = worker_counts[0]
+    base_throughput = throughputs[0]
+    
+    points = []
+    numerator = 0.0
+    denominator = 0.0
+    for workers, ops_per_sec in zip(worker_counts, throughputs):
+        relative = workers / base_workers
+        speedup = ops_per_sec / base_throughput
+        points.append({
+            "workers": workers,
+            "ops_per_sec": ops_per_sec,
+            "speedup": speedup,
+            "efficiency": speedup / relative,
+            "serial_fraction": serial_fraction(speedup, relative, mode)
+        })
+        
+        # Ajuste linear da fração serial f sobre todos os pontos
+        if relative > 1 and speedup > 0:
+            if mode == "strong":
+                # 1/S - 1/n = f (1 - 1/n)
+                a, b = 1 / speedup - 1 / relative, 1 - 1 / relative
+            else:
+                # n - S = f (n - 1)
+                a, b = relative - speedup, relative - 1
+            numerator += a * b
+            denominator += b * b
+    
+    fitted = numerator / denominator if denominator > 0 else None
+    max_speedup = 1 / fitted if mode == "strong" and fitted and fitted > 0 else None
+    
+    return {
+        "mode": mode,
+        "points": points,
+        "serial_fraction": fitted,
+        "max_speedup": max_speedup
+    }
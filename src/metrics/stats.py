@@ -0,0 +1,285 @@
+"""
+Estatística descritiva e inferencial sobre medições.
+
+Reduções vetorizadas em NumPy: séries de milhões de latências por operação
+(array('q') é lido sem cópia via np.frombuffer) agregam em milissegundos.
+"""
+from array import array
+from math import erfc, sqrt
+from typing import Dict, Any, Optional, Sequence, Tuple, Union
+import numpy as np
+
+Samples = Union[Sequence[float], array, np.ndarray]
+
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+MAD_THRESHOLD = 3.5          # z-score modificado (Iglewicz & Hoaglin)
+BOOTSTRAP_RESAMPLES = 2000
+
+# Quantis t de Student bicaudais (95%) por graus de liberdade; acima de 30 usa-se a normal
+_T_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306,
+    9: 2.262, 10: 2.228, 11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145, 15: 2.131,
+    16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093, 20: 2.086, 21: 2.080, 22: 2.074,
+    23: 2.069, 24: 2.064, 25: 2.060, 26: 2.056, 27: 2.052, 28: 2.048, 29: 2.045, 30: 2.042,
+}
+_Z_95 = 1.960
+
+
+def t_critical_95(df: int) -> float:
+    """Quantil t de Student (95%, bicaudal) para `df` graus de liberdade."""
+    if df <= 0:
+        raise ValueError(f"df must be greater than 0, got {df}")
+    return _T_95.get(df, _Z_95)
+
+
+def mean_confidence_interval(values: Sequence[float]) -> Dict[str, Any]:
+    """
+    Intervalo de confiança de 95% da média (t de Student).
+    
+    Args:
+        values: Amostras (ex: latência média por lote)
+        
+    Returns:
+        Dict com:
+            - n: int
+            - mean: float
+            - half_width: float | None (None com menos de 2 amostras)
+            - low / high: float | None
+            - relative_error: float | None (half_width / mean)
+    """
+    data = np.asarray(values, dtype=np.float64)
+    n = int(data.size)
+    if n == 0:
+        return {"n": 0, "mean": 0.0, "half_width": None, "low": None, "high": None, "relative_error": None}
+    
+    mean = float(data.mean())
+    if n < 2:
+        return {"n": n, "mean": mean, "half_width": None, "low": None, "high": None, "relative_error": None}
+    
+    half_width = t_critical_95(n - 1) * float(data.std(ddof=1)) / sqrt(n)
+    return {
+        "n": n,
+        "mean": mean,
+        "half_width": half_width,
+        "low": mean - half_width,
+        "high": mean + half_width,
+        "relative_error": half_width / mean if mean > 0 else None
+    }
+
+
+def as_array(values: Samples) -> np.ndarray:
+    """Converte amostras para float64 (array('q') sem cópia intermediária)."""
+    if isinstance(values, array) and values.typecode == 'q':
+        return np.frombuffer(values, dtype=np.int64).astype(np.float64)
+    return np.asarray(values, dtype=np.float64)
+
+
+def describe(values: Samples) -> Dict[str, Any]:
+    """
+    Estatística descritiva vetorizada.
+    
+    Args:
+        values: Amostras
+        
+    Returns:
+        Dict com:
+            - count: int
+            - mean / median / std / min / max: float (std amostral, ddof=1)
+            - p50 / p90 / p99 / p99_9: float
+    """
+    data = as_array(values)
+    if data.size == 0:
+        return {"count": 0}
+    
+    p50, p90, p99, p999 = np.percentile(data, PERCENTILES)
+    return {
+        "count": int(data.size),
+        "mean": float(data.mean()),
+        "median": float(p50),
+        "std": float(data.std(ddof=1)) if data.size > 1 else 0.0,
+        "min": float(data.min()),
+        "max": float(data.max()),
+        "p50": float(p50),
+        "p90": float(p90),
+        "p99": float(p99),
+        "p99_9": float(p999),
+    }
+
+
+def reject_outliers_mad(values: Samples, threshold: float = MAD_THRESHOLD) -> Tuple[np.ndarray, int]:
+    """
+    Remove outliers pelo z-score modificado: 0.6745 * |x - mediana| / MAD.
+    
+    Args:
+        values: Amostras
+        threshold: Limite do z-score modificado (default 3.5)
+        
+    Returns:
+        tuple: (amostras mantidas, quantidade rejeitada)
+    """
+    data = as_array(values)
+    if data.size < 3:
+        return data, 0
+    
+    median = np.median(data)
+    deviation = np.abs(data - median)
+    mad = np.median(deviation)
+    if mad == 0:
+        return data, 0
+    
+    keep = 0.6745 * deviation / mad <= threshold
+    return data[keep], int(data.size - keep.sum())
+
+
+def bootstrap_mean_ci(
+    values: Samples,
+    confidence: float = 0.95,
+    resamples: int = BOOTSTRAP_RESAMPLES,
+    seed: int = 0
+) -> Dict[str, Optional[float]]:
+    """
+    Intervalo de confiança da média por bootstrap (percentil).
+    
+    Args:
+        values: Amostras (ex: média de cada repetição)
+        confidence: Nível de confiança
+        resamples: Reamostragens
+        seed: Seed do gerador (reprodutibilidade)
+        
+    Returns:
+        Dict com low e high (None com menos de 2 amostras)
+    """
+    data = as_array(values)
+    if data.size < 2:
+        return {"low": None, "high": None}
+    
+    rng = np.random.default_rng(seed)
+    # Blocos de reamostragens limitam a matriz de índices a ~10M elementos
+    chunk = max(1, min(resamples, 10_000_000 // data.size))
+    means = np.empty(resamples)
+    for start in range(0, resamples, chunk):
+        stop = min(start + chunk, resamples)
+        idx = rng.integers(0, data.size, size=(stop - start, data.size))
+        means[start:stop] = data[idx].mean(axis=1)
+    
+    alpha = (1 - confidence) / 2 * 100
+    low, high = np.percentile(means, (alpha, 100 - alpha))
+    return {"low": float(low), "high": float(high)}
+
+
+def summarize_trials(values: Samples, seed: int = 0) -> Dict[str, Any]:
+    """
+    Resumo de uma métrica entre repetições: descrição após rejeição MAD e IC bootstrap.
+    
+    Returns:
+        Dict com os campos de describe, outliers_rejected, ci_low, ci_high e
+        values (todas as repetições, antes da rejeição; usado em comparações)
+    """
+    kept, rejected = reject_outliers_mad(values)
+    ci = bootstrap_mean_ci(kept, seed=seed)
+    return {
+        **describe(kept),
+        "outliers_rejected": rejected,
+        "ci_low": ci["low"],
+        "ci_high": ci["high"],
+        "values": as_array(values).tolist()
+    }
+
+
+def mann_whitney_u(
+    values_a: Samples,
+    values_b: Samples,
+    counts_a: Optional[Samples] = None,
+    counts_b: Optional[Samples] = None
+) -> Dict[str, Any]:
+    """
+    Teste U de Mann-Whitney bicaudal (aproximação normal com correção de empates).
+    
+    Aceita amostras brutas ou valores distintos com contagens (ex: buckets de
+    LatencyHistogram): o custo depende do número de valores distintos, não do
+    número de operações.
+    
+    Args:
+        values_a / values_b: Amostras (ou valores distintos, se houver contagens)
+        counts_a / counts_b: Contagem de cada valor (opcional)
+        
+    Returns:
+        Dict com:
+            - n_a / n_b: int
+            - u: float (estatística U de b)
+            - z: float | None
+            - p_value: float | None (None se algum grupo estiver vazio)
+            - prob_b_greater: float | None (P(b > a) + P(b = a) / 2)
+    """
+    a, b = as_array(values_a), as_array(values_b)
+    wa = as_array(counts_a) if counts_a is not None else np.ones(a.size)
+    wb = as_array(counts_b) if counts_b is not None else np.ones(b.size)
+    n_a, n_b = float(wa.sum()), float(wb.sum())
+    if n_a == 0 or n_b == 0:
+        return {"n_a": int(n_a), "n_b": int(n_b), "u": 0.0, "z": None, "p_value": None, "prob_b_greater": None}
+    
+    # Postos médios por valor distinto (empates recebem a média dos postos)
+    distinct, inverse = np.unique(np.concatenate([a, b]), return_inverse=True)
+    ties = np.bincount(inverse, weights=np.concatenate([wa, wb]), minlength=distinct.size)
+    rank = np.cumsum(ties) - (ties - 1) / 2
+    rank_sum_b = float(np.dot(wb, rank[inverse[a.size:]]))
+    u = rank_sum_b - n_b * (n_b + 1) / 2
+    
+    n = n_a + n_b
+    mean_u = n_a * n_b / 2
+    tie_term = float(np.sum(ties ** 3 - ties)) / (n * (n - 1)) if n > 1 else 0.0
+    variance = n_a * n_b / 12 * ((n + 1) - tie_term)
+    if variance <= 0:
+        z, p_value = 0.0, 1.0
+    else:
+        # Correção de continuidade
+        z = (u - mean_u - np.sign(u - mean_u) * 0.5) / sqrt(variance)
+        p_value = min(1.0, erfc(abs(z) / sqrt(2)))
+    return {
+        "n_a": int(n_a),
+        "n_b": int(n_b),
+        "u": u,
+        "z": float(z),
+        "p_value": float(p_value),
+        "prob_b_greater": u / (n_a * n_b)
+    }
+
+
+def bootstrap_mean_difference(
+    values_a: Samples,
+    values_b: Samples,
+    confidence: float = 0.95,
+    resamples: int = BOOTSTRAP_RESAMPLES,
+    seed: int = 0
+) -> Dict[str, Optional[float]]:
+    """
+    Diferença de médias (b - a) com IC e p-valor bicaudal por bootstrap.
+    
+    Args:
+        values_a / values_b: Amostras de cada grupo (ex: uma métrica por repetição)
+        confidence: Nível de confiança do IC
+        resamples: Reamostragens
+        seed: Seed do gerador (reprodutibilidade)
+        
+    Returns:
+        Dict com difference, low, high e p_value (IC e p-valor None se algum
+        grupo tiver menos de 2 amostras)
+    """
+    a, b = as_array(values_a), as_array(values_b)
+    if a.size == 0 or b.size == 0:
+        return {"difference": None, "low": None, "high": None, "p_value": None}
+    difference = float(b.mean() - a.mean())
+    if a.size < 2 or b.size < 2:
+        return {"difference": difference, "low": None, "high": None, "p_value": None}
+    
+    rng = np.random.default_rng(seed)
+    means_a = a[rng.integers(0, a.size, size=(resamples, a.size))].mean(axis=1)
+    means_b = b[rng.integers(0, b.size, size=(resamples, b.size))].mean(axis=1)
+    diffs = means_b - means_a
+    
+    alpha = (1 - confidence) / 2 * 100
+    low, high = np.percentile(diffs, (alpha, 100 - alpha))
+    # p-valor: reamostragens do outro lado de zero (bicaudal); nunca abaixo de 1/resamples
+    tail = min(np.count_nonzero(diffs <= 0), np.count_nonzero(diffs >= 0))
+    p_value = min(1.0, 2 * (tail + 1) / (resamples + 1))
+    return {"difference": difference, "low": float(low), "high": float(high), "p_value": p_value}
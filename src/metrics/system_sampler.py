@@ -2,8 +2,12 @@
 Estatísticas de sistema (CPU, processos) usando psutil.
 """
 import psutil
-from typing import Optional, Dict, List
+from typing import Optional, Dict, Any, Tuple
 from metrics.system_stat_sample import SystemStatSample
+from metrics.sample_buffer import SampleRingBuffer
+from metrics.proc_reader import ProcStatReader, proc_available
+from metrics.perf_events import PerfCounterGroup
+import os
 import time
 import logging
 import platform
@@ -11,17 +15,6 @@ import threading
 
 logger = logging.getLogger(__name__)
 
-# Tentar importar bibliotecas de performance
-_perf_available = False
-
-try:
-    if platform.system() == "Linux":
-        import perf
-        _perf_available = True
-        logger.info("perf counters available on Linux")
-except ImportError:
-    logger.debug("perf module not available, using fallback counters")
-
 # Fallback: usar ctypes para acessar QueryPerformanceCounter no Windows
 _windows_perf_available = False
 if platform.system() == "Windows":
@@ -46,28 +39,45 @@ class SystemSampler:
         ... executar workload ...
         metrics = sampler.stop()
 
-    Enquanto ativo, uma thread coleta amostras de CPU% e memória% periodicamente.
+    Enquanto ativo, uma thread coleta amostras de CPU% e memória% periodicamente
+    em um buffer circular de capacidade fixa (SampleRingBuffer), com
+    estatísticas O(1): memória constante mesmo em execuções de horas.
+    No Linux, contadores perf_event_open (ciclos, instruções, cache, branches,
+    trocas de contexto) cobrem a thread que chamou start() e seus filhos.
+
+    Backends de amostragem: "proc" lê /proc diretamente (fds reutilizados,
+    os.pread; inclui CPU por thread e utilização por núcleo), "psutil" é o
+    fallback portátil; "auto" escolhe proc quando disponível.
+
+    Com `core` (modo fixado), a thread de amostragem se fixa nesse núcleo ao
+    iniciar, fora do núcleo em que a carga roda.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        capacity: int = 4096,
+        downsample_factors: Tuple[int, ...] = (16, 256),
+        backend: str = "auto",
+        core: Optional[int] = None
+    ):
+        if backend not in ("auto", "proc", "psutil"):
+            raise ValueError(f"backend must be 'auto', 'proc' or 'psutil', got {backend!r}")
+        if backend == "auto":
+            backend = "proc" if platform.system() == "Linux" and proc_available() else "psutil"
+        self.backend = backend
+        self.core = core
         self.process = psutil.Process()
-        self.samples: List[SystemStatSample] = []
+        self.capacity = capacity
+        self.downsample_factors = downsample_factors
+        self.samples = SampleRingBuffer(capacity, downsample_factors)
         self._sampling = False
         self._start_cycles = None
-        self._perf_counters = None
+        self._perf_counters: Optional[PerfCounterGroup] = None
         self._thread: Optional[threading.Thread] = None
         self._stop_event: Optional[threading.Event] = None
-
-        # Inicializar contadores de performance para Linux
-        if _perf_available:
-            try:
-                self._perf_counters = {
-                    "cycles": perf.perf_counter(perf.PERF_TYPE_HARDWARE, perf.PERF_COUNT_HW_CPU_CYCLES)
-                }
-                logger.info("Perf counters initialized for Linux")
-            except Exception as e:
-                logger.warning(f"Failed to initialize perf counters: {e}")
-                self._perf_counters = None
+        self._proc: Optional[ProcStatReader] = None
+        self._cores_start = []
+        self._threads_start = {}
 
     def _get_windows_cycles(self) -> Optional[int]:
         """Obtém contagem de ciclos no Windows usando QueryPerformanceCounter."""
@@ -91,26 +101,33 @@ class SystemSampler:
             logger.debug("SystemSampler already running; ignoring second start().")
             return
         self._sampling = True
-        self.samples = []
+        self.samples = SampleRingBuffer(self.capacity, self.downsample_factors)
         self._stop_event = threading.Event()
 
         # Capturar estado inicial dos contadores
         if platform.system() == "Windows" and _windows_perf_available:
             self._start_cycles = self._get_windows_cycles()
-        elif _perf_available and self._perf_counters:
-            try:
-                self._perf_counters["cycles"].enable()
-                self._start_cycles = self._perf_counters["cycles"].read()
-            except Exception as e:
-                logger.warning(f"Failed to start perf counters: {e}")
-                self._start_cycles = None
+
+        # Backend /proc: base de CPU por núcleo e por thread para o delta em stop()
+        if self.backend == "proc":
+            self._proc = ProcStatReader()
+            self._proc.read_process()
+            self._cores_start = self._proc.read_cores()
+            self._threads_start = self._proc.read_threads()
 
         def _loop():
+            # Modo fixado: a thread herda a afinidade da carga; muda para o próprio núcleo
+            if self.core is not None and hasattr(os, "sched_setaffinity"):
+                try:
+                    os.sched_setaffinity(0, {self.core})
+                except OSError as e:
+                    logger.warning(f"action=system_sampler_pin status=failed core={self.core} error={e}")
             # Primeira chamada de cpu_percent pode retornar 0; fazer uma leitura inicial descartada.
-            try:
-                self.process.cpu_percent(interval=None)
-            except Exception:
-                pass
+            if self._proc is None:
+                try:
+                    self.process.cpu_percent(interval=None)
+                except Exception:
+                    pass
             while not self._stop_event.is_set():
                 try:
                     sample = self.sample()
@@ -122,6 +139,13 @@ class SystemSampler:
 
         self._thread = threading.Thread(target=_loop, name="SystemSamplerThread", daemon=True)
         self._thread.start()
+
+        # Contadores abertos depois da thread de amostragem: ficam presos à
+        # thread chamadora (workload) e não herdam o próprio sampler
+        if platform.system() == "Linux":
+            self._perf_counters = PerfCounterGroup()
+            if self._perf_counters.open():
+                self._perf_counters.enable()
         logger.debug(f"action=system_sampler_started interval={interval}s")
 
     def sample(self) -> SystemStatSample:
@@ -133,26 +157,46 @@ class SystemSampler:
             current_cycles = self._get_windows_cycles()
             if current_cycles and self._start_cycles:
                 cpu_cycles = current_cycles - self._start_cycles
-        elif _perf_available and self._perf_counters:
-            try:
-                current_cycles = self._perf_counters["cycles"].read()
-                if current_cycles and self._start_cycles:
-                    cpu_cycles = current_cycles - self._start_cycles
-            except Exception as e:
-                logger.debug(f"Failed to read perf counters in sample: {e}")
+        elif self._perf_counters is not None and self._perf_counters.available:
+            # Grupo zerado em start(): leitura já é o delta
+            cpu_cycles = self._perf_counters.read().get("cycles")
+
+        if self._proc is not None:
+            cpu_percent, memory_percent = self._proc.read_process()
+        else:
+            cpu_percent = self.process.cpu_percent(interval=None)
+            memory_percent = self.process.memory_percent()
 
         return SystemStatSample(
             timestamp=time.time(),
-            cpu_percent=self.process.cpu_percent(interval=None),
-            memory_percent=self.process.memory_percent(),
+            cpu_percent=cpu_percent,
+            memory_percent=memory_percent,
             cpu_cycles=cpu_cycles,
         )
 
+    def _stop_proc(self, cores_end, threads_end, thread_names) -> Dict[str, Any]:
+        """Fecha o backend /proc e calcula utilização por núcleo e CPU por thread."""
+        if self._proc is None:
+            return {"sampler_backend": self.backend, "per_core_utilization": [], "thread_cpu_ms": {}}
+        per_core = self._proc.core_utilization(self._cores_start, cores_end)
+        thread_cpu_ms = self._proc.thread_cpu_ms(self._threads_start, threads_end, thread_names)
+        self._proc.close()
+        self._proc = None
+        return {
+            "sampler_backend": self.backend,
+            "per_core_utilization": per_core,
+            "thread_cpu_ms": thread_cpu_ms,
+        }
+
     def stop(self) -> dict:
         """Para amostragem e agrega resultados."""
         if not self._sampling:
             logger.debug("SystemSampler.stop() called but sampler not active.")
         self._sampling = False
+        # Leitura final de /proc antes de encerrar a thread (que também é medida)
+        cores_end = self._proc.read_cores() if self._proc else []
+        threads_end = self._proc.read_threads() if self._proc else {}
+        thread_names = {t.native_id: t.name for t in threading.enumerate()}
         # Sinalizar thread
         if self._stop_event:
             self._stop_event.set()
@@ -160,29 +204,42 @@ class SystemSampler:
             self._thread.join(timeout=2.0)
         self._thread = None
 
-        # Parar contadores perf se estiverem ativos
-        if _perf_available and self._perf_counters:
+        proc_metrics = self._stop_proc(cores_end, threads_end, thread_names)
+
+        # Parar contadores perf e ler valores finais
+        hardware_counters: Dict[str, Optional[int]] = {}
+        counters_unavailable: Dict[str, str] = {}
+        if self._perf_counters is not None:
             try:
-                self._perf_counters["cycles"].disable()
-            except Exception as e:
+                self._perf_counters.disable()
+                hardware_counters = self._perf_counters.read()
+            except OSError as e:
                 logger.debug(f"Failed to disable perf counters: {e}")
+            counters_unavailable = dict(self._perf_counters.errors)
+            self._perf_counters.close()
+            self._perf_counters = None
 
-        if not self.samples:
+        stats = self.samples.stats()
+        if not stats["count"]:
             logger.warning("SystemSampler.stop() no samples collected.")
             return {
                 "cpu_percent_avg": 0.0,
                 "memory_percent_max": 0.0,
-                "cpu_cycles": None,
+                "cpu_cycles": hardware_counters.get("cycles"),
                 "sample_count": 0,
+                "hardware_counters": hardware_counters,
+                "counters_unavailable": counters_unavailable,
+                **proc_metrics,
             }
 
-        # Calcular médias e máximos
-        avg_cpu = sum(s.cpu_percent for s in self.samples) / len(self.samples)
-        max_mem = max(s.memory_percent for s in self.samples)
+        # Médias e máximos já mantidos pelo buffer (O(1))
+        avg_cpu = stats["cpu_percent_avg"]
+        max_mem = stats["memory_percent_max"]
 
         # Agregar ciclos de CPU
-        cycles_samples = [s.cpu_cycles for s in self.samples if s.cpu_cycles is not None]
-        cpu_cycles = max(cycles_samples) if cycles_samples else None
+        cpu_cycles = hardware_counters.get("cycles")
+        if cpu_cycles is None:
+            cpu_cycles = stats["cpu_cycles_max"]
 
         if cpu_cycles is None:
             logger.debug("metric=cpu_cycles status=unavailable")
@@ -190,11 +247,17 @@ class SystemSampler:
             logger.info(f"metric=cpu_cycles value={cpu_cycles}")
 
         logger.info(
-            f"action=system_stats_aggregated samples={len(self.samples)} cpu_avg={avg_cpu:.2f} mem_max={max_mem:.2f}"
+            f"action=system_stats_aggregated samples={stats['count']} cpu_avg={avg_cpu:.2f} mem_max={max_mem:.2f}"
         )
         return {
             "cpu_percent_avg": avg_cpu,
             "memory_percent_max": max_mem,
             "cpu_cycles": cpu_cycles,
-            "sample_count": len(self.samples),
+            "sample_count": stats["count"],
+            "samples_retained": stats["retained"],
+            "cpu_percent_max": stats["cpu_percent_max"],
+            "memory_percent_avg": stats["memory_percent_avg"],
+            "hardware_counters": hardware_counters,
+            "counters_unavailable": counters_unavailable,
+            **proc_metrics,
         }
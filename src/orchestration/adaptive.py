@@ -0,0 +1,136 @@
+"""
+Volume adaptativo ("auto"): executa lotes até atingir a precisão desejada.
+
+A latência por operação de cada lote (tempo do lote / operações) é tratada
+como uma amostra; o método de médias por lote reduz a autocorrelação entre
+operações consecutivas. A execução para quando o intervalo de confiança de
+95% da média fica dentro do erro relativo alvo ou quando o orçamento de
+tempo se esgota — algoritmos ruidosos recebem mais lotes, cifras rápidas e
+estáveis param cedo.
+"""
+from typing import Dict, Any, Callable, List, Optional
+from time import perf_counter_ns
+from logging import getLogger
+from metrics.aggregator import merge_algorithm_results
+from metrics.stats import mean_confidence_interval
+
+logger = getLogger(__name__)
+
+
+class AdaptiveRun:
+    """
+    Callable que substitui a função do algoritmo no ProfilerManager.
+
+    A primeira chamada sem `volume` executa a busca adaptativa; chamadas
+    seguintes sem `volume` (passada de memória, diagnóstico cProfile) repetem
+    o volume já alcançado em uma única execução. Com `volume` explícito
+    (aquecimento) delega direto ao algoritmo.
+
+    Uso típico:
+        adaptive = AdaptiveRun(run_mlkem, target_error=0.02, time_budget_s=30)
+        ProfilerManager().profile_function(adaptive, volume=None, seed=42)
+        adaptive.precision["achieved_relative_error"]
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        target_error: float = 0.02,
+        time_budget_s: float = 60.0,
+        min_batches: int = 5,
+        min_batch_ms: float = 50.0,
+        initial_batch: int = 1
+    ) -> None:
+        if target_error <= 0:
+            raise ValueError(f"target_error must be greater than 0, got {target_error}")
+        if time_budget_s <= 0:
+            raise ValueError(f"time_budget_s must be greater than 0, got {time_budget_s}")
+        if min_batches < 2:
+            raise ValueError(f"min_batches must be at least 2, got {min_batches}")
+        self.func = func
+        self.target_error = target_error
+        self.time_budget_s = time_budget_s
+        self.min_batches = min_batches
+        self.min_batch_ms = min_batch_ms
+        self.initial_batch = initial_batch
+        self.achieved_volume: Optional[int] = None
+        self.precision: Dict[str, Any] = {}
+
+    def __call__(self, volume: Optional[int] = None, seed: int = 42, **options) -> Dict[str, Any]:
+        if volume is not None:
+            return self.func(volume=volume, seed=seed, **options)
+        if self.achieved_volume is not None:
+            return self.func(volume=self.achieved_volume, seed=seed, **options)
+        return self._search(seed, options)
+
+    def _search(self, seed: int, options: Dict[str, Any]) -> Dict[str, Any]:
+        """Executa lotes até o IC de 95% atingir o erro alvo ou o orçamento esgotar."""
+        budget_ns = self.time_budget_s * 1e9
+        started_ns = perf_counter_ns()
+
+        # Calibração: dobra o lote até durar min_batch_ms (ruído do timer desprezível);
+        # lotes de calibração também contam como resultado, mas não como amostra
+        results: List[Dict[str, Any]] = []
+        volumes: List[int] = []
+        batch = self.initial_batch
+        batch_seed = seed
+        while True:
+            result, elapsed_ns = self._run_batch(batch, batch_seed, options)
+            results.append(result)
+            volumes.append(batch)
+            batch_seed += 1
+            if elapsed_ns >= self.min_batch_ms * 1e6 or perf_counter_ns() - started_ns >= budget_ns:
+                break
+            batch *= 2
+
+        per_op_ns: List[float] = [elapsed_ns / result.get("operations_completed", batch)]
+        interval = mean_confidence_interval(per_op_ns)
+        stop_reason = "time_budget"
+
+        while perf_counter_ns() - started_ns < budget_ns:
+            result, elapsed_ns = self._run_batch(batch, batch_seed, options)
+            results.append(result)
+            volumes.append(batch)
+            batch_seed += 1
+            per_op_ns.append(elapsed_ns / result.get("operations_completed", batch))
+
+            interval = mean_confidence_interval(per_op_ns)
+            error = interval["relative_error"]
+            if len(per_op_ns) >= self.min_batches and error is not None and error <= self.target_error:
+                stop_reason = "target_reached"
+                break
+
+        merged = merge_algorithm_results(results)
+        # Campos descritivos (algorithm, mode, ...) do primeiro lote; volume = total por célula
+        combined = {**results[0], **merged}
+        self.achieved_volume = sum(volumes)
+        combined["volume"] = self.achieved_volume
+
+        self.precision = {
+            "mode": "auto",
+            "target_relative_error": self.target_error,
+            "achieved_relative_error": interval["relative_error"],
+            "converged": stop_reason == "target_reached",
+            "stop_reason": stop_reason,
+            "mean_us": interval["mean"] / 1e3,
+            "ci_low_us": interval["low"] / 1e3 if interval["low"] is not None else None,
+            "ci_high_us": interval["high"] / 1e3 if interval["high"] is not None else None,
+            "batches": len(per_op_ns),
+            "batch_size": batch,
+            "volume": self.achieved_volume,
+            "elapsed_s": (perf_counter_ns() - started_ns) / 1e9,
+            "time_budget_s": self.time_budget_s
+        }
+        combined["precision"] = self.precision
+
+        logger.info(
+            f"action=adaptive_volume: COMPLETE volume={self.achieved_volume} batches={len(per_op_ns)} "
+            f"batch_size={batch} relative_error={interval['relative_error']} reason={stop_reason}"
+        )
+        return combined
+
+    def _run_batch(self, batch: int, seed: int, options: Dict[str, Any]):
+        """Executa um lote e retorna (resultado, duração em ns)."""
+        start_ns = perf_counter_ns()
+        result = self.func(volume=batch, seed=seed, **options)
+        return result, perf_counter_ns() - start_ns
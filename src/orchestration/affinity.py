@@ -0,0 +1,257 @@
+"""
+Afinidade de CPU para execução de workloads em núcleos dedicados.
+
+Inclui o modo fixado (PinnedExecution): carga e amostrador em núcleos
+distintos, prioridade opcional e checagem de governador/turbo antes da medição.
+"""
+from typing import Dict, Any, List, Optional, Tuple
+from logging import getLogger
+import os
+
+from metrics.environment import capture_environment, isolated_cpus, parse_cpulist
+from config import PIN_POLICIES, PIN_POLICY, PIN_PRIORITY
+
+logger = getLogger(__name__)
+
+
+def _read_sysfs(path: str) -> Optional[str]:
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def available_cores() -> List[int]:
+    """
+    Lista os núcleos em que o processo atual pode executar.
+    
+    Returns:
+        Lista ordenada de índices de CPU (fallback: range(cpu_count))
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def pin_to_core(core: int, pid: int = 0) -> bool:
+    """
+    Fixa o processo (ou thread, via native id) em um único núcleo.
+    
+    Args:
+        core: Índice da CPU
+        pid: PID/TID alvo (0 = processo atual)
+        
+    Returns:
+        True se a afinidade foi aplicada, False se indisponível na plataforma
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        logger.debug(f"action=pin_to_core status=unsupported core={core}")
+        return False
+    try:
+        os.sched_setaffinity(pid, {core})
+        logger.debug(f"action=pin_to_core status=success core={core} pid={pid}")
+        return True
+    except OSError as e:
+        logger.warning(f"action=pin_to_core status=failed core={core} error={e}")
+        return False
+
+
+def thread_siblings(core: int) -> List[int]:
+    """
+    Núcleos lógicos que compartilham o núcleo físico de `core` (SMT), incluindo ele.
+    
+    Returns:
+        Lista ordenada de índices (fallback: [core] sem topologia no sysfs)
+    """
+    siblings = parse_cpulist(_read_sysfs(f"/sys/devices/system/cpu/cpu{core}/topology/thread_siblings_list"))
+    return siblings or [core]
+
+
+def choose_cores(workload_core: Optional[int] = None, sampler_core: Optional[int] = None) -> Tuple[int, Optional[int]]:
+    """
+    Escolhe o núcleo da carga e o do amostrador para o modo fixado.
+    
+    Carga: núcleo isolado (isolcpus) disponível de maior índice; sem isolamento,
+    o último núcleo disponível (o núcleo 0 concentra interrupções e tarefas do
+    sistema). Amostrador: primeiro núcleo disponível fora do núcleo físico da
+    carga (evita dividir o núcleo com um irmão SMT); None com um único núcleo.
+    
+    Raises:
+        ValueError: Se um núcleo informado não estiver disponível ao processo
+    """
+    cores = available_cores()
+    for name, core in (("workload_core", workload_core), ("sampler_core", sampler_core)):
+        if core is not None and core not in cores:
+            raise ValueError(f"{name} {core} is not available to this process (available: {cores})")
+    if workload_core is not None and workload_core == sampler_core:
+        raise ValueError("workload_core and sampler_core must be different")
+    
+    if workload_core is None:
+        isolated = [core for core in isolated_cpus() if core in cores and core != sampler_core]
+        workload_core = (isolated or [core for core in cores if core != sampler_core] or cores)[-1]
+    if sampler_core is None:
+        siblings = set(thread_siblings(workload_core))
+        candidates = [core for core in cores if core not in siblings] or [core for core in cores if core != workload_core]
+        sampler_core = candidates[0] if candidates else None
+    return workload_core, sampler_core
+
+
+def frequency_scaling_issues(environment: Dict[str, Any]) -> List[str]:
+    """
+    Problemas de escalonamento de frequência que tornam a medição instável.
+    
+    Args:
+        environment: Dict de metrics.environment.capture_environment
+        
+    Returns:
+        Lista de descrições (vazia: governador performance/indisponível e turbo desligado/desconhecido)
+    """
+    issues = []
+    governor = environment.get("cpu_governor")
+    if governor is not None and governor != "performance":
+        issues.append(f"governor={governor} (expected performance)")
+    if environment.get("turbo"):
+        issues.append("turbo enabled")
+    return issues
+
+
+def set_priority(niceness: int) -> Optional[int]:
+    """
+    Ajusta o nice do processo (negativo exige CAP_SYS_NICE).
+    
+    Returns:
+        Nice anterior se aplicado, None se indisponível ou sem permissão
+    """
+    if not hasattr(os, "setpriority"):
+        return None
+    try:
+        previous = os.getpriority(os.PRIO_PROCESS, 0)
+        os.setpriority(os.PRIO_PROCESS, 0, niceness)
+        return previous
+    except OSError as e:
+        logger.warning(f"action=set_priority status=failed niceness={niceness} error={e}")
+        return None
+
+
+class PinnedExecution:
+    """
+    Modo fixado: carga e amostrador em núcleos dedicados, checagem de frequência.
+    
+    Uso típico:
+        pinning = PinnedExecution(priority=-10, policy="refuse")
+        profiler = ProfilerManager(sampler_core=pinning.sampler_core)
+        with pinning:
+            profiler.profile_function(...)
+        pinning.report   # núcleos, prioridade, governador, turbo, avisos
+    
+    apply() fixa a thread chamadora (a que executa a carga) em workload_core; o
+    SystemSampler criado com sampler_core fixa a própria thread no outro núcleo.
+    Com policy="refuse", governador diferente de performance ou turbo ligado
+    abortam a execução (RuntimeError) antes de qualquer mudança; com "warn" são
+    apenas registrados em report["warnings"].
+    """
+    
+    def __init__(
+        self,
+        workload_core: Optional[int] = None,
+        sampler_core: Optional[int] = None,
+        priority: Optional[int] = PIN_PRIORITY,
+        policy: str = PIN_POLICY
+    ) -> None:
+        if policy not in PIN_POLICIES:
+            raise ValueError(f"Unknown pin policy '{policy}'. Valid options: {', '.join(PIN_POLICIES)}")
+        self.workload_core, self.sampler_core = choose_cores(workload_core, sampler_core)
+        self.priority = priority
+        self.policy = policy
+        self.report: Dict[str, Any] = {}
+        self._previous_affinity: Optional[List[int]] = None
+        self._previous_priority: Optional[int] = None
+    
+    def apply(self) -> Dict[str, Any]:
+        """
+        Checa governador/turbo e aplica afinidade e prioridade.
+        
+        Returns:
+            Dict com:
+                - workload_core: int
+                - sampler_core: int | None
+                - pinned: bool (afinidade aplicada)
+                - priority: int | None (nice solicitado)
+                - priority_applied: bool
+                - policy: str
+                - cpu_governor: str | None
+                - turbo: bool | None
+                - workload_isolated: bool | None (None sem isolcpus no host)
+                - warnings: list[str]
+                - refused: bool
+        
+        Raises:
+            RuntimeError: policy="refuse" e frequência instável
+        """
+        environment = capture_environment()
+        issues = frequency_scaling_issues(environment)
+        isolated = environment.get("isolated_cpus") or []
+        warnings = list(issues)
+        if isolated and self.workload_core not in isolated:
+            warnings.append(f"workload core {self.workload_core} is not isolated (isolcpus={isolated})")
+        if self.sampler_core is not None and self.sampler_core in thread_siblings(self.workload_core):
+            warnings.append(f"sampler core {self.sampler_core} shares a physical core with the workload")
+        if self.sampler_core is None:
+            warnings.append("single core available: sampler shares the workload core")
+        
+        self.report = {
+            "workload_core": self.workload_core,
+            "sampler_core": self.sampler_core,
+            "pinned": False,
+            "priority": self.priority,
+            "priority_applied": False,
+            "policy": self.policy,
+            "cpu_governor": environment.get("cpu_governor"),
+            "turbo": environment.get("turbo"),
+            "workload_isolated": self.workload_core in isolated if isolated else None,
+            "warnings": warnings,
+            "refused": False,
+        }
+        
+        if issues and self.policy == "refuse":
+            self.report["refused"] = True
+            logger.error(f"action=pinned_execution status=refused issues={issues}")
+            raise RuntimeError(f"pinned run refused: {'; '.join(issues)}")
+        
+        self._previous_affinity = available_cores()
+        self.report["pinned"] = pin_to_core(self.workload_core)
+        if not self.report["pinned"]:
+            warnings.append("CPU affinity unavailable on this platform")
+        if self.priority is not None:
+            self._previous_priority = set_priority(self.priority)
+            self.report["priority_applied"] = self._previous_priority is not None
+            if not self.report["priority_applied"]:
+                warnings.append(f"could not set priority {self.priority} (requires CAP_SYS_NICE)")
+        
+        for warning in warnings:
+            logger.warning(f"action=pinned_execution warning=\"{warning}\"")
+        logger.info(
+            f"action=pinned_execution status=applied workload_core={self.workload_core} "
+            f"sampler_core={self.sampler_core} priority={self.priority}"
+        )
+        return self.report
+    
+    def restore(self) -> None:
+        """Restaura afinidade e prioridade anteriores (idempotente)."""
+        if self._previous_affinity is not None and hasattr(os, "sched_setaffinity"):
+            try:
+                os.sched_setaffinity(0, set(self._previous_affinity))
+            except OSError as e:
+                logger.warning(f"action=pinned_execution status=restore_failed error={e}")
+        if self._previous_priority is not None:
+            set_priority(self._previous_priority)
+        self._previous_affinity = None
+        self._previous_priority = None
+    
+    def __enter__(self) -> "PinnedExecution":
+        self.apply()
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.restore()
@@ -0,0 +1,102 @@
+"""
+Comparação entre execuções armazenadas (detecção de regressões).
+
+Carrega baseline e candidata do ResultsStore, aplica os testes de
+metrics.regression e gera relatório Markdown de diferenças.
+"""
+from typing import Dict, Any, List, Optional
+from datetime import datetime
+from pathlib import Path
+import logging
+
+from metrics.regression import compare_runs
+from storage.results_store import ResultsStore
+from visualize.report_markdown import ReportMarkdown
+from config import RESULTS_DIR, REGRESSION_ALPHA, REGRESSION_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+
+class Compare:
+    def __init__(self, results_store: Optional[ResultsStore] = None) -> None:
+        self.results_store = results_store or ResultsStore()
+        self.report_markdown = ReportMarkdown()
+
+    def run(
+        self,
+        baseline_ids: List[str],
+        candidate_ids: List[str],
+        alpha: float = REGRESSION_ALPHA,
+        threshold: float = REGRESSION_THRESHOLD,
+        output_path: Optional[Path] = None
+    ) -> Dict[str, Any]:
+        """
+        Compara uma execução candidata com a baseline.
+
+        Args:
+            baseline_ids: Ids de avaliações da baseline (várias são combinadas)
+            candidate_ids: Ids de avaliações da candidata
+            alpha: Nível de significância dos testes
+            threshold: Variação relativa mínima para regressão (0.05 = 5%)
+            output_path: Caminho do relatório (default: RESULTS_DIR/<algoritmo>/comparacoes/)
+
+        Returns:
+            Dict com:
+                - algorithm: str
+                - baseline / candidate: list[dict] (resumo de cada avaliação)
+                - alpha / threshold: float
+                - phases / metrics / regressions / has_regression (ver compare_runs)
+                - report_path: str
+
+        Raises:
+            ValueError: Se listas vazias, parâmetros inválidos ou algoritmos diferentes
+            KeyError: Se algum id não estiver no store
+        """
+        if not baseline_ids or not candidate_ids:
+            raise ValueError("baseline and candidate must each have at least one evaluation id")
+        if not 0 < alpha < 1:
+            raise ValueError(f"alpha must be between 0 and 1, got {alpha}")
+        if threshold < 0:
+            raise ValueError(f"threshold must not be negative, got {threshold}")
+
+        logger.info(f"action=compare: START baseline={baseline_ids} candidate={candidate_ids} alpha={alpha} threshold={threshold}")
+
+        baseline = [self.results_store.load(i) for i in baseline_ids]
+        candidate = [self.results_store.load(i) for i in candidate_ids]
+        algorithms = {r["evaluation"].get("algorithm") for r in baseline + candidate}
+        if len(algorithms) != 1:
+            raise ValueError(f"cannot compare different algorithms: {sorted(map(str, algorithms))}")
+        algorithm = algorithms.pop()
+
+        comparison = {
+            "algorithm": algorithm,
+            "baseline": [self._summary(r["evaluation"]) for r in baseline],
+            "candidate": [self._summary(r["evaluation"]) for r in candidate],
+            "alpha": alpha,
+            "threshold": threshold,
+            "compared_at": datetime.now().isoformat(),
+            **compare_runs(baseline, candidate, alpha, threshold)
+        }
+
+        if output_path is None:
+            output_path = RESULTS_DIR / algorithm / "comparacoes" / f"{baseline_ids[0]}__{candidate_ids[0]}.md"
+        self.report_markdown.build_comparison_report(comparison, Path(output_path))
+        comparison["report_path"] = str(output_path)
+
+        logger.info(
+            f"action=compare: COMPLETE algorithm={algorithm} regressions={comparison['regressions']} "
+            f"environment_mismatches={comparison['environment_mismatches']} "
+            f"report={output_path}"
+        )
+        return comparison
+
+    def _summary(self, evaluation: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": evaluation.get("id"),
+            "started_at": evaluation.get("started_at"),
+            "host": evaluation.get("host"),
+            "volume": evaluation.get("volume"),
+            "trials": evaluation.get("trials", 1),
+            "status": evaluation.get("status"),
+            "environment_hash": (evaluation.get("environment") or {}).get("environment_hash")
+        }
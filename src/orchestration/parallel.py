@@ -0,0 +1,160 @@
+"""
+Execução paralela multi-processo de workloads de algoritmos.
+
+Cada worker recebe apenas (algoritmo, volume do shard, seed, núcleo) e cria
+seu próprio ProfilerManager; nenhum estado de profiling é serializado.
+"""
+from typing import Dict, Any, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from logging import getLogger
+
+from metrics.profile.manager import ProfilerManager
+from metrics.hardware import Hardware
+from metrics.aggregator import merge_worker_results
+from metrics.proc_reader import ProcStatReader, proc_available, busy_cores
+from orchestration.affinity import available_cores, pin_to_core
+
+logger = getLogger(__name__)
+
+
+def split_volume(volume: int, workers: int) -> List[int]:
+    """
+    Divide volume em shards o mais uniformes possível.
+    
+    Args:
+        volume: Número total de operações
+        workers: Número de workers
+        
+    Returns:
+        Lista de volumes por worker (shards vazios são descartados)
+    """
+    base, remainder = divmod(volume, workers)
+    shards = [base + (1 if idx < remainder else 0) for idx in range(workers)]
+    return [s for s in shards if s > 0]
+
+
+def _run_shard(
+    algorithm: str,
+    volume: int,
+    seed: int,
+    core: Optional[int],
+    options: Dict[str, Any],
+    profiler_settings: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Executa um shard no processo worker (fixado em `core`) e retorna métricas serializáveis.
+    
+    A janela started_ns/ended_ns é a da passada medida (lean): aquecimento,
+    passada de memória separada e cProfile ficam fora do throughput.
+    """
+    from config import ALGORITHMS
+    
+    pinned = pin_to_core(core) if core is not None else False
+    
+    profiled = ProfilerManager(**profiler_settings).profile_function(ALGORITHMS[algorithm], volume=volume, seed=seed, **options)
+    window = profiled["window_ns"]
+    
+    result = profiled["result"] if isinstance(profiled["result"], dict) else {}
+    
+    return {
+        "core": core,
+        "pinned": pinned,
+        "volume": volume,
+        "seed": seed,
+        "operations_completed": result.get("operations_completed", volume),
+        "started_ns": window["started_ns"],
+        "ended_ns": window["ended_ns"],
+        "metrics": profiled["metrics"],
+        "phase_latencies_ns": result.get("phase_latencies_ns", {}),
+        "cells": result.get("cells", [])
+    }
+
+
+class ParallelExecutor:
+    """
+    Divide o volume de um algoritmo entre N processos, um por núcleo.
+    
+    Uso típico:
+        profiled = ParallelExecutor(workers=4).run("KEM", volume=1000, seed=42)
+        profiled["metrics"]["parallel_metrics"]["scaling_efficiency"]
+    
+    O retorno tem o mesmo formato de ProfilerManager.profile_function.
+    """
+    
+    def __init__(
+        self,
+        workers: int,
+        measure_reference: bool = True,
+        profiler_settings: Optional[Dict[str, Any]] = None
+    ) -> None:
+        if workers <= 0:
+            raise ValueError(f"workers must be greater than 0, got {workers}")
+        self.workers = workers
+        self.measure_reference = measure_reference
+        # Parâmetros primitivos do ProfilerManager (ex: aquecimento) de cada worker
+        self.profiler_settings = profiler_settings or {}
+        
+    def run(
+        self,
+        algorithm: str,
+        volume: int,
+        seed: int,
+        options: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Executa o algoritmo em paralelo e agrega métricas dos workers.
+        
+        Args:
+            algorithm: Chave em config.ALGORITHMS
+            volume: Número total de operações (dividido entre workers)
+            seed: Seed base (worker i usa seed+i)
+            options: Parâmetros extras repassados ao algoritmo
+            
+        Returns:
+            Dict com:
+                - result: dict (operations_completed, phase_latencies_ns, cells)
+                - metrics: dict (métricas agregadas + parallel_metrics)
+        """
+        options = options or {}
+        shards = split_volume(volume, self.workers)
+        cores = available_cores()
+        
+        logger.info(f"action=parallel_run: START algorithm={algorithm} volume={volume} workers={len(shards)} cores={cores}")
+        
+        # Referência: um único worker processando um shard sozinho
+        reference = None
+        if self.measure_reference and len(shards) > 1:
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                reference = pool.submit(
+                    _run_shard, algorithm, shards[0], seed, cores[0], options, self.profiler_settings
+                ).result()
+        
+        # Utilização por núcleo durante a fase paralela: evidência de distribuição
+        reader = ProcStatReader() if proc_available() else None
+        cores_before = reader.read_cores() if reader else []
+        
+        with ProcessPoolExecutor(max_workers=len(shards)) as pool:
+            futures = [
+                pool.submit(
+                    _run_shard, algorithm, shard, seed + idx, cores[idx % len(cores)], options, self.profiler_settings
+                )
+                for idx, shard in enumerate(shards)
+            ]
+            worker_results = [f.result() for f in futures]
+        
+        merged = merge_worker_results(worker_results, reference)
+        merged["metrics"]["hardware_info"] = Hardware().snapshot_hardware()
+        
+        if reader is not None:
+            per_core = reader.core_utilization(cores_before, reader.read_cores())
+            reader.close()
+            distribution = merged["metrics"]["cpu_distribution"]
+            distribution["per_core_utilization"] = per_core
+            distribution["busy_cores"] = busy_cores(per_core)
+        
+        parallel = merged["metrics"]["parallel_metrics"]
+        logger.info(
+            f"action=parallel_run: COMPLETE workers={parallel['workers']} "
+            f"ops_per_sec={parallel['aggregate_ops_per_sec']:.2f} efficiency={parallel['scaling_efficiency']}"
+        )
+        return merged
@@ -3,38 +3,81 @@ Orquestração de análise de escalabilidade multi-volume.
 
 User Story 3: Avaliar escalabilidade executando múltiplos volumes.
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 from pathlib import Path
 import logging
+import sqlite3
 
 from orchestration.single import Single
-from metrics.aggregator import aggregate_series
+from orchestration.affinity import available_cores
+from orchestration.scheduler import TrialScheduler
+from metrics.accumulator import SeriesAccumulator
+from storage.catalog import RunCatalog
+from storage.results_store import ResultsStore
+from metrics.scaling import analyze_scaling, default_worker_counts, SCALING_MODES
+from metrics.matrix import summarize_matrix, interleaved_order
+from metrics.drift import estimate_drift, corrected_medians
 from visualize.report_markdown import ReportMarkdown
 from visualize.plotting import Plotting
-from config import SEED, ALGORITHMS, RESULTS_DIR
+from visualize.renderer import RenderPool
+from config import (
+    SEED, ALGORITHMS, RESULTS_DIR, DEFAULT_TRIALS, SCHEDULE_ORDER, SCHEDULE_TRIALS, SCHEDULE_COOLDOWN_S, SERIES_RENDER_MODE
+)
 
 logger = logging.getLogger(__name__)
 
 class Scalability:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        results_store: Optional[ResultsStore] = None,
+        catalog: Optional[RunCatalog] = None
+    ) -> None:
+        """
+        Args:
+            results_store: Store das avaliações individuais (default: STORE_DIR)
+            catalog: Catálogo de avaliações e séries (default: CATALOG_PATH)
+        """
         self.report_markdown = ReportMarkdown()
         self.plotting = Plotting()
-        pass
+        self.results_store = results_store or ResultsStore()
+        self.catalog = catalog or RunCatalog()
 
     def run(
         self,
         algorithm: str,
         volumes: List[int],
-        seed: int = SEED
+        seed: int = SEED,
+        options: Optional[Dict[str, Any]] = None,
+        trials: int = SCHEDULE_TRIALS,
+        order: str = SCHEDULE_ORDER,
+        cooldown_s: float = SCHEDULE_COOLDOWN_S,
+        render: str = SERIES_RENDER_MODE,
+        pinning: Optional[Dict[str, Any]] = None,
+        profiler_settings: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Executa análise de escalabilidade com múltiplos volumes.
         
+        As execuções (volume x repetição) seguem o TrialScheduler: ordem
+        permutada com `seed` por padrão, pausa opcional entre execuções e
+        marcação temporal em evaluation["schedule"]. Com 2+ repetições por
+        volume a deriva do tempo de CPU é estimada e corrigida (metrics.drift).
+        
         Args:
             algorithm: Nome do algoritmo ("MLKEM_1024", "MLDSA_87", "Krypton")
             volumes: Lista de volumes a testar (ex: [100, 500, 1000, 5000])
-            seed: Seed base para PRNG (cada volume usa seed+index)
+            seed: Seed base para PRNG e para a permutação (volume i, repetição k
+                usa seed + i + k * nº de volumes)
+            options: Parâmetros extras repassados ao algoritmo em cada volume
+            trials: Repetições por volume
+            order: "random" (permutação com seed) ou "sequential" (volumes em ordem)
+            cooldown_s: Pausa entre execuções (s)
+            render: Relatórios individuais (ver Single.run); "background" os gera
+                em processos separados enquanto a série continua medindo
+            pinning: Modo fixado repassado a cada Single.run (ver PinnedExecution)
+            profiler_settings: Argumentos de profiling repassados a cada Single.run
+                (warmup_iterations, steady_state_cv, cprofile, memory_pass)
             
         Returns:
             Dict ScalabilitySeries com:
@@ -46,58 +89,67 @@ class Scalability:
                 - comparative_report_path: str
                 - comparison_images: list[str] (paths)
                 - aggregated_metrics: dict
+                - schedule: dict (order, trials, cooldown_s, seed, sequence, drift,
+                  volume_medians)
                 - status: str (success|partial|failed)
                 
         Raises:
-            ValueError: Se algorithm inválido ou volumes vazio
+            ValueError: Se algorithm inválido, volumes vazio ou agendamento inválido
         """
         # Validações
         self.validate_volumes(algorithm, volumes)
         
-        logger.info(f"action=run_scalability: START algorithm={algorithm} volumes={volumes} seed={seed}")
+        scheduler = TrialScheduler(volumes, trials=trials, order=order, seed=seed, cooldown_s=cooldown_s)
         
-        single = Single()
+        logger.info(
+            f"action=run_scalability: START algorithm={algorithm} volumes={volumes} seed={seed} "
+            f"trials={trials} order={order} cooldown_s={cooldown_s}"
+        )
+        
+        render_pool = RenderPool()
+        single = Single(results_store=self.results_store, catalog=self.catalog, render_pool=render_pool)
         started_at = datetime.now()
         series_id = f"{algorithm}_scalability_{started_at.strftime('%Y%m%d_%H%M%S_%f')}"
         
-        # Executar avaliações individuais para cada volume
-        evaluations = []
-        evaluation_ids = []
+        # Executar avaliações na ordem do agendador; agregados em streaming
         individual_reports = []
+        accumulator = SeriesAccumulator()
         
-        for idx, volume in enumerate(volumes):
-            logger.info(f"action=simgle: START volume={volume} index={idx+1}/{len(volumes)}")
-            
+        def execute(slot: Dict[str, Any]) -> Dict[str, Any]:
+            volume = slot["volume"]
             try:
-                # Usar seed incremental para cada volume
                 eval_result = single.run(
                     algorithm=algorithm,
                     volume=volume,
-                    seed=seed + idx
+                    seed=slot["seed"],
+                    options=options,
+                    render=render,
+                    pinning=pinning,
+                    **(profiler_settings or {})
                 )
-                
-                evaluations.append(eval_result)
-                evaluation_ids.append(eval_result["id"])
-                individual_reports.append(eval_result["report_path"])
-                
+                if eval_result.get("report_path"):
+                    individual_reports.append(eval_result["report_path"])
             except Exception as e:
                 logger.error(f"action=single FAILED volume={volume} error={str(e)}")
                 
                 # Criar avaliação com status failed
-                failed_eval = {
-                    "id": f"{algorithm}_{volume}_failed_{idx}",
+                eval_result = {
+                    "id": f"{algorithm}_{volume}_failed_{slot['position']}",
                     "algorithm": algorithm,
                     "volume": volume,
                     "status": "failed",
                     "metrics": {},
                     "notes": f"Error: {str(e)}",
-                    "seed": seed + idx
+                    "seed": slot["seed"]
                 }
-                evaluations.append(failed_eval)
-                evaluation_ids.append(failed_eval["id"])
+            accumulator.add(eval_result)
+            return eval_result
         
-        # Agregar métricas de todas as avaliações
-        aggregated = aggregate_series(evaluations)
+        evaluations = scheduler.run(execute)
+        evaluation_ids = [e["id"] for e in evaluations]
+        aggregated = accumulator.result()
+        schedule = self._schedule_summary(scheduler, evaluations)
+        self._collect_renders(render_pool, evaluations)
         
         # Determinar status geral
         if aggregated["success_rate"] == 1.0:
@@ -112,7 +164,7 @@ class Scalability:
         
         # Gerar relatório comparativo
         comparative_report_path = self._generate_comparative_report(
-            algorithm, volumes, evaluations, aggregated, comparison_images, started_at
+            algorithm, volumes, evaluations, aggregated, comparison_images, started_at, schedule
         )
         
         ended_at = datetime.now()
@@ -127,14 +179,326 @@ class Scalability:
             "comparative_report_path": str(comparative_report_path),
             "comparison_images": [str(p) for p in comparison_images],
             "aggregated_metrics": aggregated,
+            "schedule": schedule,
             "status": status,
             "duration_ms": duration_ms
         }
         
         logger.info(f"action=run_scalability_complete id={series_id} status={status} duration_ms={duration_ms:.2f}")
+        self._catalog_series(result, "volumes", started_at)
+        
+        return result
+
+    def run_workers(
+        self,
+        algorithm: str,
+        volume: int,
+        worker_counts: Optional[List[int]] = None,
+        seed: int = SEED,
+        options: Optional[Dict[str, Any]] = None,
+        mode: str = "strong",
+        render: str = SERIES_RENDER_MODE,
+        trials: int = DEFAULT_TRIALS,
+        profiler_settings: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Executa varredura de número de workers (escalabilidade por núcleos).
+        
+        Args:
+            algorithm: Nome do algoritmo
+            volume: strong -> volume total fixo; weak -> volume por worker
+            worker_counts: Contagens a testar (default: 1, 2, 4, ... até nº de núcleos)
+            seed: Seed base (cada worker usa seed+index)
+            options: Parâmetros extras repassados ao algoritmo
+            mode: "strong" ou "weak"
+            render: Relatórios individuais (ver Single.run)
+            trials: Repetições de cada contagem de workers (ver Single.run)
+            profiler_settings: Argumentos de profiling repassados a cada Single.run
+                (warmup_iterations, steady_state_cv, cprofile, memory_pass)
+            
+        Returns:
+            Dict com:
+                - id: str
+                - algorithm: str
+                - mode: str
+                - volume: int
+                - worker_counts: list[int]
+                - evaluation_ids: list[str]
+                - scaling: dict (speedup, eficiência, fração serial por ponto)
+                - comparative_report_path: str
+                - comparison_images: list[str] (paths)
+                - status: str (success|partial|failed)
+                
+        Raises:
+            ValueError: Se algorithm, volume, worker_counts ou mode inválidos
+        """
+        worker_counts = sorted(set(worker_counts or default_worker_counts(len(available_cores()))))
+        
+        self.validate_volumes(algorithm, [volume])
+        if any(n <= 0 for n in worker_counts):
+            raise ValueError("All worker counts must be greater than 0")
+        if mode not in SCALING_MODES:
+            raise ValueError(f"Unknown scaling mode '{mode}'. Valid options: {', '.join(SCALING_MODES)}")
+        
+        logger.info(f"action=run_workers: START algorithm={algorithm} volume={volume} workers={worker_counts} mode={mode}")
+        
+        render_pool = RenderPool()
+        single = Single(results_store=self.results_store, catalog=self.catalog, render_pool=render_pool)
+        started_at = datetime.now()
+        series_id = f"{algorithm}_workers_{mode}_{started_at.strftime('%Y%m%d_%H%M%S_%f')}"
+        
+        evaluations = []
+        for workers in worker_counts:
+            total_volume = volume if mode == "strong" else volume * workers
+            evaluation = single.run(
+                algorithm=algorithm,
+                volume=total_volume,
+                seed=seed,
+                options=options,
+                workers=workers,
+                use_pool=True,
+                measure_reference=False,
+                render=render,
+                trials=trials,
+                **(profiler_settings or {})
+            )
+            evaluations.append(evaluation)
+        self._collect_renders(render_pool, evaluations)
+        
+        # Pontos válidos: execuções bem-sucedidas com throughput medido
+        measured = [
+            e for e in evaluations
+            if e.get("status") == "success" and e.get("parallel_metrics", {}).get("aggregate_ops_per_sec", 0) > 0
+        ]
+        scaling = analyze_scaling(
+            [e["workers"] for e in measured],
+            [e["parallel_metrics"]["aggregate_ops_per_sec"] for e in measured],
+            mode
+        )
+        
+        success_rate = len(measured) / len(evaluations)
+        status = "success" if success_rate == 1.0 else "partial" if success_rate > 0 else "failed"
+        
+        comparison_images = self._generate_worker_graphs(algorithm, scaling, started_at)
+        
+        timestamp_str = started_at.strftime("%d-%m-%Y %Hh%Mm%Ss.%f")[:-3]
+        algo_dir = RESULTS_DIR / algorithm
+        algo_dir.mkdir(parents=True, exist_ok=True)
+        report_path = algo_dir / f"{algorithm} - Escalabilidade por Núcleos - {timestamp_str}.md"
+        
+        self.report_markdown.build_scaling_report({
+            "algorithm": algorithm,
+            "mode": mode,
+            "volume": volume,
+            "scaling": scaling,
+            "evaluations": evaluations,
+            "started_at": started_at.isoformat()
+        }, report_path, comparison_images)
+        
+        duration_ms = (datetime.now() - started_at).total_seconds() * 1000
+        
+        result = {
+            "id": series_id,
+            "algorithm": algorithm,
+            "mode": mode,
+            "volume": volume,
+            "worker_counts": worker_counts,
+            "evaluation_ids": [e["id"] for e in evaluations],
+            "scaling": scaling,
+            "comparative_report_path": str(report_path),
+            "comparison_images": [str(p) for p in comparison_images],
+            "status": status,
+            "duration_ms": duration_ms
+        }
+        
+        logger.info(f"action=run_workers_complete id={series_id} status={status} serial_fraction={scaling['serial_fraction']}")
+        self._catalog_series(result, "workers", started_at)
+        
+        return result
+
+    def run_matrix(
+        self,
+        volumes: List[int],
+        algorithms: Optional[List[str]] = None,
+        seed: int = SEED,
+        options: Optional[Dict[str, Dict[str, Any]]] = None,
+        rounds: int = 1,
+        render: str = SERIES_RENDER_MODE,
+        trials: int = DEFAULT_TRIALS,
+        profiler_settings: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Executa vários algoritmos sobre os mesmos volumes (modo matriz).
+        
+        A ordem é intercalada (ver interleaved_order): em cada bloco
+        (rodada, volume) todos os algoritmos rodam em sequência, com o
+        primeiro da fila rotacionado a cada bloco para cancelar a deriva
+        térmica. Algoritmos no mesmo volume usam a mesma seed.
+        
+        Args:
+            volumes: Volumes a testar (os mesmos para todos os algoritmos)
+            algorithms: Subconjunto de ALGORITHMS (default: todos)
+            seed: Seed base (cada volume usa seed+index)
+            options: Parâmetros extras por algoritmo ({"DSS": {"key_count": 10}})
+            rounds: Repetições de cada célula algoritmo x volume (média no relatório)
+            render: Relatórios individuais (ver Single.run)
+            trials: Repetições agregadas dentro de cada execução da célula (ver Single.run)
+            profiler_settings: Argumentos de profiling repassados a cada Single.run
+                (warmup_iterations, steady_state_cv, cprofile, memory_pass)
+            
+        Returns:
+            Dict com:
+                - id: str
+                - algorithm: str (algoritmos unidos por "+")
+                - algorithms: list[str]
+                - volumes: list[int]
+                - rounds: int
+                - order: list[str] (sequência executada, "algoritmo@volume")
+                - evaluation_ids: list[str]
+                - matrix: dict (summarize_matrix: cells, phases)
+                - comparative_report_path: str
+                - comparison_images: list[str] (paths)
+                - status: str (success|partial|failed)
+                
+        Raises:
+            ValueError: Se algoritmos, volumes ou rounds inválidos
+        """
+        algorithms = list(algorithms or ALGORITHMS.keys())
+        for algorithm in algorithms:
+            self.validate_volumes(algorithm, volumes)
+        if rounds <= 0:
+            raise ValueError(f"rounds must be greater than 0, got {rounds}")
+        options = options or {}
+        
+        logger.info(f"action=run_matrix: START algorithms={algorithms} volumes={volumes} rounds={rounds} seed={seed}")
+        
+        render_pool = RenderPool()
+        single = Single(results_store=self.results_store, catalog=self.catalog, render_pool=render_pool)
+        started_at = datetime.now()
+        series_id = f"matrix_{started_at.strftime('%Y%m%d_%H%M%S_%f')}"
+        
+        evaluations = []
+        order = []
+        for round_idx, volume, algorithm in interleaved_order(algorithms, volumes, rounds):
+            order.append(f"{algorithm}@{volume}")
+            evaluation = single.run(
+                algorithm=algorithm,
+                volume=volume,
+                seed=seed + volumes.index(volume),
+                options=options.get(algorithm),
+                render=render,
+                trials=trials,
+                **(profiler_settings or {})
+            )
+            evaluations.append(evaluation)
+            logger.info(
+                f"action=run_matrix: CELL round={round_idx + 1}/{rounds} algorithm={algorithm} "
+                f"volume={volume} status={evaluation['status']}"
+            )
+        
+        self._collect_renders(render_pool, evaluations)
+        matrix = summarize_matrix(evaluations, algorithms, volumes)
+        successful = sum(1 for e in evaluations if e.get("status") == "success")
+        status = "success" if successful == len(evaluations) else "partial" if successful else "failed"
+        
+        timestamp_str = started_at.strftime("%d-%m-%Y %Hh%Mm%Ss.%f")[:-3]
+        matrix_dir = RESULTS_DIR / "matrix"
+        matrix_dir.mkdir(parents=True, exist_ok=True)
+        comparison_images = self._generate_matrix_graphs(matrix_dir, algorithms, volumes, matrix, started_at)
+        report_path = matrix_dir / f"Comparativo entre Algoritmos - {timestamp_str}.md"
+        
+        self.report_markdown.build_matrix_report({
+            "algorithms": algorithms,
+            "volumes": volumes,
+            "rounds": rounds,
+            "order": order,
+            "matrix": matrix,
+            "evaluations": evaluations,
+            "started_at": started_at.isoformat()
+        }, report_path, comparison_images)
+        
+        duration_ms = (datetime.now() - started_at).total_seconds() * 1000
+        
+        result = {
+            "id": series_id,
+            "algorithm": "+".join(algorithms),
+            "algorithms": algorithms,
+            "volumes": volumes,
+            "rounds": rounds,
+            "order": order,
+            "evaluation_ids": [e["id"] for e in evaluations],
+            "matrix": matrix,
+            "comparative_report_path": str(report_path),
+            "comparison_images": [str(p) for p in comparison_images],
+            "status": status,
+            "duration_ms": duration_ms
+        }
+        
+        logger.info(f"action=run_matrix_complete id={series_id} status={status} duration_ms={duration_ms:.2f}")
+        self._catalog_series(result, "matrix", started_at)
         
         return result
 
+    def _collect_renders(self, render_pool: RenderPool, evaluations: List[Dict[str, Any]]) -> None:
+        """Aguarda os relatórios individuais em segundo plano e anexa suas imagens às avaliações."""
+        rendered = render_pool.wait()
+        render_pool.close()
+        for evaluation in evaluations:
+            if evaluation.get("id") in rendered:
+                evaluation["report_images"] = rendered[evaluation["id"]]["report_images"]
+
+    def _schedule_summary(self, scheduler: TrialScheduler, evaluations: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Ordem executada, deriva do tempo de CPU e medianas por volume (brutas e corrigidas).
+        
+        Cada avaliação bem-sucedida recebe schedule["drift_factor"] e
+        metrics["cpu_time_ms_corrected"].
+        """
+        measured = [
+            e for e in evaluations
+            if e.get("status") == "success" and e.get("metrics", {}).get("cpu_time_ms", 0) > 0
+        ]
+        volumes = [e["volume"] for e in measured]
+        cpu_times = [e["metrics"]["cpu_time_ms"] for e in measured]
+        drift = estimate_drift([e["schedule"]["started_offset_s"] for e in measured], volumes, cpu_times)
+        
+        for evaluation, factor in zip(measured, drift["factors"]):
+            evaluation["schedule"]["drift_factor"] = factor
+            evaluation["metrics"]["cpu_time_ms_corrected"] = evaluation["metrics"]["cpu_time_ms"] * factor
+        
+        if drift["identifiable"]:
+            logger.info(
+                f"action=drift_estimate drift_pct_per_min={drift['drift_pct_per_min']:.3f} "
+                f"std_error={drift['std_error']} samples={drift['samples']}"
+            )
+        
+        medians = corrected_medians(volumes, cpu_times, drift["factors"])
+        return {
+            "order": scheduler.order,
+            "trials": scheduler.trials,
+            "cooldown_s": scheduler.cooldown_s,
+            "seed": scheduler.seed,
+            "sequence": [
+                {
+                    "position": e["schedule"]["position"],
+                    "volume": e["volume"],
+                    "trial": e["schedule"]["trial"],
+                    "started_offset_s": e["schedule"]["started_offset_s"],
+                    "status": e.get("status")
+                }
+                for e in evaluations
+            ],
+            "drift": {key: value for key, value in drift.items() if key != "factors"},
+            "volume_medians": [{"volume": volume, **medians[volume]} for volume in sorted(medians)]
+        }
+
+    def _catalog_series(self, result: Dict[str, Any], kind: str, started_at: datetime) -> None:
+        """Registra a série no RunCatalog; falhas não invalidam a medição."""
+        try:
+            self.catalog.record_series(result, kind, started_at.isoformat())
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"action=catalog_series: FAILED id={result['id']} error={e}")
+
     def validate_volumes(self, algorithm, volumes):
         if algorithm not in ALGORITHMS:
             valid_algos = ", ".join(ALGORITHMS.keys())
@@ -161,8 +525,11 @@ class Scalability:
         """
         image_paths = []
         
-        # Filtrar apenas avaliações bem-sucedidas
-        successful = [e for e in evaluations if e.get("status") == "success"]
+        # Filtrar apenas avaliações bem-sucedidas (ordenadas por volume, não por execução)
+        successful = sorted(
+            (e for e in evaluations if e.get("status") == "success"),
+            key=lambda e: (e["volume"], e.get("schedule", {}).get("position", 0))
+        )
         
         if not successful:
             logger.warning("No successful evaluations to plot")
@@ -229,6 +596,116 @@ class Scalability:
             logger.info(f"Generated combined scalability plot: {combined_plot_path}")
         except Exception as e:
             logger.error(f"Failed to generate combined plot: {e}")
+
+        # Gráfico 4: Throughput por fase (ops/s)
+        phase_names = []
+        for e in successful:
+            for phase in e.get("phase_metrics", {}):
+                if phase not in phase_names:
+                    phase_names.append(phase)
+
+        if phase_names:
+            try:
+                phase_plot_path = algo_dir / f"{algorithm}_scalability_phases_{timestamp_str}.png"
+                phase_ops = {
+                    phase: [e.get("phase_metrics", {}).get(phase, {}).get("ops_per_sec", 0.0) for e in successful]
+                    for phase in phase_names
+                }
+                self.plotting.plot_scalability(
+                    volumes,
+                    phase_ops,
+                    phase_plot_path,
+                    metric_name="Throughput (ops/s)"
+                )
+                image_paths.append(phase_plot_path)
+                logger.info(f"Generated phase throughput plot: {phase_plot_path}")
+            except Exception as e:
+                logger.error(f"Failed to generate phase throughput plot: {e}")
+
+        return image_paths
+
+
+    def _generate_matrix_graphs(
+        self,
+        output_dir: Path,
+        algorithms: List[str],
+        volumes: List[int],
+        matrix: Dict[str, Any],
+        started_at: datetime
+    ) -> List[Path]:
+        """
+        Gera gráficos lado a lado (barras agrupadas por volume, uma cor por algoritmo).
+        
+        Returns:
+            Lista de paths para imagens geradas
+        """
+        image_paths = []
+        timestamp_str = started_at.strftime("%d-%m-%Y_%Hh%Mm%Ss")
+        cells = matrix["cells"]
+        
+        for key, label, log_scale in (
+            ("ops_per_sec", "Throughput (ops/s de CPU)", True),
+            ("ops_per_sec_normalized", "Throughput normalizado (maior = 1)", False),
+            ("bytes_per_op", "Bytes/op (pico do heap)", True),
+            ("cycles_per_op", "Ciclos/op", True),
+        ):
+            series = {a: [cells[a][v][key] or 0.0 for v in volumes] for a in algorithms}
+            if not any(value for values in series.values() for value in values):
+                continue
+            try:
+                plot_path = output_dir / f"matrix_{key}_{timestamp_str}.png"
+                self.plotting.plot_scalability(
+                    volumes,
+                    series,
+                    plot_path,
+                    metric_name=label,
+                    title=f"{label} - {' x '.join(algorithms)}",
+                    log_scale=log_scale
+                )
+                image_paths.append(plot_path)
+                logger.info(f"Generated matrix plot: {plot_path}")
+            except Exception as e:
+                logger.error(f"Failed to generate matrix plot {key}: {e}")
+        
+        return image_paths
+
+
+    def _generate_worker_graphs(
+        self,
+        algorithm: str,
+        scaling: Dict[str, Any],
+        started_at: datetime
+    ) -> List[Path]:
+        """
+        Gera gráficos de speedup e eficiência por número de workers.
+        
+        Returns:
+            Lista de paths para imagens geradas
+        """
+        image_paths = []
+        points = scaling.get("points", [])
+        
+        if not points:
+            logger.warning("No scaling points to plot")
+            return image_paths
+        
+        timestamp_str = started_at.strftime("%d-%m-%Y_%Hh%Mm%Ss")
+        algo_dir = RESULTS_DIR / algorithm
+        algo_dir.mkdir(parents=True, exist_ok=True)
+        
+        try:
+            speedup_plot_path = algo_dir / f"{algorithm}_scaling_{scaling['mode']}_{timestamp_str}.png"
+            self.plotting.plot_speedup(
+                [p["workers"] for p in points],
+                [p["speedup"] for p in points],
+                [p["efficiency"] for p in points],
+                speedup_plot_path,
+                title=f"{algorithm} - {scaling['mode'].capitalize()} Scaling"
+            )
+            image_paths.append(speedup_plot_path)
+            logger.info(f"Generated speedup plot: {speedup_plot_path}")
+        except Exception as e:
+            logger.error(f"Failed to generate speedup plot: {e}")
         
         return image_paths
 
@@ -240,7 +717,8 @@ class Scalability:
         evaluations: List[Dict[str, Any]],
         aggregated: Dict[str, Any],
         comparison_images: List[Path],
-        started_at: datetime
+        started_at: datetime,
+        schedule: Optional[Dict[str, Any]] = None
     ) -> Path:
         """
         Gera relatório comparativo Markdown.
@@ -262,6 +740,7 @@ class Scalability:
             "volumes": volumes,
             "aggregated_metrics": aggregated,
             "evaluations": evaluations,
+            "schedule": schedule or {},
             "started_at": started_at.isoformat()
         }
         
@@ -0,0 +1,110 @@
+"""
+Agendamento de repetições de uma série de volumes.
+
+Executar os volumes em ordem crescente, um após o outro, correlaciona o
+volume com a deriva da máquina (frequência, temperatura, ruído de fundo) e
+enviesa a estimativa de complexidade. O TrialScheduler executa K repetições
+por volume em ordem permutada com seed (reprodutível), com pausa opcional
+entre execuções, e marca cada resultado com sua posição no relógio para que
+a deriva possa ser estimada (metrics.drift).
+"""
+from typing import Dict, Any, Callable, List
+from time import perf_counter, sleep
+from logging import getLogger
+import numpy as np
+
+from config import SEED, SCHEDULE_ORDERS, SCHEDULE_ORDER, SCHEDULE_TRIALS, SCHEDULE_COOLDOWN_S
+
+logger = getLogger(__name__)
+
+
+class TrialScheduler:
+    """
+    Plano de execução (volume x repetição) e executor com marcação temporal.
+
+    Uso típico:
+        scheduler = TrialScheduler([100, 1000], trials=3, seed=42, cooldown_s=2.0)
+        results = scheduler.run(lambda slot: single.run("KEM", slot["volume"], seed=slot["seed"]))
+        results[0]["schedule"]["started_offset_s"]
+    """
+
+    def __init__(
+        self,
+        volumes: List[int],
+        trials: int = SCHEDULE_TRIALS,
+        order: str = SCHEDULE_ORDER,
+        seed: int = SEED,
+        cooldown_s: float = SCHEDULE_COOLDOWN_S
+    ) -> None:
+        if trials <= 0:
+            raise ValueError(f"trials must be greater than 0, got {trials}")
+        if order not in SCHEDULE_ORDERS:
+            raise ValueError(f"Unknown schedule order '{order}'. Valid options: {', '.join(SCHEDULE_ORDERS)}")
+        if cooldown_s < 0:
+            raise ValueError(f"cooldown_s must not be negative, got {cooldown_s}")
+        self.volumes = list(volumes)
+        self.trials = trials
+        self.order = order
+        self.seed = seed
+        self.cooldown_s = cooldown_s
+
+    def plan(self) -> List[Dict[str, Any]]:
+        """
+        Sequência de execuções.
+
+        Returns:
+            Lista de dicts com position, volume, volume_index, trial e seed
+            (seed do algoritmo: seed + volume_index + trial * nº de volumes)
+        """
+        slots = [
+            {
+                "volume": volume,
+                "volume_index": volume_index,
+                "trial": trial,
+                "seed": self.seed + volume_index + trial * len(self.volumes)
+            }
+            for trial in range(self.trials)
+            for volume_index, volume in enumerate(self.volumes)
+        ]
+        if self.order == "random":
+            permutation = np.random.default_rng(self.seed).permutation(len(slots))
+            slots = [slots[i] for i in permutation]
+        for position, slot in enumerate(slots):
+            slot["position"] = position
+        return slots
+
+    def run(self, execute: Callable[[Dict[str, Any]], Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Executa o plano, com pausa entre execuções.
+
+        Args:
+            execute: Função chamada com cada slot do plano; retorna a avaliação
+
+        Returns:
+            Avaliações na ordem executada, cada uma com "schedule":
+            position, trial, order, seed, cooldown_s, started_offset_s e
+            ended_offset_s (s desde o início da série)
+        """
+        slots = self.plan()
+        started = perf_counter()
+        results = []
+        for slot in slots:
+            if slot["position"] > 0 and self.cooldown_s > 0:
+                sleep(self.cooldown_s)
+            started_offset = perf_counter() - started
+            evaluation = execute(slot)
+            evaluation["schedule"] = {
+                "position": slot["position"],
+                "trial": slot["trial"],
+                "order": self.order,
+                "seed": self.seed,
+                "cooldown_s": self.cooldown_s,
+                "started_offset_s": started_offset,
+                "ended_offset_s": perf_counter() - started
+            }
+            results.append(evaluation)
+            logger.info(
+                f"action=trial_scheduler: SLOT position={slot['position'] + 1}/{len(slots)} "
+                f"volume={slot['volume']} trial={slot['trial'] + 1}/{self.trials} offset_s={started_offset:.2f}"
+            )
+        return results
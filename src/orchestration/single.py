@@ -4,75 +4,216 @@ Orquestração de execução única de algoritmo com profiling.
 User Story 1: Executar avaliação única com coleta de métricas completas.
 User Story 2: Gerar relatório Markdown individual.
 """
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Union
+import platform
+import sqlite3
 from datetime import datetime
 from pathlib import Path
 from logging import getLogger
 from metrics.profile.manager import ProfilerManager
-from metrics.aggregator import aggregate
-from visualize.report_markdown import ReportMarkdown
-from visualize.plotting import Plotting
-from visualize.report_markdown import ReportMarkdown
-from config import DEFAULT_VOLUME, SEED, ALGORITHMS, RESULTS_DIR
+from metrics.aggregator import aggregate, merge_algorithm_results
+from metrics.latency import summarize_phases
+from metrics.environment import capture_environment, environment_mismatches
+from orchestration.parallel import ParallelExecutor
+from orchestration.adaptive import AdaptiveRun
+from orchestration.affinity import PinnedExecution
+from storage.results_store import ResultsStore
+from storage.catalog import RunCatalog
+from visualize.renderer import Renderer, RenderPool, reserve_report_path
+from config import (
+    DEFAULT_VOLUME, SEED, ALGORITHMS, DEFAULT_TRIALS, RENDER_MODES, RENDER_MODE,
+    WARMUP_ITERATIONS, STEADY_STATE_CV, STEADY_STATE_WINDOW, MAX_WARMUP_ITERATIONS,
+    MEMORY_PASS, MEMORY_TOP_SITES,
+    AUTO_VOLUME, AUTO_TARGET_ERROR, AUTO_TIME_BUDGET_S, AUTO_MIN_BATCHES, AUTO_MIN_BATCH_MS
+)
 
 logger = getLogger(__name__)
 
 class Single:
-    def __init__(self):
-        self.plotting = Plotting()
-        pass
+    def __init__(
+        self,
+        results_store: Optional[ResultsStore] = None,
+        catalog: Optional[RunCatalog] = None,
+        render_pool: Optional[RenderPool] = None
+    ):
+        self.renderer = Renderer()
+        self.results_store = results_store or ResultsStore()
+        self.catalog = catalog or RunCatalog()
+        self.render_pool = render_pool
 
     def run(
         self,
         algorithm: str,
-        volume: int = DEFAULT_VOLUME,
-        seed: int = SEED
+        volume: Union[int, str] = DEFAULT_VOLUME,
+        seed: int = SEED,
+        options: Optional[Dict[str, Any]] = None,
+        workers: int = 1,
+        use_pool: Optional[bool] = None,
+        measure_reference: bool = True,
+        warmup_iterations: int = WARMUP_ITERATIONS,
+        steady_state_cv: Optional[float] = STEADY_STATE_CV,
+        cprofile: bool = False,
+        memory_pass: str = MEMORY_PASS,
+        target_error: float = AUTO_TARGET_ERROR,
+        time_budget_s: float = AUTO_TIME_BUDGET_S,
+        trials: int = DEFAULT_TRIALS,
+        render: str = RENDER_MODE,
+        pinning: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Executa avaliação única de algoritmo com profiling completo.
         
         Args:
             algorithm: Nome do algoritmo ("MLKEM_1024", "MLDSA_87", "Krypton")
-            volume: Número de operações a executar
+            volume: Número de operações a executar, ou "auto" para executar
+                lotes até o IC de 95% da latência por operação atingir
+                `target_error` (ou esgotar `time_budget_s`)
             seed: Seed para PRNG (reprodutibilidade - Princípio V)
+            options: Parâmetros extras repassados ao algoritmo
+                (ex: {"key_count": 1} para DSS medir apenas sign/verify)
+            workers: Número de processos; >1 divide o volume entre workers
+                fixados em núcleos distintos (ParallelExecutor)
+            use_pool: Força (True) ou evita (False) o pool de processos;
+                default: pool apenas quando workers > 1
+            measure_reference: Mede um worker isolado como base da eficiência
+            warmup_iterations: Iterações de aquecimento (volume=1) antes da medição
+            steady_state_cv: CV máximo para regime estável (None desativa detecção)
+            cprofile: Executa passada diagnóstica extra sob cProfile e reporta
+                seu overhead (a medição principal é sempre lean)
+            memory_pass: "separate" (passada de memória própria) ou "inline"
+            target_error: Erro relativo alvo do modo "auto" (meia-largura do IC / média)
+            time_budget_s: Orçamento de tempo do modo "auto" em segundos
+            trials: Repetições da mesma configuração; métricas agregadas com
+                rejeição de outliers (MAD) e IC bootstrap (ver aggregate)
+            render: Relatório/gráficos: "inline" (antes de retornar), "background"
+                (RenderPool, sem bloquear a medição) ou "deferred" (`index.py render`)
+            pinning: Modo fixado (PinnedExecution): dict com workload_core,
+                sampler_core, priority e policy ({} usa os defaults); None desativa.
+                Exige execução em processo (workers=1)
             
         Returns:
             Dict AlgorithmEvaluation com:
                 - id: str (timestamp + algoritmo)
                 - algorithm: str
                 - challenge_type: str
-                - volume: int
+                - volume: int (no modo "auto", o volume alcançado)
                 - started_at: str (ISO timestamp)
                 - ended_at: str (ISO timestamp)
                 - duration_ms: float
                 - status: str (success|partial|failed)
-                - metrics: dict (agregados)
+                - metrics: dict (agregados entre repetições: médias, percentis, ICs)
+                - phase_metrics: dict (ops/s e latências por fase, quando disponível)
+                - throughput_metrics: list (MB/s e ciclos/byte por payload, quando disponível)
+                - parallel_metrics: dict (throughput agregado e eficiência, se workers > 1)
+                - warmup_metrics: dict (cold start e convergência do aquecimento)
+                - diagnostic_metrics: dict (cProfile e seu overhead, se cprofile=True)
+                - counter_metrics: dict (contadores perf, IPC e contagens por operação)
+                - memory_metrics: dict (pico do heap Python, RSS e sítios de alocação)
+                - cpu_distribution: dict (utilização por núcleo e CPU por thread)
+                - precision: dict (IC alcançado, se volume="auto")
                 - hardware_profile: dict
+                - environment: dict (metrics.environment; changed_during_run: campos alterados entre repetições)
+                - pinning: dict (PinnedExecution.report: núcleos, prioridade, avisos; vazio fora do modo fixado)
+                - host: str
+                - latency_histograms: dict (fase -> LatencyHistogram.to_dict)
+                - report_path: str | None (reservado; None se render="deferred")
+                - report_images: list[str] (vazia até a renderização, fora do modo inline)
+                - store_path: str (avaliação persistida no ResultsStore)
+                - hardware_profile_id: str (HardwareProfile no RunCatalog)
                 - notes: str
                 
         Raises:
-            ValueError: Se algorithm inválido ou volume <= 0
+            ValueError: Se algorithm inválido, volume <= 0, workers/trials <= 0
+                ou "auto" com workers > 1
         """
         self.validate_data(algorithm, volume)
         
+        if workers <= 0:
+            raise ValueError(f"workers must be greater than 0, got {workers}")
+        
+        if trials <= 0:
+            raise ValueError(f"trials must be greater than 0, got {trials}")
+        
+        if render not in RENDER_MODES:
+            raise ValueError(f"Unknown render mode '{render}'. Valid options: {', '.join(RENDER_MODES)}")
+        
+        run_in_pool = workers > 1 if use_pool is None else use_pool
+        if volume == AUTO_VOLUME and run_in_pool:
+            raise ValueError("volume='auto' is not supported with a worker pool")
+        if pinning is not None and run_in_pool:
+            raise ValueError("pinned mode is not supported with a worker pool")
+        
+        # Núcleos escolhidos antes do profiler: o amostrador precisa do seu
+        pinned = PinnedExecution(**pinning) if pinning is not None else None
+        
         algo_func = ALGORITHMS[algorithm]
+        options = options or {}
         
         started_at = datetime.now()
         evaluation_id = f"{algorithm}_{started_at.strftime('%Y%m%d_%H%M%S_%f')}"
         
-        profiler = ProfilerManager()
+        profiler_settings = {
+            "warmup_iterations": warmup_iterations,
+            "steady_state_cv": steady_state_cv,
+            "steady_state_window": STEADY_STATE_WINDOW,
+            "max_warmup_iterations": MAX_WARMUP_ITERATIONS,
+            "cprofile": cprofile,
+            "memory_pass": memory_pass,
+            "memory_top_sites": MEMORY_TOP_SITES
+        }
+        profiler = ProfilerManager(**profiler_settings, sampler_core=pinned.sampler_core if pinned else None)
         
-        logger.info(f"action=run_single: START algorithm={algorithm} volume={volume} seed={seed}")
+        logger.info(
+            f"action=run_single: START algorithm={algorithm} volume={volume} seed={seed} "
+            f"options={options} workers={workers} trials={trials}"
+        )
         try:
-            # Executa algoritmo com profiling
-            profiled_result = profiler.profile_function(algo_func, volume=volume, seed=seed)
+            trial_metrics = []
+            trial_results = []
+            adaptive = None
+            # Fixação e checagem de frequência antes de qualquer medição (refuse -> failed)
+            if pinned is not None:
+                pinned.apply()
+            
+            # Ambiente capturado a cada repetição: mudanças (governador, turbo) ficam registradas
+            environment = capture_environment()
+            environment_changes = set()
+            for trial in range(trials):
+                if trial:
+                    environment_changes.update(environment_mismatches(environment, capture_environment()))
+                # Executa algoritmo com profiling (adaptativo, em processo ou em paralelo)
+                if volume == AUTO_VOLUME:
+                    adaptive = AdaptiveRun(
+                        algo_func, target_error, time_budget_s, AUTO_MIN_BATCHES, AUTO_MIN_BATCH_MS
+                    )
+                    profiled_result = profiler.profile_function(adaptive, volume=None, seed=seed, **options)
+                    # Demais repetições usam o volume alcançado
+                    volume = adaptive.achieved_volume
+                elif run_in_pool:
+                    profiled_result = ParallelExecutor(workers, measure_reference, profiler_settings).run(
+                        algorithm, volume, seed, options
+                    )
+                else:
+                    profiled_result = profiler.profile_function(algo_func, volume=volume, seed=seed, **options)
+                
+                trial_metrics.append(profiled_result["metrics"])
+                trial_result = profiled_result["result"]
+                trial_results.append(trial_result if isinstance(trial_result, dict) else {})
+                logger.info(f"action=run_single: TRIAL {trial + 1}/{trials} algorithm={algorithm} volume={volume}")
+            
+            if environment_changes:
+                logger.warning(f"action=run_single: ENVIRONMENT_CHANGED id={evaluation_id} fields={sorted(environment_changes)}")
             
             ended_at = datetime.now()
             duration_ms = (ended_at - started_at).total_seconds() * 1000
             
-            # Agrega métricas
+            # Agrega métricas entre repetições; seções de detalhe vêm da última
             raw_metrics = profiled_result["metrics"]
-            aggregated = aggregate([raw_metrics])
+            aggregated = aggregate(
+                trial_metrics,
+                [r.get("phase_latencies_ns", {}) for r in trial_results]
+            )
+            phase_latencies = merge_algorithm_results(trial_results)["phase_latencies_ns"]
             
             # Monta resultado final (AlgorithmEvaluation)
             evaluation = {
@@ -85,15 +226,34 @@ class Single:
                 "duration_ms": duration_ms,
                 "status": "success",
                 "metrics": aggregated,
+                "phase_metrics": summarize_phases(phase_latencies) if trials > 1 else raw_metrics.get("phase_metrics", {}),
+                "throughput_metrics": raw_metrics.get("throughput_metrics", []),
+                "parallel_metrics": raw_metrics.get("parallel_metrics", {}),
+                "warmup_metrics": raw_metrics.get("warmup_metrics", {}),
+                "diagnostic_metrics": raw_metrics.get("diagnostic_metrics", {}),
+                "counter_metrics": raw_metrics.get("counter_metrics", {}),
+                "memory_metrics": raw_metrics.get("memory_metrics", {}),
+                "cpu_distribution": raw_metrics.get("cpu_distribution", {}),
+                "precision": adaptive.precision if adaptive else {},
                 "hardware_profile": raw_metrics.get("hardware_info", {}),
+                "hardware_profile_id": raw_metrics.get("hardware_info", {}).get("hardware_profile_id"),
+                "environment": {**environment, "changed_during_run": sorted(environment_changes)},
+                "pinning": pinned.report if pinned else {},
                 "notes": "",
-                "seed": seed
+                "seed": seed,
+                "options": options,
+                "workers": workers,
+                "trials": trials,
+                "host": platform.node(),
+                "latency_histograms": {phase: hist.to_dict() for phase, hist in phase_latencies.items()}
             }
             
-            report_path, image_paths = self._generate_report(evaluation, raw_metrics)
+            # Medição encerrada: relatório e gráficos conforme o modo de renderização
+            report_path = self._render(evaluation, phase_latencies, render)
             
-            evaluation["report_path"] = str(report_path)
-            evaluation["report_images"] = [str(p) for p in image_paths]
+            # Séries do sampler só existem no processo medidor (fora do pool)
+            sampler_series = {} if run_in_pool else profiler.system_sampler.samples.series()
+            self._store(evaluation, sampler_series)
             
             logger.info(f"action=run_single: COMPLETE id={evaluation_id} status=success duration_ms={duration_ms:.2f} report={report_path}")
             return evaluation
@@ -105,7 +265,7 @@ class Single:
             logger.error(f"action=run_single: FAILED algorithm={algorithm} error={str(e)}")
             
             # Retorna estrutura com status failed
-            return {
+            evaluation = {
                 "id": evaluation_id,
                 "algorithm": algorithm,
                 "challenge_type": ALGORITHMS[algorithm],
@@ -115,91 +275,60 @@ class Single:
                 "duration_ms": duration_ms,
                 "status": "failed",
                 "metrics": {},
+                "phase_metrics": {},
+                "throughput_metrics": [],
                 "hardware_profile": {},
+                "environment": capture_environment(),
+                "pinning": pinned.report if pinned else {},
                 "notes": f"Error: {str(e)}",
-                "seed": seed
+                "seed": seed,
+                "options": options,
+                "workers": workers,
+                "trials": trials,
+                "host": platform.node(),
+                "report_path": None
             }
+            self._store(evaluation)
+            return evaluation
+        finally:
+            if pinned is not None:
+                pinned.restore()
+    
+    def _render(self, evaluation: Dict[str, Any], phase_latencies: Dict[str, Any], render: str) -> Optional[Path]:
+        """Renderiza (inline), agenda (background) ou adia (deferred) o relatório individual."""
+        evaluation["report_images"] = []
+        if render == "deferred":
+            evaluation["report_path"] = None
+            return None
+        
+        report_path = reserve_report_path(evaluation)
+        evaluation["report_path"] = str(report_path)
+        if render == "inline":
+            evaluation["report_images"] = [str(p) for p in self.renderer.render(evaluation, report_path, phase_latencies)]
+        else:
+            if self.render_pool is None:
+                self.render_pool = RenderPool()
+            self.render_pool.submit(evaluation, report_path)
+        return report_path
+
+    def _store(self, evaluation: Dict[str, Any], sampler_series: Optional[Dict[str, Any]] = None) -> None:
+        """Persiste a avaliação no ResultsStore e no RunCatalog; falhas não invalidam a medição."""
+        try:
+            evaluation["store_path"] = str(self.results_store.append(evaluation, sampler_series))
+        except OSError as e:
+            logger.warning(f"action=run_single: STORE_FAILED id={evaluation['id']} error={e}")
+        try:
+            evaluation["hardware_profile_id"] = self.catalog.record_evaluation(evaluation)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"action=run_single: CATALOG_FAILED id={evaluation['id']} error={e}")
 
     def validate_data(self, algorithm, volume):
         if algorithm not in ALGORITHMS:
             valid_algos = ", ".join(ALGORITHMS.keys())
             raise ValueError(f"Unknown algorithm '{algorithm}'. Valid options: {valid_algos}")
         
+        if volume == AUTO_VOLUME:
+            return
+        
         if volume <= 0:
             raise ValueError(f"volume must be greater than 0, got {volume}")
-
-
-    def _generate_report(self, evaluation: Dict[str, Any], raw_metrics: Dict[str, Any]) -> tuple[Path, list[Path]]:
-        """
-        Gera relatório Markdown e gráficos.
-        
-        Args:
-            evaluation: Dict AlgorithmEvaluation
-            raw_metrics: Métricas brutas incluindo séries temporais
-            
-        Returns:
-            tuple: (report_path, image_paths)
-        """
-        image_paths = []
-        algorithm = evaluation["algorithm"]
-        started_at = datetime.fromisoformat(evaluation["started_at"])
-        timestamp_str = started_at.strftime("%d-%m-%Y_%Hh-%Mm")
-        
-        # Diretório específico do algoritmo
-        algo_dir = RESULTS_DIR / algorithm / timestamp_str
-        report_path = algo_dir / f"relatorio.md"
-        
-        # Verificar colisão (raro mas possível)
-        counter = 1
-        while algo_dir.exists():
-            timestamp_str += f' - {counter}'
-            algo_dir = RESULTS_DIR / algorithm / timestamp_str
-            counter += 1
-        
-        algo_dir.mkdir(parents=True, exist_ok=True)
-
-        
-        memory_increments = raw_metrics.get("memory_metrics", {}).get("memory_increments", [])
-        system_metrics = raw_metrics.get("system_metrics", {})
-        
-        # Gráfico 1: CPU time (se houver dados de série temporal)
-        self.generate_cpu_time_plot(algo_dir, image_paths, memory_increments)
-        
-        # Gráfico 2: Memory usage
-        self.generate_memory_plot(algo_dir, image_paths, memory_increments)
-        
-        # Gerar relatório Markdown
-        ReportMarkdown().build_report(evaluation, report_path, image_paths)
-        
-        logger.info(f"action=report_generated path={report_path} images={len(image_paths)}")
-        
-        return report_path, image_paths
-
-    def generate_memory_plot(self, algo_dir, image_paths, memory_increments):
-        if memory_increments:
-            memory_plot = algo_dir / f"memory.png"
-            try:
-                self.plotting.plot_memory_series(
-                    memory_increments[:50] if len(memory_increments) > 50 else memory_increments,
-                    memory_plot
-                )
-                image_paths.append(memory_plot)
-            except Exception as e:
-                logger.warning(f"Failed to generate memory plot: {e}")
-
-    def generate_cpu_time_plot(self, algo_dir, image_paths, memory_increments):
-        if memory_increments:
-            cpu_time_plot = algo_dir / f"cpu_time.png"
-            try:
-                timestamps = list(range(len(memory_increments)))
-                # Placeholder: usar incrementos de memória como proxy para série temporal
-                self.plotting.plot_time_series(
-                    timestamps,
-                    memory_increments,
-                    cpu_time_plot,
-                    title=f"CPU Time Series",
-                    ylabel="Time Offset (arbitrary)"
-                )
-                image_paths.append(cpu_time_plot)
-            except Exception as e:
-                logger.warning(f"Failed to generate CPU time plot: {e}")
\ No newline at end of file
@@ -0,0 +1,293 @@
+"""
+Catálogo SQLite de execuções (AlgorithmEvaluation e ScalabilitySeries).
+
+Complementa o ResultsStore: o store guarda os dados completos, o catálogo
+guarda uma linha por avaliação/fase/série com colunas indexadas (algoritmo,
+volume, host, hash de hardware, versão do quantCrypt, status, data) para
+consultas históricas em milissegundos — ex: p99 de KEM no host X nos
+últimos 30 dias — sem varrer diretórios de RESULTS_DIR.
+
+Tabelas seguem specs/001-quantcrypt-eval/data-model.md:
+    hardware_profiles(id, host, architecture, ...)
+    evaluations(id, algorithm, volume, ..., hardware_profile_id, series_id)
+    phase_latencies(evaluation_id, phase, count, ops_per_sec, p50_us, ...)
+    series(id, algorithm, volumes, evaluation_ids, ...)
+"""
+import json
+import platform
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+import logging
+
+from metrics.hardware import hardware_profile_id, quantcrypt_version
+from config import CATALOG_PATH
+
+logger = logging.getLogger(__name__)
+
+LATENCY_METRICS = ("mean_us", "p50_us", "p90_us", "p99_us", "p99_9_us", "max_us", "ops_per_sec")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS hardware_profiles (
+    id TEXT PRIMARY KEY,
+    host TEXT NOT NULL,
+    architecture TEXT,
+    cpu_brand TEXT,
+    cores_physical INTEGER,
+    cores_logical INTEGER,
+    ram_total_gb REAL,
+    python_version TEXT,
+    os_name TEXT
+);
+CREATE TABLE IF NOT EXISTS evaluations (
+    id TEXT PRIMARY KEY,
+    algorithm TEXT NOT NULL,
+    volume INTEGER,
+    seed INTEGER,
+    host TEXT,
+    hardware_profile_id TEXT REFERENCES hardware_profiles(id),
+    quantcrypt_version TEXT,
+    status TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    ended_at TEXT,
+    duration_ms REAL,
+    cpu_time_ms REAL,
+    memory_mb REAL,
+    workers INTEGER,
+    trials INTEGER,
+    report_path TEXT,
+    store_path TEXT,
+    series_id TEXT,
+    notes TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_evaluations_algorithm_host_started
+    ON evaluations (algorithm, host, started_at);
+CREATE INDEX IF NOT EXISTS idx_evaluations_volume ON evaluations (algorithm, volume);
+CREATE INDEX IF NOT EXISTS idx_evaluations_hardware ON evaluations (hardware_profile_id);
+CREATE INDEX IF NOT EXISTS idx_evaluations_quantcrypt ON evaluations (quantcrypt_version);
+CREATE INDEX IF NOT EXISTS idx_evaluations_status ON evaluations (status);
+CREATE INDEX IF NOT EXISTS idx_evaluations_started ON evaluations (started_at);
+CREATE TABLE IF NOT EXISTS phase_latencies (
+    evaluation_id TEXT NOT NULL REFERENCES evaluations(id) ON DELETE CASCADE,
+    phase TEXT NOT NULL,
+    count INTEGER,
+    ops_per_sec REAL,
+    mean_us REAL,
+    p50_us REAL,
+    p90_us REAL,
+    p99_us REAL,
+    p99_9_us REAL,
+    max_us REAL,
+    PRIMARY KEY (evaluation_id, phase)
+);
+CREATE INDEX IF NOT EXISTS idx_phase_latencies_phase ON phase_latencies (phase);
+CREATE TABLE IF NOT EXISTS series (
+    id TEXT PRIMARY KEY,
+    algorithm TEXT NOT NULL,
+    kind TEXT,
+    status TEXT,
+    started_at TEXT,
+    duration_ms REAL,
+    volumes TEXT,
+    evaluation_ids TEXT,
+    comparative_report_path TEXT,
+    metrics_aggregate TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_series_algorithm_started ON series (algorithm, started_at);
+"""
+
+
+class RunCatalog:
+    """Catálogo SQLite de avaliações e séries.
+
+    Uso típico:
+        catalog = RunCatalog()
+        catalog.record_evaluation(evaluation)
+        catalog.latency_history("KEM", metric="p99_us", host="bench-01", days=30)
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path is not None else CATALOG_PATH
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA foreign_keys = ON")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def record_evaluation(self, evaluation: Dict[str, Any], series_id: Optional[str] = None) -> str:
+        """
+        Registra (ou substitui) uma avaliação, seu perfil de hardware e latências por fase.
+
+        Args:
+            evaluation: AlgorithmEvaluation (Single.run)
+            series_id: Série (Scalability) à qual a avaliação pertence, se houver
+
+        Returns:
+            str: hardware_profile_id
+        """
+        host = evaluation.get("host") or platform.node()
+        hardware = evaluation.get("hardware_profile") or {}
+        profile_id = hardware.get("hardware_profile_id") or hardware_profile_id(hardware, host)
+        metrics = evaluation.get("metrics") or {}
+        volume = evaluation.get("volume")
+
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO hardware_profiles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    profile_id, host, hardware.get("cpu_arch"), hardware.get("cpu_brand"),
+                    hardware.get("cpu_cores"), hardware.get("cpu_threads"), hardware.get("ram_total_gb"),
+                    platform.python_version(), platform.system(),
+                ),
+            )
+            conn.execute("DELETE FROM phase_latencies WHERE evaluation_id = ?", (evaluation["id"],))
+            conn.execute(
+                "INSERT OR REPLACE INTO evaluations VALUES "
+                "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    evaluation["id"], evaluation.get("algorithm"),
+                    volume if isinstance(volume, int) else None, evaluation.get("seed"),
+                    host, profile_id, quantcrypt_version(), evaluation.get("status", ""),
+                    evaluation["started_at"], evaluation.get("ended_at"), evaluation.get("duration_ms"),
+                    metrics.get("cpu_time_ms"), metrics.get("memory_mb"),
+                    evaluation.get("workers", 1), evaluation.get("trials", 1),
+                    evaluation.get("report_path"), evaluation.get("store_path"),
+                    series_id, evaluation.get("notes", ""),
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO phase_latencies VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        evaluation["id"], phase, stats.get("count"), stats.get("ops_per_sec"),
+                        stats.get("mean_us"), stats.get("p50_us"), stats.get("p90_us"),
+                        stats.get("p99_us"), stats.get("p99_9_us"), stats.get("max_us"),
+                    )
+                    for phase, stats in (evaluation.get("phase_metrics") or {}).items()
+                ],
+            )
+        return profile_id
+
+    def record_series(self, series: Dict[str, Any], kind: str = "volumes", started_at: Optional[str] = None) -> None:
+        """
+        Registra uma ScalabilitySeries e associa suas avaliações.
+
+        Args:
+            series: Resultado de Scalability.run / run_workers / run_matrix
+                (agregados em aggregated_metrics, scaling ou matrix)
+            kind: "volumes", "workers" ou "matrix"
+            started_at: Início da série (ISO); default: agora
+        """
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO series VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    series["id"], series.get("algorithm"), kind, series.get("status"),
+                    started_at or datetime.now().isoformat(), series.get("duration_ms"),
+                    json.dumps(series.get("volumes", [])), json.dumps(series.get("evaluation_ids", [])),
+                    series.get("comparative_report_path"),
+                    json.dumps(
+                        series.get("aggregated_metrics") or series.get("scaling") or series.get("matrix") or {},
+                        default=str
+                    ),
+                ),
+            )
+            conn.executemany(
+                "UPDATE evaluations SET series_id = ? WHERE id = ?",
+                [(series["id"], evaluation_id) for evaluation_id in series.get("evaluation_ids", [])],
+            )
+
+    def find_evaluations(
+        self,
+        algorithm: Optional[str] = None,
+        volume: Optional[int] = None,
+        host: Optional[str] = None,
+        hardware_profile_id: Optional[str] = None,
+        quantcrypt_version: Optional[str] = None,
+        status: Optional[str] = None,
+        since: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Lista avaliações filtradas por colunas indexadas (mais recentes primeiro).
+
+        Returns:
+            Lista de dicts com as colunas da tabela evaluations
+        """
+        where, params = self._filters(
+            algorithm=algorithm, volume=volume, host=host, hardware_profile_id=hardware_profile_id,
+            quantcrypt_version=quantcrypt_version, status=status, since=since,
+        )
+        sql = f"SELECT * FROM evaluations e {where} ORDER BY e.started_at DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [dict(row) for row in self._connect().execute(sql, params)]
+
+    def latency_history(
+        self,
+        algorithm: str,
+        metric: str = "p99_us",
+        phase: Optional[str] = None,
+        host: Optional[str] = None,
+        volume: Optional[int] = None,
+        days: Optional[float] = 30,
+        status: str = "success"
+    ) -> List[Dict[str, Any]]:
+        """
+        Série histórica de uma métrica de latência por fase.
+
+        Args:
+            algorithm: Algoritmo (KEM, DSS, Krypton)
+            metric: Coluna de phase_latencies (ver LATENCY_METRICS)
+            phase: Fase (None: todas)
+            host: Host (None: todos)
+            volume: Volume (None: todos)
+            days: Janela em dias a partir de agora (None: sem limite)
+            status: Status das avaliações consideradas
+
+        Returns:
+            Lista de dicts com started_at, evaluation_id, host, volume, phase e value
+
+        Raises:
+            ValueError: Se metric não for uma coluna de latência
+        """
+        if metric not in LATENCY_METRICS:
+            raise ValueError(f"Unknown metric '{metric}'. Valid options: {', '.join(LATENCY_METRICS)}")
+        since = datetime.now() - timedelta(days=days) if days is not None else None
+        where, params = self._filters(algorithm=algorithm, host=host, volume=volume, status=status, since=since)
+        if phase is not None:
+            where += " AND p.phase = ?"
+            params.append(phase)
+        sql = (
+            f"SELECT e.started_at, e.id AS evaluation_id, e.host, e.volume, p.phase, p.{metric} AS value "
+            f"FROM evaluations e JOIN phase_latencies p ON p.evaluation_id = e.id {where} "
+            "ORDER BY e.started_at, p.phase"
+        )
+        return [dict(row) for row in self._connect().execute(sql, params)]
+
+    def _filters(self, since: Optional[datetime] = None, **columns) -> tuple:
+        """Monta cláusula WHERE para colunas de evaluations (valores None são ignorados)."""
+        clauses = ["1 = 1"]
+        params: List[Any] = []
+        for column, value in columns.items():
+            if value is not None:
+                clauses.append(f"e.{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("e.started_at >= ?")
+            params.append(since.isoformat())
+        return "WHERE " + " AND ".join(clauses), params
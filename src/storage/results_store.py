@@ -0,0 +1,236 @@
+"""
+Armazenamento colunar persistente de avaliações em chunks NumPy (.npz).
+
+Layout em disco:
+    <root>/index/chunk_000000.npz   colunas do índice (uma linha por avaliação)
+    <root>/evaluations/<algoritmo>/<id>.npz
+                                    avaliação completa (JSON), histogramas de
+                                    latência por fase, séries do sampler e
+                                    perfil de hardware
+
+O índice guarda algoritmo, volume, seed, host, status, data e métricas
+principais como vetores tipados; consultas carregam só os chunks do índice
+e filtram com máscaras NumPy, sem reler relatórios Markdown. Chunks cheios
+(chunk_rows linhas) nunca são reescritos; o último é substituído de forma
+atômica (arquivo temporário + os.replace) a cada inclusão. Um único
+processo escritor por diretório é assumido.
+"""
+import json
+import os
+import platform
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+import numpy as np
+import logging
+
+from metrics.histogram import LatencyHistogram
+from config import STORE_DIR, STORE_CHUNK_ROWS
+
+logger = logging.getLogger(__name__)
+
+# Coluna -> dtype NumPy (strings como unicode de tamanho variável por chunk)
+INDEX_COLUMNS = {
+    "id": np.str_,
+    "algorithm": np.str_,
+    "volume": np.int64,
+    "seed": np.int64,
+    "host": np.str_,
+    "status": np.str_,
+    "started_at": "datetime64[ms]",
+    "duration_ms": np.float64,
+    "cpu_time_ms": np.float64,
+    "memory_mb": np.float64,
+    "workers": np.int64,
+    "trials": np.int64,
+    "path": np.str_,
+}
+
+_LATENCY_META = ("sub_bucket_bits", "highest_trackable_ns", "count", "total_ns", "sum_squares", "min_ns", "max_ns")
+
+
+def _json_default(value: Any) -> Any:
+    """Serializa tipos não-JSON presentes nas avaliações (funções, NumPy, Path)."""
+    if callable(value):
+        return getattr(value, "__name__", repr(value))
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
+
+
+class ResultsStore:
+    """Store colunar de avaliações (Single.run e séries do Scalability.run).
+
+    Uso típico:
+        store = ResultsStore()
+        store.append(evaluation, sampler_series=sampler.samples.series())
+        rows = store.query(algorithm="KEM", host="bench-01")
+        store.load(rows["id"][0])
+    """
+
+    def __init__(self, root: Optional[Path] = None, chunk_rows: int = STORE_CHUNK_ROWS):
+        if chunk_rows <= 0:
+            raise ValueError(f"chunk_rows must be greater than 0, got {chunk_rows}")
+        # STORE_DIR lido na chamada, não na definição (redirecionável em testes)
+        self.root = Path(root) if root is not None else STORE_DIR
+        self.chunk_rows = chunk_rows
+        self.index_dir = self.root / "index"
+        self.evaluations_dir = self.root / "evaluations"
+
+    def _chunk_paths(self) -> List[Path]:
+        if not self.index_dir.exists():
+            return []
+        return sorted(self.index_dir.glob("chunk_*.npz"))
+
+    def _read_chunk(self, path: Path) -> Dict[str, np.ndarray]:
+        with np.load(path, allow_pickle=False) as data:
+            return {name: data[name] for name in INDEX_COLUMNS}
+
+    def _write_npz(self, path: Path, arrays: Dict[str, np.ndarray]) -> None:
+        """Grava .npz de forma atômica."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp, path)
+
+    def _index_row(self, evaluation: Dict[str, Any], path: Path) -> Dict[str, Any]:
+        metrics = evaluation.get("metrics") or {}
+        volume = evaluation.get("volume")
+        return {
+            "id": evaluation["id"],
+            "algorithm": evaluation.get("algorithm", ""),
+            "volume": volume if isinstance(volume, int) else -1,
+            "seed": evaluation.get("seed", -1),
+            "host": evaluation.get("host") or platform.node(),
+            "status": evaluation.get("status", ""),
+            "started_at": np.datetime64(datetime.fromisoformat(evaluation["started_at"]), "ms"),
+            "duration_ms": evaluation.get("duration_ms", np.nan),
+            "cpu_time_ms": metrics.get("cpu_time_ms", np.nan),
+            "memory_mb": metrics.get("memory_mb", np.nan),
+            "workers": evaluation.get("workers", 1),
+            "trials": evaluation.get("trials", 1),
+            "path": str(path.relative_to(self.root)),
+        }
+
+    def _append_index(self, row: Dict[str, Any]) -> None:
+        chunks = self._chunk_paths()
+        columns = self._read_chunk(chunks[-1]) if chunks else None
+        if columns is None or len(columns["id"]) >= self.chunk_rows:
+            path = self.index_dir / f"chunk_{len(chunks):06d}.npz"
+            columns = {name: np.array([], dtype=dtype) for name, dtype in INDEX_COLUMNS.items()}
+        else:
+            path = chunks[-1]
+        updated = {
+            name: np.concatenate([columns[name], np.array([row[name]], dtype=dtype)])
+            for name, dtype in INDEX_COLUMNS.items()
+        }
+        self._write_npz(path, updated)
+
+    def append(self, evaluation: Dict[str, Any], sampler_series: Optional[Dict[str, np.ndarray]] = None) -> Path:
+        """
+        Persiste uma avaliação e inclui sua linha no índice.
+
+        Args:
+            evaluation: AlgorithmEvaluation (Single.run), bem-sucedida ou não
+            sampler_series: Séries do SystemSampler (SampleRingBuffer.series), opcional
+
+        Returns:
+            Path do arquivo .npz da avaliação
+        """
+        path = self.evaluations_dir / evaluation.get("algorithm", "unknown") / f"{evaluation['id']}.npz"
+
+        arrays: Dict[str, np.ndarray] = {}
+        document = {k: v for k, v in evaluation.items() if k != "latency_histograms"}
+        arrays["evaluation_json"] = np.array(json.dumps(document, default=_json_default))
+        arrays["hardware_profile_json"] = np.array(
+            json.dumps(evaluation.get("hardware_profile") or {}, default=_json_default)
+        )
+        for phase, hist in (evaluation.get("latency_histograms") or {}).items():
+            data = hist.to_dict() if isinstance(hist, LatencyHistogram) else hist
+            arrays[f"latency.{phase}.index"] = np.asarray(data["bucket_index"], dtype=np.int64)
+            arrays[f"latency.{phase}.count"] = np.asarray(data["bucket_count"], dtype=np.int64)
+            arrays[f"latency.{phase}.meta"] = np.array(json.dumps({key: data[key] for key in _LATENCY_META}))
+        for field, series in (sampler_series or {}).items():
+            arrays[f"sampler.{field}"] = np.asarray(series, dtype=np.float64)
+
+        self._write_npz(path, arrays)
+        self._append_index(self._index_row(evaluation, path))
+        logger.info(f"action=results_store_append id={evaluation['id']} path={path}")
+        return path
+
+    def query(
+        self,
+        algorithm: Optional[str] = None,
+        volume: Optional[int] = None,
+        seed: Optional[int] = None,
+        host: Optional[str] = None,
+        status: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Filtra o índice (critérios None são ignorados).
+
+        Returns:
+            Dict coluna -> np.ndarray com as linhas selecionadas (ver INDEX_COLUMNS)
+        """
+        chunks = [self._read_chunk(path) for path in self._chunk_paths()]
+        if not chunks:
+            return {name: np.array([], dtype=dtype) for name, dtype in INDEX_COLUMNS.items()}
+        columns = {name: np.concatenate([chunk[name] for chunk in chunks]) for name in INDEX_COLUMNS}
+
+        mask = np.ones(len(columns["id"]), dtype=bool)
+        for name, value in (("algorithm", algorithm), ("volume", volume), ("seed", seed), ("host", host), ("status", status)):
+            if value is not None:
+                mask &= columns[name] == value
+        if since is not None:
+            mask &= columns["started_at"] >= np.datetime64(since, "ms")
+        if until is not None:
+            mask &= columns["started_at"] <= np.datetime64(until, "ms")
+        return {name: values[mask] for name, values in columns.items()}
+
+    def load(self, evaluation_id: str) -> Dict[str, Any]:
+        """
+        Carrega uma avaliação completa do store.
+
+        Returns:
+            Dict com:
+                - evaluation: dict (JSON da avaliação)
+                - latency_histograms: dict fase -> LatencyHistogram
+                - sampler_series: dict campo -> np.ndarray
+                - hardware_profile: dict
+
+        Raises:
+            KeyError: Se o id não estiver no índice
+        """
+        index = self.query()
+        matches = np.nonzero(index["id"] == evaluation_id)[0]
+        if matches.size == 0:
+            raise KeyError(f"evaluation '{evaluation_id}' not found in {self.root}")
+        path = self.root / str(index["path"][matches[-1]])
+
+        histograms: Dict[str, LatencyHistogram] = {}
+        sampler_series: Dict[str, np.ndarray] = {}
+        with np.load(path, allow_pickle=False) as data:
+            evaluation = json.loads(str(data["evaluation_json"]))
+            hardware_profile = json.loads(str(data["hardware_profile_json"]))
+            for key in data.files:
+                if key.startswith("latency.") and key.endswith(".meta"):
+                    phase = key[len("latency."):-len(".meta")]
+                    histograms[phase] = LatencyHistogram.from_dict({
+                        **json.loads(str(data[key])),
+                        "bucket_index": data[f"latency.{phase}.index"],
+                        "bucket_count": data[f"latency.{phase}.count"],
+                    })
+                elif key.startswith("sampler."):
+                    sampler_series[key[len("sampler."):]] = data[key]
+
+        return {
+            "evaluation": evaluation,
+            "latency_histograms": histograms,
+            "sampler_series": sampler_series,
+            "hardware_profile": hardware_profile,
+        }
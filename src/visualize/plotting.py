@@ -1,9 +1,15 @@
 """
 Geração de gráficos com matplotlib.
 """
-import matplotlib.pyplot as plt
 from pathlib import Path
 from typing import List, Dict, Any
+from metrics.histogram import as_histogram
+
+
+def _pyplot():
+    """Importa matplotlib.pyplot no primeiro gráfico (~300 ms fora do startup da CLI)."""
+    import matplotlib.pyplot as plt
+    return plt
 
 class Plotting:
     def __init__(self) -> None:
@@ -30,6 +36,7 @@ class Plotting:
         if len(timestamps) != len(values):
             raise ValueError(f"timestamps ({len(timestamps)}) and values ({len(values)}) must have same length")
         
+        plt = _pyplot()
         fig, ax = plt.subplots(figsize=(10, 6))
         ax.plot(timestamps, values, marker='o', linewidth=2, markersize=6, color='#2563eb')
         ax.set_title(title, fontsize=14, fontweight='bold')
@@ -56,6 +63,7 @@ class Plotting:
         if not memory_samples:
             raise ValueError("memory_samples must not be empty")
         
+        plt = _pyplot()
         fig, ax = plt.subplots(figsize=(10, 6))
         sample_indices = list(range(len(memory_samples)))
         
@@ -74,16 +82,50 @@ class Plotting:
         plt.close(fig)
 
 
+    def plot_allocation_sites(self, top_allocations: List[Dict[str, Any]], output_path: Path) -> None:
+        """
+        Gera gráfico de barras horizontais dos maiores sítios de alocação.
+        
+        Args:
+            top_allocations: Lista de dicts com site, size_kb e count (tracemalloc)
+            output_path: Caminho para salvar .png
+            
+        Raises:
+            ValueError: Se lista vazia
+        """
+        if not top_allocations:
+            raise ValueError("top_allocations must not be empty")
+        
+        # Maior alocação no topo; apenas arquivo:linha para caber no eixo
+        sites = [Path(a["site"]).name for a in reversed(top_allocations)]
+        sizes = [a["size_kb"] for a in reversed(top_allocations)]
+        
+        plt = _pyplot()
+        fig, ax = plt.subplots(figsize=(10, max(3, 0.5 * len(sites) + 1)))
+        ax.barh(sites, sizes, color='#dc2626', alpha=0.8)
+        
+        ax.set_title("Top Allocation Sites (tracemalloc)", fontsize=14, fontweight='bold')
+        ax.set_xlabel("Net Allocated (KB)", fontsize=12)
+        ax.grid(True, alpha=0.3, axis='x')
+        
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        fig.savefig(output_path, dpi=300, bbox_inches='tight')
+        plt.close(fig)
+
+
     def plot_scalability(self, volumes: List[int], metrics: Dict[str, List[float]], 
-                        output_path: Path, metric_name: str = "Metric") -> None:
+                        output_path: Path, metric_name: str = "Metric",
+                        title: str | None = None, log_scale: bool = False) -> None:
         """
         Gera gráfico de barras comparativo para escalabilidade.
         
         Args:
             volumes: Lista de volumes testados
-            metrics: Dict com nome_metrica -> lista de valores
+            metrics: Dict com nome_metrica (ou algoritmo) -> lista de valores
             output_path: Caminho para salvar .png
             metric_name: Nome da métrica principal
+            title: Título (default: "<metric_name> - Scalability Analysis")
+            log_scale: Eixo Y logarítmico (séries com ordens de grandeza diferentes)
             
         Raises:
             ValueError: Se volumes vazio ou métricas incompatíveis
@@ -99,6 +141,7 @@ class Plotting:
             if len(values) != len(volumes):
                 raise ValueError(f"Metric '{metric_label}' has {len(values)} values but {len(volumes)} volumes")
         
+        plt = _pyplot()
         fig, ax = plt.subplots(figsize=(12, 6))
         
         # Cores distintas para cada métrica
@@ -118,7 +161,9 @@ class Plotting:
         
         ax.set_xticks(x_pos)
         ax.set_xticklabels([str(v) for v in volumes], fontsize=11)
-        ax.set_title(f"{metric_name} - Scalability Analysis", fontsize=14, fontweight='bold')
+        ax.set_title(title or f"{metric_name} - Scalability Analysis", fontsize=14, fontweight='bold')
+        if log_scale:
+            ax.set_yscale('log')
         ax.set_xlabel("Volume (operations)", fontsize=12)
         ax.set_ylabel(metric_name, fontsize=12)
         ax.legend(fontsize=10)
@@ -127,3 +172,103 @@ class Plotting:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         fig.savefig(output_path, dpi=300, bbox_inches='tight')
         plt.close(fig)
+
+
+    def plot_latency_distribution(self, phase_latencies: Dict[str, Any], output_path: Path) -> None:
+        """
+        Gera boxplot da distribuição de latência por fase.
+        
+        Quartis e bigodes (1,5 × IQR, limitados a min/max) vêm dos percentis
+        do histograma, sem materializar as amostras.
+        
+        Args:
+            phase_latencies: Dict fase -> LatencyHistogram ou latências por operação em ns
+            output_path: Caminho para salvar .png
+            
+        Raises:
+            ValueError: Se nenhuma fase possuir amostras
+        """
+        phases = {name: as_histogram(values) for name, values in phase_latencies.items()}
+        phases = {name: hist for name, hist in phases.items() if hist.count > 0}
+        if not phases:
+            raise ValueError("phase_latencies must contain at least one non-empty phase")
+        
+        plt = _pyplot()
+        fig, ax = plt.subplots(figsize=(10, 6))
+        
+        # Converter ns -> µs para legibilidade
+        stats = []
+        for name, hist in phases.items():
+            p = hist.percentiles((25.0, 50.0, 75.0))
+            q1, med, q3 = p[25.0] / 1e3, p[50.0] / 1e3, p[75.0] / 1e3
+            iqr = q3 - q1
+            stats.append({
+                "label": name,
+                "q1": q1,
+                "med": med,
+                "q3": q3,
+                "whislo": max(hist.min_ns / 1e3, q1 - 1.5 * iqr),
+                "whishi": min(hist.max_ns / 1e3, q3 + 1.5 * iqr),
+            })
+        ax.bxp(stats, showfliers=False)
+        
+        ax.set_xticks(list(range(1, len(phases) + 1)))
+        ax.set_xticklabels(list(phases.keys()), fontsize=11)
+        ax.set_title("Latency Distribution per Phase", fontsize=14, fontweight='bold')
+        ax.set_xlabel("Phase", fontsize=12)
+        ax.set_ylabel("Latency (µs)", fontsize=12)
+        ax.grid(True, axis='y', alpha=0.3)
+        
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        fig.savefig(output_path, dpi=300, bbox_inches='tight')
+        plt.close(fig)
+
+
+    def plot_speedup(self, worker_counts: List[int], speedups: List[float], efficiencies: List[float],
+                    output_path: Path, title: str = "Scaling") -> None:
+        """
+        Gera gráfico de speedup (vs ideal linear) e eficiência paralela por workers.
+        
+        Args:
+            worker_counts: Número de workers de cada ponto
+            speedups: Speedup medido em cada ponto
+            efficiencies: Eficiência paralela (0-1) em cada ponto
+            output_path: Caminho para salvar .png
+            title: Título do gráfico
+            
+        Raises:
+            ValueError: Se listas vazias ou tamanhos incompatíveis
+        """
+        if not worker_counts:
+            raise ValueError("worker_counts must not be empty")
+        
+        if not (len(worker_counts) == len(speedups) == len(efficiencies)):
+            raise ValueError("worker_counts, speedups and efficiencies must have same length")
+        
+        plt = _pyplot()
+        fig, ax = plt.subplots(figsize=(10, 6))
+        base = worker_counts[0]
+        ideal = [n / base for n in worker_counts]
+        
+        ax.plot(worker_counts, ideal, linestyle='--', color='#6b7280', label='Ideal (linear)')
+        ax.plot(worker_counts, speedups, marker='o', linewidth=2, markersize=6, color='#2563eb', label='Speedup')
+        ax.set_title(title, fontsize=14, fontweight='bold')
+        ax.set_xlabel("Workers", fontsize=12)
+        ax.set_ylabel("Speedup", fontsize=12)
+        ax.set_xticks(worker_counts)
+        ax.grid(True, alpha=0.3)
+        
+        # Eficiência no eixo secundário
+        ax2 = ax.twinx()
+        ax2.plot(worker_counts, [e * 100 for e in efficiencies], marker='s', linewidth=1.5,
+                 markersize=5, color='#dc2626', label='Efficiency')
+        ax2.set_ylabel("Efficiency (%)", fontsize=12)
+        ax2.set_ylim(0, max(110, max(e * 100 for e in efficiencies) + 10))
+        
+        lines1, labels1 = ax.get_legend_handles_labels()
+        lines2, labels2 = ax2.get_legend_handles_labels()
+        ax.legend(lines1 + lines2, labels1 + labels2, fontsize=10, loc='upper left')
+        
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        fig.savefig(output_path, dpi=300, bbox_inches='tight')
+        plt.close(fig)
@@ -0,0 +1,240 @@
+"""
+Renderização de relatórios individuais (Markdown + gráficos) fora da medição.
+
+A medição (Single.run) só produz a avaliação estruturada; gráficos em
+300 dpi e o Markdown são gerados aqui, em três modos (config.RENDER_MODES):
+
+    inline      renderiza antes de Single.run retornar (execução única)
+    background  envia a um RenderPool (processos com prioridade mínima);
+                séries de volumes não esperam fig.savefig entre medições
+    deferred    não renderiza; `index.py render` consome o ResultsStore depois
+
+Toda a entrada vem da própria avaliação (memory_metrics e
+latency_histograms), então o mesmo código serve avaliações recém-medidas e
+carregadas do store.
+"""
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+import logging
+import os
+
+from metrics.histogram import as_histogram
+from visualize.plotting import Plotting
+from visualize.report_markdown import ReportMarkdown
+from config import RESULTS_DIR, RENDER_WORKERS
+
+logger = logging.getLogger(__name__)
+
+
+def reserve_report_path(evaluation: Dict[str, Any]) -> Path:
+    """
+    Cria o diretório do relatório (RESULTS_DIR/<algoritmo>/<timestamp>) e retorna o .md.
+
+    Colisões (mesmo minuto) recebem sufixo incremental; o diretório é criado
+    aqui para reservar o nome mesmo que a renderização ocorra depois.
+    """
+    algorithm = evaluation["algorithm"]
+    started_at = datetime.fromisoformat(evaluation["started_at"])
+    timestamp_str = started_at.strftime("%d-%m-%Y_%Hh-%Mm")
+
+    # Diretório específico do algoritmo
+    algo_dir = RESULTS_DIR / algorithm / timestamp_str
+
+    # Verificar colisão (raro mas possível)
+    counter = 1
+    while algo_dir.exists():
+        timestamp_str += f' - {counter}'
+        algo_dir = RESULTS_DIR / algorithm / timestamp_str
+        counter += 1
+
+    algo_dir.mkdir(parents=True, exist_ok=True)
+    return algo_dir / "relatorio.md"
+
+
+def _portable(evaluation: Dict[str, Any]) -> Dict[str, Any]:
+    """Cópia rasa serializável (challenge_type é a função do algoritmo)."""
+    challenge_type = evaluation.get("challenge_type")
+    if callable(challenge_type):
+        return {**evaluation, "challenge_type": getattr(challenge_type, "__name__", repr(challenge_type))}
+    return evaluation
+
+
+class Renderer:
+    """Gera gráficos e relatório Markdown de uma avaliação."""
+
+    def __init__(self) -> None:
+        self.plotting = Plotting()
+        self.report_markdown = ReportMarkdown()
+
+    def render(
+        self,
+        evaluation: Dict[str, Any],
+        report_path: Path,
+        phase_latencies: Optional[Dict[str, Any]] = None
+    ) -> List[Path]:
+        """
+        Gera relatório Markdown e gráficos.
+
+        Args:
+            evaluation: Dict AlgorithmEvaluation
+            report_path: Caminho do .md (gráficos no mesmo diretório)
+            phase_latencies: Histogramas por fase (default: evaluation["latency_histograms"])
+
+        Returns:
+            Lista de paths das imagens geradas
+        """
+        image_paths: List[Path] = []
+        algo_dir = Path(report_path).parent
+        algo_dir.mkdir(parents=True, exist_ok=True)
+
+        memory_metrics = evaluation.get("memory_metrics", {})
+        memory_increments = memory_metrics.get("memory_increments", [])
+        if phase_latencies is None:
+            phase_latencies = {
+                phase: as_histogram(hist) for phase, hist in (evaluation.get("latency_histograms") or {}).items()
+            }
+
+        # Gráfico 1: CPU time (se houver dados de série temporal)
+        self.generate_cpu_time_plot(algo_dir, image_paths, memory_increments)
+
+        # Gráfico 2: Memory usage
+        self.generate_memory_plot(algo_dir, image_paths, memory_increments)
+
+        # Gráfico 2b: Sítios de alocação (tracemalloc)
+        self.generate_allocation_plot(algo_dir, image_paths, memory_metrics.get("top_allocations", []))
+
+        # Gráfico 3: Distribuição de latência por fase
+        self.generate_latency_plot(algo_dir, image_paths, phase_latencies)
+
+        # Gerar relatório Markdown
+        self.report_markdown.build_report(_portable(evaluation), Path(report_path), image_paths)
+
+        logger.info(f"action=report_generated path={report_path} images={len(image_paths)}")
+        return image_paths
+
+    def generate_memory_plot(self, algo_dir, image_paths, memory_increments):
+        if memory_increments:
+            memory_plot = algo_dir / f"memory.png"
+            try:
+                self.plotting.plot_memory_series(
+                    memory_increments[:50] if len(memory_increments) > 50 else memory_increments,
+                    memory_plot
+                )
+                image_paths.append(memory_plot)
+            except Exception as e:
+                logger.warning(f"Failed to generate memory plot: {e}")
+
+    def generate_allocation_plot(self, algo_dir, image_paths, top_allocations):
+        if top_allocations:
+            allocation_plot = algo_dir / f"allocations.png"
+            try:
+                self.plotting.plot_allocation_sites(top_allocations, allocation_plot)
+                image_paths.append(allocation_plot)
+            except Exception as e:
+                logger.warning(f"Failed to generate allocation plot: {e}")
+
+    def generate_latency_plot(self, algo_dir, image_paths, phase_latencies):
+        if phase_latencies:
+            latency_plot = algo_dir / f"latency.png"
+            try:
+                self.plotting.plot_latency_distribution(phase_latencies, latency_plot)
+                image_paths.append(latency_plot)
+            except Exception as e:
+                logger.warning(f"Failed to generate latency plot: {e}")
+
+    def generate_cpu_time_plot(self, algo_dir, image_paths, memory_increments):
+        if memory_increments:
+            cpu_time_plot = algo_dir / f"cpu_time.png"
+            try:
+                timestamps = list(range(len(memory_increments)))
+                # Placeholder: usar incrementos de memória como proxy para série temporal
+                self.plotting.plot_time_series(
+                    timestamps,
+                    memory_increments,
+                    cpu_time_plot,
+                    title=f"CPU Time Series",
+                    ylabel="Time Offset (arbitrary)"
+                )
+                image_paths.append(cpu_time_plot)
+            except Exception as e:
+                logger.warning(f"Failed to generate CPU time plot: {e}")
+
+
+def render_evaluation(evaluation: Dict[str, Any], report_path: str) -> Dict[str, Any]:
+    """
+    Renderiza uma avaliação (ponto de entrada dos processos do RenderPool).
+
+    Returns:
+        Dict com id, report_path e report_images (list[str])
+    """
+    image_paths = Renderer().render(evaluation, Path(report_path))
+    return {
+        "id": evaluation.get("id"),
+        "report_path": str(report_path),
+        "report_images": [str(p) for p in image_paths]
+    }
+
+
+def _lower_priority() -> None:
+    """Inicializador dos processos de renderização: prioridade mínima (nice 19)."""
+    try:
+        os.nice(19)
+    except (AttributeError, OSError):
+        pass
+
+
+class RenderPool:
+    """
+    Pool de processos para renderização em segundo plano.
+
+    Os processos rodam com nice 19 para ceder CPU à medição em andamento.
+
+    Uso típico:
+        pool = RenderPool()
+        single = Single(render_pool=pool)
+        for volume in volumes:
+            single.run("KEM", volume, render="background")
+        pool.wait()   # {id: {report_path, report_images}}
+    """
+
+    def __init__(self, workers: int = RENDER_WORKERS) -> None:
+        if workers <= 0:
+            raise ValueError(f"workers must be greater than 0, got {workers}")
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: List[Future] = []
+
+    def submit(self, evaluation: Dict[str, Any], report_path: Path) -> Future:
+        """Agenda a renderização de uma avaliação; retorna imediatamente."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_lower_priority)
+        future = self._executor.submit(render_evaluation, _portable(evaluation), str(report_path))
+        self._pending.append(future)
+        logger.info(f"action=render_submitted id={evaluation.get('id')} pending={len(self._pending)}")
+        return future
+
+    def wait(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Aguarda as renderizações pendentes.
+
+        Returns:
+            Dict id -> resultado de render_evaluation (falhas são registradas no log e omitidas)
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        for future in self._pending:
+            try:
+                result = future.result()
+                results[result["id"]] = result
+            except Exception as e:
+                logger.warning(f"action=render_failed error={e}")
+        self._pending = []
+        return results
+
+    def close(self) -> None:
+        """Aguarda pendências e encerra os processos."""
+        self.wait()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
@@ -3,9 +3,15 @@ Geração de relatórios Markdown com tabulate.
 """
 from typing import Dict, Any, List
 from pathlib import Path
-import tabulate
 from datetime import datetime
 
+
+def _tabulate(*args, **kwargs) -> str:
+    """tabulate.tabulate importado no primeiro relatório (fora do startup da CLI)."""
+    from tabulate import tabulate
+    return tabulate(*args, **kwargs)
+
+
 class ReportMarkdown:
     def build_report(self, evaluation: Dict[str, Any], output_path: Path, image_paths: List[Path] | None = None) -> None:
         """
@@ -20,7 +26,19 @@ class ReportMarkdown:
             # [Algoritmo] - [Timestamp PT-BR]
             ## Resumo
             ## Hardware
+            ## Ambiente
+            ## Execução Fixada
             ## Métricas
+            ## Precisão
+            ## Estatística entre Repetições
+            ## Aquecimento
+            ## Diagnóstico cProfile
+            ## Contadores de Hardware
+            ## Memória
+            ## Distribuição de CPU
+            ## Latência por Fase
+            ## Throughput por Payload
+            ## Execução Paralela
             ## Gráficos
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -52,6 +70,11 @@ class ReportMarkdown:
             "",
         ]
         
+        options = evaluation.get("options", {})
+        if options:
+            options_str = ", ".join(f"{k}={v}" for k, v in options.items())
+            lines[-1:-1] = [f"**Opções**: {options_str}"]
+        
         # Hardware section
         hw = evaluation.get("hardware_profile", {})
         if hw:
@@ -67,6 +90,14 @@ class ReportMarkdown:
                 "",
             ])
         
+        environment = evaluation.get("environment") or {}
+        if environment:
+            lines.extend(self._environment_section(environment))
+        
+        pinning = evaluation.get("pinning") or {}
+        if pinning:
+            lines.extend(self._pinning_section(pinning))
+        
         # Metrics table
         metrics = evaluation.get("metrics", {})
         if metrics:
@@ -82,7 +113,7 @@ class ReportMarkdown:
                 ["CPU Cycles", self._format_metric(metrics.get('cpu_cycles'))],
             ]
             
-            table = tabulate.tabulate(
+            table = _tabulate(
                 metrics_data,
                 headers=["Métrica", "Valor"],
                 tablefmt="github"
@@ -90,6 +121,221 @@ class ReportMarkdown:
             
             lines.extend([table, ""])
         
+        # Precisão alcançada no modo de volume adaptativo
+        precision = evaluation.get("precision", {})
+        if precision:
+            reason = "erro alvo atingido" if precision.get("converged") else "orçamento de tempo esgotado"
+            lines.extend([
+                "## Precisão",
+                "",
+                f"**Modo de Volume**: {precision.get('mode', 'auto')} ({reason})",
+                f"**Erro Relativo (IC 95%)**: {self._format_optional(precision.get('achieved_relative_error'), '{:.2%}')}"
+                f" (alvo {precision.get('target_relative_error', 0):.2%})",
+                f"**Latência por Operação**: {precision.get('mean_us', 0):,.2f} µs"
+                f" [{self._format_optional(precision.get('ci_low_us'), '{:,.2f}')}, "
+                f"{self._format_optional(precision.get('ci_high_us'), '{:,.2f}')}] µs",
+                f"**Lotes**: {precision.get('batches', 0)} × {precision.get('batch_size', 0)} operações"
+                f" ({precision.get('elapsed_s', 0):.1f} s de {precision.get('time_budget_s', 0):.0f} s)",
+                "",
+            ])
+        
+        # Estatística entre repetições (MAD + IC bootstrap)
+        if metrics.get("trials", 1) > 1:
+            lines.extend([
+                "## Estatística entre Repetições",
+                "",
+                f"**Repetições**: {metrics['trials']} (outliers rejeitados por MAD; IC 95% por bootstrap)",
+                "",
+                self._trials_table(metrics),
+                "",
+            ])
+        
+        # Aquecimento (cold start fora da medição)
+        warmup = evaluation.get("warmup_metrics", {})
+        if warmup.get("warmup_iterations"):
+            steady = warmup.get("steady_state_reached")
+            lines.extend([
+                "## Aquecimento",
+                "",
+                f"**Latência de Cold Start**: {self._format_optional(warmup.get('cold_start_latency_ms'), '{:.2f} ms')}",
+                f"**Iterações de Aquecimento**: {warmup.get('warmup_iterations', 0)} ({warmup.get('warmup_time_ms', 0):.2f} ms)",
+                f"**Regime Estável**: {'N/A' if steady is None else 'sim' if steady else 'não'}"
+                f" (CV final {self._format_optional(warmup.get('final_cv'), '{:.1%}')})",
+                "",
+            ])
+        
+        # Passada diagnóstica (cProfile) e overhead do tracing
+        diagnostic = evaluation.get("diagnostic_metrics", {})
+        if diagnostic:
+            cprofile_stats = diagnostic.get("cprofile", {})
+            lines.extend([
+                "## Diagnóstico cProfile",
+                "",
+                f"**Duração Lean**: {diagnostic.get('lean_wall_time_ms', 0):.2f} ms",
+                f"**Duração sob cProfile**: {diagnostic.get('cprofile_wall_time_ms', 0):.2f} ms",
+                f"**Overhead do cProfile**: {diagnostic.get('cprofile_overhead_ms', 0):.2f} ms"
+                f" ({self._format_optional(diagnostic.get('cprofile_overhead_pct'), '{:.1f}%')})",
+                f"**Chamadas**: {cprofile_stats.get('total_calls', 0):,} ({cprofile_stats.get('primitive_calls', 0):,} primitivas)",
+                "",
+            ])
+        
+        # Contadores perf_event_open (ciclos, instruções, cache, branches)
+        counter_metrics = evaluation.get("counter_metrics", {})
+        counts = counter_metrics.get("counts", {})
+        if counts or counter_metrics.get("unavailable"):
+            per_op = counter_metrics.get("per_op", {})
+            counter_data = [
+                [name, self._format_optional(value, "{:,}"), self._format_optional(per_op.get(name), "{:,.1f}")]
+                for name, value in counts.items()
+            ]
+            lines.extend([
+                "## Contadores de Hardware",
+                "",
+                _tabulate(
+                    counter_data,
+                    headers=["Evento", "Total", "Por Operação"],
+                    tablefmt="github",
+                    disable_numparse=True
+                ),
+                "",
+                f"**IPC**: {self._format_optional(counter_metrics.get('ipc'), '{:.2f}')}",
+                f"**Taxa de Cache Miss**: {self._format_optional(counter_metrics.get('cache_miss_rate'), '{:.1%}')}",
+                "",
+            ])
+            for name, reason in counter_metrics.get("unavailable", {}).items():
+                lines.append(f"- `{name}` indisponível: {reason}")
+            if counter_metrics.get("unavailable"):
+                lines.append("")
+        
+        # Memória: heap Python (tracemalloc) e RSS (alocações nativas CFFI)
+        memory = evaluation.get("memory_metrics", {})
+        if memory.get("memory_pass"):
+            lines.extend([
+                "## Memória",
+                "",
+                f"**Passada**: {memory['memory_pass']}",
+                f"**Pico do Heap Python**: {self._format_optional(memory.get('python_peak_mb'), '{:.2f} MB')}",
+                f"**Pico de RSS (VmHWM)**: {self._format_optional(memory.get('rss_peak_mb'), '{:.2f} MB')}"
+                + ("" if memory.get("peak_reset", True) else " (inclui picos anteriores à medição)"),
+                f"**Crescimento de RSS**: {self._format_optional(memory.get('rss_growth_mb'), '{:.2f} MB')}",
+                f"**ru_maxrss**: {self._format_optional(memory.get('max_rss_mb'), '{:.2f} MB')}",
+                "",
+            ])
+            allocations = memory.get("top_allocations", [])
+            if allocations:
+                lines.extend([
+                    _tabulate(
+                        [[f"`{a['site']}`", f"{a['size_kb']:,.1f}", a["count"]] for a in allocations],
+                        headers=["Sítio de Alocação", "KB", "Blocos"],
+                        tablefmt="github",
+                        disable_numparse=True
+                    ),
+                    "",
+                ])
+        
+        # Distribuição de CPU entre núcleos e threads (backend /proc)
+        distribution = evaluation.get("cpu_distribution", {})
+        per_core = distribution.get("per_core_utilization", [])
+        if per_core or distribution.get("thread_cpu_ms"):
+            lines.extend([
+                "## Distribuição de CPU",
+                "",
+                f"**Backend do Amostrador**: {distribution.get('sampler_backend', 'N/A')}",
+                f"**Núcleos Ocupados (>= 50%)**: {distribution.get('busy_cores', 0)} de {len(per_core)}",
+                "",
+            ])
+            if per_core:
+                lines.extend([
+                    _tabulate(
+                        [[f"cpu{idx}", f"{u:.1f}"] for idx, u in enumerate(per_core)],
+                        headers=["Núcleo", "Utilização (%)"],
+                        tablefmt="github",
+                        disable_numparse=True
+                    ),
+                    "",
+                ])
+            threads = sorted(distribution.get("thread_cpu_ms", {}).items(), key=lambda t: t[1], reverse=True)
+            if threads:
+                lines.extend([
+                    _tabulate(
+                        [[f"`{name}`", f"{ms:.1f}"] for name, ms in threads[:10]],
+                        headers=["Thread", "CPU (ms)"],
+                        tablefmt="github",
+                        disable_numparse=True
+                    ),
+                    "",
+                ])
+        
+        # Latência por fase (ops/s e distribuição)
+        phase_metrics = evaluation.get("phase_metrics", {})
+        if phase_metrics:
+            lines.extend([
+                "## Latência por Fase",
+                "",
+                self._phase_table(phase_metrics),
+                ""
+            ])
+        
+        # Throughput por tamanho de payload (cifras)
+        throughput_metrics = evaluation.get("throughput_metrics", [])
+        if throughput_metrics:
+            throughput_data = [
+                [
+                    self._format_bytes(row.get("payload_bytes", 0)),
+                    row.get("mode", ""),
+                    row.get("messages", 0),
+                    f"{row.get('encrypt_mb_s', 0):.2f}",
+                    f"{row.get('decrypt_mb_s', 0):.2f}",
+                    self._format_cycles(row.get("encrypt_cycles_per_byte"), row.get("cycles_estimated")),
+                    self._format_cycles(row.get("decrypt_cycles_per_byte"), row.get("cycles_estimated")),
+                ]
+                for row in throughput_metrics
+            ]
+            
+            throughput_table = _tabulate(
+                throughput_data,
+                headers=["Payload", "Modo", "Mensagens", "Encrypt (MB/s)", "Decrypt (MB/s)",
+                         "Encrypt (ciclos/byte)", "Decrypt (ciclos/byte)"],
+                tablefmt="github",
+                disable_numparse=True
+            )
+            
+            lines.extend([
+                "## Throughput por Payload",
+                "",
+                "Ciclos do perf quando disponíveis; * = estimado por tempo x frequência nominal.",
+                "",
+                throughput_table,
+                ""
+            ])
+        
+        # Execução paralela (multi-processo)
+        parallel = evaluation.get("parallel_metrics", {})
+        if parallel:
+            lines.extend([
+                "## Execução Paralela",
+                "",
+                f"**Workers**: {parallel.get('workers', 0)} (núcleos {parallel.get('cores', [])})",
+                f"**Throughput Agregado**: {parallel.get('aggregate_ops_per_sec', 0):,.1f} ops/s",
+                f"**Throughput 1 Worker**: {self._format_optional(parallel.get('single_worker_ops_per_sec'), '{:,.1f} ops/s')}",
+                f"**Speedup**: {self._format_optional(parallel.get('speedup'), '{:.2f}x')}",
+                f"**Eficiência de Escala**: {self._format_optional(parallel.get('scaling_efficiency'), '{:.1%}')}",
+                "",
+            ])
+            
+            worker_data = [
+                [w["worker"], w["core"], w["volume"], w["seed"], f"{w['wall_time_ms']:.2f}", f"{w['ops_per_sec']:,.1f}"]
+                for w in parallel.get("per_worker", [])
+            ]
+            lines.extend([
+                _tabulate(
+                    worker_data,
+                    headers=["Worker", "Núcleo", "Volume", "Seed", "Duração (ms)", "ops/s"],
+                    tablefmt="github"
+                ),
+                ""
+            ])
+        
         # Gráficos
         if image_paths:
             lines.extend([
@@ -133,6 +379,160 @@ class ReportMarkdown:
         return str(value)
 
 
+    def _format_bytes(self, size: int) -> str:
+        """Formata tamanho em bytes com unidade binária (B, KiB, MiB)."""
+        for unit in ("B", "KiB", "MiB"):
+            if size < 1024 or unit == "MiB":
+                return f"{size:g} {unit}"
+            size /= 1024
+        return f"{size:g} GiB"
+
+
+    def _format_optional(self, value, fmt: str) -> str:
+        """Formata valor opcional com `fmt`, retornando N/A para None."""
+        return "N/A" if value is None else fmt.format(value)
+
+
+    def _format_cycles(self, value, estimated: bool = False) -> str:
+        """Formata ciclos/byte, tratando None (frequência indisponível); * marca estimativa."""
+        if value is None:
+            return "N/A"
+        return f"{value:,.2f}*" if estimated else f"{value:,.2f}"
+
+
+    def _trials_table(self, metrics: Dict[str, Any]) -> str:
+        """Tabela de tempos por repetição e percentis de latência por fase."""
+        rows = []
+        for label, key, unit in (("CPU Time", "cpu_time_stats", "ms"), ("Wall Time", "wall_time_stats", "ms")):
+            stats = metrics.get(key) or {}
+            if not stats:
+                continue
+            rows.append([
+                f"{label} ({unit})",
+                f"{stats.get('mean', 0):,.2f}", f"{stats.get('median', 0):,.2f}", f"{stats.get('std', 0):,.2f}",
+                "-", "-", "-",
+                f"[{self._format_optional(stats.get('ci_low'), '{:,.2f}')}, {self._format_optional(stats.get('ci_high'), '{:,.2f}')}]",
+                stats.get("outliers_rejected", 0),
+            ])
+        for phase, stats in (metrics.get("latency_us") or {}).items():
+            rows.append([
+                f"{phase} (µs)",
+                f"{stats.get('mean', 0):,.2f}", f"{stats.get('p50', 0):,.2f}", f"{stats.get('std', 0):,.2f}",
+                f"{stats.get('p90', 0):,.2f}", f"{stats.get('p99', 0):,.2f}", f"{stats.get('p99_9', 0):,.2f}",
+                f"[{self._format_optional(stats.get('ci_low'), '{:,.2f}')}, {self._format_optional(stats.get('ci_high'), '{:,.2f}')}]",
+                stats.get("outliers_rejected", 0),
+            ])
+        return _tabulate(
+            rows,
+            headers=["Métrica", "Média", "Mediana", "Desvio", "P90", "P99", "P99.9", "IC 95%", "Outliers"],
+            tablefmt="github"
+        )
+    
+    def _environment_section(self, environment: Dict[str, Any]) -> List[str]:
+        """Seção de ambiente: governador, turbo, SMT, isolcpus, NUMA e build do quantCrypt."""
+        on_off = lambda value: "N/A" if value is None else ("ativo" if value else "inativo")
+        build = environment.get("quantcrypt_build") or {}
+        numa = environment.get("numa_nodes") or {}
+        lines = [
+            "## Ambiente",
+            "",
+            f"**Hash do Ambiente**: `{environment.get('environment_hash', 'N/A')}`",
+            f"**Governador de CPU**: {environment.get('cpu_governor') or 'N/A'}",
+            f"**Turbo**: {on_off(environment.get('turbo'))}",
+            f"**SMT**: {on_off(environment.get('smt_active'))}",
+            f"**Núcleos Isolados**: {', '.join(map(str, environment.get('isolated_cpus') or [])) or 'nenhum'}",
+            f"**Nós NUMA**: {len(numa) or 'N/A'}",
+            f"**quantCrypt**: {build.get('version') or 'N/A'} "
+            f"(wheel {', '.join(build.get('wheel_tags') or []) or 'N/A'}; "
+            f"variante esperada {build.get('expected_variant') or 'N/A'})",
+            f"**Pacotes**: {environment.get('package_count', 'N/A')} (hash `{environment.get('package_hash', 'N/A')}`)",
+            "",
+        ]
+        changed = environment.get("changed_during_run") or []
+        if changed:
+            lines[-1:-1] = [f"**Atenção**: ambiente mudou entre repetições ({', '.join(changed)})"]
+        return lines
+
+    def _pinning_section(self, pinning: Dict[str, Any]) -> List[str]:
+        """Seção do modo fixado: núcleos da carga e do amostrador, prioridade e avisos."""
+        priority = pinning.get("priority")
+        lines = [
+            "## Execução Fixada",
+            "",
+            f"**Núcleo da Carga**: {pinning.get('workload_core')} "
+            f"({'afinidade aplicada' if pinning.get('pinned') else 'afinidade não aplicada'})",
+            f"**Núcleo do Amostrador**: {self._format_optional(pinning.get('sampler_core'), '{}')}",
+            f"**Prioridade (nice)**: {'padrão' if priority is None else priority}"
+            f"{'' if priority is None or pinning.get('priority_applied') else ' (não aplicada)'}",
+            f"**Política**: {pinning.get('policy')}{' (execução recusada)' if pinning.get('refused') else ''}",
+            "",
+        ]
+        warnings = pinning.get("warnings") or []
+        if warnings:
+            lines[-1:-1] = ["", "**Avisos**:", *[f"- {warning}" for warning in warnings]]
+        return lines
+
+    def _schedule_section(self, schedule: Dict[str, Any]) -> List[str]:
+        """Seção de agendamento: ordem executada, deriva estimada e medianas por volume."""
+        drift = schedule.get("drift", {})
+        order = "aleatória (seed {})".format(schedule.get("seed")) if schedule.get("order") == "random" else "sequencial"
+        lines = [
+            "## Agendamento e Deriva",
+            "",
+            f"**Ordem**: {order}",
+            f"**Repetições por Volume**: {schedule.get('trials', 1)}",
+            f"**Pausa entre Execuções**: {schedule.get('cooldown_s', 0.0):.1f} s",
+            f"**Sequência**: {' → '.join(str(s['volume']) for s in schedule.get('sequence', []))}",
+        ]
+        if drift.get("identifiable"):
+            std_error = drift.get("std_error")
+            lines.append(
+                f"**Deriva do CPU Time**: {drift['drift_pct_per_min']:+.2f}%/min"
+                + (f" (erro padrão {(std_error or 0) * 60 * 100:.2f}%/min)" if std_error is not None else "")
+            )
+        else:
+            lines.append("**Deriva do CPU Time**: não estimável (requer 2+ repetições por volume)")
+        lines.append("")
+        
+        medians = schedule.get("volume_medians", [])
+        if medians:
+            lines.extend([
+                _tabulate(
+                    [
+                        [m["volume"], m["count"], f"{m['median']:.2f}", f"{m['corrected_median']:.2f}"]
+                        for m in medians
+                    ],
+                    headers=["Volume", "Repetições", "CPU Time Mediano (ms)", "Corrigido (ms)"],
+                    tablefmt="github"
+                ),
+                "",
+            ])
+        lines.append("")
+        return lines
+    
+    def _phase_table(self, phase_metrics: Dict[str, Dict[str, Any]]) -> str:
+        """Monta tabela Markdown com ops/s e percentis de latência por fase."""
+        rows = []
+        for phase, stats in phase_metrics.items():
+            rows.append([
+                phase,
+                stats.get("count", 0),
+                f"{stats.get('ops_per_sec', 0):,.1f}",
+                f"{stats.get('mean_us', 0):.2f}",
+                f"{stats.get('p50_us', 0):.2f}",
+                f"{stats.get('p90_us', 0):.2f}",
+                f"{stats.get('p99_us', 0):.2f}",
+                f"{stats.get('p99_9_us', 0):.2f}",
+                f"{stats.get('max_us', 0):.2f}",
+            ])
+        
+        return _tabulate(
+            rows,
+            headers=["Fase", "Operações", "ops/s", "Média (µs)", "p50 (µs)", "p90 (µs)", "p99 (µs)", "p99.9 (µs)", "Máx (µs)"],
+            tablefmt="github"
+        )
+
+
     def build_series_report(self, series: Dict[str, Any], output_path: Path, image_paths: List[Path]) -> None:
         """
         Gera relatório comparativo de escalabilidade.
@@ -143,6 +543,7 @@ class ReportMarkdown:
                 - volumes: list[int]
                 - aggregated_metrics: dict
                 - evaluations: list[dict]
+                - schedule: dict (Scalability._schedule_summary, opcional)
                 - started_at: str (ISO timestamp)
             output_path: Caminho para salvar .md
             image_paths: Lista de caminhos para gráficos gerados
@@ -153,7 +554,11 @@ class ReportMarkdown:
             ## Volumes Testados
             ## Métricas Agregadas
             ## Resultados por Volume
+            ## Throughput por Fase
+            ## Agendamento e Deriva
+            ## Latência Consolidada
             ## Gráficos Comparativos
+            ## Análise
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
@@ -161,6 +566,7 @@ class ReportMarkdown:
         volumes = series.get("volumes", [])
         aggregated = series.get("aggregated_metrics", {})
         evaluations = series.get("evaluations", [])
+        schedule = series.get("schedule") or {}
         
         # Converter timestamp
         timestamp_str = series.get("started_at", "")
@@ -197,7 +603,7 @@ class ReportMarkdown:
             ["Memory (Pico)", f"{aggregated.get('memory_peak_mb', 0):.2f} MB"],
         ]
         
-        agg_table = tabulate.tabulate(
+        agg_table = _tabulate(
             agg_data,
             headers=["Métrica", "Valor"],
             tablefmt="github"
@@ -205,8 +611,11 @@ class ReportMarkdown:
         
         lines.extend([agg_table, "", ""])
         
-        # Resultados por volume
-        successful_evals = [e for e in evaluations if e.get("status") == "success"]
+        # Resultados por volume (ordenados por volume; a ordem executada fica em "Agendamento")
+        successful_evals = sorted(
+            (e for e in evaluations if e.get("status") == "success"),
+            key=lambda e: (e.get("volume", 0), e.get("schedule", {}).get("position", 0))
+        )
         
         if successful_evals:
             lines.extend([
@@ -222,20 +631,94 @@ class ReportMarkdown:
                 memory = metrics.get("memory_mb", 0.0)
                 duration = eval_item.get("duration_ms", 0.0)
                 
-                volume_data.append([
+                row = [
                     volume,
                     f"{cpu_time:.2f} ms",
                     f"{memory:.2f} MB",
                     f"{duration:.2f} ms"
-                ])
+                ]
+                if schedule:
+                    position = eval_item.get("schedule", {}).get("position")
+                    row.extend([
+                        position + 1 if position is not None else "-",
+                        self._format_optional(metrics.get("cpu_time_ms_corrected"), "{:.2f} ms")
+                    ])
+                volume_data.append(row)
             
-            volume_table = tabulate.tabulate(
+            headers = ["Volume", "CPU Time", "Memory", "Duração Total"]
+            if schedule:
+                headers.extend(["Posição", "CPU Time (corrigido)"])
+            volume_table = _tabulate(
                 volume_data,
-                headers=["Volume", "CPU Time", "Memory", "Duração Total"],
+                headers=headers,
                 tablefmt="github"
             )
             
             lines.extend([volume_table, "", ""])
+            
+            # Throughput por fase (ops/s e p99 por volume)
+            phase_names = []
+            for eval_item in successful_evals:
+                for phase in eval_item.get("phase_metrics", {}):
+                    if phase not in phase_names:
+                        phase_names.append(phase)
+            
+            if phase_names:
+                phase_data = []
+                for eval_item in successful_evals:
+                    phase_metrics = eval_item.get("phase_metrics", {})
+                    row = [eval_item.get("volume", 0)]
+                    for phase in phase_names:
+                        stats = phase_metrics.get(phase)
+                        row.append(
+                            f"{stats.get('ops_per_sec', 0):,.1f} ops/s (p99 {stats.get('p99_us', 0):.2f} µs)"
+                            if stats else "N/A"
+                        )
+                    phase_data.append(row)
+                
+                phase_table = _tabulate(
+                    phase_data,
+                    headers=["Volume"] + phase_names,
+                    tablefmt="github"
+                )
+                
+                lines.extend([
+                    "## Throughput por Fase",
+                    "",
+                    phase_table,
+                    "",
+                    ""
+                ])
+        
+        if schedule:
+            lines.extend(self._schedule_section(schedule))
+        
+        # Percentis da série inteira (histogramas somados entre volumes)
+        latency_percentiles = aggregated.get("latency_percentiles", {})
+        if latency_percentiles:
+            latency_data = [
+                [
+                    phase,
+                    stats.get("count", 0),
+                    f"{stats.get('p50_us', 0):.2f}",
+                    f"{stats.get('p90_us', 0):.2f}",
+                    f"{stats.get('p99_us', 0):.2f}",
+                    f"{stats.get('p99_9_us', 0):.2f}",
+                    f"{stats.get('max_us', 0):.2f}",
+                ]
+                for phase, stats in latency_percentiles.items()
+            ]
+            lines.extend([
+                "## Latência Consolidada",
+                "",
+                _tabulate(
+                    latency_data,
+                    headers=["Fase", "Operações", "P50 (µs)", "P90 (µs)", "P99 (µs)", "P99.9 (µs)", "Máx (µs)"],
+                    tablefmt="github"
+                ),
+                "",
+                ""
+            ])
         
         # Falhas (se houver)
         failed_evals = [e for e in evaluations if e.get("status") != "success"]
@@ -272,17 +755,20 @@ class ReportMarkdown:
             "",
         ])
         
-        if len(successful_evals) >= 2:
-            # Calcular taxa de crescimento (CPU time)
-            first_eval = successful_evals[0]
-            last_eval = successful_evals[-1]
-            
-            first_cpu = first_eval["metrics"].get("cpu_time_ms", 1.0)
-            last_cpu = last_eval["metrics"].get("cpu_time_ms", 1.0)
-            
-            first_vol = first_eval["volume"]
-            last_vol = last_eval["volume"]
-            
+        # Menor e maior volume: (volume, CPU time); com agendamento, medianas
+        # entre repetições corrigidas pela deriva
+        volume_medians = schedule.get("volume_medians", [])
+        endpoints = None
+        if len(volume_medians) >= 2:
+            endpoints = [(m["volume"], m["corrected_median"]) for m in (volume_medians[0], volume_medians[-1])]
+        elif len(successful_evals) >= 2:
+            endpoints = [
+                (e["volume"], e["metrics"].get("cpu_time_ms", 1.0))
+                for e in (successful_evals[0], successful_evals[-1])
+            ]
+        
+        if endpoints:
+            (first_vol, first_cpu), (last_vol, last_cpu) = endpoints
             volume_ratio = last_vol / first_vol if first_vol > 0 else 1.0
             cpu_ratio = last_cpu / first_cpu if first_cpu > 0 else 1.0
             
@@ -306,3 +792,376 @@ class ReportMarkdown:
         
         content = "\n".join(lines)
         output_path.write_text(content, encoding='utf-8')
+
+
+    def build_scaling_report(self, series: Dict[str, Any], output_path: Path, image_paths: List[Path]) -> None:
+        """
+        Gera relatório de escalabilidade por número de workers (núcleos).
+        
+        Args:
+            series: Dict com:
+                - algorithm: str
+                - mode: str (strong|weak)
+                - volume: int
+                - scaling: dict (ver metrics.scaling.analyze_scaling)
+                - evaluations: list[dict]
+                - started_at: str (ISO timestamp)
+            output_path: Caminho para salvar .md
+            image_paths: Lista de caminhos para gráficos gerados
+            
+        Estrutura:
+            # [Algoritmo] - Escalabilidade por Núcleos
+            ## Resumo
+            ## Speedup e Eficiência
+            ## Gráficos Comparativos
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        algorithm = series.get("algorithm", "Unknown")
+        mode = series.get("mode", "strong")
+        scaling = series.get("scaling", {})
+        evaluations = series.get("evaluations", [])
+        
+        timestamp_str = series.get("started_at", "")
+        try:
+            dt = datetime.fromisoformat(timestamp_str)
+            timestamp_br = dt.strftime("%d-%m-%Y %Hh%Mm%Ss")
+        except:
+            timestamp_br = timestamp_str
+        
+        volume_desc = (
+            f"{series.get('volume', 0)} operações no total"
+            if mode == "strong" else f"{series.get('volume', 0)} operações por worker"
+        )
+        
+        lines = [
+            f"# {algorithm} - Escalabilidade por Núcleos",
+            "",
+            f"**Data**: {timestamp_br}",
+            "",
+            "## Resumo",
+            "",
+            f"**Algoritmo**: {algorithm}",
+            f"**Modo**: {mode} scaling ({volume_desc})",
+            f"**Workers Testados**: {', '.join(str(p['workers']) for p in scaling.get('points', []))}",
+            f"**Fração Serial Estimada**: {self._format_optional(scaling.get('serial_fraction'), '{:.2%}')}",
+        ]
+        
+        if mode == "strong":
+            lines.append(f"**Speedup Máximo (Amdahl)**: {self._format_optional(scaling.get('max_speedup'), '{:.1f}x')}")
+        lines.append("")
+        
+        points = scaling.get("points", [])
+        if points:
+            point_data = [
+                [
+                    p["workers"],
+                    f"{p['ops_per_sec']:,.1f}",
+                    f"{p['speedup']:.2f}x",
+                    f"{p['efficiency']:.1%}",
+                    self._format_optional(p["serial_fraction"], "{:.2%}"),
+                ]
+                for p in points
+            ]
+            lines.extend([
+                "## Speedup e Eficiência",
+                "",
+                _tabulate(
+                    point_data,
+                    headers=["Workers", "ops/s", "Speedup", "Eficiência", "Fração Serial"],
+                    tablefmt="github",
+                    disable_numparse=True
+                ),
+                "",
+            ])
+        
+        failed_evals = [e for e in evaluations if e.get("status") != "success"]
+        if failed_evals:
+            lines.extend(["## Falhas", ""])
+            for eval_item in failed_evals:
+                lines.append(f"- **Workers {eval_item.get('workers', '?')}**: {eval_item.get('status', 'unknown')} - {eval_item.get('notes', 'No details')}")
+            lines.append("")
+        
+        if image_paths:
+            lines.extend(["## Gráficos Comparativos", ""])
+            for img_path in image_paths:
+                lines.append(f"![{img_path.name}]({img_path.name})")
+                lines.append("")
+        
+        lines.extend([
+            "---",
+            f"*Relatório gerado em {datetime.now().strftime('%d-%m-%Y %Hh%Mm%Ss')}*"
+        ])
+        
+        output_path.write_text("\n".join(lines), encoding='utf-8')
+
+
+    def build_comparison_report(self, comparison: Dict[str, Any], output_path: Path) -> None:
+        """
+        Gera relatório Markdown de diferenças entre baseline e candidata.
+        
+        Args:
+            comparison: Dict de Compare.run (baseline, candidate, phases, metrics,
+                regressions, alpha, threshold)
+            output_path: Caminho para salvar .md
+            
+        Estrutura:
+            # [Algoritmo] - Comparação de Desempenho
+            ## Resumo
+            ## Execuções
+            ## Latência por Fase
+            ## Métricas por Operação
+            ## Regressões
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        algorithm = comparison.get("algorithm", "Unknown")
+        regressions = comparison.get("regressions", [])
+        alpha = comparison.get("alpha", 0.0)
+        threshold = comparison.get("threshold", 0.0)
+        change = lambda value: self._format_optional(value, "{:+.2%}")
+        p_value = lambda value: self._format_optional(value, "{:.2g}")
+        
+        lines = [
+            f"# {algorithm} - Comparação de Desempenho",
+            "",
+            "## Resumo",
+            "",
+            f"**Resultado**: {'REGRESSÃO' if regressions else 'sem regressões'}",
+            f"**Significância (alpha)**: {alpha:g}",
+            f"**Limiar de Variação**: {threshold:.1%}",
+            "",
+            "## Execuções",
+            "",
+            _tabulate(
+                [
+                    [role, s.get("id"), s.get("host"), s.get("started_at"), s.get("volume"), s.get("trials"),
+                     s.get("environment_hash") or "N/A"]
+                    for role, runs in (("Baseline", comparison.get("baseline", [])), ("Candidata", comparison.get("candidate", [])))
+                    for s in runs
+                ],
+                headers=["Papel", "Id", "Host", "Início", "Volume", "Repetições", "Ambiente"],
+                tablefmt="github",
+                disable_numparse=True
+            ),
+            "",
+        ]
+        
+        mismatches = comparison.get("environment_mismatches") or []
+        if mismatches:
+            lines.extend([
+                f"**Atenção**: ambientes diferentes entre as execuções ({', '.join(mismatches)}); "
+                "diferenças podem não ser do código.",
+                "",
+            ])
+        
+        phases = comparison.get("phases") or {}
+        if phases:
+            lines.extend([
+                "## Latência por Fase",
+                "",
+                "Mann-Whitney U sobre os histogramas de todas as operações; veredito pela mediana.",
+                "",
+                _tabulate(
+                    [
+                        [
+                            phase,
+                            f"{r['baseline'].get('p50', 0):,.2f}", f"{r['candidate'].get('p50', 0):,.2f}", change(r["p50_change"]),
+                            f"{r['baseline'].get('p99', 0):,.2f}", f"{r['candidate'].get('p99', 0):,.2f}", change(r["p99_change"]),
+                            p_value(r["p_value"]),
+                            self._format_optional(r["prob_slower"], "{:.1%}"),
+                            r["verdict"],
+                        ]
+                        for phase, r in phases.items()
+                    ],
+                    headers=["Fase", "p50 base (µs)", "p50 cand (µs)", "Δ p50", "p99 base (µs)", "p99 cand (µs)", "Δ p99", "p-valor", "P(cand > base)", "Veredito"],
+                    tablefmt="github",
+                    disable_numparse=True
+                ),
+                "",
+            ])
+        
+        metrics = comparison.get("metrics") or {}
+        if metrics:
+            lines.extend([
+                "## Métricas por Operação",
+                "",
+                "Diferença de médias entre repetições por bootstrap (IC 95% da diferença).",
+                "",
+                _tabulate(
+                    [
+                        [
+                            name,
+                            self._format_optional(r["baseline_mean"], "{:,.3f}"),
+                            self._format_optional(r["candidate_mean"], "{:,.3f}"),
+                            change(r["change"]),
+                            f"[{self._format_optional(r['ci_low'], '{:,.3f}')}, {self._format_optional(r['ci_high'], '{:,.3f}')}]",
+                            p_value(r["p_value"]),
+                            f"{r['n_baseline']} / {r['n_candidate']}",
+                            r["verdict"],
+                        ]
+                        for name, r in metrics.items()
+                    ],
+                    headers=["Métrica", "Baseline", "Candidata", "Δ", "IC 95% (cand - base)", "p-valor", "n", "Veredito"],
+                    tablefmt="github",
+                    disable_numparse=True
+                ),
+                "",
+            ])
+        
+        lines.extend(["## Regressões", ""])
+        if regressions:
+            lines.extend(f"- **{name}**" for name in regressions)
+        else:
+            lines.append(f"Nenhuma diferença significativa (p < {alpha:g}) acima de {threshold:.1%}.")
+        lines.append("")
+        
+        lines.extend([
+            "---",
+            f"*Relatório gerado em {datetime.now().strftime('%d-%m-%Y %Hh%Mm%Ss')}*"
+        ])
+        
+        output_path.write_text("\n".join(lines), encoding='utf-8')
+
+
+    def build_matrix_report(self, matrix_run: Dict[str, Any], output_path: Path, image_paths: List[Path]) -> None:
+        """
+        Gera relatório consolidado do modo matriz (vários algoritmos, mesmos volumes).
+        
+        Args:
+            matrix_run: Dict com:
+                - algorithms: list[str]
+                - volumes: list[int]
+                - rounds: int
+                - order: list[str] ("algoritmo@volume", na ordem executada)
+                - matrix: dict (summarize_matrix)
+                - evaluations: list[dict]
+                - started_at: str (ISO timestamp)
+            output_path: Caminho para salvar .md
+            image_paths: Lista de caminhos para gráficos gerados
+            
+        Estrutura:
+            # Comparativo entre Algoritmos
+            ## Resumo
+            ## Throughput (ops/s)
+            ## Bytes por Operação
+            ## Ciclos por Operação
+            ## Latência por Fase
+            ## Ordem de Execução
+            ## Falhas
+            ## Gráficos Comparativos
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        algorithms = matrix_run.get("algorithms", [])
+        volumes = matrix_run.get("volumes", [])
+        cells = matrix_run.get("matrix", {}).get("cells", {})
+        phases = matrix_run.get("matrix", {}).get("phases", {})
+        evaluations = matrix_run.get("evaluations", [])
+        
+        timestamp_str = matrix_run.get("started_at", "")
+        try:
+            dt = datetime.fromisoformat(timestamp_str)
+            timestamp_br = dt.strftime("%d-%m-%Y %Hh%Mm%Ss")
+        except:
+            timestamp_br = timestamp_str
+        
+        def volume_table(format_cell) -> str:
+            return _tabulate(
+                [[algorithm] + [format_cell(cells[algorithm][volume]) for volume in volumes] for algorithm in algorithms],
+                headers=["Algoritmo"] + [f"Volume {volume}" for volume in volumes],
+                tablefmt="github",
+                disable_numparse=True
+            )
+        
+        def ops_cell(cell: Dict[str, Any]) -> str:
+            if cell.get("ops_per_sec") is None:
+                return "N/A"
+            return f"{cell['ops_per_sec']:,.1f} ({self._format_optional(cell.get('ops_per_sec_normalized'), '{:.2f}')})"
+        
+        def cycles_cell(cell: Dict[str, Any]) -> str:
+            value = self._format_optional(cell.get("cycles_per_op"), "{:,.0f}")
+            return f"{value}*" if cell.get("cycles_estimated") else value
+        
+        lines = [
+            "# Comparativo entre Algoritmos",
+            "",
+            f"**Data**: {timestamp_br}",
+            "",
+            "## Resumo",
+            "",
+            f"**Algoritmos**: {', '.join(algorithms)}",
+            f"**Volumes Testados**: {', '.join(map(str, volumes))}",
+            f"**Rodadas**: {matrix_run.get('rounds', 1)}",
+            f"**Total de Avaliações**: {len(evaluations)}",
+            f"**Avaliações Bem-Sucedidas**: {sum(1 for e in evaluations if e.get('status') == 'success')}",
+            "",
+            "## Throughput (ops/s)",
+            "",
+            "Operações por segundo de CPU (média entre rodadas); entre parênteses, normalizado pelo maior valor do volume.",
+            "",
+            volume_table(ops_cell),
+            "",
+            "## Bytes por Operação",
+            "",
+            "Pico do heap Python (tracemalloc) dividido pelas operações.",
+            "",
+            volume_table(lambda cell: self._format_optional(cell.get("bytes_per_op"), "{:,.1f}")),
+            "",
+            "## Ciclos por Operação",
+            "",
+            "Contadores de hardware quando disponíveis; * = estimado por tempo de CPU x frequência nominal.",
+            "",
+            volume_table(cycles_cell),
+            "",
+        ]
+        
+        if phases:
+            lines.extend([
+                f"## Latência por Fase (volume {max(volumes)})",
+                "",
+                _tabulate(
+                    [
+                        [
+                            algorithm, phase,
+                            f"{stats.get('ops_per_sec', 0):,.1f}",
+                            f"{stats.get('p50_us', 0):.2f}",
+                            f"{stats.get('p99_us', 0):.2f}",
+                            f"{stats.get('p99_9_us', 0):.2f}",
+                        ]
+                        for algorithm, phase_metrics in phases.items()
+                        for phase, stats in phase_metrics.items()
+                    ],
+                    headers=["Algoritmo", "Fase", "ops/s", "p50 (µs)", "p99 (µs)", "p99.9 (µs)"],
+                    tablefmt="github",
+                    disable_numparse=True
+                ),
+                "",
+            ])
+        
+        lines.extend([
+            "## Ordem de Execução",
+            "",
+            " → ".join(matrix_run.get("order", [])),
+            "",
+        ])
+        
+        failed_evals = [e for e in evaluations if e.get("status") != "success"]
+        if failed_evals:
+            lines.extend(["## Falhas", ""])
+            for eval_item in failed_evals:
+                lines.append(f"- **{eval_item.get('algorithm', '?')} @ {eval_item.get('volume', '?')}**: {eval_item.get('notes', 'No details')}")
+            lines.append("")
+        
+        if image_paths:
+            lines.extend(["## Gráficos Comparativos", ""])
+            for img_path in image_paths:
+                lines.append(f"![{img_path.name}]({img_path.name})")
+                lines.append("")
+        
+        lines.extend([
+            "---",
+            f"*Relatório gerado em {datetime.now().strftime('%d-%m-%Y %Hh%Mm%Ss')}*"
+        ])
+        
+        output_path.write_text("\n".join(lines), encoding='utf-8')
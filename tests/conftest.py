@@ -0,0 +1,58 @@
+"""
+Fixtures compartilhadas entre os testes.
+"""
+from datetime import datetime, timedelta
+import pytest
+from metrics.histogram import LatencyHistogram
+
+
+@pytest.fixture(autouse=True)
+def isolated_outputs(tmp_path, tmp_path_factory, monkeypatch):
+    """
+    Redireciona store, catálogo, relatórios e cache de hardware para fora do checkout.
+
+    O cache de hardware fica num diretório da sessão para não recoletar o
+    perfil (py-cpuinfo) a cada teste.
+    """
+    outputs = tmp_path / "docs"
+    monkeypatch.setattr("storage.results_store.STORE_DIR", outputs / "store")
+    monkeypatch.setattr("storage.catalog.CATALOG_PATH", outputs / "store" / "catalog.sqlite")
+    monkeypatch.setattr("metrics.hardware.HARDWARE_CACHE_PATH", tmp_path_factory.getbasetemp() / "hardware_profile.json")
+    for module in ("visualize.renderer", "orchestration.scalability", "orchestration.compare"):
+        monkeypatch.setattr(f"{module}.RESULTS_DIR", outputs / "results")
+    return outputs
+
+
+@pytest.fixture
+def make_evaluation():
+    """
+    Fábrica de avaliações (formato de Single.run) com valores padrão.
+
+    make_evaluation(idx, algorithm="KEM", **fields): id "<algorithm>_<idx>",
+    started_at em 2026-01-01 + idx dias; fields sobrescreve qualquer campo.
+    """
+    def build(idx=0, algorithm="KEM", **fields):
+        evaluation = {
+            "id": f"{algorithm}_{idx}",
+            "algorithm": algorithm,
+            "challenge_type": algorithm,
+            "volume": 100,
+            "seed": 42,
+            "host": "bench-01",
+            "status": "success",
+            "started_at": (datetime(2026, 1, 1) + timedelta(days=idx)).isoformat(),
+            "duration_ms": 10.0,
+            "metrics": {"cpu_time_ms": 5.0, "memory_mb": 64.0},
+            "phase_metrics": {},
+            "memory_metrics": {},
+            "latency_histograms": {"encaps": LatencyHistogram.from_samples([1000] * 10).to_dict()},
+            "hardware_profile": {
+                "cpu_arch": "X86_64", "cpu_brand": "Test CPU", "cpu_cores": 2, "cpu_threads": 4, "cpu_freq_mhz": 2000.0
+            },
+            "workers": 1,
+            "trials": 1,
+        }
+        evaluation.update(fields)
+        return evaluation
+
+    return build
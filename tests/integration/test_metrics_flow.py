@@ -1,8 +1,11 @@
 """
 Teste de integração do fluxo completo de métricas.
 """
+import threading
+import time
 import pytest
 from metrics.profile.manager import ProfilerManager
+from metrics.profile.memory import Memory
 
 
 def test_profiler_manager_complete_flow():
@@ -95,3 +98,153 @@ def test_profiler_manager_handles_exceptions():
         manager.profile_function(failing_workload)
     
     # TODO: Verificar se profilers foram parados corretamente (cleanup)
+
+
+def test_profiler_manager_warmup_excluded_from_measurement():
+    """
+    Verifica que iterações de aquecimento rodam com volume=1 antes da medição
+    e que o cold start é reportado separadamente.
+    """
+    calls = []
+    
+    def workload(volume, seed=42):
+        calls.append(volume)
+        return sum(range(volume * 1000))
+    
+    manager = ProfilerManager(warmup_iterations=3)
+    result = manager.profile_function(workload, volume=50, seed=1)
+    
+    # 3 aquecimentos com volume=1 e então somente execuções medidas
+    assert calls[:3] == [1, 1, 1]
+    assert calls[3:] and all(v == 50 for v in calls[3:])
+    
+    warmup = result["metrics"]["warmup_metrics"]
+    assert warmup["warmup_iterations"] == 3
+    assert warmup["cold_start_latency_ms"] > 0
+    assert warmup["steady_state_reached"] is None
+
+
+def test_cpu_time_excludes_other_threads():
+    """cpu_time_ms é da thread medida; outras threads (ex: sampler) só entram em process_cpu_time_ms."""
+    stop = threading.Event()
+    
+    def spin():
+        while not stop.is_set():
+            pass
+    
+    spinner = threading.Thread(target=spin)
+    spinner.start()
+    try:
+        result = ProfilerManager().profile_function(lambda: time.sleep(0.05))
+    finally:
+        stop.set()
+        spinner.join()
+    
+    cpu = result["metrics"]["cpu_metrics"]
+    assert cpu["cpu_time_ms"] == cpu["thread_cpu_time_ms"] < 10
+    assert cpu["process_cpu_time_ms"] > cpu["cpu_time_ms"] + 20
+
+
+def test_profiler_manager_prepare_runs_outside_measurement():
+    """func.prepare roda uma vez, antes do aquecimento, e alimenta todas as passadas."""
+    calls = []
+    
+    def workload(volume, seed=42, inputs=None):
+        calls.append(inputs)
+        return {"operations_completed": volume}
+    
+    def prepare(volume, seed=42):
+        sum(range(2_000_000))  # custo que não pode cair em cpu_time_ms
+        return {"volume": volume, "seed": seed}
+    
+    workload.prepare = prepare
+    result = ProfilerManager(warmup_iterations=2, memory_pass="separate").profile_function(workload, volume=10, seed=3)
+    
+    # 2 aquecimentos + passada medida + passada de memória, todos com a mesma preparação
+    assert calls == [{"volume": 10, "seed": 3}] * 4
+    assert result["metrics"]["cpu_metrics"]["cpu_time_ms"] < 20
+
+
+def test_profiler_manager_steady_state_detection():
+    """Verifica que o aquecimento para quando o CV da janela fica abaixo do limiar."""
+    manager = ProfilerManager(
+        warmup_iterations=1,
+        steady_state_cv=10.0,  # limiar folgado: estabiliza na primeira janela
+        steady_state_window=4,
+        max_warmup_iterations=50
+    )
+    
+    warmup = manager.warmup(lambda volume: sum(range(1000)), volume=100)
+    
+    assert warmup["steady_state_reached"] is True
+    assert warmup["warmup_iterations"] == 4
+    assert warmup["final_cv"] is not None
+
+
+def test_profiler_manager_lean_mode_by_default():
+    """Verifica que a medição principal é lean: sem cProfile e com deltas de rusage."""
+    manager = ProfilerManager()
+    result = manager.profile_function(lambda: sum(range(200000)))
+    
+    cpu = result["metrics"]["cpu_metrics"]
+    assert cpu["wall_time_ms"] > 0
+    assert cpu["thread_cpu_time_ms"] >= 0
+    assert "total_calls" not in cpu, "cProfile não deve rodar na medição principal"
+    assert result["metrics"]["diagnostic_metrics"] == {}
+
+
+def test_profiler_manager_cprofile_diagnostic_pass():
+    """Verifica que cprofile=True executa passada extra e reporta seu overhead."""
+    calls = []
+    
+    def workload():
+        calls.append(1)
+        return sum(abs(i) for i in range(50000))
+    
+    manager = ProfilerManager(cprofile=True)
+    result = manager.profile_function(workload)
+    
+    diagnostic = result["metrics"]["diagnostic_metrics"]
+    assert diagnostic["cprofile"]["total_calls"] > 0
+    assert diagnostic["lean_wall_time_ms"] == result["metrics"]["cpu_metrics"]["wall_time_ms"]
+    assert diagnostic["cprofile_overhead_ms"] == pytest.approx(
+        diagnostic["cprofile_wall_time_ms"] - diagnostic["lean_wall_time_ms"]
+    )
+    assert "cprofile_overhead_pct" in diagnostic
+    assert len(calls) >= 2
+
+
+def test_memory_trace_reports_heap_peak_and_allocation_sites():
+    """Verifica pico do heap Python (tracemalloc), RSS e sítios de alocação."""
+    def allocate(n):
+        kept = [bytes(1024) for _ in range(n)]
+        return len(kept), kept
+    
+    result = Memory(top_n=5).trace(allocate, 2000)
+    
+    assert result["result"][0] == 2000
+    assert result["python_peak_mb"] >= 2000 * 1024 / (1024 * 1024)
+    assert result["memory_mb"] > 0
+    assert len(result["top_allocations"]) <= 5
+    assert result["top_allocations"][0]["size_kb"] >= 2000
+    assert "test_metrics_flow.py" in result["top_allocations"][0]["site"]
+
+
+def test_profiler_manager_memory_pass_separate_from_timing():
+    """Com memory_pass="separate" a memória roda em passada própria."""
+    calls = []
+    
+    def workload():
+        calls.append(1)
+        return sum(range(10000))
+    
+    result = ProfilerManager(memory_pass="separate").profile_function(workload)
+    
+    assert len(calls) == 2, "Uma passada de tempo e outra de memória"
+    memory = result["metrics"]["memory_metrics"]
+    assert memory["memory_pass"] == "separate"
+    assert "python_peak_mb" in memory
+    assert "result" not in memory
+    
+    with pytest.raises(ValueError):
+        ProfilerManager(memory_pass="polling")
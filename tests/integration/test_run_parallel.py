@@ -0,0 +1,47 @@
+"""
+Teste de integração para execução paralela multi-processo.
+"""
+import pytest
+from metrics.aggregator import merge_worker_results
+from orchestration.parallel import _run_shard
+from orchestration.single import Single
+from storage.catalog import RunCatalog
+from storage.results_store import ResultsStore
+
+
+def test_single_run_with_workers_merges_metrics(tmp_path):
+    """
+    Executa Krypton em 2 workers e valida a avaliação combinada.
+    """
+    single = Single(results_store=ResultsStore(tmp_path), catalog=RunCatalog(tmp_path / "catalog.sqlite"))
+    result = single.run(algorithm="Krypton", volume=4, seed=42, workers=2, render="deferred")
+    
+    assert result["status"] == "success", result["notes"]
+    assert result["workers"] == 2
+    
+    parallel = result["parallel_metrics"]
+    assert parallel["workers"] == 2
+    assert len(parallel["per_worker"]) == 2
+    assert parallel["aggregate_ops_per_sec"] > 0
+    assert parallel["scaling_efficiency"] is not None
+    
+    # Seeds distintas por worker, volume dividido
+    assert [w["seed"] for w in parallel["per_worker"]] == [42, 43]
+    assert sum(w["volume"] for w in parallel["per_worker"]) == 4
+    
+    # Latências de todos os workers combinadas
+    assert result["phase_metrics"]["encrypt"]["count"] == 4
+
+
+def test_shard_window_excludes_warmup_memory_and_cprofile_passes():
+    """
+    Throughput por worker usa só a passada medida, não aquecimento, tracemalloc ou cProfile.
+    """
+    settings = {"warmup_iterations": 3, "cprofile": True, "memory_pass": "separate"}
+    shard = _run_shard("Krypton", 4, 42, None, {}, settings)
+    lean_wall_ms = shard["metrics"]["cpu_metrics"]["wall_time_ms"]
+    
+    assert (shard["ended_ns"] - shard["started_ns"]) / 1e6 == pytest.approx(lean_wall_ms, abs=1e-3)
+    
+    worker = merge_worker_results([shard])["metrics"]["parallel_metrics"]["per_worker"][0]
+    assert worker["ops_per_sec"] == pytest.approx(shard["operations_completed"] / (lean_wall_ms / 1e3), rel=1e-3)
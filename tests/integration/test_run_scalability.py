@@ -146,3 +146,53 @@ def test_run_scalability_comparative_report_content():
     
     # Deve listar volumes testados
     assert "10" in content and "20" in content
+
+
+def test_run_scalability_keeps_failed_evaluation(tmp_path, monkeypatch):
+    """Avaliação que falha no Single entra na série como está, não como stub."""
+    import orchestration.scalability as scalability
+    from storage.catalog import RunCatalog
+    from storage.results_store import ResultsStore
+    
+    monkeypatch.setattr(scalability, "RESULTS_DIR", tmp_path / "results")
+    store = ResultsStore(tmp_path / "store")
+    catalog = RunCatalog(tmp_path / "catalog.sqlite")
+    
+    result = scalability.Scalability(results_store=store, catalog=catalog).run(
+        algorithm="Krypton", volumes=[2], seed=7, options={"payload_sizes": [0]}, trials=1
+    )
+    
+    assert result["status"] == "failed"
+    assert result["individual_reports"] == []
+    assert "_failed_" not in result["evaluation_ids"][0]
+    # Registro do store e do catálogo preservados
+    assert list(store.query(status="failed")["id"]) == result["evaluation_ids"]
+    assert catalog.find_evaluations(algorithm="Krypton")[0]["id"] == result["evaluation_ids"][0]
+
+
+def test_series_modes_forward_profiler_settings_and_trials(tmp_path, monkeypatch):
+    """Aquecimento, passadas de profiling e trials chegam ao Single.run nas séries."""
+    from orchestration.scalability import Scalability
+    from orchestration.single import Single
+    from storage.catalog import RunCatalog
+    from storage.results_store import ResultsStore
+    
+    calls = []
+    original = Single.run
+    
+    def recording_run(self, *args, **kwargs):
+        calls.append(kwargs)
+        return original(self, *args, **kwargs)
+    
+    monkeypatch.setattr(Single, "run", recording_run)
+    settings = {"warmup_iterations": 0, "steady_state_cv": None, "cprofile": False, "memory_pass": "inline"}
+    scalability = Scalability(results_store=ResultsStore(tmp_path / "store"), catalog=RunCatalog(tmp_path / "catalog.sqlite"))
+    
+    scalability.run(algorithm="Krypton", volumes=[2, 3], render="deferred", profiler_settings=settings)
+    scalability.run_workers(algorithm="Krypton", volume=2, worker_counts=[1], render="deferred",
+                            trials=2, profiler_settings=settings)
+    scalability.run_matrix(volumes=[2], algorithms=["Krypton"], render="deferred", trials=2, profiler_settings=settings)
+    
+    assert len(calls) == 4
+    assert all({key: call[key] for key in settings} == settings for call in calls)
+    assert [call.get("trials") for call in calls[2:]] == [2, 2]
@@ -0,0 +1,73 @@
+"""
+Testes unitários para acumuladores de streaming.
+"""
+from statistics import mean, stdev
+import pytest
+from metrics.accumulator import RunningStats, SeriesAccumulator
+
+
+def test_running_stats_matches_statistics():
+    """Welford produz a mesma média/desvio que statistics."""
+    values = [50.0, 200.0, 400.0, 125.5, 1e-3, 3e4]
+    stats = RunningStats()
+    for value in values:
+        stats.add(value)
+    
+    assert stats.count == len(values)
+    assert stats.mean == pytest.approx(mean(values))
+    assert stats.stdev == pytest.approx(stdev(values))
+    assert (stats.min, stats.max) == (min(values), max(values))
+
+
+def test_running_stats_merge_equals_single_pass():
+    """Acumuladores parciais combinados equivalem a uma única passada."""
+    values = [float(v) for v in range(1, 101)]
+    whole, left, right = RunningStats(), RunningStats(), RunningStats()
+    for value in values:
+        whole.add(value)
+    for value in values[:30]:
+        left.add(value)
+    for value in values[30:]:
+        right.add(value)
+    
+    merged = RunningStats().merge(left).merge(right)
+    
+    assert merged.count == whole.count
+    assert merged.mean == pytest.approx(whole.mean)
+    assert merged.variance == pytest.approx(whole.variance)
+    assert (merged.min, merged.max) == (1.0, 100.0)
+
+
+def test_series_accumulator_merge_partial_series():
+    """Séries parciais (ex: workers) combinadas dão o mesmo agregado."""
+    evaluations = [
+        {"volume": 100, "metrics": {"cpu_time_ms": 50.0, "memory_mb": 10.0}, "status": "success"},
+        {"volume": 500, "metrics": {}, "status": "failed"},
+        {"volume": 1000, "metrics": {"cpu_time_ms": 400.0, "memory_mb": 80.0}, "status": "success"},
+    ]
+    whole = SeriesAccumulator()
+    for evaluation in evaluations:
+        whole.add(evaluation)
+    
+    first, second = SeriesAccumulator(), SeriesAccumulator()
+    first.add(evaluations[0])
+    for evaluation in evaluations[1:]:
+        second.add(evaluation)
+    
+    result = first.merge(second).result()
+    
+    assert result == whole.result()
+    assert result["cpu_time_avg_ms"] == 225.0
+    assert result["cpu_time_std_ms"] == pytest.approx(stdev([50.0, 400.0]))
+    assert result["memory_peak_mb"] == 80.0
+    assert result["volumes"] == [100, 500, 1000]
+    assert result["success_rate"] == pytest.approx(2 / 3)
+
+
+def test_series_accumulator_empty():
+    result = SeriesAccumulator().result()
+    
+    assert result["cpu_time_avg_ms"] == 0.0
+    assert result["cpu_time_std_ms"] == 0.0
+    assert result["memory_peak_mb"] == 0.0
+    assert result["success_rate"] == 0.0
@@ -0,0 +1,68 @@
+"""
+Testes unitários para volume adaptativo (AdaptiveRun) e intervalos de confiança.
+"""
+from array import array
+import time
+import pytest
+from metrics.stats import mean_confidence_interval, t_critical_95
+from orchestration.adaptive import AdaptiveRun
+
+
+def fake_algorithm(volume, seed=42):
+    """Algoritmo sintético com custo estável por operação."""
+    latencies = array('q')
+    for _ in range(volume):
+        start = time.perf_counter_ns()
+        sum(range(200))
+        latencies.append(time.perf_counter_ns() - start)
+    return {"operations_completed": volume, "volume": volume, "seed": seed, "phase_latencies_ns": {"op": latencies}}
+
+
+def test_mean_confidence_interval():
+    """IC de 95% com t de Student e erro relativo."""
+    ci = mean_confidence_interval([10.0, 12.0, 11.0, 9.0, 13.0])
+    
+    assert ci["n"] == 5
+    assert ci["mean"] == pytest.approx(11.0)
+    assert ci["half_width"] == pytest.approx(2.776 * 1.5811388 / 5 ** 0.5, rel=1e-4)
+    assert ci["relative_error"] == pytest.approx(ci["half_width"] / 11.0)
+    assert mean_confidence_interval([5.0])["half_width"] is None
+    assert t_critical_95(1000) == pytest.approx(1.96)
+
+
+def test_adaptive_run_reaches_target():
+    """Executa lotes até o erro alvo e registra a precisão alcançada."""
+    adaptive = AdaptiveRun(fake_algorithm, target_error=0.5, time_budget_s=10, min_batches=3, min_batch_ms=1)
+    
+    result = adaptive(volume=None, seed=7)
+    
+    precision = adaptive.precision
+    assert precision["converged"] is True
+    assert precision["achieved_relative_error"] <= 0.5
+    assert precision["batches"] >= 3
+    assert result["operations_completed"] == adaptive.achieved_volume == precision["volume"]
+    assert len(result["phase_latencies_ns"]["op"]) == adaptive.achieved_volume
+
+
+def test_adaptive_run_respects_time_budget():
+    """Sem convergência possível, para no orçamento de tempo."""
+    adaptive = AdaptiveRun(fake_algorithm, target_error=1e-9, time_budget_s=0.2, min_batch_ms=1)
+    
+    started = time.monotonic()
+    adaptive(volume=None)
+    
+    assert time.monotonic() - started < 1.0
+    assert adaptive.precision["converged"] is False
+    assert adaptive.precision["stop_reason"] == "time_budget"
+
+
+def test_adaptive_run_replays_and_delegates():
+    """Após a busca, chamadas sem volume repetem o volume alcançado; com volume delegam."""
+    adaptive = AdaptiveRun(fake_algorithm, target_error=0.5, time_budget_s=5, min_batch_ms=1)
+    adaptive(volume=None)
+    
+    assert adaptive(volume=None)["operations_completed"] == adaptive.achieved_volume
+    assert adaptive(volume=1)["operations_completed"] == 1
+    
+    with pytest.raises(ValueError):
+        AdaptiveRun(fake_algorithm, target_error=0)
@@ -0,0 +1,79 @@
+"""
+Testes unitários para o modo fixado (orchestration.affinity).
+"""
+import os
+import pytest
+import orchestration.affinity as affinity
+from orchestration.affinity import PinnedExecution, choose_cores, frequency_scaling_issues
+
+STABLE = {"cpu_governor": "performance", "turbo": False, "isolated_cpus": []}
+
+
+@pytest.fixture
+def eight_cores(monkeypatch):
+    """8 núcleos lógicos, pares SMT (0,4), (1,5), (2,6), (3,7)."""
+    monkeypatch.setattr(affinity, "available_cores", lambda: list(range(8)))
+    monkeypatch.setattr(affinity, "isolated_cpus", lambda: [])
+    monkeypatch.setattr(affinity, "thread_siblings", lambda core: [core % 4, core % 4 + 4])
+
+
+def test_choose_cores_avoids_smt_sibling(eight_cores):
+    workload, sampler = choose_cores()
+
+    assert workload == 7
+    assert sampler == 0 and sampler not in (3, 7)
+
+
+def test_choose_cores_prefers_isolated(eight_cores, monkeypatch):
+    monkeypatch.setattr(affinity, "isolated_cpus", lambda: [2, 3])
+
+    assert choose_cores() == (3, 0)
+    assert choose_cores(sampler_core=3) == (2, 3)
+
+
+def test_choose_cores_rejects_unavailable_or_equal(eight_cores):
+    with pytest.raises(ValueError, match="not available"):
+        choose_cores(workload_core=12)
+    with pytest.raises(ValueError, match="must be different"):
+        choose_cores(workload_core=1, sampler_core=1)
+
+
+def test_frequency_scaling_issues():
+    assert frequency_scaling_issues(STABLE) == []
+    assert frequency_scaling_issues({"cpu_governor": None, "turbo": None}) == []
+    assert frequency_scaling_issues({"cpu_governor": "powersave", "turbo": True}) == [
+        "governor=powersave (expected performance)", "turbo enabled"
+    ]
+
+
+def test_refuse_policy_records_report_without_pinning(eight_cores, monkeypatch):
+    monkeypatch.setattr(affinity, "capture_environment", lambda: {**STABLE, "cpu_governor": "powersave"})
+    monkeypatch.setattr(affinity, "pin_to_core", lambda core: pytest.fail("pinned despite refusal"))
+    pinning = PinnedExecution(policy="refuse")
+
+    with pytest.raises(RuntimeError, match="refused"):
+        pinning.apply()
+
+    assert pinning.report["refused"] is True
+    assert pinning.report["warnings"] == ["governor=powersave (expected performance)"]
+
+
+def test_warn_policy_pins_and_restores(monkeypatch):
+    if not hasattr(os, "sched_setaffinity"):
+        pytest.skip("sched_setaffinity indisponível")
+    monkeypatch.setattr(affinity, "capture_environment", lambda: {**STABLE, "turbo": True})
+    original = os.sched_getaffinity(0)
+    core = max(original)
+
+    with PinnedExecution(workload_core=core) as pinning:
+        assert os.sched_getaffinity(0) == {core}
+
+    assert os.sched_getaffinity(0) == original
+    assert pinning.report["pinned"] is True
+    assert pinning.report["warnings"][0] == "turbo enabled"
+    assert pinning.report["refused"] is False
+
+
+def test_unknown_policy_rejected():
+    with pytest.raises(ValueError, match="Unknown pin policy"):
+        PinnedExecution(policy="ignore")
@@ -100,3 +100,28 @@ def test_aggregate_series_empty_list():
     assert result["cpu_time_avg_ms"] == 0.0
     assert result["success_rate"] == 0.0
     assert result["volumes"] == []
+
+
+def test_aggregate_series_merges_latency_histograms():
+    """Verifica percentis da série a partir de histogramas serializados."""
+    from metrics.aggregator import aggregate_series
+    from metrics.histogram import LatencyHistogram
+    
+    evaluations = [
+        {
+            "volume": volume,
+            "metrics": {"cpu_time_ms": 1.0, "memory_mb": 1.0},
+            "latency_histograms": {"encaps": LatencyHistogram.from_samples([100] * volume).to_dict()},
+            "status": "success"
+        }
+        for volume in (10, 90)
+    ]
+    evaluations[1]["latency_histograms"]["encaps"] = LatencyHistogram.from_samples([200] * 90).to_dict()
+    
+    result = aggregate_series(evaluations)
+    encaps = result["latency_percentiles"]["encaps"]
+    
+    assert encaps["count"] == 100
+    assert encaps["min_us"] == 0.1
+    assert encaps["p50_us"] == 0.2
+    assert encaps["max_us"] == 0.2
@@ -66,3 +66,84 @@ def test_aggregate_series_calculates_success_rate():
     # Success rate deve ser 2/3 = 0.666...
     # TODO: Placeholder retorna 1.0, teste falhará
     # Deve passar quando implementarmos cálculo real
+
+
+def test_merge_worker_results_aggregate_throughput():
+    """Verifica throughput agregado e eficiência versus um worker."""
+    from array import array
+    from metrics.aggregator import merge_worker_results
+    
+    def worker(core, started_ns, ended_ns):
+        return {
+            "core": core, "pinned": True, "volume": 10, "seed": core,
+            "operations_completed": 10,
+            "started_ns": started_ns, "ended_ns": ended_ns,
+            "metrics": {
+                "cpu_metrics": {"cpu_time_ms": 100.0},
+                "memory_metrics": {"memory_mb": 50.0, "memory_increments": [0.0]},
+                "system_metrics": {"cpu_percent_avg": 99.0, "cpu_cycles": None},
+            },
+            "phase_latencies_ns": {"encaps": array('q', [1000] * 10)},
+            "cells": []
+        }
+    
+    # 2 workers, 10 ops cada, em paralelo durante 1s
+    workers = [worker(0, 0, 1_000_000_000), worker(1, 0, 1_000_000_000)]
+    # Referência: 1 worker faz 10 ops em 1s
+    reference = worker(0, 0, 1_000_000_000)
+    
+    merged = merge_worker_results(workers, reference)
+    parallel = merged["metrics"]["parallel_metrics"]
+    
+    assert merged["result"]["operations_completed"] == 20
+    assert parallel["aggregate_ops_per_sec"] == 20.0
+    assert parallel["speedup"] == 2.0
+    assert parallel["scaling_efficiency"] == 1.0
+    assert parallel["cores"] == [0, 1]
+    
+    # Métricas de processo somadas e séries de fase concatenadas
+    assert merged["metrics"]["cpu_metrics"]["cpu_time_ms"] == 200.0
+    assert merged["metrics"]["system_metrics"]["cpu_cycles"] is None
+    assert merged["metrics"]["phase_metrics"]["encaps"]["count"] == 20
+
+
+def test_aggregate_trials_rejects_outliers_and_bootstraps_ci():
+    """Verifica média pós-MAD, pico de memória e IC entre repetições."""
+    from array import array
+    
+    cpu_times = [100.0, 101.0, 99.0, 100.5, 99.5, 500.0]
+    metrics_list = [
+        {
+            "cpu_metrics": {"cpu_time_ms": cpu, "wall_time_ms": cpu + 1},
+            "memory_metrics": {"memory_mb": 50.0 + i},
+            "system_metrics": {"cpu_cycles": None},
+            "hardware_info": {"cpu_count": 4},
+        }
+        for i, cpu in enumerate(cpu_times)
+    ]
+    latencies = [{"encaps": array('q', range(1000, 2000))} for _ in cpu_times]
+    
+    result = aggregate(metrics_list, latencies)
+    
+    assert result["trials"] == 6
+    assert result["cpu_time_stats"]["outliers_rejected"] == 1
+    assert result["cpu_time_ms"] == pytest.approx(100.0)
+    assert 99.0 <= result["cpu_time_stats"]["ci_low"] <= result["cpu_time_stats"]["ci_high"] <= 101.0
+    assert result["memory_mb"] == 55.0
+    assert result["cpu_cycles"] is None
+    assert result["hardware_info"] == {"cpu_count": 4}
+    
+    encaps = result["latency_us"]["encaps"]
+    assert encaps["count"] == 6000
+    assert encaps["p50"] == pytest.approx(1.4995)
+    assert encaps["p99"] == pytest.approx(1.98901, rel=1e-3)
+    assert encaps["ci_low"] == pytest.approx(1.4995)
+
+
+def test_aggregate_single_trial_has_no_ci():
+    """Uma repetição: média igual ao valor e IC indefinido."""
+    result = aggregate([{"cpu_metrics": {"cpu_time_ms": 42.0}}])
+    
+    assert result["cpu_time_ms"] == 42.0
+    assert result["cpu_time_stats"]["ci_low"] is None
+    assert result["latency_us"] == {}
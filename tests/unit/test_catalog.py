@@ -0,0 +1,63 @@
+"""
+Testes unitários para o RunCatalog (SQLite).
+"""
+from datetime import datetime, timedelta
+import pytest
+from storage.catalog import RunCatalog, hardware_profile_id
+
+
+def latency_run(make_evaluation, idx, days_ago=0, p99_us=100.0, **fields):
+    """Avaliação iniciada há `days_ago` dias com p99 de keygen/encaps."""
+    return make_evaluation(
+        idx,
+        started_at=(datetime.now() - timedelta(days=days_ago)).isoformat(),
+        phase_metrics={
+            "keygen": {"count": 100, "p50_us": 40.0, "p99_us": p99_us / 2},
+            "encaps": {"count": 100, "p50_us": 50.0, "p99_us": p99_us},
+        },
+        **fields
+    )
+
+
+def test_latency_history_filters_host_window_and_phase(tmp_path, make_evaluation):
+    catalog = RunCatalog(tmp_path / "catalog.sqlite")
+    catalog.record_evaluation(latency_run(make_evaluation, 0, days_ago=1, p99_us=100.0))
+    catalog.record_evaluation(latency_run(make_evaluation, 1, days_ago=5, p99_us=120.0))
+    catalog.record_evaluation(latency_run(make_evaluation, 2, days_ago=45, p99_us=500.0))
+    catalog.record_evaluation(latency_run(make_evaluation, 3, host="bench-02"))
+    catalog.record_evaluation(latency_run(make_evaluation, 4, status="failed"))
+    catalog.record_evaluation(latency_run(make_evaluation, 5, algorithm="DSS"))
+    
+    rows = catalog.latency_history("KEM", metric="p99_us", phase="encaps", host="bench-01", days=30)
+    
+    # Mais antigo primeiro; fora da janela, outro host, falha e outro algoritmo excluídos
+    assert [r["evaluation_id"] for r in rows] == ["KEM_1", "KEM_0"]
+    assert [r["value"] for r in rows] == [120.0, 100.0]
+    assert len(catalog.latency_history("KEM", host="bench-01", days=None)) == 6
+    
+    with pytest.raises(ValueError, match="Unknown metric"):
+        catalog.latency_history("KEM", metric="cpu_time_ms")
+
+
+def test_record_evaluation_replaces_and_links_series(tmp_path, make_evaluation):
+    catalog = RunCatalog(tmp_path / "catalog.sqlite")
+    evaluation = make_evaluation(0, host="bench-01")
+    profile_id = catalog.record_evaluation(evaluation)
+    catalog.record_evaluation(evaluation)
+    
+    assert profile_id == hardware_profile_id(evaluation["hardware_profile"], "bench-01")
+    assert len(catalog.find_evaluations(algorithm="KEM")) == 1
+    assert catalog.find_evaluations(hardware_profile_id=profile_id)[0]["id"] == "KEM_0"
+    
+    catalog.record_series({"id": "KEM_series", "algorithm": "KEM", "status": "success",
+                           "volumes": [100], "evaluation_ids": ["KEM_0"]})
+    assert catalog.find_evaluations()[0]["series_id"] == "KEM_series"
+    catalog.close()
+
+
+def test_hardware_profile_id_ignores_frequency():
+    profile = {"cpu_arch": "X86_64", "cpu_brand": "Test CPU", "cpu_cores": 2, "cpu_threads": 4}
+    
+    assert hardware_profile_id({**profile, "cpu_freq_mhz": 1200.0}, "h") == \
+        hardware_profile_id({**profile, "cpu_freq_mhz": 3400.0}, "h")
+    assert hardware_profile_id(profile, "h1") != hardware_profile_id(profile, "h2")
@@ -0,0 +1,89 @@
+"""
+Testes unitários para a captura de ambiente (metrics.environment).
+"""
+import pytest
+import metrics.environment as environment
+from metrics.environment import (
+    capture_environment, environment_mismatches, isolated_cpus, numa_nodes, package_hash, parse_cpulist
+)
+
+
+def write(root, relative, text):
+    path = root / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text + "\n")
+
+
+@pytest.fixture
+def sysfs(tmp_path, monkeypatch):
+    """Árvore /sys e /proc mínima: 4 CPUs, governador performance, turbo ligado, 2 nós NUMA."""
+    for cpu in range(4):
+        write(tmp_path, f"sys/devices/system/cpu/cpu{cpu}/cpufreq/scaling_governor", "performance")
+    write(tmp_path, "sys/devices/system/cpu/intel_pstate/no_turbo", "0")
+    write(tmp_path, "sys/devices/system/cpu/smt/active", "1")
+    write(tmp_path, "sys/devices/system/cpu/smt/control", "on")
+    write(tmp_path, "sys/devices/system/node/node0/cpulist", "0-1")
+    write(tmp_path, "sys/devices/system/node/node1/cpulist", "2-3")
+    write(tmp_path, "proc/cmdline", "root=/dev/sda1 isolcpus=nohz,domain,2-3 quiet")
+    monkeypatch.setattr(environment, "_STATIC", {})
+    return tmp_path
+
+
+def test_parse_cpulist():
+    assert parse_cpulist("0-3,8,10-11") == [0, 1, 2, 3, 8, 10, 11]
+    assert parse_cpulist("") == []
+    assert parse_cpulist(None) == []
+
+
+def test_capture_reads_sysfs(sysfs):
+    env = capture_environment(root=sysfs)
+
+    assert env["cpu_governor"] == "performance"
+    assert env["governors"] == {"performance": [0, 1, 2, 3]}
+    assert env["turbo"] is True
+    assert env["smt_active"] is True and env["smt_control"] == "on"
+    assert env["isolated_cpus"] == [2, 3]
+    assert env["numa_nodes"] == {"node0": [0, 1], "node1": [2, 3]}
+    assert env["package_count"] > 0 and len(env["package_hash"]) == 16
+
+
+def test_missing_sysfs_yields_none(tmp_path, monkeypatch):
+    monkeypatch.setattr(environment, "_STATIC", {})
+
+    env = capture_environment(root=tmp_path)
+
+    assert env["cpu_governor"] is None and env["turbo"] is None and env["smt_active"] is None
+    assert env["isolated_cpus"] == [] and env["numa_nodes"] == {}
+
+
+def test_sysfs_isolated_takes_precedence(sysfs):
+    write(sysfs, "sys/devices/system/cpu/isolated", "3")
+
+    assert isolated_cpus(sysfs) == [3]
+    assert numa_nodes(sysfs)["node1"] == [2, 3]
+
+
+def test_volatile_fields_reread_and_flagged(sysfs):
+    before = capture_environment(root=sysfs)
+    write(sysfs, "sys/devices/system/cpu/cpu3/cpufreq/scaling_governor", "powersave")
+    write(sysfs, "sys/devices/system/cpu/intel_pstate/no_turbo", "1")
+
+    after = capture_environment(root=sysfs)
+
+    assert after["cpu_governor"] == "mixed"
+    assert after["turbo"] is False
+    assert after["environment_hash"] != before["environment_hash"]
+    assert environment_mismatches(before, after) == ["cpu_governor", "turbo"]
+    assert environment_mismatches(before, {}) == []
+
+
+def test_static_part_is_memoized(sysfs, monkeypatch):
+    capture_environment(root=sysfs)
+    monkeypatch.setattr(environment, "installed_packages", lambda: pytest.fail("packages rescanned"))
+
+    capture_environment(root=sysfs)
+
+
+def test_package_hash_ignores_order_and_case():
+    assert package_hash({"numpy": "2.0", "Tabulate": "0.9"}) == package_hash({"tabulate": "0.9", "numpy": "2.0"})
+    assert package_hash({"numpy": "2.0"}) != package_hash({"numpy": "2.1"})
@@ -0,0 +1,102 @@
+"""
+Testes unitários para o perfil de hardware em cache.
+"""
+import json
+import pytest
+import cpuinfo
+import metrics.hardware as hardware
+from metrics.hardware import Hardware, hardware_profile_id
+
+KEY = {"host": "bench-01", "boot_id": "b00t", "kernel": "6.1.0", "machine": "x86_64", "cpu_model": "Test CPU", "quantcrypt_version": "1.0.0"}
+
+
+@pytest.fixture
+def cpuinfo_calls(monkeypatch):
+    """Conta chamadas a get_cpu_info e isola o cache em memória."""
+    calls = []
+
+    def fake_get_cpu_info():
+        calls.append(1)
+        return {"brand_raw": "Test CPU", "arch": "X86_64", "python_version": "3.12"}
+
+    monkeypatch.setattr(cpuinfo, "get_cpu_info", fake_get_cpu_info)
+    monkeypatch.setattr(hardware, "_PROFILES", {})
+    monkeypatch.setattr(hardware, "cache_key", lambda: dict(KEY))
+    return calls
+
+
+def test_snapshot_is_collected_once_per_process(tmp_path, cpuinfo_calls):
+    first = Hardware(tmp_path / "hw.json").snapshot_hardware()
+    second = Hardware(tmp_path / "hw.json").snapshot_hardware()
+
+    assert len(cpuinfo_calls) == 1
+    assert first["hardware_profile_id"] == second["hardware_profile_id"] == hardware_profile_id(first)
+    assert first["kernel"] == "6.1.0" and first["quantcrypt_version"] == "1.0.0"
+
+
+def test_cache_file_survives_new_process(tmp_path, cpuinfo_calls, monkeypatch):
+    cache_path = tmp_path / "hw.json"
+    profile = Hardware(cache_path).snapshot_hardware()
+    assert json.loads(cache_path.read_text())["key"] == KEY
+
+    # Novo processo: memória vazia, arquivo em disco
+    monkeypatch.setattr(hardware, "_PROFILES", {})
+    cached = Hardware(cache_path).snapshot_hardware()
+
+    assert len(cpuinfo_calls) == 1
+    assert cached["hardware_profile_id"] == profile["hardware_profile_id"]
+
+
+@pytest.mark.parametrize("field, value", [("host", "bench-02"), ("boot_id", "other"), ("kernel", "6.8.0"), ("cpu_model", "Other CPU"), ("quantcrypt_version", "1.1.0")])
+def test_cache_invalidated_when_key_changes(tmp_path, cpuinfo_calls, monkeypatch, field, value):
+    cache_path = tmp_path / "hw.json"
+    Hardware(cache_path).snapshot_hardware()
+
+    monkeypatch.setattr(hardware, "_PROFILES", {})
+    monkeypatch.setattr(hardware, "cache_key", lambda: {**KEY, field: value})
+    Hardware(cache_path).snapshot_hardware()
+
+    assert len(cpuinfo_calls) == 2
+    assert json.loads(cache_path.read_text())["key"][field] == value
+
+
+def test_copied_cache_from_other_host_is_recollected(tmp_path, monkeypatch):
+    monkeypatch.setattr(cpuinfo, "get_cpu_info", lambda: {"brand_raw": "Test CPU", "arch": "X86_64"})
+    monkeypatch.setattr(hardware, "_PROFILES", {})
+    monkeypatch.setattr(hardware.platform, "node", lambda: "bench-01")
+    cache_path = tmp_path / "hw.json"
+    first = Hardware(cache_path).snapshot_hardware()
+
+    # Mesmo checkout em outro host
+    monkeypatch.setattr(hardware, "_PROFILES", {})
+    monkeypatch.setattr(hardware.platform, "node", lambda: "bench-02")
+    second = Hardware(cache_path).snapshot_hardware()
+
+    assert second["hardware_profile_id"] != first["hardware_profile_id"]
+    assert second["hardware_profile_id"] == hardware_profile_id(second, host="bench-02")
+    assert json.loads(cache_path.read_text())["key"]["host"] == "bench-02"
+
+
+def test_failed_collection_is_not_cached(tmp_path, monkeypatch):
+    def broken():
+        raise RuntimeError("cpuinfo unavailable")
+
+    monkeypatch.setattr(cpuinfo, "get_cpu_info", broken)
+    monkeypatch.setattr(hardware, "_PROFILES", {})
+
+    snapshot = Hardware(tmp_path / "hw.json").snapshot_hardware()
+
+    assert snapshot["warning_logged"] is True
+    assert not (tmp_path / "hw.json").exists()
+    assert hardware._PROFILES == {}
+
+
+def test_unreadable_cache_is_recollected(tmp_path, cpuinfo_calls):
+    cache_path = tmp_path / "hw.json"
+    cache_path.write_text("{not json")
+
+    snapshot = Hardware(cache_path).snapshot_hardware()
+
+    assert len(cpuinfo_calls) == 1
+    assert snapshot["warning_logged"] is False
+    assert json.loads(cache_path.read_text())["profile"]["cpu_brand"] == "Test CPU"
@@ -0,0 +1,94 @@
+"""
+Testes unitários para LatencyHistogram.
+"""
+import json
+import pickle
+import numpy as np
+import pytest
+from metrics.histogram import LatencyHistogram, as_histogram, merge_histograms
+
+
+def test_record_small_values_are_exact():
+    """Valores abaixo de 2**(bits+1) ns ficam em buckets unitários."""
+    hist = LatencyHistogram()
+    for value in (100, 200, 100, 50):
+        hist.record(value)
+    
+    assert len(hist) == 4
+    assert hist.min_ns == 50
+    assert hist.max_ns == 200
+    assert hist.percentiles((50,))[50] == 100.0
+    assert hist.mean_ns == 112.5
+
+
+def test_percentiles_relative_error_bounded():
+    """Percentis do histograma ficam a menos de 1% dos exatos."""
+    samples = np.random.default_rng(3).lognormal(11, 1.2, 50_000).astype(np.int64)
+    hist = LatencyHistogram.from_samples(samples)
+    
+    approx = hist.percentiles((50, 90, 99, 99.9))
+    for p, exact in zip((50, 90, 99, 99.9), np.percentile(samples, [50, 90, 99, 99.9])):
+        assert approx[p] == pytest.approx(exact, rel=0.01)
+    
+    assert hist.mean_ns == pytest.approx(samples.mean())
+    assert hist.std_ns == pytest.approx(samples.std(ddof=1))
+
+
+def test_record_matches_record_many():
+    """Registro escalar e vetorizado produzem os mesmos buckets."""
+    samples = np.random.default_rng(5).integers(0, 10**9, 5_000)
+    single = LatencyHistogram()
+    for value in samples.tolist():
+        single.record(value)
+    
+    vectorized = LatencyHistogram.from_samples(samples)
+    
+    assert single._counts == vectorized._counts
+    assert (single.count, single.total_ns, single.min_ns, single.max_ns) == \
+        (vectorized.count, vectorized.total_ns, vectorized.min_ns, vectorized.max_ns)
+    assert single.std_ns == pytest.approx(vectorized.std_ns)
+
+
+def test_values_above_highest_trackable_saturate():
+    """Valores acima do limite caem no último bucket; max exato é preservado."""
+    hist = LatencyHistogram(highest_trackable_ns=2 ** 20)
+    hist.record(2 ** 30)
+    
+    assert hist.max_ns == 2 ** 30
+    assert hist.percentiles((100,))[100] == 2 ** 30
+    assert len(hist._counts) == hist._last_bucket + 1
+
+
+def test_merge_sums_buckets_without_mutating_inputs():
+    a = LatencyHistogram.from_samples([1000] * 3)
+    b = LatencyHistogram.from_samples([5000] * 1)
+    
+    merged = merge_histograms([a, b])
+    
+    assert merged.count == 4
+    assert (merged.min_ns, merged.max_ns) == (1000, 5000)
+    assert a.count == 3 and b.count == 1
+    
+    with pytest.raises(ValueError, match="different layouts"):
+        a.merge(LatencyHistogram(sub_bucket_bits=4))
+
+
+def test_serialization_round_trip():
+    """to_dict é JSON e pickle preserva o histograma (workers e hosts)."""
+    hist = LatencyHistogram.from_samples([10, 1_000, 100_000, 10_000_000])
+    
+    restored = LatencyHistogram.from_dict(json.loads(json.dumps(hist.to_dict())))
+    assert restored.to_dict() == hist.to_dict()
+    assert pickle.loads(pickle.dumps(hist)).to_dict() == hist.to_dict()
+    assert as_histogram(hist.to_dict()).count == 4
+
+
+def test_describe_units():
+    hist = LatencyHistogram.from_samples([1_000, 2_000, 3_000])
+    
+    stats = hist.describe(unit_ns=1e3)
+    
+    assert stats["count"] == 3
+    assert stats["mean"] == 2.0
+    assert stats["min"] == 1.0 and stats["max"] == 3.0
+    assert LatencyHistogram().describe() == {"count": 0}
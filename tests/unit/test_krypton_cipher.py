@@ -2,7 +2,7 @@
 Testes unitários para Krypton Cipher.
 """
 from pytest import raises
-from algorithms.krypton_cipher import cipher_rounds
+from algorithms.krypton_cipher import cipher_rounds, prepare_inputs
 
 def test_cipher_rounds_validates_volume():
     """Verifica que cipher_rounds rejeita volume <= 0."""
@@ -32,3 +32,51 @@ def test_cipher_rounds_accepts_seed():
     result = cipher_rounds(volume=10, seed=777)
     
     assert result is not None
+
+
+def test_cipher_rounds_payload_sweep_cells():
+    """Verifica uma célula por tamanho de payload, com volume mensagens cada."""
+    result = cipher_rounds(volume=3, seed=42, payload_sizes=[64, 4096])
+    
+    cells = result["cells"]
+    assert [c["payload_bytes"] for c in cells] == [64, 4096]
+    assert all(c["messages"] == 3 for c in cells)
+    assert all(c["encrypt_ns"] > 0 and c["decrypt_ns"] > 0 for c in cells)
+    
+    # Um histograma por fase e por célula (percentis não misturam tamanhos)
+    phases = result["phase_latencies_ns"]
+    assert sorted(phases) == sorted(f"{p}_{s}B" for p in ("setup", "encrypt", "decrypt") for s in (64, 4096))
+    assert len(phases["encrypt_64B"]) == 3 and len(phases["encrypt_4096B"]) == 3
+    assert result["operations_completed"] == 6
+
+
+def test_cipher_rounds_key_reuse_mode():
+    """Verifica modo de reutilização de chave."""
+    result = cipher_rounds(volume=2, seed=7, payload_sizes=[128], key_reuse=True)
+    
+    assert result["mode"] == "key_reuse"
+    assert result["cells"][0]["mode"] == "key_reuse"
+    # Uma construção de Krypton por célula; por mensagem no modo padrão
+    assert len(result["phase_latencies_ns"]["setup"]) == 1
+    assert len(cipher_rounds(volume=2, seed=7, payload_sizes=[128])["phase_latencies_ns"]["setup"]) == 2
+
+
+def test_cipher_rounds_validates_payload_sizes():
+    """Verifica que payloads <= 0 são rejeitados."""
+    with raises(ValueError, match="payload sizes must be greater than 0"):
+        cipher_rounds(volume=1, payload_sizes=[64, 0])
+
+
+def test_prepared_inputs_match_inline_preparation():
+    """Buffer e chaves preparados fora da função dão o mesmo resultado."""
+    inputs = prepare_inputs(volume=3, seed=5, payload_sizes=[64, 256])
+    
+    assert len(inputs["buffer"]) == 256
+    assert [len(keys) for keys in inputs["keys"]] == [3, 3]
+    assert len(prepare_inputs(volume=3, seed=5, key_reuse=True)["keys"][0]) == 1
+    assert inputs == prepare_inputs(volume=3, seed=5, payload_sizes=[64, 256])
+    
+    # Aquecimento (volume=1) reutiliza a preparação da passada medida
+    result = cipher_rounds(volume=1, seed=5, payload_sizes=[64, 256], inputs=inputs)
+    assert [cell["messages"] for cell in result["cells"]] == [1, 1]
+    assert cipher_rounds.prepare is prepare_inputs
@@ -0,0 +1,68 @@
+"""
+Testes unitários para resumo de latências por fase.
+"""
+from array import array
+from metrics.latency import summarize_latencies, summarize_phases, summarize_throughput
+
+
+def test_summarize_latencies_computes_throughput():
+    """Verifica ops/s e percentis a partir de latências em ns."""
+    # 4 operações de 1ms cada = 1000 ops/s
+    result = summarize_latencies(array('q', [1_000_000] * 4))
+    
+    assert result["count"] == 4
+    assert abs(result["total_ms"] - 4.0) < 1e-9
+    assert abs(result["ops_per_sec"] - 1000.0) < 1e-6
+    assert result["p50_us"] == 1000.0
+    assert result["max_us"] == 1000.0
+
+
+def test_summarize_latencies_empty_series():
+    """Verifica comportamento com série vazia."""
+    result = summarize_latencies([])
+    
+    assert result["count"] == 0
+    assert result["ops_per_sec"] == 0.0
+
+
+def test_summarize_phases_preserves_order():
+    """Verifica que cada fase é resumida e a ordem é preservada."""
+    phases = {
+        "keygen": array('q', [300, 100, 200]),
+        "encaps": array('q', [50, 50]),
+        "decaps": array('q', [10])
+    }
+    
+    result = summarize_phases(phases)
+    
+    assert list(result.keys()) == ["keygen", "encaps", "decaps"]
+    assert result["keygen"]["count"] == 3
+    assert result["keygen"]["p50_us"] == 0.2
+    assert summarize_phases(None) == {}
+
+
+def test_summarize_throughput_mb_s_and_cycles():
+    """Verifica MB/s e ciclos/byte a partir de uma célula de payload."""
+    cells = [{
+        "payload_bytes": 1_000_000,
+        "messages": 2,
+        "mode": "key_reuse",
+        "encrypt_ns": 1_000_000_000,  # 2 MB em 1s
+        "decrypt_ns": 500_000_000     # 2 MB em 0.5s
+    }]
+    
+    rows = summarize_throughput(cells, cpu_freq_mhz=2000.0)
+    
+    assert abs(rows[0]["encrypt_mb_s"] - 2.0) < 1e-9
+    assert abs(rows[0]["decrypt_mb_s"] - 4.0) < 1e-9
+    # 1s * 2 GHz / 2 MB = 1000 ciclos/byte
+    assert abs(rows[0]["encrypt_cycles_per_byte"] - 1000.0) < 1e-6
+    assert rows[0]["cycles_estimated"] is True
+    
+    # Ciclos do perf prevalecem: 3e9 ciclos em 1s = 3 GHz efetivos
+    measured = summarize_throughput(cells, cpu_freq_mhz=2000.0, measured_cycles=3_000_000_000, measured_ns=1e9)
+    assert abs(measured[0]["encrypt_cycles_per_byte"] - 1500.0) < 1e-6
+    assert measured[0]["cycles_estimated"] is False
+    
+    # Sem frequência conhecida, ciclos ficam indisponíveis
+    assert summarize_throughput(cells)[0]["encrypt_cycles_per_byte"] is None
@@ -0,0 +1,83 @@
+"""
+Testes unitários para o modo matriz (metrics.matrix + relatório consolidado).
+"""
+import pytest
+from metrics.matrix import efficiency_metrics, summarize_matrix, interleaved_order
+from visualize.report_markdown import ReportMarkdown
+
+
+def cell_run(make_evaluation, algorithm, volume, cpu_time_ms, **fields):
+    """Avaliação de uma célula algoritmo x volume com o tempo de CPU dado."""
+    return make_evaluation(
+        algorithm=algorithm,
+        volume=volume,
+        metrics={"cpu_time_ms": cpu_time_ms},
+        phase_metrics={"encaps": {"count": volume, "ops_per_sec": 1000.0, "p50_us": 1.0, "p99_us": 2.0, "p99_9_us": 3.0}},
+        **fields
+    )
+
+
+def test_interleaved_order_rotates_first_algorithm():
+    order = interleaved_order(["A", "B", "C"], [10, 20], rounds=2)
+    
+    assert [a for _, v, a in order[:3]] == ["A", "B", "C"]
+    assert [a for _, v, a in order[3:6]] == ["B", "C", "A"]
+    assert [a for _, v, a in order[6:9]] == ["C", "A", "B"]
+    assert len(order) == 12
+    # Cada algoritmo ocupa cada posição do bloco ao menos uma vez
+    firsts = {order[i][2] for i in range(0, 12, 3)}
+    assert firsts == {"A", "B", "C"}
+
+
+def test_efficiency_metrics_prefers_hardware_cycles(make_evaluation):
+    footprint = {"memory_metrics": {"python_peak_mb": 1.0}, "hardware_profile": {"cpu_freq_mhz": 2000.0}}
+    measured = efficiency_metrics(cell_run(
+        make_evaluation, "KEM", 1000, 500.0, counter_metrics={"per_op": {"cycles": 42_000}}, **footprint
+    ))
+    estimated = efficiency_metrics(cell_run(make_evaluation, "KEM", 1000, 500.0, **footprint))
+    
+    assert measured["ops_per_sec"] == pytest.approx(2000.0)
+    assert measured["bytes_per_op"] == pytest.approx(1024 * 1024 / 1000)
+    assert measured["cycles_per_op"] == 42_000 and not measured["cycles_estimated"]
+    # 0.5 s de CPU x 2 GHz / 1000 operações
+    assert estimated["cycles_per_op"] == pytest.approx(1e6) and estimated["cycles_estimated"]
+
+
+def test_summarize_matrix_normalises_by_fastest_algorithm(make_evaluation):
+    evaluations = [
+        cell_run(make_evaluation, "KEM", 100, 50.0),
+        cell_run(make_evaluation, "KEM", 100, 150.0),
+        cell_run(make_evaluation, "DSS", 100, 1000.0),
+        cell_run(make_evaluation, "DSS", 100, 0.0, status="failed"),
+    ]
+    
+    matrix = summarize_matrix(evaluations, ["KEM", "DSS"], [100])
+    kem, dss = matrix["cells"]["KEM"][100], matrix["cells"]["DSS"][100]
+    
+    # Média entre rodadas: (2000 + 666,7) / 2
+    assert kem["ops_per_sec"] == pytest.approx(1333.33, rel=1e-3)
+    assert kem["ops_per_sec_normalized"] == 1.0
+    assert dss["ops_per_sec_normalized"] == pytest.approx(100 / 1333.33, rel=1e-3)
+    assert (dss["rounds"], dss["failed"]) == (1, 1)
+    assert set(matrix["phases"]) == {"KEM", "DSS"}
+
+
+def test_build_matrix_report(tmp_path, make_evaluation):
+    evaluations = [cell_run(make_evaluation, "KEM", 100, 50.0), cell_run(make_evaluation, "DSS", 100, 1000.0)]
+    output_path = tmp_path / "matrix.md"
+    
+    ReportMarkdown().build_matrix_report({
+        "algorithms": ["KEM", "DSS"],
+        "volumes": [100],
+        "rounds": 1,
+        "order": ["KEM@100", "DSS@100"],
+        "matrix": summarize_matrix(evaluations, ["KEM", "DSS"], [100]),
+        "evaluations": evaluations,
+        "started_at": "2026-01-01T10:00:00"
+    }, output_path, [])
+    
+    report = output_path.read_text(encoding="utf-8")
+    assert "## Throughput (ops/s)" in report
+    assert "2,000.0 (1.00)" in report
+    assert "## Ciclos por Operação" in report and "*" in report
+    assert "KEM@100 → DSS@100" in report
@@ -31,3 +31,24 @@ def test_generate_and_sign_accepts_seed():
     result = generate_and_sign(volume=10, seed=99999)
     
     assert result is not None
+
+
+def test_generate_and_sign_key_reuse_measures_sign_verify():
+    """Verifica modo key_reuse: chaves geradas uma vez, sign/verify por operação."""
+    result = generate_and_sign(volume=6, seed=42, key_count=2)
+    
+    assert result["mode"] == "key_reuse"
+    phases = result["phase_latencies_ns"]
+    
+    # Keygen executado apenas key_count vezes
+    assert len(phases["keygen"]) == 2
+    
+    # Sign e verify possuem vetor de latência próprio, um por operação
+    assert len(phases["sign"]) == 6
+    assert len(phases["verify"]) == 6
+
+
+def test_generate_and_sign_validates_key_count():
+    """Verifica que key_count <= 0 é rejeitado."""
+    with raises(ValueError, match="key_count.*must be.*greater than 0"):
+        generate_and_sign(volume=10, key_count=0)
@@ -36,3 +36,16 @@ def test_run_mlkem_accepts_seed():
     assert result is not None
     
     # TODO: Validar que mesmo seed produz mesmos resultados
+
+
+def test_run_mlkem_returns_phase_latencies():
+    """Verifica que keygen, encaps e decaps são cronometrados separadamente."""
+    result = run_mlkem(volume=5, seed=42)
+    
+    phases = result["phase_latencies_ns"]
+    assert list(phases.keys()) == ["keygen", "encaps", "decaps"]
+    
+    # Uma amostra por iteração em cada fase
+    for phase, latencies in phases.items():
+        assert len(latencies) == 5, f"Fase {phase} deve ter 5 amostras"
+        assert latencies.min_ns > 0
@@ -0,0 +1,22 @@
+"""
+Testes unitários para execução paralela.
+"""
+from pytest import raises
+from orchestration.parallel import split_volume, ParallelExecutor
+
+
+def test_split_volume_distributes_remainder():
+    """Verifica que o resto da divisão vai para os primeiros workers."""
+    assert split_volume(10, 3) == [4, 3, 3]
+    assert sum(split_volume(1001, 8)) == 1001
+
+
+def test_split_volume_drops_empty_shards():
+    """Verifica que shards vazios são descartados quando volume < workers."""
+    assert split_volume(2, 4) == [1, 1]
+
+
+def test_parallel_executor_validates_workers():
+    """Verifica que workers <= 0 é rejeitado."""
+    with raises(ValueError, match="workers must be greater than 0"):
+        ParallelExecutor(workers=0)
@@ -0,0 +1,79 @@
+"""
+Testes unitários para perf_events (contadores perf_event_open via ctypes).
+"""
+import errno
+import platform
+import pytest
+from metrics.perf_events import (
+    PerfCounterGroup,
+    derive_counter_metrics,
+    PERF_TYPE_SOFTWARE,
+    PERF_COUNT_SW_CONTEXT_SWITCHES,
+)
+
+
+def test_derive_counter_metrics_ipc_and_per_op():
+    """Verifica IPC, taxa de cache miss e contagens por operação."""
+    counts = {
+        "cycles": 1000,
+        "instructions": 2500,
+        "cache_references": 200,
+        "cache_misses": 50,
+        "branch_misses": 10,
+        "context_switches": None
+    }
+    
+    derived = derive_counter_metrics(counts, operations=10)
+    
+    assert derived["ipc"] == pytest.approx(2.5)
+    assert derived["cache_miss_rate"] == pytest.approx(0.25)
+    assert derived["per_op"]["cycles"] == pytest.approx(100.0)
+    assert derived["per_op"]["context_switches"] is None
+
+
+def test_derive_counter_metrics_unavailable():
+    """Sem contadores, métricas derivadas são None e per_op vazio."""
+    derived = derive_counter_metrics({"cycles": None, "instructions": None})
+    
+    assert derived["ipc"] is None
+    assert derived["cache_miss_rate"] is None
+    assert derived["per_op"] == {}
+
+
+def test_perf_counter_group_degrades_on_permission_denied(monkeypatch):
+    """perf_event_paranoid restritivo: nenhum evento aberto e motivo registrado."""
+    def denied(self, nr, event_type, config, group_fd):
+        raise OSError(errno.EACCES, "perf_event_open")
+    
+    monkeypatch.setattr(PerfCounterGroup, "_open_event", denied)
+    monkeypatch.setattr(PerfCounterGroup, "_syscall_number", lambda self: 298)
+    
+    group = PerfCounterGroup()
+    assert group.open() is False
+    assert group.available is False
+    assert "permission denied" in group.errors["cycles"]
+    
+    # Operações no grupo vazio não falham
+    group.enable()
+    group.disable()
+    assert all(v is None for v in group.read().values())
+    group.close()
+
+
+@pytest.mark.skipif(platform.system() != "Linux", reason="perf_event_open requer Linux")
+def test_perf_counter_group_software_event():
+    """Evento de software (trocas de contexto) funciona mesmo sem PMU."""
+    group = PerfCounterGroup(events=(
+        ("context_switches", PERF_TYPE_SOFTWARE, PERF_COUNT_SW_CONTEXT_SWITCHES),
+    ))
+    if not group.open():
+        pytest.skip(f"perf_event_open indisponível: {group.errors}")
+    
+    group.enable()
+    _ = sum(range(100000))
+    group.disable()
+    counts = group.read()
+    group.close()
+    
+    assert isinstance(counts["context_switches"], int)
+    assert counts["context_switches"] >= 0
@@ -0,0 +1,95 @@
+"""
+Testes unitários para ProcStatReader (backend /proc do SystemSampler).
+"""
+import threading
+import time
+import pytest
+from metrics.proc_reader import ProcStatReader, proc_available, busy_cores, _parse_task_stat
+from metrics.system_sampler import SystemSampler
+
+pytestmark = pytest.mark.skipif(not proc_available(), reason="requer /proc (Linux)")
+
+
+def test_parse_task_stat_handles_parenthesis_in_comm():
+    """comm com espaços e parênteses não desloca os campos."""
+    fields = ["S"] + [str(i) for i in range(4, 53)]
+    raw = ("1234 (weird) name) " + " ".join(fields)).encode()
+    
+    comm, utime, stime, rss = _parse_task_stat(raw)
+    
+    assert comm == "weird) name"
+    assert (utime, stime, rss) == (14, 15, 24)
+
+
+def test_proc_reader_cores_and_threads():
+    """Leituras por núcleo e por thread refletem trabalho de uma thread nomeada."""
+    reader = ProcStatReader()
+    cores_before = reader.read_cores()
+    threads_before = reader.read_threads()
+    release = threading.Event()
+    
+    def spin():
+        end = time.monotonic() + 0.1
+        while time.monotonic() < end:
+            pass
+        release.wait()
+    
+    worker = threading.Thread(target=spin, name="spinner")
+    worker.start()
+    time.sleep(0.15)
+    threads_after = reader.read_threads()
+    cpu_ms = reader.thread_cpu_ms(threads_before, threads_after, {worker.native_id: worker.name})
+    release.set()
+    worker.join()
+    
+    utilization = reader.core_utilization(cores_before, reader.read_cores())
+    reader.close()
+    
+    assert len(utilization) == len(cores_before) >= 1
+    assert all(0.0 <= u <= 100.0 for u in utilization)
+    assert f"spinner:{worker.native_id}" in cpu_ms
+    assert cpu_ms[f"spinner:{worker.native_id}"] >= 0.0
+
+
+def test_busy_cores_threshold():
+    assert busy_cores([10.0, 55.0, 99.0]) == 2
+    assert busy_cores([10.0, 55.0, 99.0], threshold=95.0) == 1
+
+
+def test_system_sampler_proc_backend_reports_distribution():
+    """Backend proc amostra abaixo de 1 ms e reporta CPU por núcleo e por thread."""
+    sampler = SystemSampler(backend="proc")
+    sampler.start(interval=0.0005)
+    end = time.monotonic() + 0.1
+    while time.monotonic() < end:
+        sum(range(1000))
+    metrics = sampler.stop()
+    
+    assert metrics["sampler_backend"] == "proc"
+    assert metrics["sample_count"] > 0
+    assert len(metrics["per_core_utilization"]) >= 1
+    assert any(name.startswith("SystemSamplerThread:") for name in metrics["thread_cpu_ms"])
+    
+    with pytest.raises(ValueError):
+        SystemSampler(backend="perfmon")
+
+
+def test_sub_tick_busy_loop_reports_nonzero_cpu():
+    """Laço ocupado menor que um tick (1/SC_CLK_TCK) não lê 0% de CPU."""
+    reader = ProcStatReader()
+    tick_s = 1 / reader.clk_tck
+    main_tid = threading.get_native_id()
+    reader.read_process()
+    threads_before = reader.read_threads()
+    
+    end = time.monotonic() + tick_s / 4
+    while time.monotonic() < end:
+        pass
+    
+    cpu_percent, _ = reader.read_process()
+    cpu_ms = reader.thread_cpu_ms(threads_before, reader.read_threads())
+    reader.close()
+    
+    assert cpu_percent > 0.0
+    if reader.schedstat:
+        assert cpu_ms[f"{threads_before[main_tid][0]}:{main_tid}"] > 0.0
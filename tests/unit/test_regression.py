@@ -0,0 +1,109 @@
+"""
+Testes unitários para detecção de regressões (metrics.regression + Compare).
+"""
+import numpy as np
+import pytest
+from metrics.histogram import LatencyHistogram
+from metrics.regression import compare_latency, compare_samples, trial_samples, verdict
+from orchestration.compare import Compare
+from storage.results_store import ResultsStore
+
+
+def measured_run(make_evaluation, idx, latency_ns, cpu_times, volume=1000):
+    """Avaliação com latência de encaps ~N(latency_ns, 5%) e tempos de CPU por repetição."""
+    rng = np.random.default_rng(idx)
+    return make_evaluation(
+        idx,
+        volume=volume,
+        metrics={
+            "cpu_time_ms": float(np.mean(cpu_times)),
+            "memory_mb": 64.0,
+            "cpu_time_stats": {"mean": float(np.mean(cpu_times)), "values": cpu_times},
+        },
+        latency_histograms={
+            "encaps": LatencyHistogram.from_samples(rng.normal(latency_ns, latency_ns * 0.05, volume).astype(int)).to_dict()
+        },
+        trials=len(cpu_times)
+    )
+
+
+def test_verdict_requires_significance_and_threshold():
+    assert verdict(0.001, 0.10, alpha=0.01, threshold=0.05) == "regression"
+    assert verdict(0.001, -0.10, alpha=0.01, threshold=0.05) == "improvement"
+    # Significativo mas abaixo do limiar, ou acima do limiar sem significância
+    assert verdict(0.001, 0.02, alpha=0.01, threshold=0.05) == "unchanged"
+    assert verdict(0.2, 0.10, alpha=0.01, threshold=0.05) == "unchanged"
+    assert verdict(None, 0.10, alpha=0.01, threshold=0.05) == "inconclusive"
+
+
+def test_compare_latency_detects_slower_phase():
+    rng = np.random.default_rng(0)
+    baseline = LatencyHistogram.from_samples(rng.normal(10_000, 500, 5000).astype(int))
+    slower = LatencyHistogram.from_samples(rng.normal(11_000, 500, 5000).astype(int))
+    
+    result = compare_latency(baseline, slower, alpha=0.01, threshold=0.05)
+    
+    assert result["verdict"] == "regression"
+    assert result["p50_change"] == pytest.approx(0.10, abs=0.02)
+    assert result["prob_slower"] > 0.8
+    assert compare_latency(baseline, baseline, alpha=0.01, threshold=0.05)["verdict"] == "unchanged"
+
+
+def test_compare_samples_and_per_operation_normalisation():
+    evaluations = [
+        {"volume": 100, "metrics": {"cpu_time_ms": 2.0, "memory_mb": 10.0, "cpu_time_stats": {"values": [1.0, 3.0]}}},
+        {"volume": 200, "metrics": {"cpu_time_ms": 4.0, "memory_mb": 12.0}},
+    ]
+    samples = trial_samples(evaluations)
+    
+    # ms / volume -> µs por operação
+    assert samples["cpu_us_per_op"] == [10.0, 30.0, 20.0]
+    assert samples["memory_mb"] == [10.0, 12.0]
+    
+    result = compare_samples([10.0, 10.5, 9.5, 10.0], [12.0, 12.5, 11.5, 12.0], alpha=0.01, threshold=0.05)
+    assert result["verdict"] == "regression"
+    assert result["change"] == pytest.approx(0.2)
+
+
+def test_compare_run_writes_report_and_flags_regression(tmp_path, make_evaluation):
+    store = ResultsStore(tmp_path / "store")
+    store.append(measured_run(make_evaluation, 0, 10_000, [10.0, 10.2, 9.9]))
+    store.append(measured_run(make_evaluation, 1, 10_050, [10.1, 9.9, 10.0]))
+    store.append(measured_run(make_evaluation, 2, 12_000, [12.0, 12.1, 11.9]))
+    compare = Compare(store)
+    
+    same = compare.run(["KEM_0"], ["KEM_1"], output_path=tmp_path / "same.md")
+    slower = compare.run(["KEM_0"], ["KEM_2"], output_path=tmp_path / "slower.md")
+    
+    assert not same["has_regression"]
+    assert slower["regressions"] == ["latency:encaps", "cpu_us_per_op"]
+    report = (tmp_path / "slower.md").read_text(encoding="utf-8")
+    assert "## Latência por Fase" in report
+    assert "REGRESSÃO" in report and "KEM_2" in report
+
+
+def test_compare_rejects_different_algorithms(tmp_path, make_evaluation):
+    store = ResultsStore(tmp_path)
+    store.append(make_evaluation(0))
+    store.append(make_evaluation(1, algorithm="DSS"))
+    
+    with pytest.raises(ValueError, match="different algorithms"):
+        Compare(store).run(["KEM_0"], ["DSS_1"], output_path=tmp_path / "x.md")
+    with pytest.raises(KeyError):
+        Compare(store).run(["KEM_0"], ["missing"], output_path=tmp_path / "x.md")
+
+
+def test_compare_flags_environment_mismatch(tmp_path, make_evaluation):
+    store = ResultsStore(tmp_path / "store")
+    store.append(make_evaluation(
+        0, environment={"cpu_governor": "performance", "turbo": False, "environment_hash": "aaaa"}
+    ))
+    store.append(make_evaluation(
+        1, environment={"cpu_governor": "powersave", "turbo": False, "environment_hash": "bbbb"}
+    ))
+    
+    result = Compare(store).run(["KEM_0"], ["KEM_1"], output_path=tmp_path / "env.md")
+    
+    assert result["environment_mismatches"] == ["cpu_governor"]
+    assert [s["environment_hash"] for s in result["baseline"] + result["candidate"]] == ["aaaa", "bbbb"]
+    assert "ambientes diferentes" in (tmp_path / "env.md").read_text(encoding="utf-8")
@@ -0,0 +1,55 @@
+"""
+Testes unitários para a renderização desacoplada da medição.
+"""
+from pathlib import Path
+import pytest
+import visualize.renderer as renderer
+from metrics.histogram import LatencyHistogram
+from visualize.renderer import Renderer, RenderPool, reserve_report_path
+
+
+def renderable(make_evaluation, idx=0):
+    """Avaliação com alocações e histograma de encaps (gera allocations.png e latency.png)."""
+    return make_evaluation(
+        idx,
+        challenge_type=len,
+        memory_metrics={"top_allocations": [{"site": "x.py:1", "size_kb": 4.0, "count": 2}]},
+        latency_histograms={"encaps": LatencyHistogram.from_samples([1000, 1200, 1500] * 10).to_dict()},
+    )
+
+
+def test_reserve_report_path_avoids_collisions(tmp_path, monkeypatch, make_evaluation):
+    monkeypatch.setattr(renderer, "RESULTS_DIR", tmp_path)
+    
+    first = reserve_report_path(make_evaluation())
+    second = reserve_report_path(make_evaluation())
+    
+    assert first.name == second.name == "relatorio.md"
+    assert first.parent != second.parent
+    assert first.parent.exists() and second.parent.exists()
+
+
+def test_renderer_uses_only_the_evaluation(tmp_path, make_evaluation):
+    """Histogramas serializados e memory_metrics bastam (avaliação do store)."""
+    report_path = tmp_path / "relatorio.md"
+    
+    images = Renderer().render(renderable(make_evaluation), report_path)
+    
+    assert report_path.exists()
+    assert {p.name for p in images} == {"allocations.png", "latency.png"}
+    assert "len" in report_path.read_text(encoding="utf-8")
+
+
+def test_render_pool_renders_in_background(tmp_path, make_evaluation):
+    pool = RenderPool(workers=1)
+    pool.submit(renderable(make_evaluation, 0), tmp_path / "a" / "relatorio.md")
+    pool.submit(renderable(make_evaluation, 1), tmp_path / "b" / "relatorio.md")
+    
+    rendered = pool.wait()
+    pool.close()
+    
+    assert set(rendered) == {"KEM_0", "KEM_1"}
+    assert Path(rendered["KEM_1"]["report_path"]).exists()
+    assert all(Path(p).exists() for p in rendered["KEM_0"]["report_images"])
+    with pytest.raises(ValueError):
+        RenderPool(workers=0)
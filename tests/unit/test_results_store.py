@@ -0,0 +1,60 @@
+"""
+Testes unitários para o ResultsStore colunar.
+"""
+from datetime import datetime
+import numpy as np
+import pytest
+from metrics.histogram import LatencyHistogram
+from storage.results_store import ResultsStore
+
+
+def test_append_and_query_by_index_columns(tmp_path, make_evaluation):
+    """Filtra por algoritmo, volume, seed, host e data sem abrir as avaliações."""
+    store = ResultsStore(tmp_path, chunk_rows=2)
+    store.append(make_evaluation(0))
+    store.append(make_evaluation(1, volume=500))
+    store.append(make_evaluation(2, algorithm="DSS", host="bench-02", seed=44))
+    store.append(make_evaluation(3, status="failed"))
+    
+    # 4 linhas em chunks de 2
+    assert len(list((tmp_path / "index").glob("chunk_*.npz"))) == 2
+    assert len(store.query()["id"]) == 4
+    
+    kem = store.query(algorithm="KEM")
+    assert list(kem["id"]) == ["KEM_0", "KEM_1", "KEM_3"]
+    assert list(store.query(algorithm="KEM", volume=500)["id"]) == ["KEM_1"]
+    assert list(store.query(seed=44)["id"]) == ["DSS_2"]
+    assert list(store.query(host="bench-02")["algorithm"]) == ["DSS"]
+    assert list(store.query(status="failed")["id"]) == ["KEM_3"]
+    assert list(store.query(since=datetime(2026, 1, 3))["id"]) == ["DSS_2", "KEM_3"]
+    assert kem["cpu_time_ms"].dtype == np.float64
+
+
+def test_load_restores_histograms_and_series(tmp_path, make_evaluation):
+    store = ResultsStore(tmp_path)
+    series = {"timestamp": np.array([0.0, 0.05]), "cpu_percent": np.array([90.0, 95.0])}
+    store.append(make_evaluation(
+        0,
+        challenge_type=len,
+        hardware_profile={"cpu_brand": "Test CPU"},
+        latency_histograms={"encaps": LatencyHistogram.from_samples([1000] * 10).to_dict()}
+    ), sampler_series=series)
+    
+    loaded = store.load("KEM_0")
+    
+    assert loaded["evaluation"]["challenge_type"] == "len"
+    assert "latency_histograms" not in loaded["evaluation"]
+    assert loaded["hardware_profile"]["cpu_brand"] == "Test CPU"
+    assert loaded["latency_histograms"]["encaps"].count == 10
+    assert loaded["latency_histograms"]["encaps"].min_ns == 1000
+    np.testing.assert_array_equal(loaded["sampler_series"]["cpu_percent"], [90.0, 95.0])
+    
+    with pytest.raises(KeyError, match="not found"):
+        store.load("missing")
+
+
+def test_query_empty_store(tmp_path):
+    result = ResultsStore(tmp_path).query(algorithm="KEM")
+    
+    assert len(result["id"]) == 0
+    assert set(result) >= {"algorithm", "volume", "seed", "host"}
@@ -0,0 +1,62 @@
+"""
+Testes unitários para SampleRingBuffer (amostras do SystemSampler).
+"""
+import pytest
+from metrics.sample_buffer import SampleRingBuffer
+from metrics.system_stat_sample import SystemStatSample
+
+
+def _sample(i, cycles=None):
+    return SystemStatSample(timestamp=float(i), cpu_percent=float(i), memory_percent=float(i % 10), cpu_cycles=cycles)
+
+
+def test_ring_buffer_bounded_capacity():
+    """Buffer retém no máximo `capacity` amostras, as mais recentes, em ordem."""
+    buffer = SampleRingBuffer(capacity=8, downsample_factors=())
+    for i in range(20):
+        buffer.append(_sample(i))
+    
+    assert len(buffer) == 8
+    assert [s.timestamp for s in buffer] == [float(i) for i in range(12, 20)]
+
+
+def test_ring_buffer_stats_cover_all_samples():
+    """Estatísticas incluem amostras já sobrescritas no anel."""
+    buffer = SampleRingBuffer(capacity=4, downsample_factors=())
+    for i in range(100):
+        buffer.append(_sample(i, cycles=i * 10 if i % 2 else None))
+    
+    stats = buffer.stats()
+    assert stats["count"] == 100
+    assert stats["retained"] == 4
+    assert stats["cpu_percent_avg"] == pytest.approx(49.5)
+    assert stats["cpu_percent_min"] == 0.0
+    assert stats["cpu_percent_max"] == 99.0
+    assert stats["memory_percent_max"] == 9.0
+    assert stats["cpu_cycles_max"] == 990
+
+
+def test_ring_buffer_downsampling_tiers():
+    """Cada nível guarda a média de blocos de `factor` amostras do nível anterior."""
+    buffer = SampleRingBuffer(capacity=16, downsample_factors=(4, 2))
+    for i in range(16):
+        buffer.append(_sample(i))
+    
+    tier1 = buffer.series(tier=1)["cpu_percent"]
+    tier2 = buffer.series(tier=2)["cpu_percent"]
+    assert list(tier1) == [1.5, 5.5, 9.5, 13.5]
+    assert list(tier2) == [3.5, 11.5]
+
+
+def test_ring_buffer_empty_and_none_cycles():
+    """Buffer vazio e ciclos ausentes são tratados."""
+    buffer = SampleRingBuffer(capacity=4)
+    assert not buffer
+    assert buffer.stats() == {"count": 0, "retained": 0}
+    
+    buffer.append(_sample(1))
+    assert buffer.stats()["cpu_cycles_max"] is None
+    assert next(iter(buffer)).cpu_cycles is None
+    
+    with pytest.raises(ValueError):
+        SampleRingBuffer(capacity=0)
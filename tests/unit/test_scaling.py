@@ -0,0 +1,46 @@
+"""
+Testes unitários para análise de escalabilidade por workers.
+"""
+from pytest import raises
+from metrics.scaling import analyze_scaling, default_worker_counts, serial_fraction
+
+
+def test_default_worker_counts_powers_of_two():
+    """Verifica potências de 2 até o número de núcleos (inclusive)."""
+    assert default_worker_counts(1) == [1]
+    assert default_worker_counts(8) == [1, 2, 4, 8]
+    assert default_worker_counts(12) == [1, 2, 4, 8, 12]
+
+
+def test_analyze_scaling_perfect_strong_scaling():
+    """Escala linear: eficiência 100% e fração serial zero."""
+    result = analyze_scaling([1, 2, 4], [100.0, 200.0, 400.0], mode="strong")
+    
+    assert [p["speedup"] for p in result["points"]] == [1.0, 2.0, 4.0]
+    assert all(abs(p["efficiency"] - 1.0) < 1e-9 for p in result["points"])
+    assert abs(result["serial_fraction"]) < 1e-9
+
+
+def test_analyze_scaling_recovers_amdahl_fraction():
+    """Curva gerada pela lei de Amdahl com f=0.1 deve recuperar f."""
+    f = 0.1
+    counts = [1, 2, 4, 8]
+    throughputs = [100.0 / (f + (1 - f) / n) for n in counts]
+    
+    result = analyze_scaling(counts, throughputs, mode="strong")
+    
+    assert abs(result["serial_fraction"] - f) < 1e-9
+    assert abs(result["max_speedup"] - 10.0) < 1e-6
+
+
+def test_serial_fraction_weak_scaling_gustafson():
+    """Gustafson: S = n - f(n - 1)."""
+    # n=4, f=0.2 -> S = 4 - 0.6 = 3.4
+    assert abs(serial_fraction(3.4, 4, mode="weak") - 0.2) < 1e-9
+    assert serial_fraction(1.0, 1) is None
+
+
+def test_analyze_scaling_validates_mode():
+    """Verifica que modo inválido é rejeitado."""
+    with raises(ValueError, match="Unknown scaling mode"):
+        analyze_scaling([1, 2], [1.0, 2.0], mode="diagonal")
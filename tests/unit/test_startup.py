@@ -0,0 +1,72 @@
+"""
+Testes de startup da CLI: importações preguiçosas e orçamento de -X importtime.
+"""
+from pathlib import Path
+import subprocess
+import sys
+import pytest
+from algorithms.registry import AlgorithmRegistry
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+# Orçamento de `import index` (cumulativo, µs -> ms). Antes das importações
+# preguiçosas: ~650 ms, dominados por matplotlib.pyplot e quantcrypt.
+STARTUP_BUDGET_MS = 400
+HEAVY_MODULES = ("matplotlib", "quantcrypt", "tabulate", "cpuinfo")
+
+
+def import_profile(module: str = "index") -> dict:
+    """Roda `python -X importtime -c "import <module>"` e retorna {módulo: cumulativo_us}."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SRC_DIR,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    profile = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        profile[name.strip()] = int(cumulative)
+    return profile
+
+
+def test_cli_startup_skips_heavy_modules():
+    profile = import_profile()
+
+    loaded = sorted({name.split(".")[0] for name in profile} & set(HEAVY_MODULES))
+    assert loaded == []
+    assert not any(name.startswith("algorithms.") and name != "algorithms.registry" for name in profile)
+
+
+def test_cli_startup_within_budget():
+    # Melhor de 3: o orçamento mede o custo das importações, não ruído do host
+    best_ms = min(import_profile()["index"] for _ in range(3)) / 1000
+
+    assert best_ms < STARTUP_BUDGET_MS, f"import index took {best_ms:.0f} ms (budget {STARTUP_BUDGET_MS} ms)"
+
+
+def test_registry_resolves_on_first_access():
+    registry = AlgorithmRegistry({"sqrt": "math:sqrt"})
+
+    assert "sqrt" in registry and list(registry) == ["sqrt"]
+    assert not registry.is_loaded("sqrt")
+    assert registry["sqrt"](16) == 4
+    assert registry.is_loaded("sqrt")
+
+
+def test_registry_accepts_direct_assignment():
+    registry = AlgorithmRegistry({"KEM": "algorithms.mlkem_kem:run_mlkem"})
+    fake = lambda volume, seed: None
+
+    registry["KEM"] = fake
+
+    assert registry["KEM"] is fake
+    assert dict(registry) == {"KEM": fake}
+
+
+def test_registry_unknown_name_raises_key_error():
+    with pytest.raises(KeyError):
+        AlgorithmRegistry({})["RSA"]
@@ -0,0 +1,90 @@
+"""
+Testes unitários para metrics.stats.
+"""
+from array import array
+import numpy as np
+import pytest
+from metrics.stats import (
+    describe, reject_outliers_mad, bootstrap_mean_ci, mean_confidence_interval,
+    mann_whitney_u, bootstrap_mean_difference
+)
+
+
+def test_describe_percentiles_from_int64_array():
+    """Percentis vetorizados a partir de array('q') de latências."""
+    stats = describe(array('q', range(1, 1001)))
+    
+    assert stats["count"] == 1000
+    assert stats["min"] == 1.0
+    assert stats["max"] == 1000.0
+    assert stats["median"] == pytest.approx(500.5)
+    assert stats["p90"] == pytest.approx(900.1)
+    assert stats["p99_9"] == pytest.approx(999.001)
+
+
+def test_describe_empty():
+    assert describe([]) == {"count": 0}
+
+
+def test_reject_outliers_mad():
+    """Valores distantes da mediana (z modificado > 3.5) são rejeitados."""
+    kept, rejected = reject_outliers_mad([10, 11, 9, 10, 12, 10, 100])
+    
+    assert rejected == 1
+    assert 100 not in kept
+    
+    # Sem dispersão (MAD = 0) nada é rejeitado
+    kept, rejected = reject_outliers_mad([5, 5, 5, 5])
+    assert rejected == 0 and kept.size == 4
+
+
+def test_bootstrap_mean_ci_is_reproducible_and_contains_mean():
+    values = np.random.default_rng(1).normal(100.0, 5.0, size=50)
+    
+    ci = bootstrap_mean_ci(values, seed=7)
+    
+    assert ci == bootstrap_mean_ci(values, seed=7)
+    assert ci["low"] < values.mean() < ci["high"]
+    assert bootstrap_mean_ci([1.0]) == {"low": None, "high": None}
+
+
+def test_mean_confidence_interval_relative_error():
+    interval = mean_confidence_interval([10.0, 10.0, 10.0])
+    
+    assert interval["mean"] == 10.0
+    assert interval["relative_error"] == 0.0
+
+
+def test_mann_whitney_u_matches_expanded_samples():
+    """Valores distintos + contagens dão o mesmo U/p que as amostras brutas (com empates)."""
+    rng = np.random.default_rng(3)
+    a, b = rng.integers(0, 20, 300), rng.integers(2, 22, 250)
+    brute_u = sum((x > y) + 0.5 * (x == y) for x in b for y in a)
+    
+    raw = mann_whitney_u(a, b)
+    values_a, counts_a = np.unique(a, return_counts=True)
+    values_b, counts_b = np.unique(b, return_counts=True)
+    counted = mann_whitney_u(values_a, values_b, counts_a, counts_b)
+    
+    assert raw["u"] == pytest.approx(brute_u)
+    assert counted == pytest.approx(raw)
+    assert raw["p_value"] < 0.01 and raw["prob_b_greater"] > 0.5
+
+
+def test_mann_whitney_u_separated_and_empty_groups():
+    result = mann_whitney_u([1, 2, 3, 4, 5], [6, 7, 8, 9, 10])
+    
+    assert result["prob_b_greater"] == 1.0
+    assert result["p_value"] == pytest.approx(0.0122, abs=1e-4)
+    assert mann_whitney_u([], [1, 2])["p_value"] is None
+
+
+def test_bootstrap_mean_difference():
+    shifted = bootstrap_mean_difference([10, 11, 9, 10], [12, 13, 12, 14], seed=1)
+    same = bootstrap_mean_difference([10, 11, 9, 10], [11, 9, 10, 10], seed=1)
+    
+    assert shifted["difference"] == pytest.approx(2.75)
+    assert 0 < shifted["low"] < 2.75 < shifted["high"]
+    assert shifted["p_value"] < 0.05
+    assert same["p_value"] > 0.5
+    assert bootstrap_mean_difference([1.0], [2.0])["p_value"] is None